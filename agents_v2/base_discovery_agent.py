@@ -11,10 +11,13 @@ Key Responsibilities:
 """
 
 import anthropic
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, Set, Tuple, TYPE_CHECKING
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import copy
 import json
 import logging
+import re
 from time import time
 from dataclasses import dataclass
 
@@ -25,7 +28,9 @@ if TYPE_CHECKING:
     from domain.kernel.entity import Entity
 from tools_v2.discovery_tools import DISCOVERY_TOOLS, execute_discovery_tool
 from tools_v2.discovery_logger import DiscoveryLogger
+from tools_v2.conversation_manager import CHARS_PER_TOKEN, ConversationManager, estimate_tokens
 from tools_v2.deterministic_parser import preprocess_document as deterministic_preprocess
+from tools_v2.table_chunker import chunk_document
 
 # Import cost estimation, rate limiter, circuit breaker, and temperature
 try:
@@ -33,16 +38,24 @@ try:
         estimate_cost,
         API_RATE_LIMIT_SEMAPHORE_SIZE,
         API_RATE_LIMIT_PER_MINUTE,
-        DISCOVERY_TEMPERATURE
+        DISCOVERY_TEMPERATURE,
+        DISCOVERY_CHUNK_THRESHOLD_TOKENS,
+        DISCOVERY_CHUNK_SIZE_TOKENS,
+        DISCOVERY_CHUNK_OVERLAP_CHARS,
+        DISCOVERY_CHUNK_CONCURRENCY
     )
     from tools_v2.rate_limiter import APIRateLimiter
     from tools_v2.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerOpenError
 except ImportError:
-    def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    def estimate_cost(model: str, input_tokens: int, output_tokens: int, **cache_tokens) -> float:
         return 0.0
     API_RATE_LIMIT_SEMAPHORE_SIZE = 3
     API_RATE_LIMIT_PER_MINUTE = 40
     DISCOVERY_TEMPERATURE = 0.0  # Default to deterministic
+    DISCOVERY_CHUNK_THRESHOLD_TOKENS = 60000
+    DISCOVERY_CHUNK_SIZE_TOKENS = 20000
+    DISCOVERY_CHUNK_OVERLAP_CHARS = 1000
+    DISCOVERY_CHUNK_CONCURRENCY = 3
     APIRateLimiter = None
     CircuitBreaker = None
     CircuitBreakerConfig = None
@@ -57,6 +70,8 @@ class DiscoveryMetrics:
     tokens_used: int = 0
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_creation_tokens: int = 0  # Input tokens written to the prompt cache
+    cache_read_tokens: int = 0      # Input tokens served from the prompt cache
     execution_time: float = 0.0
     iterations: int = 0
     facts_extracted: int = 0
@@ -123,10 +138,12 @@ class BaseDiscoveryAgent(ABC):
 
         # State
         self.messages: List[Dict] = []
+        self.conversation = ConversationManager()  # Cache breakpoints, compaction, usage per iteration
         self.discovery_complete: bool = False
         self.current_document_name: str = ""  # Track source document for fact traceability
         self.current_entity: str = "target"   # "target" or "buyer" - enforced on all fact creation
         self.current_analysis_phase: str = "target_extraction"  # "target_extraction" or "buyer_extraction"
+        self.chunk_position: Optional[Tuple[int, int]] = None  # (part, total) when discovering one chunk
 
         # Metrics
         self.metrics = DiscoveryMetrics()
@@ -194,7 +211,8 @@ class BaseDiscoveryAgent(ABC):
         document_text: str,
         document_name: str = "",
         entity: str = "target",
-        analysis_phase: str = "target_extraction"
+        analysis_phase: str = "target_extraction",
+        mode: str = "auto"
     ) -> Dict[str, Any]:
         """
         Run discovery on the provided document.
@@ -204,6 +222,9 @@ class BaseDiscoveryAgent(ABC):
             document_name: Filename of source document for fact traceability
             entity: "target" or "buyer" - enforced on all extracted facts
             analysis_phase: "target_extraction" or "buyer_extraction"
+            mode: "single" (one tool loop over the whole document), "chunked"
+                (map-reduce over chunks) or "auto" (chunked when the document
+                exceeds DISCOVERY_CHUNK_THRESHOLD_TOKENS)
 
         Returns:
             Dict with discovery results including:
@@ -223,7 +244,8 @@ class BaseDiscoveryAgent(ABC):
         # Start audit logging
         self.audit_logger.start(
             document_name=document_name or "unknown",
-            document_length=len(document_text)
+            document_length=len(document_text),
+            entity=entity
         )
 
         # =================================================================
@@ -258,38 +280,10 @@ class BaseDiscoveryAgent(ABC):
         # =================================================================
 
         try:
-            # Build initial user message (with remaining prose after table extraction)
-            user_message = self._build_user_message(remaining_text)
-            self.messages = [{"role": "user", "content": user_message}]
-
-            # Discovery loop
-            iteration = 0
-            while not self.discovery_complete and iteration < self.max_iterations:
-                iteration += 1
-                self.metrics.iterations = iteration
-                self.audit_logger.set_iteration(iteration)
-                print(f"\n--- Iteration {iteration} ---")
-
-                try:
-                    # Call model
-                    response = self._call_model()
-
-                    # Process response
-                    self._process_response(response)
-
-                    if self.discovery_complete:
-                        print(f"\n[OK] {self.domain.upper()} discovery complete after {iteration} iterations")
-                        break
-
-                except Exception as e:
-                    self.metrics.errors += 1
-                    self.logger.error(f"Error in iteration {iteration}: {e}", exc_info=True)
-                    if iteration >= self.max_iterations:
-                        raise
-
-            if not self.discovery_complete:
-                print(f"\n[WARN] Max iterations ({self.max_iterations}) reached")
-                self.logger.warning("Max iterations reached without completion")
+            if self._select_discovery_mode(remaining_text, mode) == "chunked":
+                self._discover_chunked(remaining_text)
+            else:
+                self._run_discovery_loop(remaining_text)
 
             # Calculate execution time
             if self.start_time:
@@ -307,6 +301,8 @@ class BaseDiscoveryAgent(ABC):
             print(f"  Gaps identified: {self.metrics.gaps_flagged}")
             print(f"  API calls: {self.metrics.api_calls}")
             print(f"  Tokens: {self.metrics.input_tokens} in, {self.metrics.output_tokens} out")
+            print(f"  Prompt cache: {self.metrics.cache_read_tokens} read, "
+                  f"{self.metrics.cache_creation_tokens} written, {self.conversation.compactions} compactions")
             print(f"  Estimated cost: ${self.metrics.estimated_cost:.4f}")
             print(f"  Time: {self.metrics.execution_time:.1f}s")
 
@@ -327,6 +323,7 @@ class BaseDiscoveryAgent(ABC):
                     "tokens_used": self.metrics.tokens_used,
                     "execution_time": self.metrics.execution_time,
                     "iterations": self.metrics.iterations,
+                    "prompt_cache": self.conversation.summary(),
                     "estimated_cost": self.metrics.estimated_cost
                 }
             }
@@ -335,6 +332,184 @@ class BaseDiscoveryAgent(ABC):
             self.logger.error(f"Discovery failed: {e}", exc_info=True)
             raise
 
+    def _run_discovery_loop(self, document_text: str) -> None:
+        """Run the tool loop over document_text until complete_discovery or max iterations."""
+        # Build initial user message (with remaining prose after table extraction)
+        user_message = self._build_user_message(document_text)
+        self.messages = [{"role": "user", "content": user_message}]
+        self.conversation = ConversationManager()
+
+        # Discovery loop
+        iteration = 0
+        while not self.discovery_complete and iteration < self.max_iterations:
+            iteration += 1
+            self.metrics.iterations = iteration
+            self.audit_logger.set_iteration(iteration)
+            print(f"\n--- Iteration {iteration} ---")
+
+            try:
+                # Call model
+                response = self._call_model()
+
+                # Process response
+                self._process_response(response)
+
+                # Fold old tool turns into a ledger once the history gets long
+                self.conversation.compact(self.messages)
+
+                if self.discovery_complete:
+                    print(f"\n[OK] {self.domain.upper()} discovery complete after {iteration} iterations")
+                    break
+
+            except Exception as e:
+                self.metrics.errors += 1
+                self.logger.error(f"Error in iteration {iteration}: {e}", exc_info=True)
+                if iteration >= self.max_iterations:
+                    raise
+
+        if not self.discovery_complete:
+            print(f"\n[WARN] Max iterations ({self.max_iterations}) reached")
+            self.logger.warning("Max iterations reached without completion")
+
+    # =========================================================================
+    # CHUNKED DISCOVERY (map-reduce for oversized documents)
+    # =========================================================================
+
+    def _select_discovery_mode(self, document_text: str, mode: str = "auto") -> str:
+        """Resolve "auto" to "single" or "chunked" from the estimated token count."""
+        if mode in ("single", "chunked"):
+            return mode
+        if mode != "auto":
+            raise ValueError(f"Invalid discovery mode: {mode}. Must be 'auto', 'single' or 'chunked'")
+        tokens = estimate_tokens(document_text)
+        if tokens > DISCOVERY_CHUNK_THRESHOLD_TOKENS:
+            self.logger.info(f"Document is ~{tokens} tokens (> {DISCOVERY_CHUNK_THRESHOLD_TOKENS}), using chunked discovery")
+            return "chunked"
+        return "single"
+
+    def _discover_chunked(self, document_text: str) -> None:
+        """
+        Map: run the tool loop on each table-aware chunk with bounded concurrency.
+        Reduce: merge duplicate facts and reconcile gaps across chunk boundaries.
+
+        Chunk workers are shallow copies of this agent with their own
+        conversation, metrics and audit logger; they share the (thread-safe)
+        FactStore, client, rate limiter and circuit breaker.
+        """
+        chunks = chunk_document(
+            document_text,
+            max_chunk_size=DISCOVERY_CHUNK_SIZE_TOKENS * CHARS_PER_TOKEN,
+            overlap=DISCOVERY_CHUNK_OVERLAP_CHARS
+        )
+        if len(chunks) <= 1:
+            self._run_discovery_loop(document_text)
+            return
+
+        self.conversation = ConversationManager()  # Collects the workers' usage records
+        existing_fact_ids = set(self.fact_store.get_all_fact_ids())
+        existing_gap_ids = set(self.fact_store.get_all_gap_ids())
+        workers = [self._chunk_worker(index, len(chunks), len(chunk.content)) for index, chunk in enumerate(chunks)]
+        max_workers = max(1, min(DISCOVERY_CHUNK_CONCURRENCY, len(chunks)))
+        print(f"[CHUNKED] {len(chunks)} chunks, up to {max_workers} in parallel")
+
+        failed = 0
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"discovery-{self.domain}") as pool:
+            futures = {
+                pool.submit(worker._run_discovery_loop, chunk.content): worker
+                for worker, chunk in zip(workers, chunks)
+            }
+            for future in as_completed(futures):
+                part, total = futures[future].chunk_position
+                try:
+                    future.result()
+                except Exception as e:
+                    failed += 1
+                    self.logger.error(f"Chunk {part}/{total} discovery failed: {e}", exc_info=True)
+
+        self._merge_worker_metrics(workers)
+        for worker in workers:
+            self.audit_logger.absorb(worker.audit_logger)
+        self.metrics.errors += failed
+        if failed == len(workers):
+            raise RuntimeError(f"All {failed} chunks failed during {self.domain} discovery")
+        self.discovery_complete = failed == 0 and all(w.discovery_complete for w in workers)
+
+        reduced = self._reduce_chunk_results(existing_fact_ids, existing_gap_ids)
+        print(f"[CHUNKED] Reduce: merged {reduced['facts_merged']} duplicate facts, "
+              f"dropped {reduced['gaps_dropped']} gaps")
+
+    def _chunk_worker(self, index: int, total: int, chunk_length: int = 0) -> "BaseDiscoveryAgent":
+        """Copy of this agent with fresh per-loop state for one chunk."""
+        worker = copy.copy(self)
+        worker.messages = []
+        worker.conversation = ConversationManager()
+        worker.discovery_complete = False
+        worker.metrics = DiscoveryMetrics()
+        worker.chunk_position = (index + 1, total)
+        worker.audit_logger = DiscoveryLogger(domain=self.domain, output_dir=self.audit_logger.output_dir)
+        worker.audit_logger.start(
+            document_name=f"{self.current_document_name or 'unknown'} (part {index + 1} of {total})",
+            document_length=chunk_length,
+            entity=self.current_entity
+        )
+        return worker
+
+    def _merge_worker_metrics(self, workers: List["BaseDiscoveryAgent"]) -> None:
+        """Add chunk worker metrics and prompt-cache usage to this agent's."""
+        for worker in workers:
+            for name in ("api_calls", "tool_calls", "input_tokens", "output_tokens",
+                         "cache_creation_tokens", "cache_read_tokens", "iterations", "errors"):
+                setattr(self.metrics, name, getattr(self.metrics, name) + getattr(worker.metrics, name))
+            self.metrics.estimated_cost += worker.metrics.estimated_cost
+            self.conversation.usage.extend(worker.conversation.usage)
+            self.conversation.compactions += worker.conversation.compactions
+        self.metrics.tokens_used = self.metrics.input_tokens + self.metrics.output_tokens
+
+    def _reduce_chunk_results(self, existing_fact_ids: Set[str], existing_gap_ids: Set[str]) -> Dict[str, int]:
+        """
+        Merge duplicate facts created by the chunk workers and drop gaps that
+        another chunk answered or that repeat an earlier gap.
+
+        A gap counts as answered only when a new fact in the same domain,
+        entity and category names it: the fact's item appears in the gap
+        description. Sharing a category is not enough ("No backup
+        retention policy" is not answered by a Veeam inventory entry).
+
+        Only items created during this run are touched.
+        """
+        new_fact_ids = [f for f in self.fact_store.get_all_fact_ids() if f not in existing_fact_ids]
+        merged = self.fact_store.merge_duplicate_facts(new_fact_ids)
+
+        items_by_scope: Dict[Tuple[str, str, str], List[str]] = {}
+        for fact_id in new_fact_ids:
+            fact = self.fact_store.get_fact(fact_id)
+            if fact and fact.item.strip():
+                items_by_scope.setdefault((fact.domain, fact.entity, fact.category), []).append(
+                    " ".join(fact.item.lower().split()))
+
+        seen = set()
+        drop = []
+        for gap_id in self.fact_store.get_all_gap_ids():
+            if gap_id in existing_gap_ids:
+                continue
+            gap = self.fact_store.get_gap(gap_id)
+            if not gap:
+                continue
+            scope = (gap.domain, gap.entity, gap.category)
+            description = " ".join(gap.description.lower().split())
+            key = scope + (description,)
+            answered = any(
+                re.search(rf"(?<!\w){re.escape(item)}(?!\w)", description)
+                for item in items_by_scope.get(scope, ())
+            )
+            if answered or key in seen:
+                drop.append(gap_id)
+            seen.add(key)
+        dropped = self.fact_store.remove_gaps(drop) if drop else 0
+
+        self.logger.info(f"Chunked discovery reduce: {len(merged)} facts merged, {dropped} gaps dropped")
+        return {"facts_merged": len(merged), "gaps_dropped": dropped}
+
     def _build_user_message(self, document_text: str) -> str:
         """Build the user message with document content"""
         parts = []
@@ -368,7 +543,15 @@ class BaseDiscoveryAgent(ABC):
         parts.append("")
 
         # Document content
-        parts.append("## Document to Analyze")
+        if self.chunk_position:
+            part, total = self.chunk_position
+            parts.append(f"## Document to Analyze (part {part} of {total})")
+            parts.append("")
+            parts.append(f"This is part {part} of {total} of a large document; the other parts are processed separately.")
+            parts.append(f"Extract every {self.domain} fact in this part. Gaps are reconciled across parts afterwards, "
+                         "so only flag what this part should contain but does not.")
+        else:
+            parts.append("## Document to Analyze")
         parts.append("")
         parts.append(document_text)
         parts.append("")
@@ -437,7 +620,7 @@ class BaseDiscoveryAgent(ABC):
                             temperature=DISCOVERY_TEMPERATURE,  # Deterministic extraction
                             system=cached_system,
                             tools=self.tools,
-                            messages=self.messages,
+                            messages=self.conversation.prepare(self.messages),
                             timeout=timeout_seconds
                         )
                     else:
@@ -447,7 +630,7 @@ class BaseDiscoveryAgent(ABC):
                             temperature=DISCOVERY_TEMPERATURE,  # Deterministic extraction
                             system=cached_system,
                             tools=self.tools,
-                            messages=self.messages,
+                            messages=self.conversation.prepare(self.messages),
                             timeout=timeout_seconds
                         )
                 finally:
@@ -461,17 +644,21 @@ class BaseDiscoveryAgent(ABC):
                     self.metrics.output_tokens += response.usage.output_tokens
                     self.metrics.tokens_used = self.metrics.input_tokens + self.metrics.output_tokens
 
-                    # Log cache statistics if available (prompt caching)
-                    cache_created = getattr(response.usage, 'cache_creation_input_tokens', 0)
-                    cache_read = getattr(response.usage, 'cache_read_input_tokens', 0)
-                    if cache_created or cache_read:
-                        self.logger.info(f"Prompt cache: created={cache_created}, read={cache_read} tokens")
+                    # Record cached vs uncached input for this iteration (prompt caching)
+                    usage = self.conversation.record_usage(response.usage, history_messages=len(self.messages))
+                    self.metrics.cache_creation_tokens += usage.cache_creation_tokens
+                    self.metrics.cache_read_tokens += usage.cache_read_tokens
+                    if usage.cache_creation_tokens or usage.cache_read_tokens:
+                        self.logger.info(f"Prompt cache: created={usage.cache_creation_tokens}, "
+                                         f"read={usage.cache_read_tokens}, uncached={usage.input_tokens} tokens")
 
                     # Calculate running cost
                     self.metrics.estimated_cost = estimate_cost(
                         self.model,
                         self.metrics.input_tokens,
-                        self.metrics.output_tokens
+                        self.metrics.output_tokens,
+                        cache_creation_tokens=self.metrics.cache_creation_tokens,
+                        cache_read_tokens=self.metrics.cache_read_tokens
                     )
 
                 return response
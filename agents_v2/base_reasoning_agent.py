@@ -26,6 +26,7 @@ from tools_v2.reasoning_tools import (
     execute_reasoning_tool,
     ReasoningStore
 )
+from tools_v2.conversation_manager import ConversationManager
 
 # Import cost estimation, rate limiter, circuit breaker, and temperature
 try:
@@ -38,7 +39,7 @@ try:
     from tools_v2.rate_limiter import APIRateLimiter
     from tools_v2.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerOpenError
 except ImportError:
-    def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    def estimate_cost(model: str, input_tokens: int, output_tokens: int, **cache_tokens) -> float:
         return 0.0
     API_RATE_LIMIT_SEMAPHORE_SIZE = 3
     API_RATE_LIMIT_PER_MINUTE = 40
@@ -57,6 +58,8 @@ class ReasoningMetrics:
     tokens_used: int = 0
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_creation_tokens: int = 0  # Input tokens written to the prompt cache
+    cache_read_tokens: int = 0      # Input tokens served from the prompt cache
     execution_time: float = 0.0
     iterations: int = 0
     risks_identified: int = 0
@@ -104,6 +107,7 @@ class BaseReasoningAgent(ABC):
 
         # State
         self.messages: List[Dict] = []
+        self.conversation = ConversationManager()  # Cache breakpoints, compaction, usage per iteration
         self.reasoning_complete: bool = False
 
         # Metrics
@@ -199,6 +203,7 @@ class BaseReasoningAgent(ABC):
             # Build initial user message
             user_message = self._build_user_message(deal_context or {})
             self.messages = [{"role": "user", "content": user_message}]
+            self.conversation = ConversationManager()
 
             # Reasoning loop
             iteration = 0
@@ -214,6 +219,9 @@ class BaseReasoningAgent(ABC):
                     # Process response
                     self._process_response(response)
 
+                    # Fold old tool turns into a ledger once the history gets long
+                    self.conversation.compact(self.messages)
+
                     if self.reasoning_complete:
                         print(f"\n[OK] {self.domain.upper()} reasoning complete after {iteration} iterations")
                         break
@@ -265,6 +273,8 @@ class BaseReasoningAgent(ABC):
             print(f"  Facts cited: {self.metrics.facts_cited}/{domain_facts['fact_count']} ({citation_coverage:.0f}%)")
             print(f"  API calls: {self.metrics.api_calls}")
             print(f"  Tokens: {self.metrics.input_tokens} in, {self.metrics.output_tokens} out")
+            print(f"  Prompt cache: {self.metrics.cache_read_tokens} read, "
+                  f"{self.metrics.cache_creation_tokens} written, {self.conversation.compactions} compactions")
             print(f"  Estimated cost: ${self.metrics.estimated_cost:.4f}")
             print(f"  Time: {self.metrics.execution_time:.1f}s")
 
@@ -280,6 +290,7 @@ class BaseReasoningAgent(ABC):
                     "tokens_used": self.metrics.tokens_used,
                     "execution_time": self.metrics.execution_time,
                     "iterations": self.metrics.iterations,
+                    "prompt_cache": self.conversation.summary(),
                     "facts_cited": self.metrics.facts_cited,
                     "estimated_cost": self.metrics.estimated_cost
                 }
@@ -379,7 +390,7 @@ class BaseReasoningAgent(ABC):
                             "cache_control": {"type": "ephemeral"}
                         }],
                         tools=self.tools,
-                        messages=self.messages,
+                        messages=self.conversation.prepare(self.messages),
                         timeout=timeout_seconds  # Add timeout to prevent hanging
                     )
                 finally:
@@ -393,17 +404,21 @@ class BaseReasoningAgent(ABC):
                     self.metrics.output_tokens += response.usage.output_tokens
                     self.metrics.tokens_used = self.metrics.input_tokens + self.metrics.output_tokens
 
-                    # Log cache statistics if available (prompt caching)
-                    cache_created = getattr(response.usage, 'cache_creation_input_tokens', 0)
-                    cache_read = getattr(response.usage, 'cache_read_input_tokens', 0)
-                    if cache_created or cache_read:
-                        self.logger.info(f"Prompt cache: created={cache_created}, read={cache_read} tokens")
+                    # Record cached vs uncached input for this iteration (prompt caching)
+                    usage = self.conversation.record_usage(response.usage, history_messages=len(self.messages))
+                    self.metrics.cache_creation_tokens += usage.cache_creation_tokens
+                    self.metrics.cache_read_tokens += usage.cache_read_tokens
+                    if usage.cache_creation_tokens or usage.cache_read_tokens:
+                        self.logger.info(f"Prompt cache: created={usage.cache_creation_tokens}, "
+                                         f"read={usage.cache_read_tokens}, uncached={usage.input_tokens} tokens")
 
                     # Calculate running cost
                     self.metrics.estimated_cost = estimate_cost(
                         self.model,
                         self.metrics.input_tokens,
-                        self.metrics.output_tokens
+                        self.metrics.output_tokens,
+                        cache_creation_tokens=self.metrics.cache_creation_tokens,
+                        cache_read_tokens=self.metrics.cache_read_tokens
                     )
 
                 return response
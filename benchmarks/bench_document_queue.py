@@ -0,0 +1,202 @@
+"""
+Document Processing Queue Benchmark
+
+Measures how quickly the threading DocumentProcessor drains a data-room style
+upload of mixed PDF, Excel and Word files. It compares the old layout (one
+worker thread that parses in-process) with the worker pool (several threads
+that parse in the shared process pool).
+
+Fact analysis is an LLM call in production. It is replaced here by a fixed
+sleep (--analysis-ms, default 0), so the benchmark measures parsing and
+queueing. Classification and merging have no facts to work on.
+
+Usage:
+    python benchmarks/bench_document_queue.py
+    python benchmarks/bench_document_queue.py --docs 60 --workers 4 --processes 4 --analysis-ms 200
+
+Output:
+    - Wall time, docs/sec, wait and processing latency per configuration
+    - Speedup of the pool over the single worker
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools_v2.document_processor import (
+    ContentExtractor, DocumentProcessor, ProcessingPriority, _extract_document, get_parse_pool
+)
+
+WORDS = ["server", "network", "firewall", "license", "contract", "backup", "storage", "cluster",
+         "identity", "endpoint", "vendor", "support", "migration", "renewal", "capacity", "latency"]
+
+
+def _sentence(rng: random.Random, length: int = 14) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(length)).capitalize() + "."
+
+
+def make_pdf(path: Path, rng: random.Random, pages: int) -> None:
+    import fitz  # PyMuPDF
+
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page()
+        text = "\n".join(_sentence(rng) for _ in range(45))
+        page.insert_textbox(fitz.Rect(36, 36, 576, 806), text, fontsize=8)
+    doc.save(str(path))
+    doc.close()
+
+
+def make_xlsx(path: Path, rng: random.Random, rows: int) -> None:
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    for sheet_index in range(3):
+        ws = wb.active if sheet_index == 0 else wb.create_sheet()
+        ws.title = f"Inventory {sheet_index + 1}"
+        ws.append(["Application", "Vendor", "Users", "Annual Cost", "Notes"])
+        for i in range(rows):
+            ws.append([f"App {i}", rng.choice(WORDS).title(), rng.randint(5, 5000),
+                       rng.randint(1000, 900000), _sentence(rng, 8)])
+    wb.save(str(path))
+
+
+def make_docx(path: Path, rng: random.Random, paragraphs: int) -> None:
+    from docx import Document
+
+    doc = Document()
+    doc.add_heading("IT Overview", level=1)
+    for _ in range(paragraphs):
+        doc.add_paragraph(" ".join(_sentence(rng) for _ in range(4)))
+    table = doc.add_table(rows=1, cols=3)
+    for row_index in range(paragraphs // 4):
+        cells = table.add_row().cells
+        cells[0].text, cells[1].text, cells[2].text = f"System {row_index}", rng.choice(WORDS), str(rng.randint(1, 99))
+    doc.save(str(path))
+
+
+def build_batch(root: Path, count: int, seed: int = 11) -> List[Path]:
+    """Write a deterministic mix of PDF/XLSX/DOCX files (roughly a third each)."""
+    rng = random.Random(seed)
+    files = []
+    for i in range(count):
+        kind = ("pdf", "xlsx", "docx")[i % 3]
+        path = root / f"doc_{i:03d}.{kind}"
+        if kind == "pdf":
+            make_pdf(path, rng, pages=rng.randint(10, 30))
+        elif kind == "xlsx":
+            make_xlsx(path, rng, rows=rng.randint(300, 900))
+        else:
+            make_docx(path, rng, paragraphs=rng.randint(80, 200))
+        files.append(path)
+    return files
+
+
+class BenchProcessor(DocumentProcessor):
+    """DocumentProcessor with analysis replaced by a fixed delay and no disk writes."""
+
+    def __init__(self, analysis_ms: int, **kwargs):
+        super().__init__(**kwargs)
+        self.analysis_seconds = analysis_ms / 1000
+
+    def _analyze_content(self, extraction, filename):
+        if self.analysis_seconds:
+            time.sleep(self.analysis_seconds)
+        return []
+
+    def save_pending_changes(self, output_dir: str = None) -> str:
+        return ""
+
+
+def run(files: List[Path], workers: int, processes: int, analysis_ms: int) -> Dict:
+    """Queue every file across three deals and time until the queue drains."""
+    processor = BenchProcessor(analysis_ms, workers=workers, parse_processes=processes)
+
+    start = time.perf_counter()
+    for i, path in enumerate(files):
+        processor.queue_document(f"DOC-{i:03d}", path.name, str(path),
+                                 ProcessingPriority.NORMAL, deal_id=f"deal-{i % 3}")
+    processor.start_worker()
+    while True:
+        stats = processor.get_queue_stats()
+        if stats["completed"] + stats["failed"] == len(files):
+            break
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    processor.stop_worker()
+
+    return {
+        "label": f"{workers} thread(s), {processes or 'no'} parse process(es)",
+        "elapsed": elapsed,
+        "docs_per_sec": len(files) / elapsed,
+        "failed": stats["failed"],
+        "wait": stats["wait_seconds"],
+        "processing": stats["processing_seconds"],
+    }
+
+
+def print_separator():
+    """Print separator line."""
+    print("=" * 80)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--docs", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--processes", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--analysis-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    print_separator()
+    print(f"Document Queue Benchmark ({args.docs} docs, {os.cpu_count()} CPUs, "
+          f"analysis {args.analysis_ms}ms/doc)")
+    print_separator()
+
+    root = Path(tempfile.mkdtemp(prefix="bench_docs_"))
+    try:
+        files = build_batch(root, args.docs)
+        total_mb = sum(p.stat().st_size for p in files) / 1e6
+        print(f"Generated {len(files)} files ({total_mb:.1f} MB) in {root}")
+
+        # Import the parsers and start the parsing processes before timing
+        samples = [str(p) for p in files[:3]]
+        for sample in samples:
+            ContentExtractor().extract(sample)
+        pool = get_parse_pool(args.processes)
+        if pool:
+            list(pool.map(_extract_document, samples * args.processes))
+
+        results = [
+            run(files, workers=1, processes=0, analysis_ms=args.analysis_ms),
+            run(files, workers=args.workers, processes=args.processes, analysis_ms=args.analysis_ms),
+        ]
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print()
+    print(f"{'Configuration':<38} {'Wall (s)':>9} {'Docs/s':>8} {'Wait avg/max (s)':>18} {'Proc avg (s)':>13}")
+    print("-" * 90)
+    for r in results:
+        print(f"{r['label']:<38} {r['elapsed']:>9.2f} {r['docs_per_sec']:>8.1f} "
+              f"{r['wait']['avg']:>8.2f}/{r['wait']['max']:<8.2f} {r['processing']['avg']:>13.3f}")
+        if r["failed"]:
+            print(f"  ({r['failed']} failed)")
+
+    print()
+    print(f"Speedup: {results[0]['elapsed'] / results[1]['elapsed']:.2f}x")
+    print_separator()
+
+
+if __name__ == "__main__":
+    main()
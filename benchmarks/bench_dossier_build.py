@@ -0,0 +1,116 @@
+"""
+Dossier Build Benchmark
+
+Times DossierBuilder.build_all_dossiers() for a synthetic application estate
+with the indexed related-finding and narrative lookups against a subclass
+that restores the previous per-item scans (list-equality membership checks
+and a title/description/sentence scan for every item).
+
+Usage:
+    python benchmarks/bench_dossier_build.py [item_count] [finding_count]
+
+Output:
+    - Build time and dossiers/sec for both lookups
+    - Speedup
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.inventory_dossier import AHOCORASICK_AVAILABLE, DossierBuilder
+
+
+class LegacyDossierBuilder(DossierBuilder):
+    """DossierBuilder with the original O(items x findings) lookups."""
+
+    def _find_related_findings(self, fact_ids, item_name):
+        related_risks, related_work_items, seen_ids = [], [], set()
+        for fact_id in fact_ids:
+            for finding in self.findings_by_fact_id.get(fact_id, []):
+                finding_id = finding.get('finding_id', finding.get('id', ''))
+                if finding_id and finding_id not in seen_ids:
+                    seen_ids.add(finding_id)
+                    if finding in self.risks:
+                        related_risks.append(finding)
+                    elif finding in self.work_items:
+                        related_work_items.append(finding)
+        item_lower = item_name.lower()
+        for findings, related in ((self.risks, related_risks), (self.work_items, related_work_items)):
+            for finding in findings:
+                finding_id = finding.get('finding_id', finding.get('id', ''))
+                if finding_id in seen_ids:
+                    continue
+                if item_lower in finding.get('title', '').lower() or item_lower in finding.get('description', '').lower():
+                    seen_ids.add(finding_id)
+                    related.append(finding)
+        return related_risks, related_work_items
+
+    def _extract_narrative_mentions(self, item_name, domain):
+        narrative = self.narratives.get(domain, '')
+        if not narrative or not item_name:
+            return []
+        item_lower = item_name.lower()
+        return [
+            s.strip() + '.' for s in narrative.replace('\n', ' ').split('.')
+            if item_lower in s.lower() and len(s.strip()) > 20
+        ][:3]
+
+
+def generate_estate(item_count: int, finding_count: int):
+    """Facts, findings and an applications narrative for a synthetic estate."""
+    names = [f"App{i:05d} Suite" for i in range(item_count)]
+    facts = [
+        {"fact_id": f"F-APP-{i:05d}", "domain": "applications", "entity": "target", "item": name,
+         "category": "saas", "details": {"vendor": f"Vendor {i % 50}", "user_count": str(i % 900)}}
+        for i, name in enumerate(names)
+    ]
+    risks, work_items = [], []
+    for i in range(finding_count):
+        subject = names[(i * 7) % item_count]
+        finding = {
+            "finding_id": f"F-{i:05d}",
+            "title": f"{subject} requires remediation",
+            "description": f"{subject} shares a tenant with the parent company and must be separated before TSA exit.",
+            "severity": "high" if i % 5 == 0 else "medium",
+            "based_on_facts": [f"F-APP-{(i * 13) % item_count:05d}"],
+        }
+        (risks if i % 2 == 0 else work_items).append(finding)
+    narrative = " ".join(
+        f"{names[i]} is used by the finance and operations teams for day-to-day work."
+        for i in range(0, item_count, 3)
+    )
+    return facts, {"risks": risks, "work_items": work_items}, {"applications": narrative}
+
+
+def time_build(cls, facts, findings, narratives) -> tuple:
+    start = time.perf_counter()
+    dossiers = cls(facts, findings, narratives).build_all_dossiers()
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(len(d) for d in dossiers.values())
+
+
+def main():
+    item_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    finding_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    facts, findings, narratives = generate_estate(item_count, finding_count)
+
+    print(f"Dossier build benchmark ({item_count} items, {finding_count} findings, "
+          f"aho-corasick={'yes' if AHOCORASICK_AVAILABLE else 'no'})")
+    print("=" * 60)
+
+    legacy_time, legacy_count = time_build(LegacyDossierBuilder, facts, findings, narratives)
+    indexed_time, indexed_count = time_build(DossierBuilder, facts, findings, narratives)
+    assert legacy_count == indexed_count
+
+    print(f"Legacy scans:   {legacy_time:8.2f}s  ({legacy_count / legacy_time:8.0f} dossiers/sec)")
+    print(f"Mention index:  {indexed_time:8.2f}s  ({indexed_count / indexed_time:8.0f} dossiers/sec)")
+    print(f"Speedup:        {legacy_time / indexed_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
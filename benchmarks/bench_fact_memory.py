@@ -0,0 +1,129 @@
+"""
+Memory Benchmark for Compact Fact Records
+
+Measures the per-record memory footprint and to_dict() cost of the slotted,
+interned Fact dataclass against a dict-backed replica of the previous layout
+(plain @dataclass, no interning, dataclasses.asdict serialization).
+
+Records are round-tripped through JSON before construction so that string
+fields are distinct objects, as they are when facts are loaded from disk or
+the database.
+
+Usage:
+    python benchmarks/bench_fact_memory.py [fact_count]
+
+Output:
+    - Bytes per fact (legacy vs compact) and the reduction
+    - to_dict() throughput for both layouts
+"""
+
+import dataclasses
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from stores.fact_store import Fact
+
+DOMAINS = ["infrastructure", "network", "cybersecurity", "applications", "identity_access", "organization"]
+CATEGORIES = ["hosting", "compute", "storage", "backup_dr", "cloud", "security", "saas", "erp"]
+
+
+def _legacy_fact_class():
+    """Build a non-slotted replica of Fact with the same fields and defaults."""
+    spec = []
+    for f in dataclasses.fields(Fact):
+        if f.default is not dataclasses.MISSING:
+            spec.append((f.name, f.type, dataclasses.field(default=f.default)))
+        elif f.default_factory is not dataclasses.MISSING:
+            spec.append((f.name, f.type, dataclasses.field(default_factory=f.default_factory)))
+        else:
+            spec.append((f.name, f.type))
+    return dataclasses.make_dataclass("LegacyFact", spec)
+
+
+def generate_fact_payloads(count: int):
+    """Fact constructor kwargs for count synthetic facts."""
+    payloads = []
+    for i in range(count):
+        payload = {
+            "fact_id": f"F-BENCH-{i:05d}",
+            "domain": DOMAINS[i % len(DOMAINS)],
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "item": f"System {i}",
+            "details": {"vendor": "Microsoft", "version": str(i % 12), "deployment": "on_prem"},
+            "status": "documented",
+            "evidence": {"exact_quote": f"System {i} runs on-premises", "source_section": "Infrastructure"},
+            "entity": "target",
+            "source_document": f"document_{i % 20}.pdf",
+            "deal_id": "deal-benchmark-0001",
+            "verification_status": "pending",
+        }
+        payloads.append(payload)
+    return payloads
+
+
+def measure_bytes_per_record(cls, payloads) -> float:
+    """Allocated bytes per constructed record, including its strings."""
+    encoded = json.dumps(payloads)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    payloads = json.loads(encoded)
+    records = [cls(**p) for p in payloads]
+    del payloads  # only what the records keep alive should count
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    per_record = allocated / len(records)
+    del records
+    return per_record
+
+
+def measure_to_dict(records, to_dict, rounds: int = 5) -> float:
+    """Best-of-N records per second for a serializer."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for record in records:
+            to_dict(record)
+        best = min(best, time.perf_counter() - start)
+    return len(records) / best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    LegacyFact = _legacy_fact_class()
+    payloads = generate_fact_payloads(count)
+
+    print(f"Fact memory benchmark ({count} facts)")
+    print("=" * 60)
+
+    legacy_bytes = measure_bytes_per_record(LegacyFact, payloads)
+    compact_bytes = measure_bytes_per_record(Fact, payloads)
+    print(f"Legacy  (dict-backed):     {legacy_bytes:8.0f} bytes/fact")
+    print(f"Compact (slots + intern):  {compact_bytes:8.0f} bytes/fact")
+    print(f"Reduction:                 {100 * (1 - compact_bytes / legacy_bytes):7.1f}%")
+    print()
+
+    legacy_records = [LegacyFact(**p) for p in payloads]
+    compact_records = [Fact(**p) for p in payloads]
+
+    def legacy_to_dict(record):
+        result = dataclasses.asdict(record)
+        result["review_priority"] = 0.0
+        return result
+
+    legacy_rate = measure_to_dict(legacy_records, legacy_to_dict)
+    compact_rate = measure_to_dict(compact_records, Fact.to_dict)
+    print(f"to_dict legacy (asdict):   {legacy_rate:10.0f} facts/sec")
+    print(f"to_dict compact:           {compact_rate:10.0f} facts/sec")
+    print(f"Speedup:                   {compact_rate / legacy_rate:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,14 @@
 P3 FIX #11: Performance Benchmark for Organization Bridge Lock Contention
 
 Measures throughput and latency of build_organization_from_facts() under
-concurrent load to quantify the performance impact of threading.RLock.
+concurrent load on a shared FactStore. Builds are planned from lock-free
+snapshots and memoized per organization-facts version, so after the first
+call repeated builds are served from the memo; pass --cold to clear the
+memo before every call and measure full builds.
 
 Usage:
     python benchmarks/bench_org_bridge_concurrency.py
+    python benchmarks/bench_org_bridge_concurrency.py --cold
 
 Output:
     - Calls/sec for 1, 5, 10, 20 threads
@@ -24,7 +28,7 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from stores.fact_store import FactStore
-from services.organization_bridge import build_organization_from_facts
+from services.organization_bridge import build_organization_from_facts, clear_organization_build_cache
 
 
 def setup_fact_store(fact_count: int = 50) -> FactStore:
@@ -47,8 +51,10 @@ def setup_fact_store(fact_count: int = 50) -> FactStore:
     return fact_store
 
 
-def benchmark_single_call(fact_store: FactStore) -> float:
+def benchmark_single_call(fact_store: FactStore, cold: bool = False) -> float:
     """Benchmark a single call and return duration in seconds."""
+    if cold:
+        clear_organization_build_cache()
     start = time.perf_counter()
     store, status = build_organization_from_facts(
         fact_store,
@@ -63,7 +69,8 @@ def benchmark_single_call(fact_store: FactStore) -> float:
 def benchmark_concurrent_calls(
     fact_store: FactStore,
     num_threads: int,
-    calls_per_thread: int = 10
+    calls_per_thread: int = 10,
+    cold: bool = False
 ) -> dict:
     """
     Benchmark concurrent calls with specified thread count.
@@ -77,7 +84,7 @@ def benchmark_concurrent_calls(
         """Each worker makes multiple calls and records latencies."""
         task_latencies = []
         for _ in range(calls_per_thread):
-            lat = benchmark_single_call(fact_store)
+            lat = benchmark_single_call(fact_store, cold=cold)
             task_latencies.append(lat)
         return task_latencies
 
@@ -140,8 +147,10 @@ def print_metrics(metrics: dict):
 
 def main():
     """Run benchmark suite."""
+    cold = "--cold" in sys.argv[1:]
+
     print_separator()
-    print("Organization Bridge Concurrency Benchmark")
+    print(f"Organization Bridge Concurrency Benchmark ({'cold builds' if cold else 'memoized builds'})")
     print_separator()
     print()
 
@@ -154,7 +163,7 @@ def main():
     # Warmup
     print("Warming up (5 calls)...")
     for _ in range(5):
-        benchmark_single_call(fact_store)
+        benchmark_single_call(fact_store, cold=cold)
     print("✓ Warmup complete")
     print()
 
@@ -170,7 +179,8 @@ def main():
         metrics = benchmark_concurrent_calls(
             fact_store,
             num_threads=num_threads,
-            calls_per_thread=10
+            calls_per_thread=10,
+            cold=cold
         )
         results.append(metrics)
 
@@ -226,9 +236,9 @@ def main():
 
     if scalability < 10:
         print("RECOMMENDATIONS:")
-        print("- Consider using per-request FactStore instances instead of shared")
-        print("- Lock is coarse-grained (entire FactStore modification)")
-        print("- For high-concurrency deployments, use connection pooling with separate stores")
+        print("- Builds hold no lock while planning; remaining contention is the GIL")
+        print("- For CPU-bound concurrency, scale out with worker processes")
+        print("- Check the memo is being hit (run without --cold) for repeated dashboard requests")
     else:
         print("RECOMMENDATIONS:")
         print("- Current lock implementation is performant for expected load")
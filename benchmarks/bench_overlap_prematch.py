@@ -0,0 +1,151 @@
+"""
+Benchmark for Overlap Pre-Matching
+
+Compares the legacy overlap generation (one prompt per domain with both full
+inventories, domains run serially) with local pre-matching (exact matches
+accepted without the LLM, ambiguous candidate pairs sent in concurrent
+batches) over synthetic target/buyer inventories.
+
+The model is simulated: each call sleeps for a fixed latency plus a per-1k
+prompt character cost, and returns no overlaps, so the numbers reflect
+prompt volume and scheduling rather than model quality. The legacy prompt
+grows with the inventories (and its single reply is capped at max_tokens);
+pre-matched prompts stay bounded by OVERLAP_LLM_BATCH_PAIRS.
+
+Usage:
+    python benchmarks/bench_overlap_prematch.py [facts_per_side_per_domain]
+
+Output:
+    - LLM calls, total and largest prompt characters, simulated wall time
+    - Overlaps accepted from exact matches without the LLM
+    - Pairs scored locally vs the full cross product
+"""
+
+import contextlib
+import io
+import json
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.overlap_generator import OverlapGenerator
+
+from tools_v2.discovery_tools import DOMAIN_CATEGORIES
+
+# Shared platform catalog: both sides draw some facts from it (alignment / version gaps)
+PLATFORMS = [("Microsoft", "Exchange Online"), ("Microsoft", "Active Directory"), ("Oracle", "E-Business Suite"),
+             ("SAP", "S/4HANA"), ("Cisco", "Meraki"), ("Palo Alto", "Prisma Access"), ("VMware", "vSphere"),
+             ("Okta", "Workforce Identity"), ("ServiceNow", "ITSM"), ("Salesforce", "Sales Cloud"),
+             ("Dell", "PowerEdge"), ("CrowdStrike", "Falcon"), ("Veeam", "Backup & Replication"),
+             ("Workday", "HCM"), ("Splunk", "Enterprise Security"), ("Fortinet", "FortiGate")]
+VENDORS = sorted({vendor for vendor, _ in PLATFORMS})
+SHARED_FRACTION = 0.2
+
+CALL_LATENCY = 0.05       # Seconds per simulated LLM call
+LATENCY_PER_1K_CHARS = 0.002
+
+
+class SimulatedMessages:
+    """Stands in for client.messages; records calls and prompt sizes."""
+
+    def __init__(self):
+        self.calls = 0
+        self.prompt_chars = 0
+        self.largest_prompt = 0
+        self._lock = threading.Lock()
+
+    def create(self, messages, **kwargs):
+        prompt = messages[0]["content"]
+        with self._lock:
+            self.calls += 1
+            self.prompt_chars += len(prompt)
+            self.largest_prompt = max(self.largest_prompt, len(prompt))
+        time.sleep(CALL_LATENCY + LATENCY_PER_1K_CHARS * len(prompt) / 1000)
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps([]))])
+
+
+def generate_inventories(per_side: int, seed: int = 11):
+    """
+    facts_by_domain with per_side target and buyer facts per domain.
+
+    About SHARED_FRACTION of each side are catalog platforms (some on both
+    sides, in different versions); the rest are entity-specific systems.
+    """
+    rng = random.Random(seed)
+    facts_by_domain = {}
+    for domain, categories in DOMAIN_CATEGORIES.items():
+        prefix = domain[:3].upper()
+        sides = {"target": [], "buyer": []}
+        for entity, tag in (("target", "TGT"), ("buyer", "BYR")):
+            for i in range(per_side):
+                category = rng.choice(categories)
+                if rng.random() < SHARED_FRACTION:
+                    vendor, product = rng.choice(PLATFORMS)
+                    name = f"{vendor} {product}"
+                else:
+                    vendor = rng.choice(VENDORS) if rng.random() < 0.5 else ""
+                    name = f"{entity.title()} system {tag}{i:04d}"
+                details = {"version": f"{rng.randint(1, 12)}.{rng.randint(0, 9)}", "users": str(rng.randint(10, 5000))}
+                if vendor:
+                    details["vendor"] = vendor
+                sides[entity].append({
+                    "fact_id": f"F-{tag}-{prefix}-{i + 1:03d}",
+                    "item": name,
+                    "category": category,
+                    "statement": f"{name} is in production",
+                    "details": details,
+                })
+        facts_by_domain[domain] = sides
+    return facts_by_domain
+
+
+def run(facts_by_domain, prematch: bool):
+    messages = SimulatedMessages()
+    generator = OverlapGenerator(anthropic_client=SimpleNamespace(messages=messages), prematch=prematch)
+    start = time.perf_counter()
+    overlaps = generator.generate_overlap_map_all_domains(facts_by_domain)
+    elapsed = time.perf_counter() - start
+    return {
+        "calls": messages.calls,
+        "prompt_chars": messages.prompt_chars,
+        "largest_prompt": messages.largest_prompt,
+        "seconds": elapsed,
+        "auto_overlaps": sum(len(o) for o in overlaps.values()),
+        "stats": generator.prematch_stats,
+    }
+
+
+def main():
+    per_side = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    facts_by_domain = generate_inventories(per_side)
+
+    # Suppress the generator's per-domain progress output
+    with contextlib.redirect_stdout(io.StringIO()):
+        legacy = run(facts_by_domain, prematch=False)
+        prematched = run(facts_by_domain, prematch=True)
+
+    scored = sum(s["pairs_scored"] for s in prematched["stats"].values())
+    cross = sum(s["cross_product"] for s in prematched["stats"].values())
+
+    print(f"Overlap pre-matching benchmark ({per_side} target + {per_side} buyer facts x {len(DOMAIN_CATEGORIES)} domains)")
+    print("=" * 70)
+    print(f"{'':24}{'legacy':>14}{'pre-matched':>16}")
+    print(f"{'LLM calls':24}{legacy['calls']:>14}{prematched['calls']:>16}")
+    print(f"{'Prompt characters':24}{legacy['prompt_chars']:>14,}{prematched['prompt_chars']:>16,}")
+    print(f"{'Largest prompt':24}{legacy['largest_prompt']:>14,}{prematched['largest_prompt']:>16,}")
+    print(f"{'Simulated wall time (s)':24}{legacy['seconds']:>14.2f}{prematched['seconds']:>16.2f}")
+    print()
+    print(f"Overlaps accepted without LLM: {prematched['auto_overlaps']}")
+    print(f"Candidate pairs sent to LLM: {sum(s['candidate_pairs'] for s in prematched['stats'].values()):,}")
+    print(f"Pairs scored locally: {scored:,} of {cross:,} ({100 * scored / max(cross, 1):.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
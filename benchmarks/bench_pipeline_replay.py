@@ -0,0 +1,202 @@
+"""
+End-to-End Pipeline Replay Benchmark
+
+Runs discovery, reasoning, coverage, synthesis, output save and database
+persistence over synthetic VDR corpora of increasing size, with the
+Anthropic client replaced by the offline replay client. Model calls cost
+only the configured latency, so the numbers measure the pipeline itself
+and are reproducible run to run.
+
+Each corpus runs in its own subprocess so peak RSS is per corpus.
+
+Usage:
+    python benchmarks/bench_pipeline_replay.py [size ...] [--latency S] [--jitter S] [--seed N]
+
+    Sizes default to small, medium and large (see synthetic_vdr.CORPUS_SIZES).
+    Corpora are generated under test_docs/synthetic_vdr/ on first use.
+
+Output:
+    - Wall time and per-phase time for each corpus
+    - Peak RSS, model calls, facts/sec and DB rows/sec
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Agents refuse to start without a key; the replay client never uses it
+os.environ.setdefault("ANTHROPIC_API_KEY", "replay-offline")
+
+from benchmarks.synthetic_vdr import CORPUS_SIZES, ensure_corpus
+
+PHASES = ["load", "discovery", "reasoning", "merge", "coverage", "synthesis", "save", "db_persist"]
+DEAL_ID = "bench-replay"
+
+
+@contextmanager
+def _timed(phases: Dict[str, float], name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def run_pipeline(corpus_dir: Path, latency: float, jitter: float, seed: int) -> Dict:
+    """Run the pipeline once over corpus_dir and return timings and counts."""
+    import config_v2
+    import main_v2
+    from flask import Flask
+    from benchmarks.replay_client import ReplayAnthropicClient, load_transcripts, replay_anthropic
+    from stores.fact_store import FactStore
+    from stores.inventory_store import InventoryStore
+    from tools_v2.rate_limiter import APIRateLimiter
+    from web.analysis_runner import persist_to_database
+    from web.database import db, Deal
+
+    domains = list(main_v2.DISCOVERY_AGENTS)
+    phases: Dict[str, float] = {}
+
+    # Replayed calls are local; the per-minute limiter would only add sleeps
+    APIRateLimiter.reset_instance()
+    APIRateLimiter._instance = APIRateLimiter(max_concurrent=config_v2.API_RATE_LIMIT_SEMAPHORE_SIZE,
+                                              requests_per_minute=1_000_000)
+    client = ReplayAnthropicClient(load_transcripts(corpus_dir / "transcripts"),
+                                   latency=latency, jitter=jitter, seed=seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        config_v2.OUTPUT_DIR = tmp_dir  # discovery audit logs
+        start = time.perf_counter()
+
+        with replay_anthropic(client), redirect_stdout(io.StringIO()):
+            with _timed(phases, "load"):
+                docs = main_v2.load_documents_by_entity(corpus_dir / "documents")
+
+            with _timed(phases, "discovery"):
+                fact_store = FactStore(deal_id=DEAL_ID)
+                inventory_store = InventoryStore(deal_id=DEAL_ID)
+                for domain in domains:
+                    main_v2.run_discovery(
+                        document_text=docs["target"],
+                        domain=domain,
+                        fact_store=fact_store,
+                        target_name="Synthetic Target",
+                        deal_id=DEAL_ID,
+                        inventory_store=inventory_store,
+                    )
+
+            with _timed(phases, "reasoning"):
+                reasoning_results = {domain: main_v2.run_reasoning(fact_store, domain) for domain in domains}
+
+            with _timed(phases, "merge"):
+                reasoning_store = main_v2.merge_reasoning_stores(fact_store, reasoning_results)
+
+            with _timed(phases, "coverage"):
+                main_v2.run_coverage_analysis(fact_store)
+
+            with _timed(phases, "synthesis"):
+                main_v2.run_synthesis(fact_store, reasoning_store)
+
+            with _timed(phases, "save"):
+                fact_store.save(str(tmp_dir / "facts.json"))
+                reasoning_store.save(str(tmp_dir / "findings.json"))
+
+            app = Flask(__name__)
+            app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_dir / 'bench.db'}"
+            app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+            db.init_app(app)
+            with app.app_context():
+                db.create_all()
+                db.session.add(Deal(id=DEAL_ID, name="Replay", target_name="Synthetic Target"))
+                db.session.commit()
+                with _timed(phases, "db_persist"):
+                    persisted = persist_to_database(
+                        SimpleNamespace(fact_store=fact_store, reasoning_store=reasoning_store),
+                        DEAL_ID, "bench",
+                    )
+                db.session.remove()
+
+        wall = time.perf_counter() - start
+
+    db_rows = persisted["facts_count"] + persisted["findings_count"] + persisted.get("gaps_count", 0) + 1
+    return {
+        "wall": wall,
+        "phases": phases,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "model_calls": client.calls,
+        "facts": len(fact_store.facts),
+        "findings": len(reasoning_store.risks) + len(reasoning_store.work_items),
+        "db_rows": db_rows,
+        "db_rows_per_sec": db_rows / phases["db_persist"] if phases["db_persist"] else 0.0,
+        "facts_per_sec": len(fact_store.facts) / wall if wall else 0.0,
+    }
+
+
+def run_in_subprocess(size: str, args) -> Dict:
+    """Run one corpus in a fresh interpreter so ru_maxrss is not shared."""
+    command = [
+        sys.executable, __file__, "--child", size,
+        "--latency", str(args.latency), "--jitter", str(args.jitter), "--seed", str(args.seed),
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True, cwd=PROJECT_ROOT)
+    if completed.returncode != 0:
+        raise RuntimeError(f"{size} run failed:\n{completed.stderr[-2000:]}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end pipeline replay benchmark")
+    parser.add_argument("sizes", nargs="*", help=f"Corpus sizes ({', '.join(CORPUS_SIZES)})")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per replayed model call")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Max extra random seconds per call")
+    parser.add_argument("--seed", type=int, default=0, help="Jitter seed")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    args.sizes = args.sizes or list(CORPUS_SIZES)
+    unknown = [size for size in args.sizes if size not in CORPUS_SIZES]
+    if unknown:
+        parser.error(f"unknown corpus size(s): {', '.join(unknown)}")
+
+    if args.child:
+        logging.basicConfig(level=logging.ERROR)
+        result = run_pipeline(ensure_corpus(args.child), args.latency, args.jitter, args.seed)
+        print(json.dumps(result))
+        return
+
+    print(f"Pipeline replay benchmark (latency={args.latency}s, jitter={args.jitter}s, seed={args.seed})")
+    print("=" * 100)
+    header = f"{'corpus':8s} {'wall':>8s} " + " ".join(f"{p:>10s}" for p in PHASES)
+    print(header)
+    results = {}
+    for size in args.sizes:
+        ensure_corpus(size)
+        results[size] = result = run_in_subprocess(size, args)
+        print(f"{size:8s} {result['wall']:7.2f}s " +
+              " ".join(f"{result['phases'].get(p, 0.0):9.3f}s" for p in PHASES))
+
+    print()
+    print(f"{'corpus':8s} {'facts':>7s} {'findings':>9s} {'calls':>6s} {'peak RSS':>10s} "
+          f"{'facts/sec':>10s} {'DB rows/sec':>12s}")
+    for size, result in results.items():
+        print(f"{size:8s} {result['facts']:7d} {result['findings']:9d} {result['model_calls']:6d} "
+              f"{result['peak_rss_mb']:8.1f}MB {result['facts_per_sec']:10.1f} {result['db_rows_per_sec']:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
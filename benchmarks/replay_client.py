@@ -0,0 +1,304 @@
+"""
+Replay Anthropic Client
+
+A local stand-in for anthropic.Anthropic that lets the full pipeline run
+offline and deterministically:
+
+- Discovery calls replay recorded tool-use transcripts (the JSON written
+  next to each DiscoveryLogger .md log, or generated by synthetic_vdr.py),
+  one recorded iteration per model call, then complete_discovery.
+- Reasoning calls synthesize identify_risk / create_work_item calls that
+  cite the fact IDs injected into the system prompt, then complete_reasoning.
+- Anything else gets a short end_turn text reply.
+
+Each call sleeps for a configurable latency (plus seeded jitter) so the
+harness can model API round-trips without a network.
+
+Usage:
+    from benchmarks.replay_client import ReplayAnthropicClient, load_transcripts, replay_anthropic
+
+    client = ReplayAnthropicClient(load_transcripts(Path("output/logs")), latency=0.05)
+    with replay_anthropic(client):
+        run_discovery(...)
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# (domain, entity) -> recorded iterations, each a list of {tool_name, tool_input}
+Transcripts = Dict[Tuple[str, str], List[List[Dict[str, Any]]]]
+
+DISCOVERY_TASK_PATTERN = re.compile(r"Extract all (\w+) information from the document above")
+REASONING_TASK_PATTERN = re.compile(r"signal completion of the (\w+) domain")
+FACT_ID_PATTERN = re.compile(r"\*\*(F-[A-Z]+-[A-Z]+-\d+)\*\*")
+
+FACTS_PER_FINDING = 3
+CHARS_PER_TOKEN = 4
+
+
+# =============================================================================
+# RESPONSE OBJECTS (attribute-compatible with anthropic.types.Message)
+# =============================================================================
+
+@dataclass
+class ReplayBlock:
+    type: str
+    text: str = ""
+    id: str = ""
+    name: str = ""
+    input: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ReplayUsage:
+    input_tokens: int
+    output_tokens: int
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+
+@dataclass
+class ReplayMessage:
+    id: str
+    model: str
+    content: List[ReplayBlock]
+    stop_reason: str
+    usage: ReplayUsage
+    role: str = "assistant"
+    type: str = "message"
+
+
+# =============================================================================
+# TRANSCRIPTS
+# =============================================================================
+
+def load_transcripts(paths: Iterable[Path]) -> Transcripts:
+    """
+    Load discovery transcripts from JSON files and/or directories of them.
+
+    Later transcripts for the same (domain, entity) are appended after
+    earlier ones, matching the order documents were processed in.
+    """
+    transcripts: Transcripts = {}
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+
+    files: List[Path] = []
+    for path in map(Path, paths):
+        files.extend(sorted(path.glob("*.json")) if path.is_dir() else [path])
+
+    for file in files:
+        with open(file) as f:
+            data = json.load(f)
+        if "iterations" not in data or "domain" not in data:
+            continue
+        key = (data["domain"], data.get("entity", "target"))
+        transcripts.setdefault(key, []).extend(
+            [
+                {"tool_name": call["tool_name"], "tool_input": call["tool_input"]}
+                for call in iteration["tool_calls"]
+            ]
+            for iteration in data["iterations"]
+        )
+    return transcripts
+
+
+def _text_of(content: Any) -> str:
+    """Flatten message or system content (str or list of blocks) to text."""
+    if isinstance(content, str):
+        return content
+    parts = []
+    for block in content or []:
+        if isinstance(block, dict):
+            parts.append(block.get("text", ""))
+        else:
+            parts.append(getattr(block, "text", ""))
+    return "\n".join(parts)
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+class _ReplayMessages:
+    def __init__(self, client: "ReplayAnthropicClient"):
+        self._client = client
+
+    def create(self, **kwargs) -> ReplayMessage:
+        return self._client.respond(**kwargs)
+
+
+class ReplayAnthropicClient:
+    """
+    Deterministic, offline replacement for anthropic.Anthropic.
+
+    Responses depend only on the request (the task in the first user
+    message and how many assistant turns it already holds), so one client
+    can serve any number of agents, including concurrently.
+    """
+
+    def __init__(
+        self,
+        transcripts: Optional[Transcripts] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int = 0,
+        findings_per_call: int = 4,
+        max_findings: int = 24,
+    ):
+        """
+        Args:
+            transcripts: Recorded discovery iterations keyed by (domain, entity)
+            latency: Seconds each call sleeps before responding
+            jitter: Extra uniform random delay of up to this many seconds
+            seed: Seed for the jitter (same seed, same delays)
+            findings_per_call: Reasoning findings emitted per model call
+            max_findings: Upper bound on reasoning findings per domain
+        """
+        self.transcripts = transcripts or {}
+        self.latency = latency
+        self.jitter = jitter
+        self.findings_per_call = findings_per_call
+        self.max_findings = max_findings
+        self.messages = _ReplayMessages(self)
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.calls_by_kind: Dict[str, int] = {}
+
+    def respond(self, **kwargs) -> ReplayMessage:
+        messages = kwargs.get("messages", [])
+        task = _text_of(messages[0]["content"]) if messages else ""
+        turn = sum(1 for m in messages if m.get("role") == "assistant")
+
+        discovery = DISCOVERY_TASK_PATTERN.search(task)
+        reasoning = REASONING_TASK_PATTERN.search(task)
+        if discovery:
+            kind = "discovery"
+            entity = "buyer" if "**BUYER COMPANY**" in task else "target"
+            blocks = self._discovery_blocks(discovery.group(1), entity, turn)
+        elif reasoning:
+            kind = "reasoning"
+            system = _text_of(kwargs.get("system", ""))
+            blocks = self._reasoning_blocks(reasoning.group(1), system, turn)
+        else:
+            kind = "other"
+            blocks = [ReplayBlock(type="text", text="Replay client: no recorded response for this request.")]
+
+        with self._lock:
+            self.calls += 1
+            self.calls_by_kind[kind] = self.calls_by_kind.get(kind, 0) + 1
+            call_number = self.calls
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        for index, block in enumerate(blocks):
+            if block.type == "tool_use":
+                block.id = f"toolu_replay_{call_number:06d}_{index:02d}"
+
+        prompt_chars = len(_text_of(kwargs.get("system", ""))) + sum(
+            len(_text_of(m.get("content"))) for m in messages
+        )
+        output_chars = sum(len(json.dumps(b.input)) + len(b.text) for b in blocks)
+        return ReplayMessage(
+            id=f"msg_replay_{call_number:06d}",
+            model=kwargs.get("model", "replay"),
+            content=blocks,
+            stop_reason="tool_use" if any(b.type == "tool_use" for b in blocks) else "end_turn",
+            usage=ReplayUsage(
+                input_tokens=prompt_chars // CHARS_PER_TOKEN,
+                output_tokens=output_chars // CHARS_PER_TOKEN,
+            ),
+        )
+
+    # -------------------------------------------------------------------------
+    # Discovery
+    # -------------------------------------------------------------------------
+
+    def _discovery_blocks(self, domain: str, entity: str, turn: int) -> List[ReplayBlock]:
+        iterations = self.transcripts.get((domain, entity), [])
+        if turn < len(iterations) and iterations[turn]:
+            return [
+                ReplayBlock(type="tool_use", name=call["tool_name"], input=dict(call["tool_input"]))
+                for call in iterations[turn]
+            ]
+        return [ReplayBlock(type="tool_use", name="complete_discovery", input={
+            "domain": domain,
+            "categories_covered": [],
+            "summary": f"Replayed {len(iterations)} recorded iterations.",
+        })]
+
+    # -------------------------------------------------------------------------
+    # Reasoning
+    # -------------------------------------------------------------------------
+
+    def _reasoning_blocks(self, domain: str, system: str, turn: int) -> List[ReplayBlock]:
+        fact_ids = list(dict.fromkeys(FACT_ID_PATTERN.findall(system)))
+        groups = [fact_ids[i:i + FACTS_PER_FINDING] for i in range(0, len(fact_ids), FACTS_PER_FINDING)]
+        groups = groups[:self.max_findings]
+
+        start = turn * self.findings_per_call
+        batch = groups[start:start + self.findings_per_call]
+        if not batch:
+            return [ReplayBlock(type="tool_use", name="complete_reasoning", input={
+                "domain": domain,
+                "facts_analyzed": len(fact_ids),
+                "summary": f"Replayed {len(groups)} findings.",
+            })]
+        return [
+            self._finding_block(domain, start + offset, facts)
+            for offset, facts in enumerate(batch)
+        ]
+
+    @staticmethod
+    def _finding_block(domain: str, number: int, facts: List[str]) -> ReplayBlock:
+        common = {
+            "domain": domain,
+            "description": f"Replayed finding {number + 1} covering {', '.join(facts)}.",
+            "confidence": "medium",
+            "reasoning": "Synthesized by the replay client from the cited facts.",
+            "mna_lens": "separation_complexity",
+            "mna_implication": "Separation effort scales with the cited systems.",
+        }
+        if number % 2 == 0:
+            return ReplayBlock(type="tool_use", name="identify_risk", input={
+                **common,
+                "title": f"{domain.replace('_', ' ').title()} risk {number + 1}",
+                "category": "integration",
+                "severity": ("high", "medium", "low")[number % 3],
+                "integration_dependent": bool(number % 4),
+                "mitigation": "Plan remediation before TSA exit.",
+                "based_on_facts": facts,
+            })
+        return ReplayBlock(type="tool_use", name="create_work_item", input={
+            **common,
+            "title": f"{domain.replace('_', ' ').title()} work item {number + 1}",
+            "phase": ("Day_1", "Day_100", "Post_100")[number % 3],
+            "priority": ("high", "medium", "low")[number % 3],
+            "owner_type": "buyer",
+            "cost_estimate": "25k_to_100k",
+            "triggered_by": facts,
+            "target_action": "Provide configuration exports for the cited systems.",
+        })
+
+
+@contextmanager
+def replay_anthropic(client: ReplayAnthropicClient) -> Iterator[ReplayAnthropicClient]:
+    """Make every anthropic.Anthropic(...) constructed inside the block return client."""
+    import anthropic
+
+    original = anthropic.Anthropic
+    anthropic.Anthropic = lambda *args, **kwargs: client
+    try:
+        yield client
+    finally:
+        anthropic.Anthropic = original
@@ -0,0 +1,169 @@
+"""
+Synthetic VDR Corpora
+
+Generates deterministic virtual data room corpora of increasing size for the
+end-to-end pipeline benchmark, together with the discovery transcripts the
+replay client plays back for them.
+
+Each corpus has one target document per domain. Every document carries prose
+(one sentence per item, which the replayed transcript extracts) and the
+applications document also carries an inventory table, which the
+deterministic parser extracts without any model call.
+
+Layout:
+    test_docs/synthetic_vdr/<size>/documents/target_<domain>.md
+    test_docs/synthetic_vdr/<size>/transcripts/<domain>_target.json
+
+Usage:
+    python benchmarks/synthetic_vdr.py [size ...]
+
+Output:
+    - Path and item count of each generated corpus
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools_v2.discovery_logger import TRANSCRIPT_VERSION
+from tools_v2.discovery_tools import DOMAIN_CATEGORIES
+
+SYNTHETIC_VDR_DIR = PROJECT_ROOT / "test_docs" / "synthetic_vdr"
+
+# Items per domain in each corpus (prose items; applications add as many table rows)
+CORPUS_SIZES = {
+    "small": 10,
+    "medium": 50,
+    "large": 200,
+}
+
+CALLS_PER_ITERATION = 8
+
+VENDORS = ["Microsoft", "Oracle", "SAP", "Cisco", "Palo Alto", "VMware", "Okta", "ServiceNow", "Salesforce", "Dell"]
+SITES = ["Dallas", "Chicago", "Atlanta", "Denver", "Phoenix", "Boston"]
+CRITICALITY = ["Critical", "High", "Medium", "Low"]
+
+
+def _item_name(domain: str, index: int) -> str:
+    prefix = "".join(part[0] for part in domain.split("_")).upper()
+    return f"{prefix} System {index:04d}"
+
+
+def _item_sentence(rng: random.Random, name: str, category: str) -> str:
+    return (
+        f"{name} is the {category.replace('_', ' ')} platform supplied by {rng.choice(VENDORS)}, "
+        f"hosted in {rng.choice(SITES)} and supporting {rng.randint(20, 2000)} users."
+    )
+
+
+def generate_corpus(size: str, items_per_domain: int, root: Path = SYNTHETIC_VDR_DIR, seed: int = 7) -> Path:
+    """
+    Write one corpus and its transcripts, returning the corpus directory.
+
+    Output is a pure function of (items_per_domain, seed), so regenerating
+    a corpus reproduces it byte for byte.
+    """
+    rng = random.Random(seed)
+    corpus_dir = root / size
+    documents_dir = corpus_dir / "documents"
+    transcripts_dir = corpus_dir / "transcripts"
+    documents_dir.mkdir(parents=True, exist_ok=True)
+    transcripts_dir.mkdir(parents=True, exist_ok=True)
+
+    for domain, categories in DOMAIN_CATEGORIES.items():
+        document_name = f"target_{domain}.md"
+        lines = [f"# Target Company {domain.replace('_', ' ').title()} Overview", ""]
+        calls: List[Dict] = []
+
+        lines += ["## Environment Narrative", ""]
+        for i in range(items_per_domain):
+            name = _item_name(domain, i)
+            category = categories[i % len(categories)]
+            sentence = _item_sentence(rng, name, category)
+            lines.append(sentence)
+            calls.append({
+                "tool_name": "create_inventory_entry",
+                "tool_input": {
+                    "domain": domain,
+                    "category": category,
+                    "item": name,
+                    "entity": "target",
+                    "status": "documented",
+                    "details": {"vendor": sentence.split("supplied by ")[1].split(",")[0]},
+                    "evidence": {"exact_quote": sentence, "source_section": "Environment Narrative"},
+                    "source_document": document_name,
+                },
+            })
+        lines.append("")
+
+        if domain == "applications":
+            lines += [
+                "## Target Company Application Inventory", "",
+                "| Application | Vendor | Category | Version | Users | Criticality |",
+                "|---|---|---|---|---|---|",
+            ]
+            for i in range(items_per_domain):
+                lines.append(
+                    f"| Table App {i:04d} | {rng.choice(VENDORS)} | {categories[i % len(categories)]} | "
+                    f"{rng.randint(1, 12)}.{rng.randint(0, 9)} | {rng.randint(10, 5000)} | {rng.choice(CRITICALITY)} |"
+                )
+            lines.append("")
+
+        calls.append({
+            "tool_name": "flag_gap",
+            "tool_input": {
+                "domain": domain,
+                "category": categories[-1],
+                "description": f"No {categories[-1].replace('_', ' ')} documentation provided for {domain}",
+                "importance": "medium",
+                "entity": "target",
+            },
+        })
+
+        (documents_dir / document_name).write_text("\n".join(lines))
+
+        iterations = [
+            {
+                "iteration": number + 1,
+                "tool_calls": [dict(call, result={}) for call in calls[start:start + CALLS_PER_ITERATION]],
+            }
+            for number, start in enumerate(range(0, len(calls), CALLS_PER_ITERATION))
+        ]
+        transcript = {
+            "transcript_version": TRANSCRIPT_VERSION,
+            "domain": domain,
+            "entity": "target",
+            "document_name": document_name,
+            "document_length": sum(len(line) + 1 for line in lines),
+            "timestamp": "synthetic",
+            "iterations": iterations,
+        }
+        with open(transcripts_dir / f"{domain}_target.json", "w") as f:
+            json.dump(transcript, f, indent=2)
+
+    return corpus_dir
+
+
+def ensure_corpus(size: str, root: Path = SYNTHETIC_VDR_DIR) -> Path:
+    """Return the corpus directory for size, generating it on first use."""
+    corpus_dir = root / size
+    if not (corpus_dir / "transcripts").is_dir():
+        generate_corpus(size, CORPUS_SIZES[size], root=root)
+    return corpus_dir
+
+
+def main():
+    sizes = sys.argv[1:] or list(CORPUS_SIZES)
+    for size in sizes:
+        corpus_dir = generate_corpus(size, CORPUS_SIZES[size])
+        print(f"{size:8s} {CORPUS_SIZES[size] * len(DOMAIN_CATEGORIES):6d} prose items  -> {corpus_dir}")
+
+
+if __name__ == "__main__":
+    main()
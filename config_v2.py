@@ -52,6 +52,27 @@ MODEL_OUTPUT_CAPS = {
 DISCOVERY_MAX_ITERATIONS = 30  # Safety limit - agent should call complete_discovery before this
 REASONING_MAX_ITERATIONS = 60   # Reasoning needs fewer but still generous
 
+# Agent tool loops: old tool turns are compacted into an ID ledger once the
+# conversation history passes this many (estimated) tokens - see tools_v2/conversation_manager.py
+CONVERSATION_COMPACT_TOKENS = int(os.getenv('CONVERSATION_COMPACT_TOKENS', '30000'))
+CONVERSATION_KEEP_RECENT_TURNS = int(os.getenv('CONVERSATION_KEEP_RECENT_TURNS', '4'))
+
+# Chunked (map-reduce) discovery for oversized documents: documents whose
+# estimated token count exceeds the threshold are split with the table-aware
+# chunker and discovered chunk by chunk, then duplicate facts are merged
+DISCOVERY_CHUNK_THRESHOLD_TOKENS = int(os.getenv('DISCOVERY_CHUNK_THRESHOLD_TOKENS', '60000'))
+DISCOVERY_CHUNK_SIZE_TOKENS = int(os.getenv('DISCOVERY_CHUNK_SIZE_TOKENS', '20000'))
+DISCOVERY_CHUNK_OVERLAP_CHARS = int(os.getenv('DISCOVERY_CHUNK_OVERLAP_CHARS', '1000'))
+DISCOVERY_CHUNK_CONCURRENCY = int(os.getenv('DISCOVERY_CHUNK_CONCURRENCY', '3'))  # Also bounded by the API rate limiter
+
+# Overlap generation (Phase 3.5): target/buyer facts are pre-matched locally
+# (name/vendor/category blocking + similarity); exact matches are accepted
+# without the LLM and only ambiguous candidate pairs are sent, in batches
+OVERLAP_PREMATCH_ENABLED = os.getenv('OVERLAP_PREMATCH_ENABLED', 'true').lower() == 'true'
+OVERLAP_LLM_BATCH_PAIRS = int(os.getenv('OVERLAP_LLM_BATCH_PAIRS', '30'))  # Candidate pairs per LLM call (keeps the JSON reply within max_tokens)
+OVERLAP_CANDIDATES_PER_FACT = int(os.getenv('OVERLAP_CANDIDATES_PER_FACT', '2'))  # Best buyer candidates kept per target fact
+OVERLAP_MAX_CONCURRENCY = int(os.getenv('OVERLAP_MAX_CONCURRENCY', '4'))  # Concurrent overlap LLM calls across domains
+
 # Temperature - SET TO 0 FOR DETERMINISTIC OUTPUT
 # This is critical for consistency between runs
 DISCOVERY_TEMPERATURE = 0.0  # Zero for fully deterministic extraction
@@ -93,6 +114,22 @@ AUTHORITY_FOLDERS = {
     3: "notes"             # Lowest authority - discussion notes
 }
 
+# Uploads are streamed to disk in chunks (hashed in the same pass), but
+# parsing still loads each document's full text into memory, so keep the
+# per-request limit modest
+MAX_UPLOAD_SIZE_MB = int(os.getenv('MAX_UPLOAD_SIZE_MB', '30'))
+UPLOAD_CHUNK_SIZE = int(os.getenv('UPLOAD_CHUNK_SIZE', str(1024 * 1024)))  # Bytes read/written per step
+UPLOAD_SPOOL_DIR = Path(os.getenv('UPLOAD_SPOOL_DIR', str(UPLOADS_DIR / ".spool")))  # Resumable upload parts
+UPLOAD_SPOOL_MAX_AGE_HOURS = int(os.getenv('UPLOAD_SPOOL_MAX_AGE_HOURS', '24'))  # Abandoned parts are removed after this
+
+# Threading document processor (dev fallback when Celery is off): uploaded
+# documents are processed by a pool of worker threads; text extraction
+# (PDF/Excel/Word parsing) runs in a shared process pool. 0 processes parses
+# in the worker threads instead
+DOCUMENT_WORKERS = int(os.getenv('DOCUMENT_WORKERS', '4'))
+DOCUMENT_PARSE_PROCESSES = int(os.getenv('DOCUMENT_PARSE_PROCESSES', str(min(4, os.cpu_count() or 1))))
+DOCUMENT_PARSE_TIMEOUT_SECONDS = float(os.getenv('DOCUMENT_PARSE_TIMEOUT_SECONDS', '300'))  # Hung parsers are killed after this
+
 
 def ensure_directories():
     """Create required directories (called lazily when needed)."""
@@ -170,15 +207,25 @@ MODEL_COSTS = {
     }
 }
 
-def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
-    """Estimate API cost for a given model and token counts."""
+# Prompt caching multipliers on the input price
+CACHE_WRITE_COST_MULTIPLIER = 1.25
+CACHE_READ_COST_MULTIPLIER = 0.10
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int,
+                  cache_creation_tokens: int = 0, cache_read_tokens: int = 0) -> float:
+    """Estimate API cost for a given model and token counts.
+
+    input_tokens is uncached input; cache writes and reads are priced separately.
+    """
     if model not in MODEL_COSTS:
         return 0.0
 
     costs = MODEL_COSTS[model]
     input_cost = (input_tokens / 1_000_000) * costs["input"]
+    cache_cost = ((cache_creation_tokens * CACHE_WRITE_COST_MULTIPLIER +
+                   cache_read_tokens * CACHE_READ_COST_MULTIPLIER) / 1_000_000) * costs["input"]
     output_cost = (output_tokens / 1_000_000) * costs["output"]
-    return input_cost + output_cost
+    return input_cost + cache_cost + output_cost
 
 
 # =============================================================================
@@ -199,6 +246,20 @@ DATABASE_POOL_TIMEOUT = int(os.getenv('DATABASE_POOL_TIMEOUT', '30'))
 # Query timeout (seconds)
 DATABASE_QUERY_TIMEOUT = int(os.getenv('DATABASE_QUERY_TIMEOUT', '30'))
 
+# Incremental persistence during analysis: a background flusher writes new
+# facts/gaps once this many are pending, or at least every N seconds
+INCREMENTAL_FLUSH_EVERY = int(os.getenv('INCREMENTAL_FLUSH_EVERY', '50'))
+INCREMENTAL_FLUSH_INTERVAL = float(os.getenv('INCREMENTAL_FLUSH_INTERVAL', '5'))
+
+# DualWriteFactStore write-behind: fact writes are queued and upserted in
+# batches by a background writer instead of one round trip per fact. When the
+# queue is full, add_fact waits up to FACT_WRITE_ENQUEUE_TIMEOUT seconds, then
+# writes inline
+FACT_WRITE_BEHIND = os.getenv('FACT_WRITE_BEHIND', 'false').lower() == 'true'
+FACT_WRITE_QUEUE_SIZE = int(os.getenv('FACT_WRITE_QUEUE_SIZE', '1000'))
+FACT_WRITE_BATCH_SIZE = int(os.getenv('FACT_WRITE_BATCH_SIZE', '100'))
+FACT_WRITE_ENQUEUE_TIMEOUT = float(os.getenv('FACT_WRITE_ENQUEUE_TIMEOUT', '5'))
+
 
 # =============================================================================
 # REDIS CONFIGURATION (Phase 2)
@@ -211,9 +272,20 @@ REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 USE_REDIS_SESSIONS = os.getenv('USE_REDIS_SESSIONS', 'false').lower() == 'true'
 USE_CELERY = os.getenv('USE_CELERY', 'false').lower() == 'true'
 
+# Celery analysis fan-out: domains of one analysis run in parallel subtasks
+ANALYSIS_MAX_PARALLEL_DOMAINS = int(os.getenv('ANALYSIS_MAX_PARALLEL_DOMAINS', '3'))  # Concurrent domain subtasks per deal
+ANALYSIS_DOMAIN_MAX_RETRIES = int(os.getenv('ANALYSIS_DOMAIN_MAX_RETRIES', '2'))  # Retries for a failed domain
+ANALYSIS_DOMAIN_RETRY_DELAY = int(os.getenv('ANALYSIS_DOMAIN_RETRY_DELAY', '30'))  # Seconds between domain retries
+
 # Session configuration
 SESSION_LIFETIME_DAYS = int(os.getenv('SESSION_LIFETIME_DAYS', '7'))
 
+# Retention/cleanup jobs (web/tasks/retention.py): keys are walked with SCAN
+# and rows deleted in short batched transactions, pausing between batches
+RETENTION_BATCH_SIZE = int(os.getenv('RETENTION_BATCH_SIZE', '500'))  # Keys/rows per batch
+RETENTION_BATCH_PAUSE_MS = int(os.getenv('RETENTION_BATCH_PAUSE_MS', '50'))  # Pause between batches
+RETENTION_MAX_SECONDS = int(os.getenv('RETENTION_MAX_SECONDS', '300'))  # Time budget per job; the next run continues
+
 
 # =============================================================================
 # V2 FEATURE FLAGS
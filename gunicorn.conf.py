@@ -15,11 +15,14 @@ bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
 workers = int(os.environ.get('GUNICORN_WORKERS', '1'))
 
 # Threads per worker - MEMORY FIX: reduced from 4 to 2
-# Each thread can handle concurrent requests; fewer threads = lower memory usage
+# Progress streams (SSE) hold a thread while open; web/progress_events.py
+# caps them at half of GUNICORN_THREADS per worker, so raise this for
+# deployments with many open progress pages
 threads = int(os.environ.get('GUNICORN_THREADS', '2'))
 
-# Worker class - sync is fine for Flask, use gevent for async
-worker_class = 'sync'
+# Worker class - gthread, so an open progress stream ties up one thread
+# rather than a whole sync worker
+worker_class = 'gthread'
 
 # Timeout - 5 minutes for long-running analysis
 timeout = 300
@@ -1090,10 +1090,12 @@ def cmd_delete(session: Session, args: List[str]) -> str:
 
     elif item_type == 'fact':
         session.fact_store.facts = [f for f in session.fact_store.facts if f.fact_id != item_id]
+        session.fact_store.mark_changed()
         return f"✓ Deleted fact {item_id}: {item.item}"
 
     elif item_type == 'gap':
         session.fact_store.gaps = [g for g in session.fact_store.gaps if g.gap_id != item_id]
+        session.fact_store.mark_changed()
         return f"✓ Deleted gap {item_id}: {item.description}"
 
     return f"Cannot delete items of type '{item_type}'"
@@ -7,6 +7,9 @@ Provides functionality for:
 - Comparing actual staffing against benchmarks
 - Identifying missing roles
 - Compensation benchmarking
+
+Lookups go through BenchmarkTables (services/benchmark_tables.py), which are
+compiled when benchmarks are loaded or custom benchmarks are uploaded.
 """
 
 import json
@@ -31,6 +34,7 @@ from models.organization_stores import (
     StaffingComparisonResult,
     CategorySummary
 )
+from services.benchmark_tables import BenchmarkTables, estimate_percentile
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +102,7 @@ class BenchmarkService:
         self._loaded = False
         self._data_sources: List[BenchmarkDataSource] = []
         self._metadata: Dict = {}
+        self._tables: Optional[BenchmarkTables] = None
 
     def load_benchmarks(self) -> bool:
         """
@@ -167,12 +172,29 @@ class BenchmarkService:
                 self._load_custom_benchmarks(custom_path)
 
             self._loaded = True
+            self._compile_tables()
             return True
 
         except Exception as e:
             logger.error(f"Failed to load benchmarks: {e}")
             return False
 
+    def _compile_tables(self) -> BenchmarkTables:
+        """Rebuild the lookup tables from the currently loaded data."""
+        self._tables = BenchmarkTables(
+            self._profiles,
+            self._compensation_benchmarks,
+            self._location_adjustments,
+            self._industry_adjustments
+        )
+        return self._tables
+
+    def _get_tables(self) -> BenchmarkTables:
+        """Lookup tables for the loaded benchmarks (loading them if needed)."""
+        if not self._loaded:
+            self.load_benchmarks()
+        return self._tables or self._compile_tables()
+
     def _load_custom_benchmarks(self, custom_path: Path) -> bool:
         """Load custom benchmark data (Point 61)."""
         try:
@@ -276,13 +298,7 @@ class BenchmarkService:
 
     def get_profile_by_id(self, profile_id: str) -> Optional[BenchmarkProfile]:
         """Get a specific profile by ID."""
-        if not self._loaded:
-            self.load_benchmarks()
-
-        for profile in self._profiles:
-            if profile.profile_id == profile_id:
-                return profile
-        return None
+        return self._get_tables().profiles_by_id.get(profile_id)
 
     def match_profile(
         self,
@@ -308,14 +324,10 @@ class BenchmarkService:
             logger.warning("No benchmark profiles loaded")
             return None
 
-        # Score each profile
-        scored_profiles = []
-        for profile in self._profiles:
-            score = profile.match_score(revenue, employees, industry)
-            if score > 0:
-                scored_profiles.append((score, profile))
+        # Highest-scoring profile via the industry and size-band indexes
+        best_score, best_match = self._get_tables().match_profile(revenue, employees, industry)
 
-        if not scored_profiles:
+        if not best_match:
             # Fall back to general profiles if no industry match
             for profile in self._profiles:
                 if 'general' in profile.industries:
@@ -325,11 +337,7 @@ class BenchmarkService:
             logger.warning(f"No matching profile for revenue={revenue}, employees={employees}, industry={industry}")
             return None
 
-        # Return highest scoring profile
-        scored_profiles.sort(key=lambda x: x[0], reverse=True)
-        best_match = scored_profiles[0][1]
-
-        logger.info(f"Matched profile '{best_match.profile_name}' for {industry} company (score: {scored_profiles[0][0]})")
+        logger.info(f"Matched profile '{best_match.profile_name}' for {industry} company (score: {best_score})")
         return best_match
 
     def compare_staffing(
@@ -356,47 +364,41 @@ class BenchmarkService:
         total_expected_typical = 0
         total_expected_max = 0
 
-        # Compare each category
-        for category_name, bench_range in benchmark.expected_staffing.items():
+        # Compare each category (bounds and display names precomputed per profile)
+        for category_name, display_name, bench_min, bench_typical, bench_max, bench_range in \
+                self._get_tables().category_rows(benchmark):
             actual = staff_by_category.get(category_name, 0)
             total_actual += actual
-            total_expected_min += int(bench_range.min_value)
-            total_expected_typical += int(bench_range.typical_value)
-            total_expected_max += int(bench_range.max_value)
+            total_expected_min += bench_min
+            total_expected_typical += bench_typical
+            total_expected_max += bench_max
 
-            variance = actual - int(bench_range.typical_value)
+            variance = actual - bench_typical
             status = bench_range.status(actual)
 
             # Generate analysis text
             if status == "understaffed":
-                analysis = f"{category_name.title()} appears understaffed ({actual} vs expected {int(bench_range.min_value)}-{int(bench_range.max_value)}). May indicate MSP reliance or shared services."
+                analysis = f"{category_name.title()} appears understaffed ({actual} vs expected {bench_min}-{bench_max}). May indicate MSP reliance or shared services."
             elif status == "overstaffed":
-                analysis = f"{category_name.title()} above benchmark range ({actual} vs expected max {int(bench_range.max_value)}). May indicate complex environment or inefficiency."
+                analysis = f"{category_name.title()} above benchmark range ({actual} vs expected max {bench_max}). May indicate complex environment or inefficiency."
                 overstaffed_areas.append(OverstaffedArea(
                     category=category_name,
                     actual_count=actual,
-                    expected_max=int(bench_range.max_value),
-                    overage=actual - int(bench_range.max_value),
+                    expected_max=bench_max,
+                    overage=actual - bench_max,
                     potential_reasons=["Complex environment", "Historical growth", "Pending attrition"],
                     recommendation="Investigate drivers. May be synergy opportunity post-close."
                 ))
             else:
                 analysis = f"{category_name.title()} staffing is within expected range."
 
-            # Get display name
-            try:
-                category_enum = RoleCategory.from_string(category_name)
-                display_name = category_enum.display_name
-            except:
-                display_name = category_name.replace('_', ' ').title()
-
             category_comparisons.append(CategoryComparison(
                 category=category_name,
                 category_display=display_name,
                 actual_count=actual,
-                benchmark_min=int(bench_range.min_value),
-                benchmark_typical=int(bench_range.typical_value),
-                benchmark_max=int(bench_range.max_value),
+                benchmark_min=bench_min,
+                benchmark_typical=bench_typical,
+                benchmark_max=bench_max,
                 variance=variance,
                 status=status,
                 analysis=analysis
@@ -562,46 +564,8 @@ class BenchmarkService:
         Returns:
             Dict with p25, p50, p75 adjusted compensation, or None
         """
-        if not self._loaded:
-            self.load_benchmarks()
-
-        # Find matching role in compensation benchmarks
-        category_benchmarks = self._compensation_benchmarks.get(category, {})
-
-        # Try exact match first
-        role_key = None
-        for key in category_benchmarks:
-            if key.lower() == role_title.lower():
-                role_key = key
-                break
-
-        # Try fuzzy match
-        if not role_key:
-            role_lower = role_title.lower()
-            for key in category_benchmarks:
-                if key.lower() in role_lower or role_lower in key.lower():
-                    role_key = key
-                    break
-
-        if not role_key:
-            return None
-
-        base_comp = category_benchmarks[role_key]
-
-        # Apply adjustments
-        loc_mult = self._location_adjustments.get(location_tier, {}).get('multiplier', 1.0)
-        ind_mult = self._industry_adjustments.get(industry, {}).get('multiplier', 1.0)
-        total_mult = loc_mult * ind_mult
-
-        return {
-            'role_matched': role_key,
-            'p25': int(base_comp['p25'] * total_mult),
-            'p50': int(base_comp['p50'] * total_mult),
-            'p75': int(base_comp['p75'] * total_mult),
-            'location_adjustment': loc_mult,
-            'industry_adjustment': ind_mult,
-            'description': base_comp.get('description', '')
-        }
+        # Exact then fuzzy role match, adjusted percentiles precomputed per tier/industry
+        return self._get_tables().compensation(category, role_title, location_tier, industry)
 
     def assess_compensation(
         self,
@@ -658,20 +622,7 @@ class BenchmarkService:
 
     def _estimate_percentile(self, value: float, benchmark: Dict) -> int:
         """Estimate what percentile a value falls at."""
-        if value <= benchmark['p25']:
-            return 25
-        elif value >= benchmark['p75']:
-            return 75
-        elif value <= benchmark['p50']:
-            # Interpolate between p25 and p50
-            range_size = benchmark['p50'] - benchmark['p25']
-            position = value - benchmark['p25']
-            return 25 + int((position / range_size) * 25) if range_size > 0 else 37
-        else:
-            # Interpolate between p50 and p75
-            range_size = benchmark['p75'] - benchmark['p50']
-            position = value - benchmark['p50']
-            return 50 + int((position / range_size) * 25) if range_size > 0 else 62
+        return estimate_percentile(value, benchmark['p25'], benchmark['p50'], benchmark['p75'])
 
     # =========================================================================
     # Data Source Attribution (Point 60)
@@ -754,6 +705,9 @@ class BenchmarkService:
                 notes="User-uploaded benchmark data"
             ))
 
+            # Recompile lookup tables for the merged data
+            self._compile_tables()
+
             # Persist to custom benchmarks file
             self._save_custom_benchmarks(data)
 
@@ -842,12 +796,7 @@ class BenchmarkService:
         Returns:
             Dict with adjusted compensation and breakdown
         """
-        if not self._loaded:
-            self.load_benchmarks()
-
-        loc_mult = self._location_adjustments.get(location_tier, {}).get('multiplier', 1.0)
-        ind_mult = self._industry_adjustments.get(industry, {}).get('multiplier', 1.0)
-        total_mult = loc_mult * ind_mult
+        loc_mult, ind_mult, total_mult = self._get_tables().multipliers(location_tier, industry)
         adjusted = base_compensation * total_mult
 
         return {
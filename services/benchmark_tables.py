@@ -0,0 +1,328 @@
+"""
+Benchmark Lookup Tables
+
+Compiled, read-only indexes over loaded benchmark data, so staffing and
+compensation lookups don't walk the profile and compensation dictionaries
+on every call:
+
+- Profiles indexed by industry and by revenue/employee size band
+- Compensation roles indexed by normalized title, with p25/p50/p75 points
+  and every location x industry multiplier precomputed
+- A trie over role-equivalency variations for one-scan title normalization
+
+BenchmarkService compiles a BenchmarkTables after load_benchmarks() and
+upload_custom_benchmarks(); nothing is rebuilt between those calls.
+
+Usage:
+    tables = BenchmarkTables(profiles, compensation, location_adj, industry_adj)
+    profile = tables.match_profile(revenue=80_000_000, employees=400, industry="healthcare")
+    comp = tables.compensation("security", "Security Analyst", "tier_1_metro", "healthcare")
+
+    trie = RoleTitleTrie(ROLE_EQUIVALENCY_MAP)
+    trie.normalize_all(["Sr. Sys Admin", "Helpdesk Lead"])
+"""
+
+import logging
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from models.organization_models import BenchmarkProfile, RoleCategory
+
+logger = logging.getLogger(__name__)
+
+# Memoized lookups are dropped once a cache grows past this many entries
+_MAX_CACHE_ENTRIES = 4096
+
+
+def estimate_percentile(value: float, p25: float, p50: float, p75: float) -> int:
+    """Piecewise-linear percentile estimate from p25/p50/p75 points (clamped to 25-75)."""
+    if value <= p25:
+        return 25
+    if value >= p75:
+        return 75
+    if value <= p50:
+        range_size = p50 - p25
+        return 25 + int(((value - p25) / range_size) * 25) if range_size > 0 else 37
+    range_size = p75 - p50
+    return 50 + int(((value - p50) / range_size) * 25) if range_size > 0 else 62
+
+
+class _BandIndex:
+    """
+    Which inclusive [min, max] ranges contain a value, by binary search.
+
+    The sorted range boundaries split the number line into slots (each
+    boundary point and each open interval between two boundaries); the
+    matching ranges are precomputed per slot.
+    """
+
+    def __init__(self, ranges: List[Tuple[float, float]]):
+        self._bounds = sorted({b for r in ranges for b in r})
+        bounds = self._bounds
+        self._slots: List[Set[int]] = [set() for _ in range(2 * len(bounds) + 1)]
+        for idx, (low, high) in enumerate(ranges):
+            for k, point in enumerate(bounds):
+                if low <= point <= high:
+                    self._slots[2 * k + 1].add(idx)
+                if k + 1 < len(bounds) and low <= point and bounds[k + 1] <= high:
+                    self._slots[2 * k + 2].add(idx)
+
+    def containing(self, value: float) -> Set[int]:
+        i = bisect_left(self._bounds, value)
+        if i < len(self._bounds) and self._bounds[i] == value:
+            return self._slots[2 * i + 1]
+        return self._slots[2 * i]
+
+
+class BenchmarkTables:
+    """
+    Lookup tables compiled from one snapshot of benchmark data.
+
+    Args:
+        profiles: Loaded benchmark profiles (order breaks score ties)
+        compensation: {category: {role_title: {'p25', 'p50', 'p75', ...}}}
+        location_adjustments: {tier: {'multiplier': float, ...}}
+        industry_adjustments: {industry: {'multiplier': float, ...}}
+    """
+
+    def __init__(
+        self,
+        profiles: List[BenchmarkProfile],
+        compensation: Dict[str, Dict[str, Dict]],
+        location_adjustments: Dict[str, Dict],
+        industry_adjustments: Dict[str, Dict]
+    ):
+        # Profiles
+        self.profiles = list(profiles)
+        self.profiles_by_id = {p.profile_id: p for p in self.profiles}
+        self._profile_keys = []
+        self._by_industry: Dict[str, Set[int]] = {}
+        self._general: Set[int] = set()
+        for idx, p in enumerate(self.profiles):
+            industries = {i.lower() for i in p.industries}
+            self._profile_keys.append((
+                p.revenue_range_min, p.revenue_range_max, (p.revenue_range_min + p.revenue_range_max) / 2,
+                p.employee_range_min, p.employee_range_max, (p.employee_range_min + p.employee_range_max) / 2,
+                industries, 'general' in p.industries,
+            ))
+            for industry in industries:
+                self._by_industry.setdefault(industry, set()).add(idx)
+            if 'general' in p.industries:
+                self._general.add(idx)
+        self._revenue_bands = _BandIndex([(p.revenue_range_min, p.revenue_range_max) for p in self.profiles])
+        self._employee_bands = _BandIndex([(p.employee_range_min, p.employee_range_max) for p in self.profiles])
+        self._match_cache: Dict[Tuple, Tuple[int, Optional[BenchmarkProfile]]] = {}
+        self._category_rows: Dict[str, List[Tuple]] = {}
+
+        # Compensation
+        self._compensation = compensation
+        self._comp_exact: Dict[str, Dict[str, str]] = {}
+        self._comp_keys: Dict[str, List[Tuple[str, str]]] = {}
+        self._comp_points: Dict[Tuple[str, str], Tuple[float, float, float]] = {}
+        for category, roles in compensation.items():
+            exact = self._comp_exact[category] = {}
+            keys = self._comp_keys[category] = []
+            for key, values in roles.items():
+                exact.setdefault(key.lower(), key)
+                keys.append((key, key.lower()))
+                self._comp_points[(category, key)] = (values['p25'], values['p50'], values['p75'])
+        self._role_key_cache: Dict[Tuple[str, str], Optional[str]] = {}
+
+        # Regional adjustments: every tier x industry combination up front
+        self._location_mult = {tier: adj.get('multiplier', 1.0) for tier, adj in location_adjustments.items()}
+        self._industry_mult = {ind: adj.get('multiplier', 1.0) for ind, adj in industry_adjustments.items()}
+        self._multipliers = {
+            (tier, ind): (loc, ind_mult, loc * ind_mult)
+            for tier, loc in self._location_mult.items()
+            for ind, ind_mult in self._industry_mult.items()
+        }
+        self._adjusted_cache: Dict[Tuple, Tuple[int, int, int]] = {}
+
+    # =========================================================================
+    # Profiles
+    # =========================================================================
+
+    def _score(self, idx: int, revenue: float, employees: int, industry: str) -> int:
+        """BenchmarkProfile.match_score over the precomputed profile keys."""
+        rev_min, rev_max, rev_mid, emp_min, emp_max, emp_mid, industries, has_general = self._profile_keys[idx]
+        score = 0
+        if rev_min <= revenue <= rev_max:
+            score += 10
+            if abs(revenue - rev_mid) < rev_mid * 0.3:
+                score += 5
+        if emp_min <= employees <= emp_max:
+            score += 10
+            if abs(employees - emp_mid) < emp_mid * 0.3:
+                score += 5
+        if industry in industries:
+            score += 20
+        elif has_general:
+            score += 5
+        return score
+
+    def match_profile(self, revenue: float, employees: int, industry: str) -> Tuple[int, Optional[BenchmarkProfile]]:
+        """
+        Highest-scoring profile (earliest wins ties) and its score.
+
+        Only profiles in the company's revenue band, employee band or
+        industry (plus general profiles) can score above zero, so only
+        those are scored.
+
+        Returns:
+            (score, profile); (0, None) when no profile scores
+        """
+        industry = industry.lower()
+        key = (revenue, employees, industry)
+        cached = self._match_cache.get(key)
+        if cached is not None:
+            return cached
+
+        candidates = (self._revenue_bands.containing(revenue) | self._employee_bands.containing(employees) |
+                      self._by_industry.get(industry, set()) | self._general)
+        best: Tuple[int, Optional[BenchmarkProfile]] = (0, None)
+        for idx in sorted(candidates):
+            score = self._score(idx, revenue, employees, industry)
+            if score > best[0]:
+                best = (score, self.profiles[idx])
+
+        if len(self._match_cache) >= _MAX_CACHE_ENTRIES:
+            self._match_cache.clear()
+        self._match_cache[key] = best
+        return best
+
+    def category_rows(self, profile: BenchmarkProfile) -> List[Tuple[str, str, int, int, int, Any]]:
+        """
+        (category, display name, min, typical, max, range) per expected
+        staffing category, computed once per loaded profile.
+        """
+        cached = self._category_rows.get(profile.profile_id)
+        if cached is not None and self.profiles_by_id.get(profile.profile_id) is profile:
+            return cached
+
+        rows = []
+        for category, bench_range in profile.expected_staffing.items():
+            try:
+                display_name = RoleCategory.from_string(category).display_name
+            except Exception:
+                display_name = category.replace('_', ' ').title()
+            rows.append((category, display_name, int(bench_range.min_value),
+                         int(bench_range.typical_value), int(bench_range.max_value), bench_range))
+
+        if self.profiles_by_id.get(profile.profile_id) is profile:
+            self._category_rows[profile.profile_id] = rows
+        return rows
+
+    # =========================================================================
+    # Compensation
+    # =========================================================================
+
+    def role_key(self, category: str, role_title: str) -> Optional[str]:
+        """Compensation role matching a title: exact (case-insensitive), then substring either way."""
+        role_lower = role_title.lower()
+        cache_key = (category, role_lower)
+        if cache_key in self._role_key_cache:
+            return self._role_key_cache[cache_key]
+
+        role_key = self._comp_exact.get(category, {}).get(role_lower)
+        if role_key is None:
+            for key, key_lower in self._comp_keys.get(category, []):
+                if key_lower in role_lower or role_lower in key_lower:
+                    role_key = key
+                    break
+
+        if len(self._role_key_cache) >= _MAX_CACHE_ENTRIES:
+            self._role_key_cache.clear()
+        self._role_key_cache[cache_key] = role_key
+        return role_key
+
+    def multipliers(self, location_tier: str, industry: str) -> Tuple[float, float, float]:
+        """(location, industry, total) multipliers; unknown keys count as 1.0."""
+        found = self._multipliers.get((location_tier, industry))
+        if found is not None:
+            return found
+        loc = self._location_mult.get(location_tier, 1.0)
+        ind = self._industry_mult.get(industry, 1.0)
+        return loc, ind, loc * ind
+
+    def adjusted_points(self, category: str, role_key: str, location_tier: str,
+                        industry: str) -> Tuple[int, int, int]:
+        """p25/p50/p75 of a compensation role after regional and industry adjustment."""
+        cache_key = (category, role_key, location_tier, industry)
+        points = self._adjusted_cache.get(cache_key)
+        if points is None:
+            total = self.multipliers(location_tier, industry)[2]
+            points = tuple(int(p * total) for p in self._comp_points[(category, role_key)])
+            if len(self._adjusted_cache) >= _MAX_CACHE_ENTRIES:
+                self._adjusted_cache.clear()
+            self._adjusted_cache[cache_key] = points
+        return points
+
+    def compensation(self, category: str, role_title: str, location_tier: str = "average",
+                     industry: str = "general") -> Optional[Dict]:
+        """Adjusted compensation benchmark for a role (see BenchmarkService.get_compensation_benchmark)."""
+        role_key = self.role_key(category, role_title)
+        if role_key is None:
+            return None
+
+        loc_mult, ind_mult, _ = self.multipliers(location_tier, industry)
+        p25, p50, p75 = self.adjusted_points(category, role_key, location_tier, industry)
+        return {
+            'role_matched': role_key,
+            'p25': p25,
+            'p50': p50,
+            'p75': p75,
+            'location_adjustment': loc_mult,
+            'industry_adjustment': ind_mult,
+            'description': self._compensation[category][role_key].get('description', '')
+        }
+
+
+class RoleTitleTrie:
+    """
+    Normalizes role titles through an equivalency map with one trie scan.
+
+    A title maps to the equivalency of its exact (lowercased, stripped)
+    text, otherwise of the earliest-added variation it contains, otherwise
+    to itself lowercased. Results are memoized per title.
+    """
+
+    _END = object()
+
+    def __init__(self, equivalency_map: Dict[str, str]):
+        self._exact = dict(equivalency_map)
+        self._root: Dict = {}
+        for rank, (variation, normalized) in enumerate(equivalency_map.items()):
+            node = self._root
+            for ch in variation:
+                node = node.setdefault(ch, {})
+            node.setdefault(self._END, (rank, normalized))
+        self._cache: Dict[str, str] = {}
+
+    def normalize(self, role_title: str) -> str:
+        cached = self._cache.get(role_title)
+        if cached is not None:
+            return cached
+
+        title_lower = role_title.lower().strip()
+        normalized = self._exact.get(title_lower)
+        if normalized is None:
+            best = None
+            for start in range(len(title_lower)):
+                node = self._root
+                for ch in title_lower[start:]:
+                    node = node.get(ch)
+                    if node is None:
+                        break
+                    match = node.get(self._END)
+                    if match is not None and (best is None or match[0] < best[0]):
+                        best = match
+            normalized = best[1] if best else role_title.lower()
+
+        if len(self._cache) >= _MAX_CACHE_ENTRIES:
+            self._cache.clear()
+        self._cache[role_title] = normalized
+        return normalized
+
+    def normalize_all(self, role_titles: Iterable[str]) -> Dict[str, str]:
+        """Normalize a batch of titles, each distinct title once."""
+        return {title: self.normalize(title) for title in dict.fromkeys(role_titles)}
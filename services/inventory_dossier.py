@@ -13,15 +13,26 @@ This gives practitioners a single pane of glass for each item,
 allowing them to "dig as deep as they want."
 """
 
+import bisect
 import json
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Set
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set
+from dataclasses import dataclass, field, fields, asdict
 
 logger = logging.getLogger(__name__)
 
+# Optional: C Aho-Corasick automaton for matching all item names in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+AHOCORASICK_MIN_PATTERNS = 8  # Below this, per-name str.find is faster
+MENTION_TEXT_SEPARATOR = '\x00'  # Joins texts so no name can match across two of them
+
 
 # =============================================================================
 # DOSSIER DATA MODEL
@@ -170,6 +181,78 @@ class ItemDossier:
         return result
 
 
+# =============================================================================
+# MENTION INDEX
+# =============================================================================
+
+class MentionIndex:
+    """
+    Inverted index from names to the texts that mention them.
+
+    A text mentions a name when the lower-cased name is a substring of the
+    lower-cased text - the same test as `name.lower() in text.lower()`.
+    All known names are matched in one pass over the texts (Aho-Corasick
+    when pyahocorasick is installed, else one str.find sweep per name over
+    the concatenated texts). Names not known up front are resolved with a
+    linear scan on first lookup and cached.
+    """
+
+    def __init__(self, names: Iterable[str], texts: List[str]):
+        self.texts = [text.lower() for text in texts]
+        self._hits: Dict[str, List[int]] = {}
+
+        # A name containing the separator could match across two texts
+        patterns = {name.lower() for name in names if name and MENTION_TEXT_SEPARATOR not in name}
+        if not patterns or not self.texts:
+            return
+
+        if AHOCORASICK_AVAILABLE and len(patterns) >= AHOCORASICK_MIN_PATTERNS:
+            self._index_with_automaton(patterns)
+        else:
+            self._index_with_find(patterns)
+
+    def _index_with_automaton(self, patterns: Set[str]):
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+            self._hits[pattern] = []
+        automaton.make_automaton()
+
+        for position, text in enumerate(self.texts):
+            for _, pattern in automaton.iter(text):
+                hits = self._hits[pattern]
+                if not hits or hits[-1] != position:
+                    hits.append(position)
+
+    def _index_with_find(self, patterns: Set[str]):
+        corpus = MENTION_TEXT_SEPARATOR.join(self.texts)
+        starts = []
+        offset = 0
+        for text in self.texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        for pattern in patterns:
+            hits = self._hits[pattern] = []
+            found = corpus.find(pattern)
+            while found >= 0:
+                position = bisect.bisect_right(starts, found) - 1
+                hits.append(position)
+                if position + 1 >= len(starts):
+                    break
+                # Resume at the next text - one hit per text is enough
+                found = corpus.find(pattern, starts[position + 1])
+
+    def lookup(self, name: str) -> List[int]:
+        """Positions (ascending) of the texts that mention name."""
+        name_lower = name.lower()
+        hits = self._hits.get(name_lower)
+        if hits is None:
+            hits = [i for i, text in enumerate(self.texts) if name_lower in text]
+            self._hits[name_lower] = hits
+        return hits
+
+
 # =============================================================================
 # DOSSIER BUILDER
 # =============================================================================
@@ -271,6 +354,14 @@ class DossierBuilder:
             self.work_items = self.findings.get('work_items', [])
             self.recommendations = self.findings.get('recommendations', [])
 
+        # Membership by identity - `finding in self.risks` compares dicts field by field
+        self._risk_refs: Set[int] = {id(risk) for risk in self.risks}
+        self._work_item_refs: Set[int] = {id(wi) for wi in self.work_items}
+
+        # Name -> finding/sentence indexes, built on first lookup
+        self._finding_mentions: Optional[MentionIndex] = None
+        self._narrative_mentions: Dict[str, tuple] = {}
+
         # Build fact_id -> findings index
         all_findings = self.risks + self.work_items + self.recommendations
         for finding in all_findings:
@@ -380,6 +471,33 @@ class DossierBuilder:
     # FINDING LOOKUP METHODS
     # =========================================================================
 
+    def _item_names(self) -> Set[str]:
+        """All indexed item names (lower-cased)."""
+        return {key.split(':', 2)[2] for key in self.facts_by_item}
+
+    def _get_finding_mentions(self) -> MentionIndex:
+        """Index of risk then work item title/description text by item name."""
+        if self._finding_mentions is None:
+            texts = [
+                f"{finding.get('title', '')}{MENTION_TEXT_SEPARATOR}{finding.get('description', '')}"
+                for finding in self.risks + self.work_items
+            ]
+            self._finding_mentions = MentionIndex(self._item_names(), texts)
+        return self._finding_mentions
+
+    def _get_narrative_mentions(self, domain: str) -> tuple:
+        """(sentences, index) for a domain narrative, split once per domain."""
+        cached = self._narrative_mentions.get(domain)
+        if cached is None:
+            narrative = self.narratives.get(domain, '')
+            sentences = [
+                sentence for sentence in narrative.replace('\n', ' ').split('.')
+                if len(sentence.strip()) > 20
+            ]
+            cached = (sentences, MentionIndex(self._item_names(), sentences))
+            self._narrative_mentions[domain] = cached
+        return cached
+
     def _find_related_findings(self, fact_ids: List[str], item_name: str) -> tuple:
         """
         Find all findings related to a set of fact_ids or item name.
@@ -396,52 +514,34 @@ class DossierBuilder:
                 finding_id = finding.get('finding_id', finding.get('id', ''))
                 if finding_id and finding_id not in seen_ids:
                     seen_ids.add(finding_id)
-                    if finding in self.risks:
+                    if id(finding) in self._risk_refs:
                         related_risks.append(finding)
-                    elif finding in self.work_items:
+                    elif id(finding) in self._work_item_refs:
                         related_work_items.append(finding)
 
         # Method 2: Name matching in title/description (fallback)
-        item_lower = item_name.lower()
-        for risk in self.risks:
-            finding_id = risk.get('finding_id', risk.get('id', ''))
-            if finding_id in seen_ids:
-                continue
-            title = risk.get('title', '').lower()
-            desc = risk.get('description', '').lower()
-            if item_lower in title or item_lower in desc:
-                seen_ids.add(finding_id)
-                related_risks.append(risk)
-
-        for wi in self.work_items:
-            finding_id = wi.get('finding_id', wi.get('id', ''))
+        # Index positions cover risks first, then work items, in list order
+        risk_count = len(self.risks)
+        for position in self._get_finding_mentions().lookup(item_name):
+            if position < risk_count:
+                finding, related = self.risks[position], related_risks
+            else:
+                finding, related = self.work_items[position - risk_count], related_work_items
+            finding_id = finding.get('finding_id', finding.get('id', ''))
             if finding_id in seen_ids:
                 continue
-            title = wi.get('title', '').lower()
-            desc = wi.get('description', '').lower()
-            if item_lower in title or item_lower in desc:
-                seen_ids.add(finding_id)
-                related_work_items.append(wi)
+            seen_ids.add(finding_id)
+            related.append(finding)
 
         return related_risks, related_work_items
 
     def _extract_narrative_mentions(self, item_name: str, domain: str) -> List[str]:
         """Extract narrative excerpts that mention this item."""
-        excerpts = []
-        narrative = self.narratives.get(domain, '')
-
-        if not narrative or not item_name:
-            return excerpts
-
-        # Split into sentences and find mentions
-        item_lower = item_name.lower()
-        sentences = narrative.replace('\n', ' ').split('.')
-
-        for sentence in sentences:
-            if item_lower in sentence.lower() and len(sentence.strip()) > 20:
-                excerpts.append(sentence.strip() + '.')
+        if not self.narratives.get(domain) or not item_name:
+            return []
 
-        return excerpts[:3]  # Limit to 3 excerpts
+        sentences, index = self._get_narrative_mentions(domain)
+        return [sentences[i].strip() + '.' for i in index.lookup(item_name)[:3]]  # Limit to 3 excerpts
 
     def _calculate_status(self, risks: List[Dict], dossier: ItemDossier = None) -> str:
         """
@@ -1227,17 +1327,31 @@ class DossierJSONExporter:
 class DossierHTMLExporter:
     """Export dossiers to interactive HTML format."""
 
+    # Dossier fields not shown on a card; left out of the card's cache key so
+    # rebuilt but otherwise unchanged dossiers still hit the fragment cache
+    CARD_EXCLUDED_FIELDS = {'created_at'}
+
     @staticmethod
     def export_domain(dossiers: List[ItemDossier], domain: str, output_path: Path) -> Path:
         """Export domain dossiers to HTML with collapsible sections."""
+        with open(output_path, 'w') as f:
+            f.writelines(DossierHTMLExporter.iter_domain(dossiers, domain))
+        return output_path
 
-        status_colors = {
-            'red': '#dc3545',
-            'yellow': '#ffc107',
-            'green': '#28a745'
-        }
+    @staticmethod
+    def iter_domain(dossiers: List[ItemDossier], domain: str, cache=None) -> Iterator[str]:
+        """
+        Render domain dossiers as a stream of HTML chunks.
+
+        The page header and summary come first, then one chunk per dossier
+        card. Cards are cached by the content of the dossier, so after a
+        small edit only the affected cards are rendered again.
+        """
+        from tools_v2.renderers.fragment_cache import content_hash, get_fragment_cache
+        if cache is None:
+            cache = get_fragment_cache()
 
-        html = f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1439,67 +1553,132 @@ class DossierHTMLExporter:
 """
 
         for dossier in dossiers:
-            # Build evidence HTML with quality indicators (Phase 3)
-            evidence_html = ""
-            for ev in dossier.evidence[:3]:  # Show up to 3 evidence items
-                quote = ev.quote if hasattr(ev, 'quote') else ev.get('quote', '')
-
-                # Get formatted citation if available
-                if hasattr(ev, 'format_citation'):
-                    citation = ev.format_citation()
-                else:
-                    citation = ev.source_document if hasattr(ev, 'source_document') else ev.get('source_document', '')
+            yield cache.render(
+                "dossier_card", domain, dossier.entity,
+                content_hash(*(getattr(dossier, f.name) for f in fields(dossier)
+                               if f.name not in DossierHTMLExporter.CARD_EXCLUDED_FIELDS)),
+                lambda dossier=dossier: DossierHTMLExporter._render_dossier_card(dossier)
+            )
 
-                # Get quality score for indicator
-                if hasattr(ev, 'quality_score'):
-                    quality = ev.quality_score()
-                    quality_indicator = "⭐" * quality if quality > 0 else "⚠️"
-                else:
-                    quality_indicator = ""
+        yield """
+    <script>
+        // Track current filters
+        let currentStatusFilter = 'all';
+        let currentEntityFilter = 'all';
 
-                # Get fact ID for traceability
-                fact_id = ev.fact_id if hasattr(ev, 'fact_id') else ev.get('fact_id', '')
-                fact_id_html = f'<span style="color:#007bff;font-weight:500">[{fact_id}]</span> ' if fact_id else ''
+        function toggleDossier(el) {
+            el.classList.toggle('open');
+        }
+
+        function applyFilters() {
+            document.querySelectorAll('.dossier').forEach(d => {
+                const matchesStatus = currentStatusFilter === 'all' || d.dataset.status === currentStatusFilter;
+                const matchesEntity = currentEntityFilter === 'all' || d.dataset.entity === currentEntityFilter;
+                d.style.display = (matchesStatus && matchesEntity) ? 'block' : 'none';
+            });
+        }
+
+        function filterDossiers(status) {
+            // Update status filter buttons
+            document.querySelectorAll('.filter-btn').forEach(btn => {
+                if (btn.onclick && btn.onclick.toString().includes('filterDossiers')) {
+                    btn.classList.remove('active');
+                }
+            });
+            event.target.classList.add('active');
 
-                evidence_html += f'''<div class="evidence">
+            currentStatusFilter = status;
+            applyFilters();
+        }
+
+        function filterByEntity(entity) {
+            // Update entity filter buttons
+            document.querySelectorAll('.filter-btn').forEach(btn => {
+                if (btn.onclick && btn.onclick.toString().includes('filterByEntity')) {
+                    btn.classList.remove('active');
+                }
+            });
+            if (currentEntityFilter !== entity) {
+                event.target.classList.add('active');
+                currentEntityFilter = entity;
+            } else {
+                // Toggle off - show all entities
+                currentEntityFilter = 'all';
+            }
+            applyFilters();
+        }
+
+        // Expand first red item by default
+        const firstRed = document.querySelector('.dossier[data-status="red"]');
+        if (firstRed) firstRed.classList.add('open');
+    </script>
+</body>
+</html>"""
+
+    @staticmethod
+    def _render_dossier_card(dossier: ItemDossier) -> str:
+        """Render one collapsible dossier card."""
+        # Build evidence HTML with quality indicators (Phase 3)
+        evidence_html = ""
+        for ev in dossier.evidence[:3]:  # Show up to 3 evidence items
+            quote = ev.quote if hasattr(ev, 'quote') else ev.get('quote', '')
+
+            # Get formatted citation if available
+            if hasattr(ev, 'format_citation'):
+                citation = ev.format_citation()
+            else:
+                citation = ev.source_document if hasattr(ev, 'source_document') else ev.get('source_document', '')
+
+            # Get quality score for indicator
+            if hasattr(ev, 'quality_score'):
+                quality = ev.quality_score()
+                quality_indicator = "⭐" * quality if quality > 0 else "⚠️"
+            else:
+                quality_indicator = ""
+
+            # Get fact ID for traceability
+            fact_id = ev.fact_id if hasattr(ev, 'fact_id') else ev.get('fact_id', '')
+            fact_id_html = f'<span style="color:#007bff;font-weight:500">[{fact_id}]</span> ' if fact_id else ''
+
+            evidence_html += f'''<div class="evidence">
                     "{quote[:250]}{"..." if len(quote) > 250 else ""}"
                     <div class="source">{fact_id_html}{quality_indicator} — {citation}</div>
                 </div>'''
 
-            # Build risks HTML
-            risks_html = ""
-            for risk in dossier.risks:
-                risk_id = risk.risk_id if hasattr(risk, 'risk_id') else risk.get('risk_id', '')
-                title = risk.title if hasattr(risk, 'title') else risk.get('title', '')
-                severity = risk.severity if hasattr(risk, 'severity') else risk.get('severity', '')
-                desc = risk.description if hasattr(risk, 'description') else risk.get('description', '')
-                risks_html += f'''
+        # Build risks HTML
+        risks_html = ""
+        for risk in dossier.risks:
+            risk_id = risk.risk_id if hasattr(risk, 'risk_id') else risk.get('risk_id', '')
+            title = risk.title if hasattr(risk, 'title') else risk.get('title', '')
+            severity = risk.severity if hasattr(risk, 'severity') else risk.get('severity', '')
+            desc = risk.description if hasattr(risk, 'description') else risk.get('description', '')
+            risks_html += f'''
                 <div class="risk-item">
                     <strong>{risk_id}: {title}</strong>
                     <span class="severity {severity.lower()}">{severity}</span>
                     <p>{desc[:300]}{"..." if len(desc) > 300 else ""}</p>
                 </div>'''
 
-            # Build work items HTML
-            work_html = ""
-            for wi in dossier.work_items:
-                wi_id = wi.work_item_id if hasattr(wi, 'work_item_id') else wi.get('work_item_id', '')
-                title = wi.title if hasattr(wi, 'title') else wi.get('title', '')
-                phase = wi.phase if hasattr(wi, 'phase') else wi.get('phase', '')
-                work_html += f'<div class="work-item"><strong>{wi_id}: {title}</strong> <span style="color:#666">({phase})</span></div>'
-
-            # Build attributes HTML
-            attrs_html = ""
-            for key, value in list(dossier.attributes.items())[:8]:
-                attrs_html += f'<tr><td>{key.replace("_", " ").title()}</td><td>{value}</td></tr>'
-
-            # Build data gaps HTML (Phase 4)
-            gaps_html = ""
-            if dossier.data_gaps:
-                completeness_pct = int(dossier.data_completeness * 100)
-                completeness_class = "red" if completeness_pct < 50 else "yellow"
-                gaps_list = ''.join(f'<li>{g.replace("_", " ").title()}</li>' for g in dossier.data_gaps)
-                gaps_html = f'''
+        # Build work items HTML
+        work_html = ""
+        for wi in dossier.work_items:
+            wi_id = wi.work_item_id if hasattr(wi, 'work_item_id') else wi.get('work_item_id', '')
+            title = wi.title if hasattr(wi, 'title') else wi.get('title', '')
+            phase = wi.phase if hasattr(wi, 'phase') else wi.get('phase', '')
+            work_html += f'<div class="work-item"><strong>{wi_id}: {title}</strong> <span style="color:#666">({phase})</span></div>'
+
+        # Build attributes HTML
+        attrs_html = ""
+        for key, value in list(dossier.attributes.items())[:8]:
+            attrs_html += f'<tr><td>{key.replace("_", " ").title()}</td><td>{value}</td></tr>'
+
+        # Build data gaps HTML (Phase 4)
+        gaps_html = ""
+        if dossier.data_gaps:
+            completeness_pct = int(dossier.data_completeness * 100)
+            completeness_class = "red" if completeness_pct < 50 else "yellow"
+            gaps_list = ''.join(f'<li>{g.replace("_", " ").title()}</li>' for g in dossier.data_gaps)
+            gaps_html = f'''
                 <div class="section" style="background: #fff3cd; padding: 15px; border-radius: 4px; border-left: 3px solid #ffc107;">
                     <h4 style="color: #856404; margin-top: 0;">⚠️ Data Gaps ({len(dossier.data_gaps)} critical fields missing)</h4>
                     <ul style="margin: 10px 0;">{gaps_list}</ul>
@@ -1509,25 +1688,25 @@ class DossierHTMLExporter:
                     </p>
                 </div>'''
 
-            # Build conflicts HTML (Phase 6)
-            conflicts_html = ""
-            if dossier.has_conflicts and dossier.attribute_conflicts:
-                conflicts_rows = ''.join(
-                    f'<tr><td><strong>{k.replace("_", " ").title()}</strong></td><td>{" vs ".join(str(v) for v in vals)}</td></tr>'
-                    for k, vals in dossier.attribute_conflicts.items()
-                )
-                conflicts_html = f'''
+        # Build conflicts HTML (Phase 6)
+        conflicts_html = ""
+        if dossier.has_conflicts and dossier.attribute_conflicts:
+            conflicts_rows = ''.join(
+                f'<tr><td><strong>{k.replace("_", " ").title()}</strong></td><td>{" vs ".join(str(v) for v in vals)}</td></tr>'
+                for k, vals in dossier.attribute_conflicts.items()
+            )
+            conflicts_html = f'''
                 <div class="section" style="background: #f8d7da; padding: 15px; border-radius: 4px; border-left: 3px solid #dc3545;">
                     <h4 style="color: #721c24; margin-top: 0;">⚠️ Data Conflicts Detected ({dossier.conflict_count})</h4>
                     <p style="color: #721c24;">Multiple values found for the same attribute. Review source documents:</p>
                     <table style="width: 100%;"><tbody>{conflicts_rows}</tbody></table>
                 </div>'''
 
-            # Determine entity class for badge styling
-            entity_class = dossier.entity if dossier.entity in ['target', 'buyer'] else 'unknown'
-            entity_label = dossier.entity.upper() if dossier.entity else 'UNKNOWN'
+        # Determine entity class for badge styling
+        entity_class = dossier.entity if dossier.entity in ['target', 'buyer'] else 'unknown'
+        entity_label = dossier.entity.upper() if dossier.entity else 'UNKNOWN'
 
-            html += f"""
+        return f"""
     <div class="dossier" data-status="{dossier.overall_status}" data-entity="{dossier.entity}">
         <div class="dossier-header {dossier.overall_status}" onclick="toggleDossier(this.parentElement)">
             <h3>
@@ -1568,72 +1747,10 @@ class DossierHTMLExporter:
     </div>
 """
 
-        html += """
-    <script>
-        // Track current filters
-        let currentStatusFilter = 'all';
-        let currentEntityFilter = 'all';
-
-        function toggleDossier(el) {
-            el.classList.toggle('open');
-        }
-
-        function applyFilters() {
-            document.querySelectorAll('.dossier').forEach(d => {
-                const matchesStatus = currentStatusFilter === 'all' || d.dataset.status === currentStatusFilter;
-                const matchesEntity = currentEntityFilter === 'all' || d.dataset.entity === currentEntityFilter;
-                d.style.display = (matchesStatus && matchesEntity) ? 'block' : 'none';
-            });
-        }
-
-        function filterDossiers(status) {
-            // Update status filter buttons
-            document.querySelectorAll('.filter-btn').forEach(btn => {
-                if (btn.onclick && btn.onclick.toString().includes('filterDossiers')) {
-                    btn.classList.remove('active');
-                }
-            });
-            event.target.classList.add('active');
-
-            currentStatusFilter = status;
-            applyFilters();
-        }
-
-        function filterByEntity(entity) {
-            // Update entity filter buttons
-            document.querySelectorAll('.filter-btn').forEach(btn => {
-                if (btn.onclick && btn.onclick.toString().includes('filterByEntity')) {
-                    btn.classList.remove('active');
-                }
-            });
-            if (currentEntityFilter !== entity) {
-                event.target.classList.add('active');
-                currentEntityFilter = entity;
-            } else {
-                // Toggle off - show all entities
-                currentEntityFilter = 'all';
-            }
-            applyFilters();
-        }
-
-        // Expand first red item by default
-        const firstRed = document.querySelector('.dossier[data-status="red"]');
-        if (firstRed) firstRed.classList.add('open');
-    </script>
-</body>
-</html>"""
-
-        output_path.write_text(html)
-        return output_path
-
     @staticmethod
     def export_to_string(dossiers: List[ItemDossier], domain: str) -> str:
         """Export domain dossiers to HTML string (no file)."""
-        import tempfile
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "temp.html"
-            DossierHTMLExporter.export_domain(dossiers, domain, output_path)
-            return output_path.read_text()
+        return ''.join(DossierHTMLExporter.iter_domain(dossiers, domain))
 
 
 # =============================================================================
@@ -6,10 +6,14 @@ OrganizationDataStore format for the web interface.
 """
 
 import re
+import json
 import uuid
 import logging
-import copy
+import pickle
 import threading
+import weakref
+from collections import OrderedDict
+from contextlib import nullcontext
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
@@ -27,13 +31,6 @@ from models.organization_stores import (
 
 logger = logging.getLogger(__name__)
 
-# Thread safety for FactStore modifications (P0 Fix: Concurrency)
-# This lock protects assumption merge/rollback operations to prevent
-# race conditions when multiple threads call build_organization_from_facts()
-# concurrently with the same FactStore instance.
-_fact_store_modification_lock = threading.RLock()
-
-
 def gen_id(prefix: str) -> str:
     """Generate a unique ID with prefix."""
     return f"{prefix}_{uuid.uuid4().hex[:8]}"
@@ -61,6 +58,113 @@ DEFAULT_SALARIES = {
 }
 
 
+# =============================================================================
+# SNAPSHOT AND MEMOIZATION
+# =============================================================================
+# Builds read an immutable snapshot of the organization facts and never hold
+# a lock while planning. The only write (replacing assumed facts) is a single
+# atomic FactStore.replace_facts() call. Results are memoized per FactStore by
+# (deal, entity, organization-domain version, build options), so repeated
+# dashboard requests reuse the last build until org facts change.
+
+ORG_BUILD_CACHE_SIZE = 16  # Memoized builds kept per FactStore
+
+_org_build_cache: "weakref.WeakKeyDictionary[FactStore, OrderedDict]" = weakref.WeakKeyDictionary()
+_org_build_cache_lock = threading.Lock()  # Guards the memo dicts only; never held while building
+
+
+@dataclass(frozen=True)
+class OrgFactsSnapshot:
+    """
+    Immutable view of the organization facts one build reads.
+
+    Exposes `facts` like a FactStore, so hierarchy detection and the
+    assumption engine can run on it directly.
+    """
+    facts: Tuple[Fact, ...]      # Organization-domain facts (all entities), FactStore order
+    total_facts: int             # Size of the whole FactStore
+    version: Optional[int]       # FactStore.domain_version("organization"); None if unversioned
+
+
+@dataclass
+class OrganizationBuildPlan:
+    """Result of planning a build: the org store plus the assumed facts to apply."""
+    store: OrganizationDataStore
+    status: str
+    assumptions: List[Any]  # List[OrganizationAssumption]; empty = leave the FactStore unchanged
+
+
+def snapshot_org_facts(fact_store: FactStore) -> OrgFactsSnapshot:
+    """Take a consistent snapshot of the organization facts in fact_store."""
+    lock = getattr(fact_store, '_lock', None)
+    with lock if lock is not None else nullcontext():
+        facts = fact_store.facts or []
+        org_facts = tuple(f for f in facts if f.domain == "organization")
+        version_fn = getattr(fact_store, 'domain_version', None)
+        version = version_fn("organization") if callable(version_fn) else None
+        return OrgFactsSnapshot(facts=org_facts, total_facts=len(facts), version=version)
+
+
+def _is_assumed_org_fact(fact: Fact, entity: str) -> bool:
+    return (fact.domain == "organization" and
+            fact.entity == entity and
+            (fact.details or {}).get('data_source') == 'assumed')
+
+
+def _assumption_to_fact(assumption: Any, deal_id: str) -> Fact:
+    """Planned (not yet stored) Fact for an assumption; gets its ID when applied."""
+    return Fact(fact_id="", deal_id=deal_id, **assumption.to_fact(deal_id))
+
+
+def _org_build_key(deal_id: str, entity: str, snapshot: OrgFactsSnapshot,
+                   company_profile: Optional[Dict[str, Any]], assumptions_enabled: bool) -> Optional[Tuple]:
+    if snapshot.version is None:
+        return None
+    try:
+        profile_key = json.dumps(company_profile, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    return (deal_id, entity, snapshot.version, snapshot.total_facts > 0,
+            bool(assumptions_enabled), profile_key)
+
+
+def _get_memoized_build(fact_store: FactStore, key: Tuple) -> Optional[Tuple[OrganizationDataStore, str]]:
+    with _org_build_cache_lock:
+        try:
+            builds = _org_build_cache.get(fact_store)
+        except TypeError:  # Not weak-referenceable
+            return None
+        if not builds or key not in builds:
+            return None
+        builds.move_to_end(key)
+        payload, status = builds[key]
+    # Builds are kept pickled: callers may modify the store they get back, and
+    # unpickling is cheaper than copy.deepcopy() or a rebuild
+    return pickle.loads(payload), status
+
+
+def _memoize_build(fact_store: FactStore, key: Tuple, store: OrganizationDataStore, status: str) -> None:
+    try:
+        payload = pickle.dumps(store, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        logger.debug(f"Organization build not memoized: {e}")
+        return
+    with _org_build_cache_lock:
+        try:
+            builds = _org_build_cache.setdefault(fact_store, OrderedDict())
+        except TypeError:
+            return
+        builds[key] = (payload, status)
+        while len(builds) > ORG_BUILD_CACHE_SIZE:
+            builds.popitem(last=False)
+
+
+def clear_organization_build_cache() -> None:
+    """Drop all memoized organization builds."""
+    with _org_build_cache_lock:
+        _org_build_cache.clear()
+
+
 def build_organization_from_facts(
     fact_store: FactStore,
     target_name: str = "Target",
@@ -75,11 +179,13 @@ def build_organization_from_facts(
     Enhanced for spec 11: Detects hierarchy presence and generates assumptions
     when organizational structure data is missing or incomplete.
 
-    THREAD SAFETY: This function modifies fact_store.facts in-place when assumptions
-    are enabled. Concurrent calls with the same FactStore instance are protected by
-    an internal lock, but this may cause performance bottlenecks. For best performance,
-    use separate FactStore instances per request/thread, or disable assumptions in
-    multi-threaded environments.
+    THREAD SAFETY: The build is planned from an immutable snapshot of the
+    organization facts (plan_organization_from_snapshot) without holding any
+    lock. Generated assumptions are then written with one atomic
+    FactStore.replace_facts() call, which is idempotent, so concurrent calls
+    on the same FactStore neither block each other nor duplicate assumptions.
+    Results are memoized by (deal, entity, organization-domain version);
+    code that edits fact_store.facts directly must call fact_store.mark_changed().
 
     Args:
         fact_store: The fact store containing organization facts
@@ -99,7 +205,6 @@ def build_organization_from_facts(
         - "error": Unrecoverable error
     """
     from config_v2 import ENABLE_ORG_ASSUMPTIONS, ENABLE_BUYER_ORG_ASSUMPTIONS
-    from config_v2 import LOG_ASSUMPTION_GENERATION, LOG_HIERARCHY_DETECTION
 
     # Try to get deal_id from fact_store if not provided
     if not deal_id and hasattr(fact_store, 'deal_id') and fact_store.deal_id:
@@ -115,26 +220,90 @@ def build_organization_from_facts(
     if entity == "buyer" and not ENABLE_BUYER_ORG_ASSUMPTIONS:
         assumptions_enabled = False
 
+    snapshot = snapshot_org_facts(fact_store)
+    key = _org_build_key(deal_id, entity, snapshot, company_profile, assumptions_enabled)
+    if key is not None:
+        memoized = _get_memoized_build(fact_store, key)
+        if memoized is not None:
+            logger.debug(f"Reusing organization build for {entity} (org facts version {snapshot.version})")
+            return memoized
+
+    plan = plan_organization_from_snapshot(
+        snapshot,
+        target_name=target_name,
+        deal_id=deal_id,
+        entity=entity,
+        company_profile=company_profile,
+        assumptions_enabled=assumptions_enabled
+    )
+
+    if plan.assumptions:
+        try:
+            _merge_assumptions_into_fact_store(
+                fact_store=fact_store,
+                assumptions=plan.assumptions,
+                deal_id=deal_id,
+                entity=entity
+            )
+        except (ValueError, KeyError, AttributeError, TypeError) as e:
+            # Nothing was written (replace_facts validates first): rebuild from observed data only
+            logger.error(f"Assumption merge failed for {entity} (recoverable), continuing with observed data only: {e}")
+            plan = plan_organization_from_snapshot(
+                snapshot,
+                target_name=target_name,
+                deal_id=deal_id,
+                entity=entity,
+                company_profile=company_profile,
+                assumptions_enabled=False
+            )
+
+    # Memoize only when the FactStore is still at the snapshot's version
+    # (applying new assumptions moves it on; the next call rebuilds once)
+    if key is not None and snapshot_org_facts(fact_store).version == snapshot.version:
+        _memoize_build(fact_store, key, plan.store, plan.status)
+
+    return plan.store, plan.status
+
+
+def plan_organization_from_snapshot(
+    snapshot: OrgFactsSnapshot,
+    target_name: str = "Target",
+    deal_id: str = "",
+    entity: str = "target",
+    company_profile: Optional[Dict[str, Any]] = None,
+    assumptions_enabled: bool = False
+) -> OrganizationBuildPlan:
+    """
+    Plan an organization build from a snapshot, without touching any FactStore.
+
+    When the hierarchy is partial or missing (and assumptions are enabled),
+    generated assumptions replace the entity's previously assumed facts in
+    the build, and are returned in plan.assumptions for the caller to apply.
+
+    Returns:
+        OrganizationBuildPlan with the store, status (see
+        build_organization_from_facts) and assumptions to apply
+    """
+    from config_v2 import LOG_ASSUMPTION_GENERATION, LOG_HIERARCHY_DETECTION
+
     store = OrganizationDataStore()
 
     # Check if fact store has any facts at all
-    total_facts = len(fact_store.facts) if fact_store.facts else 0
-    if total_facts == 0:
+    if snapshot.total_facts == 0:
         logger.warning("No facts at all in fact store")
-        return store, "no_facts"
+        return OrganizationBuildPlan(store, "no_facts", [])
 
     # CRITICAL (P0 FIX #4): Validate entity field on facts during extraction (fail-fast)
     # Extract org facts AND validate entity in single pass for performance
     all_org_facts = []
     facts_missing_entity = []
 
-    for fact in fact_store.facts:
-        if fact.domain == "organization":
-            # Validate entity immediately (fail-fast optimization)
-            if not hasattr(fact, 'entity') or fact.entity is None or fact.entity == "":
-                facts_missing_entity.append(fact.item)
-            else:
-                all_org_facts.append(fact)
+    for fact in snapshot.facts:
+        # Validate entity immediately (fail-fast optimization)
+        if not hasattr(fact, 'entity') or fact.entity is None or fact.entity == "":
+            facts_missing_entity.append(fact.item)
+        else:
+            all_org_facts.append(fact)
 
     # Fail fast if any facts have missing entity
     if facts_missing_entity:
@@ -153,15 +322,24 @@ def build_organization_from_facts(
     if not org_facts:
         logger.warning(f"No organization facts found for entity: {entity} "
                       f"(has {len(all_org_facts)} org facts for other entities)")
-        return store, "no_org_facts"
+        return OrganizationBuildPlan(store, "no_org_facts", [])
+
+    # Detection and generation look at observed facts only: the entity's
+    # previous assumptions are replaced, so they must not feed the new ones
+    # (otherwise successive builds alternate between two assumption sets)
+    observed = OrgFactsSnapshot(
+        facts=tuple(f for f in snapshot.facts if not _is_assumed_org_fact(f, entity)),
+        total_facts=snapshot.total_facts,
+        version=snapshot.version
+    )
 
     # STEP 1: Detect hierarchy presence (spec 08) if assumptions enabled
     hierarchy_presence = None
     if assumptions_enabled:
         try:
-            from services.org_hierarchy_detector import detect_hierarchy_presence, HierarchyPresenceStatus
+            from services.org_hierarchy_detector import detect_hierarchy_presence
 
-            hierarchy_presence = detect_hierarchy_presence(fact_store, entity=entity)
+            hierarchy_presence = detect_hierarchy_presence(observed, entity=entity)
 
             if LOG_HIERARCHY_DETECTION:
                 logger.info(
@@ -175,11 +353,9 @@ def build_organization_from_facts(
             hierarchy_presence = None
             assumptions_enabled = False  # Disable assumptions if detection fails
 
-    # Track if assumptions were merged (P1 FIX #4: for rollback on staff creation failure)
-    assumptions_merged_successfully = False
-    assumptions_backup_for_staff_rollback = None
-
-    # STEP 2 & 3: Generate and merge assumptions if needed (P0 FIX #5, #6: isolation + atomicity)
+    # STEP 2 & 3: Generate assumptions if needed; they replace the entity's old
+    # assumed facts in this build (P0 FIX #3, #5: cleanup + entity isolation)
+    planned_assumptions = []
     if assumptions_enabled and hierarchy_presence:
         from services.org_hierarchy_detector import HierarchyPresenceStatus
 
@@ -204,78 +380,19 @@ def build_organization_from_facts(
 
                 # Generate assumptions
                 assumptions = generate_org_assumptions(
-                    fact_store=fact_store,
+                    fact_store=observed,
                     hierarchy_presence=hierarchy_presence,
                     entity=entity,
                     company_profile=validated_profile
                 )
 
                 if assumptions:
-                    # P0 FIX #6: Backup for atomicity with thread safety
-                    # Use deep copy to ensure backup is independent of fact_store.facts mutations
-                    # Use lock to prevent concurrent modifications from corrupting state
-                    with _fact_store_modification_lock:
-                        # Deep copy the facts list to create independent backup
-                        old_assumptions_backup = copy.deepcopy([
-                            f for f in fact_store.facts
-                            if (f.domain == "organization" and
-                                f.entity == entity and
-                                (f.details or {}).get('data_source') == 'assumed')
-                        ])
-
-                        # Track the original facts list reference to detect tampering
-                        original_facts_id = id(fact_store.facts)
-
-                        try:
-                            # P0 FIX #3: Remove old assumptions (entity-scoped)
-                            _remove_old_assumptions_from_fact_store(
-                                fact_store=fact_store,
-                                entity=entity
-                            )
-
-                            # P0 FIX #2: Merge with idempotency protection
-                            _merge_assumptions_into_fact_store(
-                                fact_store=fact_store,
-                                assumptions=assumptions,
-                                deal_id=deal_id,
-                                entity=entity
-                            )
-
-                            # Refresh org_facts to include assumptions
-                            org_facts = [f for f in fact_store.facts
-                                       if f.domain == "organization" and f.entity == entity]
-
-                            # Mark assumptions as successfully merged (P1 FIX #4)
-                            assumptions_merged_successfully = True
-                            assumptions_backup_for_staff_rollback = old_assumptions_backup
-
-                            if LOG_ASSUMPTION_GENERATION:
-                                logger.info(f"Generated and merged {len(assumptions)} assumptions for {entity}")
-
-                        except Exception as e:
-                            # P0 FIX #6: ROLLBACK on failure (thread-safe)
-                            logger.error(f"Assumption merge failed for {entity}, rolling back: {e}")
-
-                            # Verify facts list wasn't replaced (safety check)
-                            if id(fact_store.facts) != original_facts_id:
-                                logger.warning(
-                                    f"FactStore.facts was replaced during merge "
-                                    f"(id changed from {original_facts_id} to {id(fact_store.facts)}). "
-                                    f"Rollback may be incomplete."
-                                )
-
-                            # Remove failed merge attempts (use in-place modification to preserve list identity)
-                            facts_to_keep = [
-                                f for f in fact_store.facts
-                                if not (f.domain == "organization" and
-                                        f.entity == entity and
-                                        (f.details or {}).get('data_source') == 'assumed')
-                            ]
-                            fact_store.facts[:] = facts_to_keep
-
-                            # Restore backup
-                            fact_store.facts.extend(old_assumptions_backup)
-                            raise  # Re-raise to trigger fallback
+                    assumed_facts = [_assumption_to_fact(a, deal_id) for a in assumptions]
+                    org_facts = [f for f in org_facts if not _is_assumed_org_fact(f, entity)] + assumed_facts
+                    planned_assumptions = list(assumptions)
+
+                    if LOG_ASSUMPTION_GENERATION:
+                        logger.info(f"Generated {len(assumptions)} assumptions for {entity}")
 
             except (ValueError, KeyError, AttributeError, TypeError) as e:
                 # P2 FIX #7: Catch only expected/recoverable errors
@@ -316,71 +433,48 @@ def build_organization_from_facts(
                 logger.info(f"Found authoritative IT headcount from fact {fact.item}: {authoritative_headcount}")
                 break
 
-    # Build staff members from facts (P1 FIX #4: with rollback protection)
-    # If staff creation fails after assumptions were merged, rollback the assumptions
+    # Build staff members from facts. Nothing has been written to the FactStore
+    # yet, so a failure here needs no rollback (P1 FIX #4)
     staff_members = []
 
-    try:
-        # Process leadership
-        for fact in leadership_facts:
-            members = _create_staff_from_leadership_fact(fact, deal_id=deal_id)
-            staff_members.extend(members)
-
-        # Process central IT teams
-        for fact in central_it_facts:
-            members = _create_staff_from_team_fact(fact, RoleCategory.INFRASTRUCTURE, deal_id=deal_id)
-            staff_members.extend(members)
-
-        # Process app teams
-        for fact in app_team_facts:
-            members = _create_staff_from_team_fact(fact, RoleCategory.APPLICATIONS, deal_id=deal_id)
-            staff_members.extend(members)
-
-        # Process embedded IT
-        for fact in embedded_facts:
-            members = _create_staff_from_team_fact(fact, RoleCategory.OTHER, deal_id=deal_id)
-            staff_members.extend(members)
-
-        # Process roles (from Role & Compensation Breakdown table)
-        for fact in roles_facts:
-            members = _create_staff_from_role_fact(fact, deal_id=deal_id)
-            staff_members.extend(members)
-
-        # Process key individuals
-        for fact in key_individual_facts:
-            member = _create_staff_from_key_individual_fact(fact, deal_id=deal_id)
-            if member:
-                # Check if already added, update if so
-                existing = next((s for s in staff_members if s.name == member.name), None)
-                if existing:
-                    existing.is_key_person = True
-                    existing.key_person_reason = member.key_person_reason
-                else:
-                    staff_members.append(member)
-
-        store.staff_members = staff_members
-
-    except Exception as e:
-        # P1 FIX #4: Rollback assumptions if staff creation failed
-        logger.error(f"Staff member creation failed for {entity}, rolling back assumptions: {e}")
-
-        if assumptions_merged_successfully and assumptions_backup_for_staff_rollback is not None:
-            with _fact_store_modification_lock:
-                # Remove assumptions that were just merged
-                fact_store.facts = [
-                    f for f in fact_store.facts
-                    if not (f.domain == "organization" and
-                            f.entity == entity and
-                            (f.details or {}).get('data_source') == 'assumed')
-                ]
-
-                # Restore old assumptions (if any existed)
-                fact_store.facts.extend(assumptions_backup_for_staff_rollback)
-
-                logger.info(f"Rolled back assumptions for {entity} due to staff creation failure")
-
-        # Re-raise the exception
-        raise
+    # Process leadership
+    for fact in leadership_facts:
+        members = _create_staff_from_leadership_fact(fact, deal_id=deal_id)
+        staff_members.extend(members)
+
+    # Process central IT teams
+    for fact in central_it_facts:
+        members = _create_staff_from_team_fact(fact, RoleCategory.INFRASTRUCTURE, deal_id=deal_id)
+        staff_members.extend(members)
+
+    # Process app teams
+    for fact in app_team_facts:
+        members = _create_staff_from_team_fact(fact, RoleCategory.APPLICATIONS, deal_id=deal_id)
+        staff_members.extend(members)
+
+    # Process embedded IT
+    for fact in embedded_facts:
+        members = _create_staff_from_team_fact(fact, RoleCategory.OTHER, deal_id=deal_id)
+        staff_members.extend(members)
+
+    # Process roles (from Role & Compensation Breakdown table)
+    for fact in roles_facts:
+        members = _create_staff_from_role_fact(fact, deal_id=deal_id)
+        staff_members.extend(members)
+
+    # Process key individuals
+    for fact in key_individual_facts:
+        member = _create_staff_from_key_individual_fact(fact, deal_id=deal_id)
+        if member:
+            # Check if already added, update if so
+            existing = next((s for s in staff_members if s.name == member.name), None)
+            if existing:
+                existing.is_key_person = True
+                existing.key_person_reason = member.key_person_reason
+            else:
+                staff_members.append(member)
+
+    store.staff_members = staff_members
 
     # Set authoritative headcount from IT Budget fact if found
     if authoritative_headcount is not None:
@@ -406,9 +500,7 @@ def build_organization_from_facts(
     store._update_counts()
 
     # P2 FIX #9: Determine final status using explicit tracking (not FactStore inference)
-    # We tracked assumptions_merged_successfully during the merge phase (line 234)
-    # This is more reliable than scanning FactStore after the fact
-    if assumptions_merged_successfully:
+    if planned_assumptions:
         status = "success_with_assumptions"
         logger.info(f"Built organization store with {len(staff_members)} staff "
                    f"(includes assumptions), "
@@ -420,7 +512,7 @@ def build_organization_from_facts(
     logger.info(f"  FTEs: {store.total_internal_fte}, Contractors: {store.total_contractor}, "
                f"Total Comp: ${store.total_compensation:,.0f}")
 
-    return store, status
+    return OrganizationBuildPlan(store, status, planned_assumptions)
 
 
 def build_organization_from_inventory_store(
@@ -1132,9 +1224,7 @@ def _remove_old_assumptions_from_fact_store(
     CRITICAL (P0 FIX #3): Prevents stale assumptions from polluting
     inventory when source data is updated or assumptions re-generated.
 
-    Thread Safety: This function must be called within _fact_store_modification_lock
-    to prevent concurrent modifications. Uses in-place list modification to
-    preserve backup references.
+    Thread Safety: Runs as one atomic FactStore.replace_facts() call.
 
     Args:
         fact_store: FactStore to clean
@@ -1143,11 +1233,9 @@ def _remove_old_assumptions_from_fact_store(
     Returns:
         Number of assumptions removed
     """
-    original_count = len(fact_store.facts)
-
     # Defensive check: warn if any org facts have None details (prevents silent filter bugs)
     none_details_count = sum(
-        1 for f in fact_store.facts
+        1 for f in list(fact_store.facts)
         if f.domain == "organization" and f.entity == entity and f.details is None
     )
     if none_details_count > 0:
@@ -1156,25 +1244,9 @@ def _remove_old_assumptions_from_fact_store(
             f"These facts may not be filtered correctly. This indicates a data integrity issue."
         )
 
-    # In-place removal to preserve list identity (thread-safe with lock)
-    # Using list comprehension + slice assignment instead of reassignment
-    facts_to_keep = [
-        f for f in fact_store.facts
-        if not (f.domain == "organization" and
-                f.entity == entity and
-                (f.details or {}).get('data_source') == 'assumed')
-    ]
-
-    # Replace contents in-place (preserves list object identity)
-    fact_store.facts[:] = facts_to_keep
-
-    # P1 FIX #5: Clear assumed fact index for this entity (index maintenance)
-    if hasattr(fact_store, '_assumed_fact_keys_by_entity'):
-        if entity in fact_store._assumed_fact_keys_by_entity:
-            fact_store._assumed_fact_keys_by_entity[entity].clear()
-            logger.debug(f"Cleared assumed fact index for {entity}")
-
-    removed_count = original_count - len(fact_store.facts)
+    # In-place removal (preserves list identity) that also maintains the
+    # fact index, the assumed fact index (P1 FIX #5) and FactStore versions
+    removed_count = len(fact_store.replace_facts(lambda f: _is_assumed_org_fact(f, entity), [])["removed"])
 
     if removed_count > 0:
         logger.info(f"Removed {removed_count} old assumptions for {entity} (cleanup)")
@@ -1191,11 +1263,11 @@ def _merge_assumptions_into_fact_store(
     """
     Merge synthetic assumptions into FactStore as Fact objects.
 
-    CRITICAL (P0 FIX #2): Includes idempotency protection to prevent
-    duplicate assumptions if bridge is called multiple times.
-
-    Thread Safety: This function must be called within _fact_store_modification_lock
-    to prevent concurrent modifications from corrupting the idempotency check.
+    The entity's previously assumed facts are replaced by the new set in a
+    single atomic FactStore.replace_facts() call: assumptions that are
+    unchanged keep their fact IDs, stale ones are removed (P0 FIX #3) and
+    other entities are untouched (P0 FIX #5). Re-applying the same set is a
+    no-op (P0 FIX #2), so concurrent builds cannot duplicate assumptions.
 
     This allows downstream extraction logic to treat assumptions
     the same as observed facts (unified processing).
@@ -1206,43 +1278,10 @@ def _merge_assumptions_into_fact_store(
         deal_id: Deal ID for fact tagging
         entity: "target" or "buyer"
     """
-    # IDEMPOTENCY CHECK: Query index for O(1) lookup (P1 FIX #5: O(N) → O(1))
-    # Before: Linear scan through all facts (O(N) where N = total facts)
-    # After: Direct index lookup (O(1) where K = assumed facts for entity)
-    existing_assumption_keys = fact_store.get_assumed_fact_keys(entity)
-
-    logger.debug(f"Found {len(existing_assumption_keys)} existing assumptions for {entity} (via index)")
-
-    # Filter out assumptions that already exist
-    new_assumptions = []
-    duplicate_count = 0
-
-    for assumption in assumptions:
-        key = f"{assumption.category}:{assumption.item}"
-        if key in existing_assumption_keys:
-            duplicate_count += 1
-            logger.debug(f"Skipping duplicate assumption: {assumption.item}")
-        else:
-            new_assumptions.append(assumption)
-
-    if duplicate_count > 0:
-        logger.info(f"Skipped {duplicate_count} duplicate assumptions (idempotency protection)")
-
-    # Merge only new assumptions
-    for assumption in new_assumptions:
-        # Convert assumption to fact dict
-        fact_dict = assumption.to_fact(deal_id)
-
-        # Add to fact store using add_fact method
-        fact_store.add_fact(
-            domain=fact_dict['domain'],
-            category=fact_dict['category'],
-            item=fact_dict['item'],
-            details=fact_dict['details'],
-            status=fact_dict['status'],
-            evidence=fact_dict['evidence'],
-            entity=fact_dict['entity']
-        )
+    result = fact_store.replace_facts(
+        lambda f: _is_assumed_org_fact(f, entity),
+        [assumption.to_fact(deal_id) for assumption in assumptions]
+    )
 
-    logger.info(f"Merged {len(new_assumptions)} new assumptions into FactStore "
-                f"(skipped {duplicate_count} duplicates)")
+    logger.info(f"Merged {len(result['added'])} new assumptions into FactStore for {entity} "
+                f"(kept {len(result['kept'])}, removed {len(result['removed'])} stale)")
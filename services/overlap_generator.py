@@ -14,13 +14,30 @@ ARCHITECTURE:
 STRATEGY:
 Uses LLM to detect overlaps with structured output, ensuring consistent
 overlap map generation across all analyses.
+
+With pre-matching enabled (OVERLAP_PREMATCH_ENABLED), facts are first paired
+locally (services/overlap_matcher.py): exact platform matches become overlaps
+directly and only ambiguous candidate pairs go to the LLM, in batches that
+run concurrently across domains.
 """
 
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from dataclasses import asdict
 import json
 from anthropic import Anthropic
 from tools_v2.reasoning_tools import OverlapCandidate, OVERLAP_TYPES, ALL_DOMAINS
+from services.overlap_matcher import (
+    EXACT_MATCH_OVERLAP_TYPES, CandidatePair, batch_candidates, exact_match_overlaps, exact_match_pairs,
+    prematch_facts
+)
+
+try:
+    from config_v2 import OVERLAP_PREMATCH_ENABLED, OVERLAP_LLM_BATCH_PAIRS, OVERLAP_MAX_CONCURRENCY
+except ImportError:
+    OVERLAP_PREMATCH_ENABLED = True
+    OVERLAP_LLM_BATCH_PAIRS = 30
+    OVERLAP_MAX_CONCURRENCY = 4
 
 
 # Domain-specific overlap types (most relevant for each domain)
@@ -63,9 +80,24 @@ DOMAIN_OVERLAP_PRIORITIES = {
 class OverlapGenerator:
     """Generates overlap candidates by comparing target and buyer facts."""
 
-    def __init__(self, anthropic_client: Optional[Anthropic] = None):
-        """Initialize with Anthropic client."""
+    def __init__(
+        self,
+        anthropic_client: Optional[Anthropic] = None,
+        prematch: Optional[bool] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Initialize with Anthropic client.
+
+        Args:
+            anthropic_client: Client to use (a default Anthropic() if None)
+            prematch: Pair facts locally before the LLM (OVERLAP_PREMATCH_ENABLED if None)
+            max_concurrency: Concurrent LLM calls (OVERLAP_MAX_CONCURRENCY if None)
+        """
         self.client = anthropic_client or Anthropic()
+        self.prematch = OVERLAP_PREMATCH_ENABLED if prematch is None else prematch
+        self.max_concurrency = max(1, max_concurrency or OVERLAP_MAX_CONCURRENCY)
+        self.prematch_stats: Dict[str, Dict[str, int]] = {}  # domain -> counts from the last run
 
     def generate_overlap_map_for_domain(
         self,
@@ -91,6 +123,9 @@ class OverlapGenerator:
         if not buyer_facts:
             return []  # No buyer facts = no overlap to detect
 
+        if self.prematch:
+            return self._generate_prematched({domain: (target_facts, buyer_facts)})[domain]
+
         # Format facts for comparison
         target_inventory = self._format_facts(target_facts, "TARGET")
         buyer_inventory = self._format_facts(buyer_facts, "BUYER")
@@ -144,10 +179,21 @@ class OverlapGenerator:
         domain: str,
         target_inventory: str,
         buyer_inventory: str,
-        overlap_types: List[str]
+        overlap_types: List[str],
+        candidate_pairs: Optional[List[CandidatePair]] = None
     ) -> str:
         """Build prompt for LLM to detect overlaps."""
 
+        pairs_section = ""
+        if candidate_pairs:
+            pair_lines = [f"- {p.target_fact_id} <-> {p.buyer_fact_id} (similarity {p.score:.2f})"
+                          for p in candidate_pairs]
+            pairs_section = (
+                "CANDIDATE PAIRS (pre-matched by name, vendor and category - assess only these;\n"
+                "exact platform matches were already recorded, do not repeat them):\n"
+                + "\n".join(pair_lines) + "\n\n" + "=" * 70 + "\n\n"
+            )
+
         return f"""You are analyzing IT due diligence data for an M&A transaction.
 
 Your task: Identify meaningful overlaps between the TARGET company and BUYER company in the {domain.upper()} domain.
@@ -169,7 +215,7 @@ VALID OVERLAP TYPES FOR {domain.upper()}:
 
 {"="*70}
 
-OUTPUT FORMAT (JSON array of overlap objects):
+{pairs_section}OUTPUT FORMAT (JSON array of overlap objects):
 
 [
   {{
@@ -294,6 +340,21 @@ Return ONLY the JSON array, no other text.
         Returns:
             Dict of domain -> List[OverlapCandidate]
         """
+        if self.prematch:
+            inputs = {}
+            for domain in ALL_DOMAINS:
+                if domain == "cross-domain":
+                    continue
+                domain_facts = facts_by_domain.get(domain, {})
+                inputs[domain] = (domain_facts.get("target", []), domain_facts.get("buyer", []))
+                print(f"[OVERLAP GEN] {domain}: {len(inputs[domain][0])} target facts, "
+                      f"{len(inputs[domain][1])} buyer facts")
+
+            overlaps_by_domain = self._generate_prematched(inputs)
+            for domain, overlaps in overlaps_by_domain.items():
+                print(f"[OVERLAP GEN] {domain}: Generated {len(overlaps)} overlaps")
+            return overlaps_by_domain
+
         overlaps_by_domain = {}
 
         for domain in ALL_DOMAINS:
@@ -318,6 +379,100 @@ Return ONLY the JSON array, no other text.
 
         return overlaps_by_domain
 
+    # =========================================================================
+    # PRE-MATCHED GENERATION
+    # =========================================================================
+
+    def _generate_prematched(
+        self,
+        inputs: Dict[str, Tuple[List[Dict], List[Dict]]]
+    ) -> Dict[str, List[OverlapCandidate]]:
+        """
+        Generate overlaps for several domains from locally pre-matched pairs.
+
+        Exact matches are accepted as-is; ambiguous candidate batches from all
+        domains share one bounded pool of LLM calls. Overlap IDs are assigned
+        per domain once all results are in (exact matches first).
+        """
+        overlaps_by_domain: Dict[str, List[OverlapCandidate]] = {}
+        jobs: List[Tuple[str, str]] = []
+
+        for domain, (target_facts, buyer_facts) in inputs.items():
+            if not target_facts or not buyer_facts:
+                overlaps_by_domain[domain] = []
+                continue
+            auto_overlaps, prompts = self._plan_domain(domain, target_facts, buyer_facts)
+            overlaps_by_domain[domain] = auto_overlaps
+            jobs.extend((domain, prompt) for prompt in prompts)
+
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(jobs))) as pool:
+                results = list(pool.map(lambda job: self._detect_overlaps_safely(job[1], job[0]), jobs))
+            for (domain, _), overlaps in zip(jobs, results):
+                overlaps_by_domain[domain].extend(overlaps)
+
+        for domain, overlaps in overlaps_by_domain.items():
+            for i, overlap in enumerate(overlaps):
+                overlap.overlap_id = f"OVL-{domain.upper()[:3]}-{i+1:03d}"
+
+        return overlaps_by_domain
+
+    def _plan_domain(
+        self,
+        domain: str,
+        target_facts: List[Dict],
+        buyer_facts: List[Dict]
+    ) -> Tuple[List[OverlapCandidate], List[str]]:
+        """
+        Pre-match one domain: (overlaps from exact matches, LLM prompts for ambiguous batches).
+
+        Exact matches are only accepted without the LLM where the domain
+        prioritises platform_alignment/version_gap; in other domains they
+        join the candidate pairs the LLM classifies.
+        """
+        result = prematch_facts(target_facts, buyer_facts)
+        priority_overlap_types = DOMAIN_OVERLAP_PRIORITIES.get(domain, OVERLAP_TYPES)
+        if set(EXACT_MATCH_OVERLAP_TYPES) <= set(priority_overlap_types):
+            auto_overlaps = exact_match_overlaps(domain, result.exact_matches)
+            candidates = result.candidates
+        else:
+            auto_overlaps = []
+            candidates = exact_match_pairs(result.exact_matches) + result.candidates
+
+        facts_by_id = {f.get("fact_id"): f for f in target_facts + buyer_facts}
+        prompts = []
+        for batch in batch_candidates(candidates, OVERLAP_LLM_BATCH_PAIRS):
+            target_ids = list(dict.fromkeys(p.target_fact_id for p in batch))
+            buyer_ids = list(dict.fromkeys(p.buyer_fact_id for p in batch))
+            prompts.append(self._build_overlap_detection_prompt(
+                domain=domain,
+                target_inventory=self._format_facts([facts_by_id[i] for i in target_ids], "TARGET"),
+                buyer_inventory=self._format_facts([facts_by_id[i] for i in buyer_ids], "BUYER"),
+                overlap_types=priority_overlap_types,
+                candidate_pairs=batch
+            ))
+
+        self.prematch_stats[domain] = {
+            "exact_matches": len(result.exact_matches),
+            "auto_accepted": len(auto_overlaps),
+            "candidate_pairs": len(candidates),
+            "llm_batches": len(prompts),
+            "pairs_scored": result.comparisons,
+            "cross_product": result.cross_product,
+        }
+        print(f"[OVERLAP GEN] {domain}: {len(result.exact_matches)} exact matches, "
+              f"{len(candidates)} candidate pairs in {len(prompts)} LLM batches "
+              f"({result.comparisons}/{result.cross_product} pairs scored)")
+        return auto_overlaps, prompts
+
+    def _detect_overlaps_safely(self, prompt: str, domain: str) -> List[OverlapCandidate]:
+        """LLM overlap detection for one batch; errors degrade to no overlaps."""
+        try:
+            return self._call_llm_for_overlap_detection(prompt, domain)
+        except Exception as e:
+            print(f"[ERROR] Overlap generation failed for {domain}: {e}")
+            return []
+
     def save_overlaps_to_file(
         self,
         overlaps_by_domain: Dict[str, List[OverlapCandidate]],
@@ -0,0 +1,313 @@
+"""
+Overlap Pre-Matching - local candidate pairing for Phase 3.5
+
+PURPOSE:
+Comparing every target fact with every buyer fact in one LLM prompt grows
+with the product of both inventories and overflows the prompt on large
+estates. This module pairs facts locally first:
+
+1. Blocking: buyer facts are indexed by normalized name tokens, vendor and
+   category; a target fact is only scored against buyer facts sharing a key.
+2. Scoring: name-token similarity plus vendor and category agreement.
+3. Decisions:
+   - exact: same normalized name (and no conflicting vendor) - accepted
+     without the LLM as platform_alignment / version_gap overlaps in domains
+     that prioritise those types (applications, infrastructure); elsewhere
+     they are sent to the LLM like ambiguous pairs (a "Chief Information
+     Officer" on both sides is not a platform overlap)
+   - ambiguous: the best-scoring remaining pairs per target fact - sent to
+     the LLM in small batches (see OverlapGenerator)
+
+Works on the fact dicts the OverlapGenerator receives (Fact.to_dict()).
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from tools_v2.reasoning_tools import OverlapCandidate
+
+try:
+    from config_v2 import OVERLAP_CANDIDATES_PER_FACT
+except ImportError:
+    OVERLAP_CANDIDATES_PER_FACT = 2
+
+# Overlap types exact_match_overlaps() produces; a domain must prioritise
+# all of them for its exact matches to be accepted without the LLM
+EXACT_MATCH_OVERLAP_TYPES = ("platform_alignment", "version_gap")
+
+# Pairs scoring below this are dropped (vendor + category scores 0.40, vendor alone 0.25)
+PREMATCH_MIN_SCORE = 0.30
+
+# A shared category alone pairs facts only when the buyer has at most this
+# many facts in it (the target's ERP vs the buyer's ERP), not in catch-all
+# categories like "custom"
+CATEGORY_PAIR_MAX_BLOCK = 5
+
+# Name-token and vendor blocks larger than this are too generic to pair on;
+# the fact's other keys still apply
+MAX_BLOCK_SIZE = 50
+
+# Score weights
+NAME_WEIGHT = 0.60
+VENDOR_WEIGHT = 0.25
+CATEGORY_WEIGHT = 0.15
+
+NAME_DETAIL_KEYS = ("product", "name", "application", "platform", "system")
+VENDOR_DETAIL_KEYS = ("vendor", "provider", "manufacturer")
+
+# Tokens that do not distinguish one product from another
+NOISE_TOKENS = frozenset({
+    "the", "and", "of", "for", "inc", "corp", "corporation", "co", "llc", "ltd",
+    "software", "system", "systems", "platform", "solution", "solutions", "suite", "edition",
+})
+
+# 6.0, 2.4.1, v12, 2012/2019 (years), 19c/11g; plain numbers stay in the name ("Office 365")
+_VERSION_TOKEN = re.compile(r"^(v\d+(\.\d+)*|\d+(\.\d+)+[a-z]?|(19|20)\d\d|\d+[cgi])$")
+_NON_ALNUM = re.compile(r"[^a-z0-9.]+")
+
+
+@dataclass
+class FactProfile:
+    """Normalized matching attributes of one fact."""
+    fact_id: str
+    name: str                       # Display name
+    name_key: str                   # Normalized name (tokens joined)
+    name_tokens: FrozenSet[str]
+    vendor: str
+    category: str
+    version: str
+
+
+@dataclass
+class CandidatePair:
+    """A target/buyer fact pair that may be an overlap."""
+    target_fact_id: str
+    buyer_fact_id: str
+    score: float
+
+
+@dataclass
+class ExactMatch:
+    """Target and buyer facts that name the same platform."""
+    name: str
+    target_fact_ids: List[str]
+    buyer_fact_ids: List[str]
+    target_versions: List[str] = field(default_factory=list)
+    buyer_versions: List[str] = field(default_factory=list)
+
+
+@dataclass
+class PrematchResult:
+    """Output of prematch_facts()."""
+    exact_matches: List[ExactMatch]
+    candidates: List[CandidatePair]   # Ambiguous pairs for the LLM
+    comparisons: int                  # Pairs actually scored
+    cross_product: int                # Pairs a full comparison would consider
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_NON_ALNUM.sub(" ", str(text).lower()).split())
+
+
+def profile_fact(fact: Dict) -> FactProfile:
+    """Extract the normalized name, vendor, category and version of a fact dict."""
+    details = fact.get("details") or {}
+    name = next((str(details[k]) for k in NAME_DETAIL_KEYS if details.get(k)), "") \
+        or fact.get("item") or fact.get("statement") or ""
+    vendor = next((str(details[k]) for k in VENDOR_DETAIL_KEYS if details.get(k)), "")
+
+    tokens = [t.strip(".") for t in _normalize(name).split()]
+    version = str(details.get("version") or "")
+    name_tokens = []
+    for token in tokens:
+        if not token or token in NOISE_TOKENS:
+            continue
+        if _VERSION_TOKEN.match(token):
+            version = version or token
+            continue
+        name_tokens.append(token)
+
+    return FactProfile(
+        fact_id=fact.get("fact_id", ""),
+        name=str(name),
+        name_key=" ".join(name_tokens),
+        name_tokens=frozenset(name_tokens),
+        vendor=_normalize(vendor),
+        category=_normalize(fact.get("category", "")),
+        version=_normalize(version),
+    )
+
+
+def score_pair(target: FactProfile, buyer: FactProfile) -> float:
+    """Similarity of two profiles in [0, 1]."""
+    union = target.name_tokens | buyer.name_tokens
+    jaccard = len(target.name_tokens & buyer.name_tokens) / len(union) if union else 0.0
+    vendor = 1.0 if target.vendor and target.vendor == buyer.vendor else 0.0
+    category = 1.0 if target.category and target.category == buyer.category else 0.0
+    return NAME_WEIGHT * jaccard + VENDOR_WEIGHT * vendor + CATEGORY_WEIGHT * category
+
+
+def is_exact_match(target: FactProfile, buyer: FactProfile) -> bool:
+    """Same normalized name, and vendors agree where both are known."""
+    if not target.name_key or target.name_key != buyer.name_key:
+        return False
+    return not (target.vendor and buyer.vendor and target.vendor != buyer.vendor)
+
+
+def _block_keys(profile: FactProfile) -> List[str]:
+    keys = [f"n:{token}" for token in profile.name_tokens]
+    if profile.vendor:
+        keys.append(f"v:{profile.vendor}")
+    if profile.category:
+        keys.append(f"c:{profile.category}")
+    return keys
+
+
+def prematch_facts(
+    target_facts: List[Dict],
+    buyer_facts: List[Dict],
+    candidates_per_fact: Optional[int] = None,
+    min_score: float = PREMATCH_MIN_SCORE
+) -> PrematchResult:
+    """
+    Pair target and buyer facts locally.
+
+    Args:
+        target_facts: Target fact dicts for one domain
+        buyer_facts: Buyer fact dicts for the same domain
+        candidates_per_fact: Ambiguous buyer candidates kept per target fact
+        min_score: Pairs below this score are dropped, except same-category
+            pairs in small categories (CATEGORY_PAIR_MAX_BLOCK)
+
+    Returns:
+        PrematchResult with exact matches and ambiguous candidate pairs
+    """
+    top_k = candidates_per_fact if candidates_per_fact is not None else OVERLAP_CANDIDATES_PER_FACT
+    targets = [profile_fact(f) for f in target_facts]
+    buyers = [profile_fact(f) for f in buyer_facts]
+
+    blocks: Dict[str, List[int]] = {}
+    for index, buyer in enumerate(buyers):
+        for key in _block_keys(buyer):
+            blocks.setdefault(key, []).append(index)
+
+    exact: Dict[str, ExactMatch] = {}
+    candidates: List[CandidatePair] = []
+    comparisons = 0
+
+    for target in targets:
+        seen = set()
+        for key in _block_keys(target):
+            block = blocks.get(key, ())
+            limit = CATEGORY_PAIR_MAX_BLOCK if key.startswith("c:") else MAX_BLOCK_SIZE
+            if len(block) > limit:
+                continue
+            seen.update(block)
+        small_category = 0 < len(blocks.get(f"c:{target.category}", ())) <= CATEGORY_PAIR_MAX_BLOCK
+
+        scored: List[Tuple[float, int]] = []
+        for index in sorted(seen):
+            buyer = buyers[index]
+            comparisons += 1
+            if is_exact_match(target, buyer):
+                match = exact.setdefault(target.name_key, ExactMatch(name=target.name, target_fact_ids=[],
+                                                                    buyer_fact_ids=[]))
+                if target.fact_id not in match.target_fact_ids:
+                    match.target_fact_ids.append(target.fact_id)
+                    if target.version:
+                        match.target_versions.append(target.version)
+                if buyer.fact_id not in match.buyer_fact_ids:
+                    match.buyer_fact_ids.append(buyer.fact_id)
+                    if buyer.version:
+                        match.buyer_versions.append(buyer.version)
+                continue
+            score = score_pair(target, buyer)
+            if score >= min_score or (small_category and target.category == buyer.category):
+                scored.append((score, index))
+
+        scored.sort(key=lambda pair: (-pair[0], pair[1]))
+        for score, index in scored[:top_k]:
+            candidates.append(CandidatePair(target.fact_id, buyers[index].fact_id, round(score, 3)))
+
+    return PrematchResult(
+        exact_matches=list(exact.values()),
+        candidates=candidates,
+        comparisons=comparisons,
+        cross_product=len(targets) * len(buyers),
+    )
+
+
+def exact_match_overlaps(domain: str, exact_matches: List[ExactMatch]) -> List[OverlapCandidate]:
+    """
+    Turn exact matches into OverlapCandidates without calling the LLM.
+
+    Overlap IDs are placeholders; OverlapGenerator numbers the domain's
+    overlaps once LLM results are in.
+    """
+    overlaps = []
+    for match in exact_matches:
+        target_versions = sorted(set(match.target_versions))
+        buyer_versions = sorted(set(match.buyer_versions))
+        version_gap = bool(target_versions and buyer_versions and target_versions != buyer_versions)
+
+        if version_gap:
+            overlap_type = "version_gap"
+            why = (f"Both run {match.name} on different versions ({', '.join(target_versions)} vs "
+                   f"{', '.join(buyer_versions)}); versions must be aligned before consolidation.")
+        else:
+            overlap_type = "platform_alignment"
+            why = (f"Both run {match.name}; consolidation or shared licensing is possible "
+                   f"without a platform migration.")
+
+        def summary(versions: List[str]) -> str:
+            return f"{match.name} (version {', '.join(versions)})" if versions else match.name
+
+        overlaps.append(OverlapCandidate(
+            overlap_id="",
+            domain=domain,
+            overlap_type=overlap_type,
+            target_fact_ids=list(match.target_fact_ids),
+            buyer_fact_ids=list(match.buyer_fact_ids),
+            target_summary=summary(target_versions),
+            buyer_summary=summary(buyer_versions),
+            why_it_matters=why,
+            confidence=0.9,
+        ))
+    return overlaps
+
+
+def exact_match_pairs(exact_matches: List[ExactMatch]) -> List[CandidatePair]:
+    """Every target/buyer pair of the exact matches, for domains that send them to the LLM."""
+    return [
+        CandidatePair(target_id, buyer_id, 1.0)
+        for match in exact_matches
+        for target_id in match.target_fact_ids
+        for buyer_id in match.buyer_fact_ids
+    ]
+
+
+def batch_candidates(candidates: List[CandidatePair], max_pairs: int) -> List[List[CandidatePair]]:
+    """
+    Split candidate pairs into batches of at most max_pairs.
+
+    Pairs of one target fact stay in the same batch (unless that alone
+    exceeds max_pairs) so the LLM can compare its alternatives.
+    """
+    by_target: Dict[str, List[CandidatePair]] = {}
+    for pair in candidates:
+        by_target.setdefault(pair.target_fact_id, []).append(pair)
+
+    batches: List[List[CandidatePair]] = []
+    current: List[CandidatePair] = []
+    for pairs in by_target.values():
+        if current and len(current) + len(pairs) > max_pairs:
+            batches.append(current)
+            current = []
+        current.extend(pairs)
+        while len(current) > max_pairs:
+            batches.append(current[:max_pairs])
+            current = current[max_pairs:]
+    if current:
+        batches.append(current)
+    return batches
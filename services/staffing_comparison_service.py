@@ -24,6 +24,7 @@ from models.organization_stores import (
     TotalITCostSummary
 )
 from services.benchmark_service import BenchmarkService
+from services.benchmark_tables import RoleTitleTrie
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +101,7 @@ class StaffingComparisonService:
 
         # Role equivalency for matching (Point 64)
         self.role_equivalency_map = ROLE_EQUIVALENCY_MAP.copy()
+        self._role_trie: Optional[RoleTitleTrie] = None  # Built on first use
 
     def run_full_comparison(
         self,
@@ -474,21 +476,16 @@ class StaffingComparisonService:
         """
         Normalize a role title for comparison (Point 64).
 
-        Maps non-standard titles to benchmark roles.
+        Maps non-standard titles to benchmark roles: direct match first,
+        then the earliest-added variation contained in the title, otherwise
+        the title itself.
         """
-        title_lower = role_title.lower().strip()
+        return self._get_role_trie().normalize(role_title)
 
-        # Direct match
-        if title_lower in self.role_equivalency_map:
-            return self.role_equivalency_map[title_lower]
-
-        # Substring match
-        for key, normalized in self.role_equivalency_map.items():
-            if key in title_lower:
-                return normalized
-
-        # No mapping found, return original
-        return role_title.lower()
+    def _get_role_trie(self) -> RoleTitleTrie:
+        if self._role_trie is None:
+            self._role_trie = RoleTitleTrie(self.role_equivalency_map)
+        return self._role_trie
 
     def map_roles_to_benchmarks(
         self,
@@ -499,10 +496,12 @@ class StaffingComparisonService:
 
         Returns dict mapping normalized role to list of staff.
         """
-        role_groups = {}
+        # Normalize each distinct title in the census once
+        normalized_titles = self._get_role_trie().normalize_all(m.role_title for m in staff)
 
+        role_groups = {}
         for member in staff:
-            normalized = self.normalize_role_title(member.role_title)
+            normalized = normalized_titles[member.role_title]
             if normalized not in role_groups:
                 role_groups[normalized] = []
             role_groups[normalized].append(member)
@@ -512,6 +511,7 @@ class StaffingComparisonService:
     def add_role_equivalency(self, variation: str, normalized_role: str) -> None:
         """Add a custom role equivalency mapping."""
         self.role_equivalency_map[variation.lower()] = normalized_role.lower()
+        self._role_trie = None
 
     # =========================================================================
     # Historical Trend Analysis (Point 65)
@@ -9,16 +9,27 @@ Orchestrates the complete validation flow:
 5. Cross-domain consistency (Layer 3 - after all domains)
 
 This is the main entry point for running validation on extracted data.
+
+validate_domains() validates several domains at once. In parallel mode the
+CPU-bound evidence verification runs on a process pool (documents are
+shipped to each worker once, at start-up) while the LLM-backed layers run
+on a thread pool, so the two overlap instead of running domain by domain.
 """
 
 import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 from tools_v2.evidence_verifier import (
-    verify_all_facts,
+    verify_facts_batch,
     EvidenceVerificationReport,
+    PreparedDocumentCache,
     create_evidence_flags
 )
 from tools_v2.category_validator import (
@@ -55,6 +66,9 @@ PASS_THRESHOLD = 0.80  # Above this = validation passes
 RERUN_THRESHOLD = 0.60  # Below this = requires re-extraction
 HUMAN_REVIEW_THRESHOLD = 0.70  # Below this = needs human review
 
+# Parallel mode (validate_domains)
+PARALLEL_LLM_WORKERS = 8  # Concurrent category/domain/adversarial calls
+
 
 # =============================================================================
 # RESULT MODELS
@@ -106,10 +120,45 @@ class ValidationPipelineResult:
             "flags_count": len(self.all_flags),
             "critical_issues_count": len(self.critical_issues),
             "total_time_ms": self.total_time_ms,
+            "layer_times": dict(self.layer_times),
             "validated_at": self.validated_at.isoformat()
         }
 
 
+# =============================================================================
+# PROCESS-POOL WORKERS
+# =============================================================================
+
+# Per-process document snapshot, populated once by _init_evidence_worker
+_worker_documents: Dict[str, Any] = {}
+
+
+def _init_evidence_worker(
+    document_text: str,
+    source_documents: Optional[Dict[str, str]]
+):
+    """Process-pool initializer: receive the source documents once per worker."""
+    _worker_documents["document_text"] = document_text
+    _worker_documents["source_documents"] = source_documents
+    _worker_documents["cache"] = PreparedDocumentCache()
+
+
+def _verify_domain_evidence(
+    domain: str,
+    facts: List[Dict[str, Any]]
+) -> Tuple[EvidenceVerificationReport, float]:
+    """Process-pool task: verify one domain's evidence against the worker snapshot."""
+    start = time.time()
+    report = verify_facts_batch(
+        facts=facts,
+        document_text=_worker_documents["document_text"],
+        domain=domain,
+        documents=_worker_documents["source_documents"],
+        document_cache=_worker_documents["cache"]
+    )
+    return report, (time.time() - start) * 1000
+
+
 # =============================================================================
 # VALIDATION PIPELINE CLASS
 # =============================================================================
@@ -133,7 +182,8 @@ class ValidationPipeline:
         enable_evidence: bool = EVIDENCE_VERIFICATION_ENABLED,
         enable_category: bool = CATEGORY_VALIDATION_ENABLED,
         enable_domain: bool = DOMAIN_VALIDATION_ENABLED,
-        enable_adversarial: bool = ADVERSARIAL_REVIEW_ENABLED
+        enable_adversarial: bool = ADVERSARIAL_REVIEW_ENABLED,
+        evidence_workers: int = 1
     ):
         """
         Initialize the validation pipeline.
@@ -145,6 +195,8 @@ class ValidationPipeline:
             enable_category: Enable category validation
             enable_domain: Enable domain validation
             enable_adversarial: Enable adversarial review
+            evidence_workers: Process pool size for verifying source documents
+                in parallel (1 = in-process)
         """
         self.api_key = api_key
         self.validation_store = validation_store
@@ -154,6 +206,10 @@ class ValidationPipeline:
         self.enable_category = enable_category
         self.enable_domain = enable_domain
         self.enable_adversarial = enable_adversarial
+        self.evidence_workers = evidence_workers
+
+        # Normalized documents, reused across domains validated against the same text
+        self._prepared_documents = PreparedDocumentCache()
 
         # Initialize validators
         self.category_validator = CategoryValidator(api_key=api_key)
@@ -172,7 +228,8 @@ class ValidationPipeline:
         document_text: str,
         facts: List[Dict[str, Any]],
         gaps: Optional[List[Dict[str, Any]]] = None,
-        run_cross_domain: bool = False
+        run_cross_domain: bool = False,
+        source_documents: Optional[Dict[str, str]] = None
     ) -> ValidationPipelineResult:
         """
         Run complete validation pipeline for a domain.
@@ -183,11 +240,12 @@ class ValidationPipeline:
             facts: Extracted facts for this domain
             gaps: Identified gaps (optional)
             run_cross_domain: Whether to run cross-domain validation
+            source_documents: Optional source_document name -> text, so each
+                fact's evidence is checked against its own document
 
         Returns:
             ValidationPipelineResult with complete assessment
         """
-        import time
         start_time = time.time()
 
         result = ValidationPipelineResult(
@@ -203,13 +261,10 @@ class ValidationPipeline:
         if self.enable_evidence:
             step_start = time.time()
             result.evidence_report = self._run_evidence_verification(
-                facts, document_text, domain
+                facts, document_text, domain, source_documents
             )
             result.layer_times["evidence"] = (time.time() - step_start) * 1000
 
-            # Collect evidence flags
-            self._collect_evidence_flags(result)
-
         # Step 2: Category Validation (Layer 1)
         if self.enable_category:
             step_start = time.time()
@@ -218,10 +273,6 @@ class ValidationPipeline:
             )
             result.layer_times["category"] = (time.time() - step_start) * 1000
 
-            # Collect category flags
-            if result.category_report:
-                result.all_flags.extend(result.category_report.all_flags)
-
         # Step 3: Domain Validation (Layer 2)
         if self.enable_domain:
             step_start = time.time()
@@ -230,9 +281,8 @@ class ValidationPipeline:
             )
             result.layer_times["domain"] = (time.time() - step_start) * 1000
 
-            # Collect domain flags
-            if result.domain_result:
-                result.all_flags.extend(result.domain_result.flags)
+        # Collect evidence, category and domain flags
+        self._collect_layer_flags(result)
 
         # Step 4: Adversarial Review (optional)
         if self.enable_adversarial and not self._should_skip_adversarial(result):
@@ -265,6 +315,178 @@ class ValidationPipeline:
 
         return result
 
+    # =========================================================================
+    # MULTI-DOMAIN VALIDATION
+    # =========================================================================
+
+    def validate_domains(
+        self,
+        document_text: str,
+        facts_by_domain: Dict[str, List[Dict[str, Any]]],
+        gaps_by_domain: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        run_cross_domain: bool = False,
+        source_documents: Optional[Dict[str, str]] = None,
+        parallel: bool = True,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, ValidationPipelineResult]:
+        """
+        Run the validation pipeline for several domains.
+
+        With parallel=True, evidence verification for every domain runs on a
+        process pool while category, domain and adversarial review run on a
+        thread pool. Results are identical to calling validate_domain() per
+        domain; layer_times holds each stage's own duration and
+        total_time_ms the wall-clock time of the whole batch.
+
+        Args:
+            document_text: Source document text
+            facts_by_domain: Domain name -> extracted facts
+            gaps_by_domain: Domain name -> identified gaps (optional)
+            run_cross_domain: Run cross-domain validation once all domains finish
+            source_documents: Optional source_document name -> text
+            parallel: Use the process/thread pools (False = one domain at a time)
+            max_workers: Evidence process pool size (default: CPU count)
+
+        Returns:
+            Domain name -> ValidationPipelineResult
+        """
+        gaps_by_domain = gaps_by_domain or {}
+        domains = list(facts_by_domain)
+
+        if parallel and len(domains) > 1:
+            results = self._validate_domains_parallel(
+                document_text, facts_by_domain, gaps_by_domain,
+                source_documents, max_workers
+            )
+        else:
+            results = {
+                domain: self.validate_domain(
+                    domain=domain,
+                    document_text=document_text,
+                    facts=facts_by_domain[domain],
+                    gaps=gaps_by_domain.get(domain),
+                    source_documents=source_documents
+                )
+                for domain in domains
+            }
+
+        if run_cross_domain and results:
+            step_start = time.time()
+            cross_domain_result = self._run_cross_domain_validation()
+            elapsed_ms = (time.time() - step_start) * 1000
+            for result in results.values():
+                result.cross_domain_result = cross_domain_result
+                result.layer_times["cross_domain"] = elapsed_ms
+
+        return results
+
+    def _validate_domains_parallel(
+        self,
+        document_text: str,
+        facts_by_domain: Dict[str, List[Dict[str, Any]]],
+        gaps_by_domain: Dict[str, List[Dict[str, Any]]],
+        source_documents: Optional[Dict[str, str]],
+        max_workers: Optional[int]
+    ) -> Dict[str, ValidationPipelineResult]:
+        """Fan all domains' stages out to process/thread pools, then assemble."""
+        start_time = time.time()
+        domains = list(facts_by_domain)
+
+        llm_stages = []
+        if self.enable_category:
+            llm_stages.append(("category", "category_report", self._run_category_validation))
+        if self.enable_domain:
+            llm_stages.append(("domain", "domain_result", self._run_domain_validation))
+        if self.enable_adversarial:
+            # Started speculatively; discarded below if the skip rules apply
+            llm_stages.append(("adversarial", "adversarial_findings", self._run_adversarial_review))
+
+        def stage_args(stage: str, domain: str) -> tuple:
+            facts = facts_by_domain[domain]
+            if stage == "category":
+                return (domain, document_text, self._categorize_facts(facts))
+            if stage == "domain":
+                return (domain, document_text, facts, gaps_by_domain.get(domain))
+            return (domain, document_text, facts)
+
+        def timed(func, *args) -> Tuple[Any, float]:
+            step_start = time.time()
+            value = func(*args)
+            return value, (time.time() - step_start) * 1000
+
+        results: Dict[str, ValidationPipelineResult] = {}
+        with ExitStack() as stack:
+            evidence_futures = {}
+            if self.enable_evidence:
+                processes = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=min(len(domains), max_workers or os.cpu_count() or 1),
+                    initializer=_init_evidence_worker,
+                    initargs=(document_text, source_documents)
+                ))
+                evidence_futures = {
+                    domain: processes.submit(_verify_domain_evidence, domain, facts_by_domain[domain])
+                    for domain in domains
+                }
+
+            stage_futures = {}
+            if llm_stages:
+                threads = stack.enter_context(ThreadPoolExecutor(
+                    max_workers=min(len(domains) * len(llm_stages), PARALLEL_LLM_WORKERS)
+                ))
+                for domain in domains:
+                    for stage, attr, func in llm_stages:
+                        stage_futures[domain, stage] = threads.submit(
+                            timed, func, *stage_args(stage, domain)
+                        )
+
+            for domain in domains:
+                result = ValidationPipelineResult(
+                    domain=domain,
+                    overall_valid=True,
+                    overall_confidence=1.0
+                )
+
+                if domain in evidence_futures:
+                    try:
+                        report, elapsed_ms = evidence_futures[domain].result()
+                    except BrokenProcessPool:
+                        logger.warning(f"Evidence worker pool failed; verifying {domain} in-process")
+                        report, elapsed_ms = timed(
+                            self._run_evidence_verification,
+                            facts_by_domain[domain], document_text, domain, source_documents
+                        )
+                    result.evidence_report = report
+                    result.layer_times["evidence"] = elapsed_ms
+
+                for stage, attr, _ in llm_stages:
+                    value, elapsed_ms = stage_futures[domain, stage].result()
+                    setattr(result, attr, value)
+                    result.layer_times[stage] = elapsed_ms
+
+                self._collect_layer_flags(result)
+
+                if self.enable_adversarial and self._should_skip_adversarial(result):
+                    result.adversarial_findings = []
+                    result.layer_times.pop("adversarial", None)
+
+                self._calculate_final_status(result)
+
+                if self.validation_store:
+                    self._persist_validation_state(domain, facts_by_domain[domain], result)
+
+                results[domain] = result
+
+        total_ms = (time.time() - start_time) * 1000
+        for domain, result in results.items():
+            result.total_time_ms = total_ms
+            logger.info(
+                f"Validation pipeline for {domain} (parallel): "
+                f"valid={result.overall_valid}, conf={result.overall_confidence:.2f}, "
+                f"rerun={result.requires_rerun}, stages={result.layer_times}"
+            )
+
+        return results
+
     # =========================================================================
     # LAYER 1: EVIDENCE VERIFICATION
     # =========================================================================
@@ -273,15 +495,19 @@ class ValidationPipeline:
         self,
         facts: List[Dict[str, Any]],
         document_text: str,
-        domain: str
+        domain: str,
+        source_documents: Optional[Dict[str, str]] = None
     ) -> EvidenceVerificationReport:
-        """Run evidence verification on all facts."""
+        """Run evidence verification on all facts, batched by source document."""
         logger.debug(f"Running evidence verification for {domain}")
 
-        report = verify_all_facts(
+        report = verify_facts_batch(
             facts=facts,
             document_text=document_text,
-            domain=domain
+            domain=domain,
+            documents=source_documents,
+            document_cache=self._prepared_documents,
+            max_workers=self.evidence_workers
         )
 
         logger.info(
@@ -291,6 +517,16 @@ class ValidationPipeline:
 
         return report
 
+    def _collect_layer_flags(self, result: ValidationPipelineResult):
+        """Collect flags from evidence, category and domain validation, in that order."""
+        self._collect_evidence_flags(result)
+
+        if result.category_report:
+            result.all_flags.extend(result.category_report.all_flags)
+
+        if result.domain_result:
+            result.all_flags.extend(result.domain_result.flags)
+
     def _collect_evidence_flags(self, result: ValidationPipelineResult):
         """Collect flags from evidence verification."""
         if not result.evidence_report:
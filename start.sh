@@ -28,6 +28,8 @@ echo "Starting gunicorn..."
 # Start gunicorn with detailed logging
 exec gunicorn \
     -w 1 \
+    -k gthread \
+    --threads ${GUNICORN_THREADS:-2} \
     -b 0.0.0.0:$PORT \
     --timeout 300 \
     --log-level debug \
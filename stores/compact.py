@@ -0,0 +1,53 @@
+"""
+Compact Record Helpers
+
+Shared helpers for the slotted record dataclasses (Fact, Gap, OpenQuestion,
+InventoryItem) that are held in memory by every web and Celery worker.
+
+- intern_fields: share one string object per distinct value for
+  low-cardinality fields (domain, category, entity, status, deal_id, ...).
+  Records loaded from JSON or the database otherwise carry their own copy
+  of "infrastructure", "target", "documented" etc. per instance.
+- record_to_dict: a flat replacement for dataclasses.asdict that copies
+  only container values, skipping asdict's per-value recursion and deepcopy.
+"""
+
+import sys
+from dataclasses import fields
+from typing import Any, Dict, Iterable, Tuple
+
+
+def intern_fields(record: Any, names: Iterable[str]) -> None:
+    """Intern the string values of the named attributes in place."""
+    for name in names:
+        value = getattr(record, name)
+        if type(value) is str:
+            setattr(record, name, sys.intern(value))
+
+
+def _copy_container(value: Any) -> Any:
+    """Copy nested dicts/lists/tuples so callers can mutate the result safely."""
+    if type(value) is dict:
+        return {k: _copy_container(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_container(v) for v in value]
+    if type(value) is tuple:
+        return tuple(_copy_container(v) for v in value)
+    return value
+
+
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def record_to_dict(record: Any) -> Dict[str, Any]:
+    """
+    Convert a flat dataclass record to a dict.
+
+    Equivalent to dataclasses.asdict for records whose fields hold scalars
+    and JSON-style containers (dicts, lists, tuples).
+    """
+    cls = type(record)
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return {name: _copy_container(getattr(record, name)) for name in names}
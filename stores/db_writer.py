@@ -406,6 +406,39 @@ class IncrementalDBWriter:
             self._local.stats['errors'] += 1
             return False
 
+    # =========================================================================
+    # TOMBSTONES (facts/gaps removed from the session after being written)
+    # =========================================================================
+
+    def soft_delete_facts(self, session, fact_ids: List[str], deal_id: str, commit: bool = True) -> bool:
+        """Soft-delete previously written facts (e.g. duplicates merged away)."""
+        from web.database import Fact
+        return self._soft_delete(session, Fact, fact_ids, deal_id, commit)
+
+    def soft_delete_gaps(self, session, gap_ids: List[str], deal_id: str, commit: bool = True) -> bool:
+        """Soft-delete previously written gaps (e.g. gaps answered by another chunk)."""
+        from web.database import Gap
+        return self._soft_delete(session, Gap, gap_ids, deal_id, commit)
+
+    def _soft_delete(self, session, model_class, ids: List[str], deal_id: str, commit: bool) -> bool:
+        self._init_thread_stats()
+        if not ids:
+            return True
+        try:
+            session.query(model_class).filter(
+                model_class.deal_id == deal_id,
+                model_class.id.in_(list(ids)),
+                model_class.deleted_at.is_(None),
+            ).update({model_class.deleted_at: datetime.utcnow()}, synchronize_session=False)
+            if commit:
+                session.commit()
+            return True
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"Failed to soft-delete {len(ids)} {model_class.__tablename__}: {e}")
+            self._local.stats['errors'] += 1
+            return False
+
     # =========================================================================
     # FINDING WRITING (Risks, Work Items, Recommendations)
     # =========================================================================
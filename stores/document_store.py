@@ -11,6 +11,7 @@ Key Principle: Documents are the source of truth. Facts are interpretations.
 The document hash is the immutable anchor for audit trails.
 """
 
+import io
 import json
 import shutil
 import logging
@@ -18,14 +19,19 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import BinaryIO, Dict, List, Optional, Any, Union
 from uuid import uuid4
 import threading
 
-from utils.file_hasher import compute_sha256, compute_sha256_from_bytes
+from utils.file_hasher import compute_sha256, copy_and_hash
 
 logger = logging.getLogger(__name__)
 
+try:
+    from config_v2 import UPLOAD_CHUNK_SIZE
+except ImportError:
+    UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class DocumentStatus(Enum):
     """Document processing status."""
@@ -123,6 +129,9 @@ class DocumentStore:
         target_docs = store.get_documents_for_entity("target")
     """
 
+    # Streamed uploads are spooled here (inside base_dir, so the final move is a rename)
+    INCOMING_DIR = ".incoming"
+
     _instance: Optional["DocumentStore"] = None
     _instances: Dict[str, "DocumentStore"] = {}  # deal_id -> instance for deal-scoped stores
     _lock = threading.Lock()
@@ -364,6 +373,9 @@ class DocumentStore:
         """
         Add a document from bytes (for web uploads).
 
+        Prefer add_document_from_stream() for uploads; this keeps the whole
+        file in memory.
+
         Args:
             file_bytes: Raw file content
             filename: Original filename
@@ -374,24 +386,100 @@ class DocumentStore:
 
         Returns:
             Document record
+        """
+        if not isinstance(file_bytes, bytes):
+            raise TypeError(f"Expected bytes, got {type(file_bytes).__name__}")
+        return self.add_document_from_stream(
+            io.BytesIO(file_bytes), filename, entity,
+            deal_id=deal_id, authority_level=authority_level, uploaded_by=uploaded_by
+        )
+
+    def add_document_from_stream(
+        self,
+        stream: BinaryIO,
+        filename: str,
+        entity: str,
+        deal_id: str = None,
+        authority_level: int = 1,
+        uploaded_by: str = "system"
+    ) -> Document:
+        """
+        Add a document from a readable stream (for web uploads).
+
+        The stream is spooled to disk in chunks and hashed in the same pass,
+        so memory use does not depend on the file size. Duplicates (same
+        hash) discard the spooled copy and return the existing document.
+
+        Args:
+            stream: Binary stream, e.g. FileStorage.stream
+            filename: Original filename
+            entity: "target" or "buyer"
+            deal_id: Deal ID (uses store's deal_id if not provided)
+            authority_level: 1-3
+            uploaded_by: User identifier
+
+        Returns:
+            Document record (new or existing if duplicate)
 
         Raises:
-            ValueError: If deal_id is not provided and store has no deal_id
+            ValueError: If entity is invalid
+        """
+        self._validate_entity(entity)
+
+        spool_dir = self.base_dir / self.INCOMING_DIR
+        spool_dir.mkdir(exist_ok=True)
+        spool_path = spool_dir / f"{uuid4().hex}.part"
+        try:
+            with open(spool_path, "wb") as f:
+                file_hash, file_size = copy_and_hash(stream, f, chunk_size=UPLOAD_CHUNK_SIZE)
+            return self.add_spooled_document(
+                spool_path, file_hash, filename, entity,
+                deal_id=deal_id, authority_level=authority_level, uploaded_by=uploaded_by,
+                file_size=file_size
+            )
+        finally:
+            spool_path.unlink(missing_ok=True)
+
+    def add_spooled_document(
+        self,
+        spool_path: Union[str, Path],
+        file_hash: str,
+        filename: str,
+        entity: str,
+        deal_id: str = None,
+        authority_level: int = 1,
+        uploaded_by: str = "system",
+        file_size: Optional[int] = None
+    ) -> Document:
+        """
+        Register a file that has already been written and hashed.
+
+        Used by streaming and resumable uploads: the spooled file is moved
+        (not copied) into document storage, so it must be on the same
+        filesystem as base_dir for the move to be a rename.
+
+        Args:
+            spool_path: Fully written file; moved into storage, or left in
+                place when it duplicates an existing document
+            file_hash: SHA-256 of the file's bytes
+            filename: Original filename
+            entity: "target" or "buyer"
+            deal_id: Deal ID (uses store's deal_id if not provided)
+            authority_level: 1-3
+            uploaded_by: User identifier
+            file_size: Size in bytes (read from disk if not given)
+
+        Returns:
+            Document record (new or existing if duplicate)
         """
+        spool_path = Path(spool_path)
+        self._validate_entity(entity)
+
         # Resolve deal_id
         effective_deal_id = deal_id or self.deal_id
         if not effective_deal_id:
             logger.warning(f"Document {filename} added without deal_id - data isolation may be compromised")
 
-        # Validate entity
-        if entity not in ("target", "buyer"):
-            raise ValueError(
-                f"Invalid entity '{entity}'. Must be 'target' or 'buyer'."
-            )
-
-        # Compute hash from bytes
-        file_hash = compute_sha256_from_bytes(file_bytes)
-
         # Check for duplicate
         with self._lock:
             if file_hash in self._hash_index:
@@ -409,9 +497,11 @@ class DocumentStore:
         safe_filename = f"{short_hash}_{filename}"
         raw_file_path = storage_dir / safe_filename
 
-        # Write bytes to file
-        with open(raw_file_path, "wb") as f:
-            f.write(file_bytes)
+        if file_size is None:
+            file_size = spool_path.stat().st_size
+
+        # Move the spooled file into place (a rename on the same filesystem)
+        shutil.move(str(spool_path), str(raw_file_path))
 
         # Extracted text path
         extracted_dir = self.base_dir / entity / "extracted"
@@ -434,7 +524,7 @@ class DocumentStore:
             page_count=0,
             status=DocumentStatus.PENDING.value,
             deal_id=effective_deal_id or "",  # Include deal_id
-            file_size_bytes=len(file_bytes),
+            file_size_bytes=file_size,
             mime_type=mime_type
         )
 
@@ -445,9 +535,17 @@ class DocumentStore:
 
         self._save_manifest()
 
-        logger.info(f"Added document from bytes: {filename} (doc_id: {doc_id}, deal: {effective_deal_id})")
+        logger.info(f"Added streamed document: {filename} (doc_id: {doc_id}, "
+                    f"{file_size} bytes, deal: {effective_deal_id})")
         return doc
 
+    def _validate_entity(self, entity: str):
+        """Raise ValueError unless entity is "target" or "buyer"."""
+        if entity not in ("target", "buyer"):
+            raise ValueError(
+                f"Invalid entity '{entity}'. Must be 'target' or 'buyer'."
+            )
+
     def _detect_mime_type(self, file_path: Path) -> str:
         """Detect MIME type from file extension."""
         extension_map = {
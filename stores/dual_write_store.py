@@ -19,17 +19,246 @@ Usage:
         status="documented",
         evidence={"exact_quote": "..."}
     )
+
+    # Write-behind: add_fact returns as soon as the fact ID is queued; a
+    # background writer upserts queued facts in multi-row batches
+    store = DualWriteFactStore(deal_id="deal-123", write_behind=True)
+    ...
+    store.sync_to_db()          # Flushes the queue, then syncs everything
+    store.get_write_metrics()   # Queue depth, lag, batch sizes
+    store.close()               # Final flush, stops the writer
 """
 
 import os
 import logging
-from typing import Dict, Any, Optional, List
+import queue
+import threading
+import time
+from typing import Callable, Dict, Any, Optional, List
 from datetime import datetime
 
 from stores.fact_store import FactStore, Fact
 
 logger = logging.getLogger(__name__)
 
+try:
+    from config_v2 import (FACT_WRITE_BEHIND, FACT_WRITE_QUEUE_SIZE,
+                           FACT_WRITE_BATCH_SIZE, FACT_WRITE_ENQUEUE_TIMEOUT)
+except ImportError:
+    FACT_WRITE_BEHIND = False
+    FACT_WRITE_QUEUE_SIZE = 1000
+    FACT_WRITE_BATCH_SIZE = 100
+    FACT_WRITE_ENQUEUE_TIMEOUT = 5.0
+
+# Columns refreshed when a queued fact already exists in the database
+# (the same fields the synchronous update path sets)
+_DB_UPDATE_FIELDS = (
+    'domain', 'category', 'item', 'status', 'entity', 'details', 'evidence',
+    'source_document', 'confidence_score', 'verified', 'verification_status',
+)
+
+
+# =============================================================================
+# WRITE-BEHIND QUEUE
+# =============================================================================
+
+class FactWriteBehind:
+    """
+    Bounded write-behind queue of fact IDs with a background batch writer.
+
+    Only IDs are queued: the writer reads each fact's current state when it
+    writes the batch, so a fact changed several times while queued is
+    written once. A fact changed after its batch was taken is queued again.
+
+    Backpressure: when max_pending IDs are waiting, enqueue blocks until the
+    writer catches up, for at most enqueue_timeout seconds; after that the
+    fact is written inline on the caller's thread.
+
+    Args:
+        write_batch: Writes a list of fact IDs, returns {fact_id: error} for
+            facts that failed (empty when all committed)
+        max_pending: Queue capacity
+        batch_size: Maximum fact IDs per write
+        enqueue_timeout: Seconds to wait for space before writing inline
+        on_written: Called with the IDs of every committed batch
+        on_failed: Called with {fact_id: error} for failed writes
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[str]], Dict[str, str]],
+        max_pending: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        enqueue_timeout: Optional[float] = None,
+        on_written: Optional[Callable[[List[str]], None]] = None,
+        on_failed: Optional[Callable[[Dict[str, str]], None]] = None
+    ):
+        self.write_batch = write_batch
+        self.max_pending = max(1, max_pending or FACT_WRITE_QUEUE_SIZE)
+        self.batch_size = max(1, batch_size or FACT_WRITE_BATCH_SIZE)
+        self.enqueue_timeout = FACT_WRITE_ENQUEUE_TIMEOUT if enqueue_timeout is None else enqueue_timeout
+        self.on_written = on_written
+        self.on_failed = on_failed
+
+        self._queue: "queue.Queue[str]" = queue.Queue(maxsize=self.max_pending)
+        self._pending: Dict[str, float] = {}  # fact_id -> monotonic time first queued
+        self._pending_lock = threading.Lock()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._metrics = {
+            'enqueued': 0,
+            'coalesced': 0,
+            'backpressure_waits': 0,
+            'inline_writes': 0,
+            'batches': 0,
+            'facts_written': 0,
+            'facts_failed': 0,
+            'last_batch_size': 0,
+            'max_batch_size': 0,
+            'lag_total_seconds': 0.0,
+            'max_lag_seconds': 0.0,
+        }
+
+    def start(self) -> "FactWriteBehind":
+        """Start the writer thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="fact-write-behind", daemon=True)
+            self._thread.start()
+        return self
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def enqueue(self, fact_id: str) -> None:
+        """Queue a fact for writing (no-op if it is already queued)."""
+        with self._pending_lock:
+            if fact_id in self._pending:
+                self._metrics['coalesced'] += 1
+                return
+            self._pending[fact_id] = time.monotonic()
+            self._metrics['enqueued'] += 1
+
+        if not self.running:
+            self._write([fact_id], inline=True)
+            return
+
+        try:
+            self._queue.put_nowait(fact_id)
+            return
+        except queue.Full:
+            self._metrics['backpressure_waits'] += 1
+
+        try:
+            self._queue.put(fact_id, timeout=self.enqueue_timeout)
+        except queue.Full:
+            logger.warning(f"Fact write queue full for {self.enqueue_timeout}s, writing {fact_id} inline")
+            self._write([fact_id], inline=True)
+
+    def flush(self) -> None:
+        """Block until every queued fact has been written (or has failed)."""
+        if self.running:
+            self._queue.join()
+            return
+        # Writer stopped: drain on this thread
+        while True:
+            batch = self._take_batch(block=False)
+            if not batch:
+                return
+            self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def stop(self) -> None:
+        """Write everything still queued, then stop the writer thread."""
+        self.flush()
+        self._stopping = True
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopping:
+            batch = self._take_batch(block=True)
+            if not batch:
+                continue
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _take_batch(self, block: bool) -> List[str]:
+        """Take up to batch_size IDs; waits briefly for the first one when block is set."""
+        batch: List[str] = []
+        try:
+            batch.append(self._queue.get(timeout=0.2) if block else self._queue.get_nowait())
+            while len(batch) < self.batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _write(self, fact_ids: List[str], inline: bool = False) -> None:
+        # Un-mark before reading fact state, so a change made while this
+        # batch is being written queues the fact again
+        with self._pending_lock:
+            queued_at = [self._pending.pop(fid, time.monotonic()) for fid in fact_ids]
+
+        try:
+            failed = self.write_batch(fact_ids) or {}
+        except Exception as e:
+            logger.error(f"Fact write batch of {len(fact_ids)} failed: {e}")
+            failed = {fid: str(e) for fid in fact_ids}
+
+        now = time.monotonic()
+        written = [fid for fid in fact_ids if fid not in failed]
+        m = self._metrics
+        m['batches'] += 1
+        m['last_batch_size'] = len(fact_ids)
+        m['max_batch_size'] = max(m['max_batch_size'], len(fact_ids))
+        m['facts_written'] += len(written)
+        m['facts_failed'] += len(failed)
+        if inline:
+            m['inline_writes'] += 1
+        for fid, started in zip(fact_ids, queued_at):
+            if fid not in failed:
+                lag = now - started
+                m['lag_total_seconds'] += lag
+                m['max_lag_seconds'] = max(m['max_lag_seconds'], lag)
+
+        if written and self.on_written:
+            self.on_written(written)
+        if failed and self.on_failed:
+            self.on_failed(failed)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, lag (queued -> committed) and batch size statistics."""
+        with self._pending_lock:
+            oldest = min(self._pending.values(), default=None)
+            pending = len(self._pending)
+        m = dict(self._metrics)
+        lag_total = m.pop('lag_total_seconds')
+        return {
+            **m,
+            'running': self.running,
+            'queue_depth': self._queue.qsize(),
+            'pending': pending,
+            'max_pending': self.max_pending,
+            'batch_size': self.batch_size,
+            'current_lag_seconds': round(time.monotonic() - oldest, 3) if oldest is not None else 0.0,
+            'avg_lag_seconds': round(lag_total / m['facts_written'], 3) if m['facts_written'] else 0.0,
+            'max_lag_seconds': round(m['max_lag_seconds'], 3),
+            'avg_batch_size': round((m['facts_written'] + m['facts_failed']) / m['batches'], 1) if m['batches'] else 0.0,
+        }
+
+
+# =============================================================================
+# DUAL-WRITE STORE
+# =============================================================================
+
 
 class DualWriteFactStore(FactStore):
     """
@@ -43,25 +272,45 @@ class DualWriteFactStore(FactStore):
     - Backwards compatibility with existing code
     - Data redundancy during migration
     - Ability to verify JSON/DB consistency
+
+    With write_behind, database writes leave the add_fact/update_fact path:
+    fact IDs go into a bounded FactWriteBehind queue and are upserted in
+    multi-row batches. Call sync_to_db() or flush_writes() before relying on
+    the database, and close() when done.
     """
 
-    def __init__(self, deal_id: Optional[str] = None, enable_dual_write: Optional[bool] = None):
+    def __init__(self, deal_id: Optional[str] = None, enable_dual_write: Optional[bool] = None,
+                 write_behind: Optional[bool] = None, app=None):
         """
         Initialize dual-write fact store.
 
         Args:
             deal_id: Deal ID to associate facts with in PostgreSQL
             enable_dual_write: Override for dual-write (defaults to USE_DATABASE env var)
+            write_behind: Queue writes for a background batch writer
+                (defaults to FACT_WRITE_BEHIND)
+            app: Flask app for database writes (defaults to the current app)
         """
         super().__init__()
 
         self.deal_id = deal_id
+        self._app = app
         self._db_enabled = self._check_db_enabled(enable_dual_write)
         self._db_fact_ids: Dict[str, str] = {}  # Maps JSON fact_id to DB fact_id
         self._write_errors: List[Dict[str, Any]] = []
+        self._write_errors_lock = threading.Lock()
+
+        self._write_behind: Optional[FactWriteBehind] = None
+        if self._db_enabled and (FACT_WRITE_BEHIND if write_behind is None else write_behind):
+            self._write_behind = FactWriteBehind(
+                self._upsert_batch,
+                on_written=self._mark_written,
+                on_failed=self._record_write_errors,
+            ).start()
 
         if self._db_enabled:
-            logger.info(f"DualWriteFactStore initialized with deal_id={deal_id}, dual-write ENABLED")
+            mode = "write-behind" if self._write_behind else "synchronous"
+            logger.info(f"DualWriteFactStore initialized with deal_id={deal_id}, dual-write ENABLED ({mode})")
         else:
             logger.info("DualWriteFactStore initialized, dual-write DISABLED (JSON only)")
 
@@ -122,10 +371,138 @@ class DualWriteFactStore(FactStore):
 
         # Then, write to PostgreSQL if enabled
         if self._db_enabled:
-            self._write_to_db(fact_id)
+            self._schedule_write(fact_id)
 
         return fact_id
 
+    def _schedule_write(self, fact_id: str) -> None:
+        """Queue the fact for the background writer, or write it now."""
+        if self._write_behind:
+            if self._app is None:
+                self._app = self._current_app()
+            self._write_behind.enqueue(fact_id)
+        else:
+            self._write_to_db(fact_id)
+
+    @staticmethod
+    def _current_app():
+        """The Flask app of the active app context, if any."""
+        try:
+            from flask import current_app, has_app_context
+            return current_app._get_current_object() if has_app_context() else None
+        except ImportError:
+            return None
+
+    def _standalone_app(self):
+        """The app given at construction, else the module-level web app."""
+        if self._app is None:
+            from web.app import app as web_app
+            self._app = web_app
+        return self._app
+
+    def _db_record(self, fact: Fact) -> Dict[str, Any]:
+        """Database column values for a fact."""
+        return {
+            'id': fact.fact_id,
+            'deal_id': self.deal_id,
+            'domain': fact.domain,
+            'category': fact.category,
+            'item': fact.item,
+            'status': fact.status,
+            'entity': fact.entity,
+            'details': fact.details,
+            'evidence': fact.evidence,
+            'source_document': fact.source_document,
+            'confidence_score': fact.confidence_score,
+            'verified': fact.verified,
+            'verification_status': fact.verification_status,
+            'source_quote': fact.evidence.get('exact_quote', '') if fact.evidence else '',
+        }
+
+    def _upsert_batch(self, fact_ids: List[str]) -> Dict[str, str]:
+        """
+        Write facts with one multi-row INSERT ... ON CONFLICT DO UPDATE.
+
+        If the batch statement fails, the facts are retried one by one so a
+        single bad row does not fail the rest. Runs on the writer thread.
+
+        Returns:
+            {fact_id: error} for facts that could not be written
+        """
+        from web.database import db, Fact as DBFact
+
+        records = []
+        failed: Dict[str, str] = {}
+        for fact_id in fact_ids:
+            fact = self.get_fact(fact_id)
+            if fact:
+                records.append(self._db_record(fact))
+            else:
+                failed[fact_id] = "Fact not found in store"
+        if not records:
+            return failed
+
+        with self._standalone_app().app_context():
+            try:
+                self._execute_upsert(db, DBFact, records)
+                db.session.commit()
+                return failed
+            except Exception as e:
+                db.session.rollback()
+                if len(records) == 1:
+                    failed[records[0]['id']] = str(e)
+                    return failed
+                logger.warning(f"Batch upsert of {len(records)} facts failed, retrying individually: {e}")
+
+            for record in records:
+                try:
+                    self._execute_upsert(db, DBFact, [record])
+                    db.session.commit()
+                except Exception as e:
+                    db.session.rollback()
+                    failed[record['id']] = str(e)
+            return failed
+
+    @staticmethod
+    def _execute_upsert(db, model, records: List[Dict[str, Any]]) -> None:
+        """Multi-row upsert on PostgreSQL/SQLite, session.merge elsewhere."""
+        dialect = db.engine.dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            for record in records:
+                db.session.merge(model(**record))
+            return
+
+        stmt = insert(model).values(records)
+        updates = {name: getattr(stmt.excluded, name) for name in _DB_UPDATE_FIELDS}
+        updates['updated_at'] = datetime.utcnow()
+        db.session.execute(stmt.on_conflict_do_update(index_elements=['id'], set_=updates))
+
+    def _mark_written(self, fact_ids: List[str]) -> None:
+        """Record committed facts and drop their now-stale write errors."""
+        written = set(fact_ids)
+        for fact_id in fact_ids:
+            self._db_fact_ids[fact_id] = fact_id
+        with self._write_errors_lock:
+            self._write_errors[:] = [e for e in self._write_errors if e['fact_id'] not in written]
+
+    def _record_write_errors(self, failed: Dict[str, str]) -> None:
+        """Keep one error entry per fact (with an attempt count) until it is written."""
+        now = datetime.utcnow().isoformat()
+        with self._write_errors_lock:
+            existing = {e['fact_id']: e for e in self._write_errors}
+            for fact_id, error in failed.items():
+                logger.error(f"Failed to write fact {fact_id} to PostgreSQL: {error}")
+                entry = existing.get(fact_id)
+                if entry:
+                    entry.update(error=error, timestamp=now, attempts=entry.get('attempts', 1) + 1)
+                else:
+                    self._write_errors.append({'fact_id': fact_id, 'error': error,
+                                               'timestamp': now, 'attempts': 1})
+
     def _write_to_db(self, fact_id: str) -> bool:
         """
         Write a fact to PostgreSQL.
@@ -141,7 +518,7 @@ class DualWriteFactStore(FactStore):
             from web.database import db, Fact as DBFact
 
             # Get the fact from in-memory store
-            fact = self.get_fact_by_id(fact_id)
+            fact = self.get_fact(fact_id)
             if not fact:
                 logger.error(f"Fact {fact_id} not found in store for DB write")
                 return False
@@ -196,18 +573,11 @@ class DualWriteFactStore(FactStore):
                 return do_write()
             else:
                 # Create app context for standalone usage
-                from web.app import create_app
-                app = create_app()
-                with app.app_context():
+                with self._standalone_app().app_context():
                     return do_write()
 
         except Exception as e:
-            logger.error(f"Failed to write fact {fact_id} to PostgreSQL: {e}")
-            self._write_errors.append({
-                'fact_id': fact_id,
-                'error': str(e),
-                'timestamp': datetime.utcnow().isoformat()
-            })
+            self._record_write_errors({fact_id: str(e)})
             return False
 
     def update_fact(self, fact_id: str, **updates) -> bool:
@@ -222,7 +592,7 @@ class DualWriteFactStore(FactStore):
             True if successful
         """
         # Update in JSON store
-        fact = self.get_fact_by_id(fact_id)
+        fact = self.get_fact(fact_id)
         if not fact:
             return False
 
@@ -239,7 +609,7 @@ class DualWriteFactStore(FactStore):
 
         # Update in PostgreSQL
         if self._db_enabled:
-            self._write_to_db(fact_id)
+            self._schedule_write(fact_id)
 
         return True
 
@@ -258,12 +628,16 @@ class DualWriteFactStore(FactStore):
         Returns:
             True if successful
         """
-        # Call parent method
-        result = super().verify_fact(fact_id, verified_by, verification_status, verification_note)
+        # Call parent method (it only records who verified and when)
+        result = super().verify_fact(fact_id, verified_by)
+        if result:
+            fact = self.get_fact(fact_id)
+            fact.verification_status = verification_status
+            fact.verification_note = verification_note
 
         # Sync to PostgreSQL
         if result and self._db_enabled:
-            self._write_to_db(fact_id)
+            self._schedule_write(fact_id)
 
         return result
 
@@ -280,6 +654,9 @@ class DualWriteFactStore(FactStore):
         if not self._db_enabled:
             return {'status': 'skipped', 'reason': 'Database not enabled'}
 
+        if self._write_behind:
+            return self._sync_write_behind()
+
         stats = {
             'total': len(self.facts),
             'created': 0,
@@ -304,13 +681,80 @@ class DualWriteFactStore(FactStore):
         logger.info(f"Sync complete: {stats}")
         return stats
 
+    def _sync_write_behind(self) -> Dict[str, Any]:
+        """sync_to_db for write-behind mode: queue every fact, then flush."""
+        already_written = set(self._db_fact_ids)
+        fact_ids = [fact.fact_id for fact in self.facts]
+        for fact_id in fact_ids:
+            self._write_behind.enqueue(fact_id)
+        self._write_behind.flush()
+
+        failed = {e['fact_id'] for e in self.get_write_errors()}
+        stats = {'total': len(fact_ids), 'created': 0, 'updated': 0, 'errors': 0, 'skipped': 0}
+        for fact_id in fact_ids:
+            if fact_id in failed:
+                stats['errors'] += 1
+            elif fact_id in already_written:
+                stats['updated'] += 1
+            else:
+                stats['created'] += 1
+
+        logger.info(f"Sync complete: {stats}")
+        return stats
+
+    def flush_writes(self) -> None:
+        """Wait until all queued fact writes are committed (write-behind mode)."""
+        if self._write_behind:
+            self._write_behind.flush()
+
+    def retry_write_errors(self) -> Dict[str, int]:
+        """
+        Write again every fact listed in get_write_errors().
+
+        Upserts are idempotent, so retrying is always safe. An entry is only
+        removed once its fact has been committed; facts that fail again keep
+        their entry.
+
+        Returns:
+            {'retried', 'succeeded', 'failed'}
+        """
+        fact_ids = list(dict.fromkeys(e['fact_id'] for e in self.get_write_errors()))
+        if not fact_ids or not self._db_enabled:
+            return {'retried': 0, 'succeeded': 0, 'failed': len(fact_ids)}
+
+        if self._write_behind:
+            for fact_id in fact_ids:
+                self._write_behind.enqueue(fact_id)
+            self._write_behind.flush()
+        else:
+            self._mark_written([fact_id for fact_id in fact_ids if self._write_to_db(fact_id)])
+
+        still_failing = {e['fact_id'] for e in self.get_write_errors()} & set(fact_ids)
+        return {'retried': len(fact_ids), 'succeeded': len(fact_ids) - len(still_failing),
+                'failed': len(still_failing)}
+
+    def get_write_metrics(self) -> Dict[str, Any]:
+        """Write-behind queue depth, lag and batch sizes."""
+        if not self._write_behind:
+            return {'write_behind': False, 'synced': self.synced_fact_count,
+                    'errors': len(self._write_errors)}
+        return {'write_behind': True, 'synced': self.synced_fact_count,
+                'errors': len(self._write_errors), **self._write_behind.metrics()}
+
+    def close(self) -> None:
+        """Flush queued writes and stop the background writer."""
+        if self._write_behind:
+            self._write_behind.stop()
+
     def get_write_errors(self) -> List[Dict[str, Any]]:
         """Get list of write errors that occurred during dual-write."""
-        return self._write_errors.copy()
+        with self._write_errors_lock:
+            return [dict(e) for e in self._write_errors]
 
     def clear_write_errors(self):
         """Clear the write error log."""
-        self._write_errors.clear()
+        with self._write_errors_lock:
+            self._write_errors.clear()
 
     @property
     def db_enabled(self) -> bool:
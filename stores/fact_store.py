@@ -9,13 +9,19 @@ Key Features:
 - Domain and category organization
 - Merge capability for parallel discovery
 - Export/import for reasoning phase handoff
+- Version counters and a change feed for incremental consumers
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Any, Tuple
 from datetime import datetime
+import itertools
+import json
 import re
 
+from stores.compact import intern_fields, record_to_dict
+
 
 def _generate_timestamp() -> str:
     """
@@ -34,10 +40,14 @@ def _generate_timestamp() -> str:
         raise ValueError(f"Generated timestamp has invalid format: {timestamp}")
     return timestamp
 import logging
+import os
 import threading
 
 logger = logging.getLogger(__name__)
 
+# Change events kept for FactStore.changes_since() (older versions force a full rebuild)
+FACT_CHANGE_LOG_SIZE = int(os.environ.get('FACT_CHANGE_LOG_SIZE', '10000'))
+
 # Domain prefixes for fact IDs
 DOMAIN_PREFIXES = {
     "infrastructure": "INFRA",
@@ -90,7 +100,19 @@ DOMAIN_PRIORITY_WEIGHTS = {
 }
 
 
-@dataclass
+# Low-cardinality string fields shared across thousands of records; interned
+# on construction so each distinct value is stored once per process.
+FACT_INTERNED_FIELDS = (
+    "domain", "category", "status", "entity", "analysis_phase",
+    "source_document", "deal_id", "verification_status",
+)
+GAP_INTERNED_FIELDS = ("domain", "category", "importance", "entity", "deal_id")
+QUESTION_INTERNED_FIELDS = (
+    "domain", "category", "priority", "suggested_recipient", "status", "deal_id",
+)
+
+
+@dataclass(slots=True)
 class Fact:
     """
     A single extracted fact with unique ID for citation.
@@ -134,8 +156,11 @@ class Fact:
     needs_review: bool = False          # Flagged for human review (sparse details, low confidence)
     needs_review_reason: str = ""       # Why it needs review
 
+    def __post_init__(self):
+        intern_fields(self, FACT_INTERNED_FIELDS)
+
     def to_dict(self) -> Dict:
-        result = asdict(self)
+        result = record_to_dict(self)
         # Include calculated review priority
         result['review_priority'] = self.review_priority
         return result
@@ -260,7 +285,7 @@ class Fact:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Gap:
     """
     A gap identified during discovery - missing information.
@@ -277,8 +302,11 @@ class Gap:
     deal_id: str = ""         # Deal this gap belongs to - REQUIRED for proper isolation
     created_at: str = field(default_factory=lambda: _generate_timestamp())
 
+    def __post_init__(self):
+        intern_fields(self, GAP_INTERNED_FIELDS)
+
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return record_to_dict(self)
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Gap":
@@ -402,7 +430,7 @@ QUESTION_RECIPIENTS = [
     "Management"
 ]
 
-@dataclass
+@dataclass(slots=True)
 class OpenQuestion:
     """
     An open question for follow-up with management or target company.
@@ -433,8 +461,11 @@ class OpenQuestion:
     deal_id: str = ""                             # Deal this question belongs to
     created_at: str = field(default_factory=lambda: _generate_timestamp())
 
+    def __post_init__(self):
+        intern_fields(self, QUESTION_INTERNED_FIELDS)
+
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return record_to_dict(self)
 
     @classmethod
     def from_dict(cls, data: Dict) -> "OpenQuestion":
@@ -462,6 +493,24 @@ class OpenQuestion:
         self.answer = reason or "Deferred for future follow-up"
 
 
+@dataclass(frozen=True, slots=True)
+class FactChange:
+    """
+    One entry in the FactStore change feed.
+
+    op is one of:
+    - add_fact / add_gap: item_id was added
+    - remove_fact / remove_gap: item_id was removed
+    - update_fact: item_id was changed in place (verification, review status)
+    - reload: facts/gaps were replaced wholesale; consumers should rebuild
+    """
+    version: int       # FactStore.version after this change
+    op: str
+    item_id: str       # Fact or gap ID ("" for reload)
+    domain: str = ""
+    entity: str = ""
+
+
 class FactStore:
     """
     Central store for facts extracted during Discovery phase.
@@ -473,6 +522,9 @@ class FactStore:
     - Export to JSON for reasoning phase handoff
     - Load from JSON to resume or reason from existing facts
     - Open Questions for follow-up (Point 82-86)
+    - Versioning: `version` increases on every change to facts or gaps, with
+      per-domain and per-entity counters (domain_version, entity_version)
+      and a change feed (subscribe, changes_since) for incremental consumers
 
     Usage:
         # In Discovery agent
@@ -526,6 +578,14 @@ class FactStore:
         # Example: {"target": {"leadership:CIO", "leadership:VP"}, "buyer": {...}}
         self._assumed_fact_keys_by_entity: Dict[str, set] = {}
 
+        # Versioning and change feed
+        self.version = 0
+        self._domain_versions: Dict[str, int] = {}
+        self._entity_versions: Dict[str, int] = {}
+        self._change_log: Deque[FactChange] = deque(maxlen=FACT_CHANGE_LOG_SIZE)
+        self._pending_changes: List[FactChange] = []
+        self._subscribers: List[Callable[[FactChange], None]] = []
+
         # Warn if no deal_id provided
         if not deal_id:
             logger.warning("FactStore created without deal_id - data isolation may be compromised")
@@ -559,6 +619,33 @@ class FactStore:
         Returns:
             Unique fact ID with entity prefix (e.g., F-TGT-INFRA-001, F-BYR-APP-002)
 
+        Raises:
+            ValueError: If entity is invalid, locked, or deal_id missing
+        """
+        effective_deal_id, analysis_phase = self._validate_new_fact(domain, entity, analysis_phase, deal_id)
+
+        with self._lock:
+            fact = self._create_fact(
+                domain=domain, category=category, item=item, details=details,
+                status=status, evidence=evidence, entity=entity,
+                source_document=source_document, needs_review=needs_review,
+                needs_review_reason=needs_review_reason, analysis_phase=analysis_phase,
+                is_integration_insight=is_integration_insight, deal_id=effective_deal_id
+            )
+            self._append_fact(fact)
+            fact_id = fact.fact_id
+
+        self._publish_changes()
+        return fact_id
+
+    def _validate_new_fact(self, domain: str, entity: str,
+                           analysis_phase: Optional[str], deal_id: Optional[str]) -> Tuple[str, str]:
+        """
+        Validate add_fact arguments before anything is written.
+
+        Returns:
+            (effective deal_id, analysis_phase)
+
         Raises:
             ValueError: If entity is invalid, locked, or deal_id missing
         """
@@ -598,52 +685,147 @@ class FactStore:
             # Config not available, skip validation
             pass
 
-        with self._lock:
-            fact_id = self._generate_fact_id(domain, entity)
+        return effective_deal_id, analysis_phase
 
-            fact = Fact(
-                fact_id=fact_id,
-                domain=domain,
-                category=category,
-                item=item,
-                details=details or {},
-                status=status,
-                evidence=evidence or {},
-                entity=entity,
-                analysis_phase=analysis_phase,
-                is_integration_insight=is_integration_insight,
-                source_document=source_document,
-                deal_id=effective_deal_id,
-                needs_review=needs_review,
-                needs_review_reason=needs_review_reason
-            )
+    def _create_fact(self, domain: str, category: str, item: str,
+                     details: Dict[str, Any], status: str, evidence: Dict[str, str],
+                     entity: str, source_document: str, needs_review: bool,
+                     needs_review_reason: str, analysis_phase: str,
+                     is_integration_insight: bool, deal_id: str) -> Fact:
+        """
+        Build a new Fact with a fresh ID and initial confidence score.
 
-            # Calculate initial confidence score
-            fact.confidence_score = fact.calculate_confidence()
+        NOTE: Must be called within self._lock context (allocates an ID).
+        """
+        fact = Fact(
+            fact_id=self._generate_fact_id(domain, entity),
+            domain=domain,
+            category=category,
+            item=item,
+            details=details or {},
+            status=status,
+            evidence=evidence or {},
+            entity=entity,
+            analysis_phase=analysis_phase,
+            is_integration_insight=is_integration_insight,
+            source_document=source_document,
+            deal_id=deal_id,
+            needs_review=needs_review,
+            needs_review_reason=needs_review_reason
+        )
+
+        # Calculate initial confidence score
+        fact.confidence_score = fact.calculate_confidence()
 
-            # Auto-flag for review if confidence is low
-            if fact.confidence_score < 0.4 and not fact.needs_review:
-                fact.needs_review = True
-                fact.needs_review_reason = "Low confidence score"
+        # Auto-flag for review if confidence is low
+        if fact.confidence_score < 0.4 and not fact.needs_review:
+            fact.needs_review = True
+            fact.needs_review_reason = "Low confidence score"
+        return fact
 
-            self.facts.append(fact)
-            self._fact_index[fact_id] = fact  # Update index
+    def _append_fact(self, fact: Fact) -> None:
+        """
+        Append a fact and update indexes and versions.
 
-            # DIAGNOSTIC: Log fact addition with current count
-            logger.info(f"[FACT STORE] Added fact {fact_id} to store (total facts: {len(self.facts)}), domain={fact.domain}, category={fact.category}, entity={fact.entity}, item='{fact.item}'")
+        NOTE: Must be called within self._lock context.
+        """
+        fact_id = fact.fact_id
+        self.facts.append(fact)
+        self._fact_index[fact_id] = fact  # Update index
 
-            # P1 FIX #5: Update assumed facts index for O(1) idempotency checks
-            if fact.domain == "organization" and (fact.details or {}).get('data_source') == 'assumed':
-                if entity not in self._assumed_fact_keys_by_entity:
-                    self._assumed_fact_keys_by_entity[entity] = set()
-                key = f"{fact.category}:{fact.item}"
-                self._assumed_fact_keys_by_entity[entity].add(key)
-                logger.debug(f"Indexed assumed fact key: {entity}/{key}")
+        # DIAGNOSTIC: Log fact addition with current count
+        logger.info(f"[FACT STORE] Added fact {fact_id} to store (total facts: {len(self.facts)}), domain={fact.domain}, category={fact.category}, entity={fact.entity}, item='{fact.item}'")
 
-            review_flag = " [NEEDS REVIEW]" if fact.needs_review else ""
-            logger.debug(f"Added fact {fact_id}: {item} (confidence: {fact.confidence_score:.2f}){review_flag}")
+        # P1 FIX #5: Update assumed facts index for O(1) idempotency checks
+        if fact.domain == "organization" and (fact.details or {}).get('data_source') == 'assumed':
+            if fact.entity not in self._assumed_fact_keys_by_entity:
+                self._assumed_fact_keys_by_entity[fact.entity] = set()
+            key = f"{fact.category}:{fact.item}"
+            self._assumed_fact_keys_by_entity[fact.entity].add(key)
+            logger.debug(f"Indexed assumed fact key: {fact.entity}/{key}")
 
-        return fact_id
+        review_flag = " [NEEDS REVIEW]" if fact.needs_review else ""
+        logger.debug(f"Added fact {fact_id}: {fact.item} (confidence: {fact.confidence_score:.2f}){review_flag}")
+        self._record_change("add_fact", fact_id, fact.domain, fact.entity)
+
+    def replace_facts(
+        self,
+        predicate: Callable[[Fact], bool],
+        new_facts: List[Dict[str, Any]]
+    ) -> Dict[str, List[str]]:
+        """
+        Atomically replace the facts matching predicate with new_facts.
+
+        new_facts are dicts of add_fact() keyword arguments. A matching fact
+        that already has the same domain, category, item, entity and details
+        as one of new_facts is kept (with its ID), so re-applying the same
+        set changes nothing. All new facts are validated before any change.
+
+        Args:
+            predicate: Selects the facts being replaced
+            new_facts: Facts to add in their place
+
+        Returns:
+            Dict with "added", "removed" and "kept" fact ID lists
+        """
+        validated = []
+        for spec in new_facts:
+            spec = dict(spec)
+            spec["deal_id"], spec["analysis_phase"] = self._validate_new_fact(
+                spec["domain"], spec.get("entity", "target"),
+                spec.get("analysis_phase"), spec.get("deal_id")
+            )
+            validated.append(spec)
+
+        result: Dict[str, List[str]] = {"added": [], "removed": [], "kept": []}
+        with self._lock:
+            existing = {}
+            for fact in self.facts:
+                if predicate(fact):
+                    existing.setdefault(self._replace_key(fact.domain, fact.category, fact.item,
+                                                          fact.entity, fact.details), []).append(fact)
+
+            to_add = []
+            for spec in validated:
+                key = self._replace_key(spec["domain"], spec["category"], spec["item"],
+                                        spec.get("entity", "target"), spec.get("details"))
+                if existing.get(key):
+                    result["kept"].append(existing[key].pop(0).fact_id)
+                else:
+                    to_add.append(spec)
+
+            removed = {id(fact) for facts in existing.values() for fact in facts}
+            if removed:
+                self.facts[:] = [f for f in self.facts if id(f) not in removed]
+                for facts in existing.values():
+                    for fact in facts:
+                        self._fact_index.pop(fact.fact_id, None)
+                        assumed_keys = self._assumed_fact_keys_by_entity.get(fact.entity)
+                        if assumed_keys is not None:
+                            assumed_keys.discard(f"{fact.category}:{fact.item}")
+                        self._record_change("remove_fact", fact.fact_id, fact.domain, fact.entity)
+                        result["removed"].append(fact.fact_id)
+
+            for spec in to_add:
+                fact = self._create_fact(
+                    domain=spec["domain"], category=spec["category"], item=spec["item"],
+                    details=spec.get("details"), status=spec["status"], evidence=spec.get("evidence"),
+                    entity=spec.get("entity", "target"), source_document=spec.get("source_document", ""),
+                    needs_review=spec.get("needs_review", False),
+                    needs_review_reason=spec.get("needs_review_reason", ""),
+                    analysis_phase=spec["analysis_phase"],
+                    is_integration_insight=spec.get("is_integration_insight", False),
+                    deal_id=spec["deal_id"]
+                )
+                self._append_fact(fact)
+                result["added"].append(fact.fact_id)
+
+        self._publish_changes()
+        return result
+
+    @staticmethod
+    def _replace_key(domain: str, category: str, item: str, entity: str, details: Optional[Dict]) -> Tuple:
+        return (domain, category, item, entity, json.dumps(details or {}, sort_keys=True, default=str))
 
     def add_fact_from_dict(self, fact_data: Dict[str, Any], deal_id: str = None) -> Optional['Fact']:
         """
@@ -729,7 +911,9 @@ class FactStore:
             self.gaps.append(gap)
             self._gap_index[gap_id] = gap  # Update index
             logger.debug(f"Added gap {gap_id}: {description[:50]}...")
+            self._record_change("add_gap", gap_id, domain, entity)
 
+        self._publish_changes()
         return gap_id
 
     def _generate_fact_id(self, domain: str, entity: str = "target") -> str:
@@ -784,6 +968,106 @@ class FactStore:
         self._gap_counters[counter_key] += 1
         return f"G-{entity_prefix}-{domain_prefix}-{self._gap_counters[counter_key]:03d}"
 
+    # =========================================================================
+    # VERSIONING AND CHANGE FEED
+    # =========================================================================
+
+    def _record_change(self, op: str, item_id: str = "", domain: str = "", entity: str = "") -> None:
+        """
+        Bump version counters and append a change event.
+
+        NOTE: Must be called within self._lock context. Call
+        _publish_changes() once the lock is released.
+        """
+        self.version += 1
+        if op == "reload":
+            domains = set(self._domain_versions) | {f.domain for f in self.facts} | {g.domain for g in self.gaps}
+            entities = set(self._entity_versions) | {f.entity for f in self.facts} | {g.entity for g in self.gaps}
+        else:
+            domains, entities = (domain,), (entity,)
+        for key in domains:
+            self._domain_versions[key] = self._domain_versions.get(key, 0) + 1
+        for key in entities:
+            self._entity_versions[key] = self._entity_versions.get(key, 0) + 1
+
+        change = FactChange(version=self.version, op=op, item_id=item_id, domain=domain, entity=entity)
+        self._change_log.append(change)
+        if self._subscribers:
+            self._pending_changes.append(change)
+
+    def _publish_changes(self) -> None:
+        """Deliver recorded changes to subscribers (outside the store lock)."""
+        if not self._pending_changes:
+            return
+        with self._lock:
+            changes, self._pending_changes = self._pending_changes, []
+            subscribers = list(self._subscribers)
+        for change in changes:
+            for callback in subscribers:
+                try:
+                    callback(change)
+                except Exception as e:
+                    logger.warning(f"FactStore change subscriber failed on {change.op} {change.item_id}: {e}")
+
+    def subscribe(self, callback: Callable[[FactChange], None]) -> Callable[[], None]:
+        """
+        Call callback(change) for every change to facts or gaps.
+
+        Callbacks run on the mutating thread after the store lock is
+        released, so they may read the store. Changes made concurrently by
+        different threads can be delivered out of order; compare
+        change.version, or use changes_since(), where order matters.
+
+        Returns:
+            Function that removes the subscription
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def changes_since(self, version: int) -> Optional[List[FactChange]]:
+        """
+        Get changes made after `version`, oldest first.
+
+        Returns None if the change log (FACT_CHANGE_LOG_SIZE entries) no
+        longer reaches back that far; the caller should rebuild from the
+        full store and continue from the current version.
+        """
+        with self._lock:
+            if version >= self.version:
+                return []
+            if not self._change_log or self._change_log[0].version > version + 1:
+                return None
+            # Log versions are consecutive, so the position follows from the version
+            start = len(self._change_log) - (self.version - version)
+            return list(itertools.islice(self._change_log, start, None))
+
+    def domain_version(self, domain: str) -> int:
+        """Version counter for one domain's facts and gaps (0 if never changed)."""
+        return self._domain_versions.get(domain, 0)
+
+    def entity_version(self, entity: str) -> int:
+        """Version counter for one entity's facts and gaps (0 if never changed)."""
+        return self._entity_versions.get(entity, 0)
+
+    def mark_changed(self) -> None:
+        """
+        Record a reload after facts or gaps were edited directly.
+
+        Code that assigns or appends to self.facts / self.gaps instead of
+        using the store's methods must call this so versions and
+        subscribers see the change.
+        """
+        with self._lock:
+            self._record_change("reload")
+        self._publish_changes()
+
     def get_fact(self, fact_id: str) -> Optional[Fact]:
         """Get a specific fact by ID (O(1) lookup using index)."""
         with self._lock:
@@ -1220,11 +1504,14 @@ class FactStore:
             for fact in facts_to_remove:
                 self.facts.remove(fact)
                 self._fact_index.pop(fact.fact_id, None)  # Remove from index
+                self._record_change("remove_fact", fact.fact_id, fact.domain, fact.entity)
             
             removed = original_count - len(self.facts)
             if removed > 0:
                 logger.info(f"Removed {removed} facts from source: {source_document}")
-            return removed
+
+        self._publish_changes()
+        return removed
 
     def get_source_summary(self) -> Dict[str, Any]:
         """
@@ -1300,7 +1587,10 @@ class FactStore:
             fact.verified_at = _generate_timestamp()
             fact.updated_at = _generate_timestamp()
             logger.info(f"Fact {fact_id} verified by {verified_by}")
-            return True
+            self._record_change("update_fact", fact_id, fact.domain, fact.entity)
+
+        self._publish_changes()
+        return True
 
     def unverify_fact(self, fact_id: str) -> bool:
         """
@@ -1322,7 +1612,10 @@ class FactStore:
             fact.verified_at = None
             fact.updated_at = _generate_timestamp()
             logger.info(f"Fact {fact_id} verification removed")
-            return True
+            self._record_change("update_fact", fact_id, fact.domain, fact.entity)
+
+        self._publish_changes()
+        return True
 
     def get_verified_facts(self, domain: str = None) -> List[Fact]:
         """
@@ -1625,7 +1918,10 @@ class FactStore:
             fact.confidence_score = fact.calculate_confidence()
 
             logger.info(f"Fact {fact_id} status updated to {status} by {reviewer_id}")
-            return True
+            self._record_change("update_fact", fact_id, fact.domain, fact.entity)
+
+        self._publish_changes()
+        return True
 
     def bulk_verify(self, fact_ids: List[str], verified_by: str) -> Dict[str, int]:
         """
@@ -1689,6 +1985,7 @@ class FactStore:
                 self._fact_index[fact.fact_id] = fact  # Update index
                 existing_fact_ids.add(fact.fact_id)
                 counts["facts"] += 1
+                self._record_change("add_fact", fact.fact_id, fact.domain, fact.entity)
 
                 # Update counter to avoid future conflicts (atomic within lock)
                 # Parse ID like "F-INFRA-001" -> prefix="INFRA", seq=1
@@ -1714,6 +2011,7 @@ class FactStore:
                 self._gap_index[gap.gap_id] = gap  # Update index
                 existing_gap_ids.add(gap.gap_id)
                 counts["gaps"] += 1
+                self._record_change("add_gap", gap.gap_id, gap.domain, gap.entity)
 
                 # Update counter to avoid future conflicts (atomic within lock)
                 try:
@@ -1733,7 +2031,9 @@ class FactStore:
                     self.discovery_complete[domain] = status
 
             logger.info(f"Merged {counts['facts']} facts and {counts['gaps']} gaps (skipped {counts['duplicates']} duplicates)")
-            return counts
+
+        self._publish_changes()
+        return counts
 
     def save(self, path: str):
         """Save fact store to JSON file with retry logic."""
@@ -1847,6 +2147,7 @@ class FactStore:
                 logger.warning(f"Could not parse question ID {question.question_id}: {e}")
 
         store.discovery_complete = data.get("discovery_complete", {})
+        store.mark_changed()
 
         logger.info(f"Loaded {len(store.facts)} facts, {len(store.gaps)} gaps, {len(store.open_questions)} questions from {path}")
         return store
@@ -2304,7 +2605,9 @@ class FactStore:
                     self.facts.remove(fact)
                     del self._fact_index[to_remove]
                     removed.append(to_remove)
+                    self._record_change("remove_fact", to_remove, fact.domain, fact.entity)
 
+        self._publish_changes()
         return {
             "duplicates_found": len(duplicates),
             "automatically_removed": len(removed),
@@ -2312,6 +2615,90 @@ class FactStore:
             "manual_review_needed": len(duplicates) - len(removed)
         }
 
+    def merge_duplicate_facts(
+        self,
+        fact_ids: Optional[List[str]] = None,
+        threshold: float = DUPLICATE_SIMILARITY_THRESHOLD
+    ) -> Dict[str, str]:
+        """
+        Merge duplicates among fact_ids (all facts if None) into one fact each.
+
+        Facts are compared within the same domain, entity and category; the
+        same item (ignoring case and spacing) or a similarity at or above
+        threshold counts as a duplicate. The earliest fact is kept and gains
+        any detail keys it lacks plus the longer evidence quote; the others
+        are removed.
+
+        Used as the reduce step of chunked discovery, where overlapping
+        chunks extract the same item twice.
+
+        Returns:
+            Dict mapping each removed fact ID to the fact ID it was merged into
+        """
+        merged: Dict[str, str] = {}
+        with self._lock:
+            if fact_ids is None:
+                candidates = list(self.facts)
+            else:
+                wanted = set(fact_ids)
+                candidates = [f for f in self.facts if f.fact_id in wanted]
+
+            groups: Dict[Tuple[str, str, str], List[Fact]] = {}
+            for fact in candidates:
+                kept_facts = groups.setdefault((fact.domain, fact.entity, fact.category), [])
+                item_key = " ".join(fact.item.lower().split())
+                target = next(
+                    (k for k in kept_facts
+                     if " ".join(k.item.lower().split()) == item_key
+                     or self._calculate_fact_similarity(k, fact) >= threshold),
+                    None
+                )
+                if target is None:
+                    kept_facts.append(fact)
+                    continue
+
+                for key, value in (fact.details or {}).items():
+                    if key not in target.details:
+                        target.details[key] = value
+                quote = (fact.evidence or {}).get("exact_quote", "")
+                if len(quote) > len((target.evidence or {}).get("exact_quote", "")):
+                    target.evidence = dict(fact.evidence)
+                target.confidence_score = target.calculate_confidence()
+                merged[fact.fact_id] = target.fact_id
+
+            if merged:
+                removed = [f for f in candidates if f.fact_id in merged]
+                self.facts[:] = [f for f in self.facts if f.fact_id not in merged]
+                for fact in removed:
+                    self._fact_index.pop(fact.fact_id, None)
+                    self._record_change("remove_fact", fact.fact_id, fact.domain, fact.entity)
+                for kept_id in dict.fromkeys(merged.values()):
+                    kept = self._fact_index[kept_id]
+                    self._record_change("update_fact", kept_id, kept.domain, kept.entity)
+                logger.info(f"Merged {len(merged)} duplicate facts into {len(set(merged.values()))}")
+
+        self._publish_changes()
+        return merged
+
+    def remove_gaps(self, gap_ids: List[str]) -> int:
+        """
+        Remove gaps by ID.
+
+        Returns:
+            Number of gaps removed
+        """
+        to_remove = set(gap_ids)
+        with self._lock:
+            removed = [g for g in self.gaps if g.gap_id in to_remove]
+            if removed:
+                self.gaps[:] = [g for g in self.gaps if g.gap_id not in to_remove]
+                for gap in removed:
+                    self._gap_index.pop(gap.gap_id, None)
+                    self._record_change("remove_gap", gap.gap_id, gap.domain, gap.entity)
+
+        self._publish_changes()
+        return len(removed)
+
     # =========================================================================
     # CONFIDENCE SCORING (Point 73)
     # =========================================================================
@@ -11,12 +11,27 @@ Each granular fact represents a single data point:
 - $45,000/month cloud spend
 
 These facts link back to parent systems and forward to source evidence.
+
+Numeric facts are additionally held in a columnar layer (value list plus
+position indexes per domain/system/type/item) so rollups such as
+sum_by_item() and totals_by() do not scan every fact; results are cached
+until the next add_fact/merge_from.
+
+Usage:
+    store = GranularFactsStore()
+    store.add_fact("applications", "licensing", "cost", "Salesforce licenses", 120000)
+    store.sum_by_item("licenses")
+    store.totals_by("domain", fact_type="cost")
+    with open("facts.csv", "w", newline="") as f:
+        store.write_csv(f)
 """
 
+import csv
 import json
 import hashlib
+import re
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Set, TextIO, Tuple
 from datetime import datetime
 from pathlib import Path
 import logging
@@ -45,6 +60,19 @@ FACT_TYPES = {
     "other": "Uncategorized fact"
 }
 
+# Fields totals_by() can group on
+GROUP_BY_FIELDS = {
+    "domain": "domain",
+    "system": "parent_system_id",
+    "type": "fact_type",
+    "category": "category",
+    "unit": "unit",
+    "entity": "entity",
+}
+
+# Item tokens for the numeric item index
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
 
 # =============================================================================
 # DATA CLASSES
@@ -143,6 +171,20 @@ class GranularFactsStore:
         self._by_system: Dict[str, List[str]] = {}  # system_id -> [fact_ids]
         self._by_domain: Dict[str, List[str]] = {}  # domain -> [fact_ids]
         self._by_type: Dict[str, List[str]] = {}    # fact_type -> [fact_ids]
+
+        # Columnar numeric layer: numeric facts and their values in insertion
+        # order, with position lists per domain/system/type/normalized item
+        self._num_facts: List[GranularFact] = []
+        self._num_values: List[Any] = []
+        self._num_by_domain: Dict[str, List[int]] = {}
+        self._num_by_system: Dict[str, List[int]] = {}
+        self._num_by_type: Dict[str, List[int]] = {}
+        self._num_by_item: Dict[str, List[int]] = {}   # item.lower() -> positions
+        self._num_by_unit: Dict[str, List[int]] = {}   # unit.lower() -> positions
+        self._item_totals: Dict[str, List[Any]] = {}   # item.lower() -> [total, count]
+        self._item_tokens: Dict[str, Set[str]] = {}    # token -> normalized items
+        self._agg_cache: Dict[Tuple, Any] = {}         # Cleared whenever facts are added
+
         self.created_at: str = datetime.utcnow().isoformat()
         self.last_updated: str = self.created_at
 
@@ -236,6 +278,35 @@ class GranularFactsStore:
             self._by_type[fact.fact_type] = []
         self._by_type[fact.fact_type].append(fact.granular_fact_id)
 
+        if isinstance(fact.value, (int, float)):
+            self._index_numeric(fact)
+
+    def _index_numeric(self, fact: GranularFact):
+        """Append a numeric fact to the columnar layer and drop cached totals."""
+        pos = len(self._num_values)
+        self._num_facts.append(fact)
+        self._num_values.append(fact.value)
+
+        if fact.parent_system_id:
+            self._num_by_system.setdefault(fact.parent_system_id, []).append(pos)
+        self._num_by_domain.setdefault(fact.domain, []).append(pos)
+        self._num_by_type.setdefault(fact.fact_type, []).append(pos)
+
+        item = fact.item.lower()
+        if item not in self._num_by_item:
+            self._num_by_item[item] = []
+            self._item_totals[item] = [0, 0]
+            for token in set(_TOKEN_RE.findall(item)):
+                self._item_tokens.setdefault(token, set()).add(item)
+        self._num_by_item[item].append(pos)
+        totals = self._item_totals[item]
+        totals[0] += fact.value
+        totals[1] += 1
+        if fact.unit:
+            self._num_by_unit.setdefault(fact.unit.lower(), []).append(pos)
+
+        self._agg_cache.clear()
+
     def get_fact(self, fact_id: str) -> Optional[GranularFact]:
         """Get a fact by ID."""
         return self._facts.get(fact_id)
@@ -261,17 +332,123 @@ class GranularFactsStore:
 
     def get_numeric_facts(self) -> List[GranularFact]:
         """Get all facts with numeric values (for aggregation)."""
-        return [f for f in self._facts.values()
-                if isinstance(f.value, (int, float))]
+        return list(self._num_facts)
 
-    def sum_by_item(self, item_pattern: str) -> float:
-        """Sum all numeric values for facts matching an item pattern."""
-        total = 0.0
+    # =========================================================================
+    # AGGREGATION
+    # =========================================================================
+
+    def _items_matching(self, pattern: str) -> List[str]:
+        """
+        Normalized numeric items containing pattern (case-insensitive substring).
+
+        The longest alphanumeric run of the pattern must lie inside a single
+        item token, so only items with such a token are checked.
+        """
+        tokens = _TOKEN_RE.findall(pattern)
+        if not tokens:
+            candidates = self._num_by_item.keys()
+        else:
+            longest = max(tokens, key=len)
+            candidates = set()
+            for token, items in self._item_tokens.items():
+                if longest in token:
+                    candidates |= items
+        return [item for item in candidates if pattern in item]
+
+    def aggregate_by_item(self, item_pattern: str, match_unit: bool = False) -> Tuple[Any, int]:
+        """
+        Total and count of numeric facts whose item contains item_pattern.
+
+        Args:
+            item_pattern: Case-insensitive substring of the item
+            match_unit: Also include facts whose unit contains the pattern
+
+        Returns:
+            (total, matching fact count)
+        """
         pattern = item_pattern.lower()
-        for fact in self._facts.values():
-            if pattern in fact.item.lower() and isinstance(fact.value, (int, float)):
-                total += fact.value
-        return total
+        key = ("item", pattern, match_unit)
+        cached = self._agg_cache.get(key)
+        if cached is not None:
+            return cached
+
+        items = self._items_matching(pattern)
+        units = [unit for unit in self._num_by_unit if pattern in unit] if match_unit else []
+        if not units:
+            # Running per-item totals; no per-fact work
+            result = (sum(self._item_totals[item][0] for item in items),
+                      sum(self._item_totals[item][1] for item in items))
+        else:
+            positions: Set[int] = set()
+            for item in items:
+                positions.update(self._num_by_item[item])
+            for unit in units:
+                positions.update(self._num_by_unit[unit])
+            values = self._num_values
+            result = (sum(values[pos] for pos in positions), len(positions))
+
+        self._agg_cache[key] = result
+        return result
+
+    def sum_by_item(self, item_pattern: str, match_unit: bool = False) -> float:
+        """Sum all numeric values for facts matching an item pattern."""
+        return float(self.aggregate_by_item(item_pattern, match_unit)[0])
+
+    def _numeric_positions(self, domain: Optional[str], fact_type: Optional[str],
+                           system_id: Optional[str]) -> List[int]:
+        """Positions of numeric facts matching all given filters."""
+        selected = [index.get(value, []) for index, value in (
+            (self._num_by_domain, domain),
+            (self._num_by_type, fact_type),
+            (self._num_by_system, system_id),
+        ) if value is not None]
+        if not selected:
+            return list(range(len(self._num_values)))
+        smallest = min(selected, key=len)
+        if len(selected) == 1:
+            return smallest
+        others = [set(positions) for positions in selected if positions is not smallest]
+        return [pos for pos in smallest if all(pos in other for other in others)]
+
+    def sum_values(self, domain: Optional[str] = None, fact_type: Optional[str] = None,
+                   system_id: Optional[str] = None) -> float:
+        """Sum numeric values, optionally filtered by domain, fact type and system."""
+        key = ("sum", domain, fact_type, system_id)
+        cached = self._agg_cache.get(key)
+        if cached is None:
+            values = self._num_values
+            cached = float(sum(values[pos] for pos in self._numeric_positions(domain, fact_type, system_id)))
+            self._agg_cache[key] = cached
+        return cached
+
+    def totals_by(self, group_by: str, domain: Optional[str] = None,
+                  fact_type: Optional[str] = None, system_id: Optional[str] = None) -> Dict[str, float]:
+        """
+        Numeric totals grouped by a fact field.
+
+        Args:
+            group_by: One of GROUP_BY_FIELDS (domain, system, type, category, unit, entity)
+            domain, fact_type, system_id: Optional filters
+
+        Returns:
+            {group value: total}; facts without a value for the field are
+            grouped under ""
+        """
+        if group_by not in GROUP_BY_FIELDS:
+            raise ValueError(f"Cannot group by {group_by!r}; expected one of {sorted(GROUP_BY_FIELDS)}")
+
+        key = ("by", group_by, domain, fact_type, system_id)
+        cached = self._agg_cache.get(key)
+        if cached is None:
+            attr = GROUP_BY_FIELDS[group_by]
+            facts, values = self._num_facts, self._num_values
+            cached = {}
+            for pos in self._numeric_positions(domain, fact_type, system_id):
+                group = getattr(facts[pos], attr) or ""
+                cached[group] = cached.get(group, 0.0) + values[pos]
+            self._agg_cache[key] = cached
+        return dict(cached)
 
     def count_by_domain(self) -> Dict[str, int]:
         """Count facts per domain."""
@@ -314,12 +491,16 @@ class GranularFactsStore:
         Returns:
             List of row dictionaries
         """
+        return list(self.iter_rows(domain))
+
+    def iter_rows(self, domain: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield flat export rows one fact at a time (see to_rows)."""
         if domain:
-            facts = self.get_facts_by_domain(domain)
+            facts = (self._facts[fid] for fid in self._by_domain.get(domain, []) if fid in self._facts)
         else:
-            facts = self.get_all_facts()
-
-        return [f.to_row() for f in facts]
+            facts = iter(self._facts.values())
+        for fact in facts:
+            yield fact.to_row()
 
     def to_json(self) -> str:
         """Export all facts as JSON string."""
@@ -336,18 +517,29 @@ class GranularFactsStore:
 
     def to_csv_rows(self) -> List[List[str]]:
         """Export as CSV-ready rows (header + data)."""
-        if not self._facts:
-            return []
-
-        # Header
-        rows = [list(self.to_rows()[0].keys())] if self._facts else []
-
-        # Data rows
-        for fact in self._facts.values():
-            row_dict = fact.to_row()
-            rows.append([str(v) for v in row_dict.values()])
+        return list(self.iter_csv_rows())
+
+    def iter_csv_rows(self, domain: Optional[str] = None) -> Iterator[List[str]]:
+        """Yield the CSV header, then one row per fact, without building the full table."""
+        header_written = False
+        for row_dict in self.iter_rows(domain):
+            if not header_written:
+                yield list(row_dict.keys())
+                header_written = True
+            yield [str(v) for v in row_dict.values()]
+
+    def write_csv(self, fileobj: TextIO, domain: Optional[str] = None) -> int:
+        """
+        Stream facts as CSV to an open text file.
 
-        return rows
+        Returns:
+            Number of data rows written
+        """
+        writer = csv.writer(fileobj)
+        count = -1
+        for count, row in enumerate(self.iter_csv_rows(domain)):
+            writer.writerow(row)
+        return max(count, 0)
 
     # =========================================================================
     # PERSISTENCE
@@ -412,8 +604,6 @@ class GranularFactsStore:
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive statistics about the store."""
-        numeric_facts = self.get_numeric_facts()
-
         return {
             "total_facts": self.total_facts,
             "facts_by_domain": self.count_by_domain(),
@@ -421,7 +611,7 @@ class GranularFactsStore:
             "facts_by_system": self.count_by_system(),
             "unique_systems": len(self._by_system),
             "unique_domains": len(self._by_domain),
-            "numeric_facts": len(numeric_facts),
+            "numeric_facts": len(self._num_facts),
             "validated_facts": sum(1 for f in self._facts.values() if f.validated),
             "unvalidated_facts": sum(1 for f in self._facts.values() if not f.validated),
             "facts_with_evidence": sum(1 for f in self._facts.values() if f.evidence_quote),
@@ -15,6 +15,8 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 import logging
 
+from stores.compact import intern_fields, record_to_dict
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +25,15 @@ def _generate_timestamp() -> str:
     return datetime.now().isoformat()
 
 
-@dataclass
+# Low-cardinality string fields, interned so each distinct value is stored
+# once per process rather than once per item.
+INVENTORY_INTERNED_FIELDS = (
+    "inventory_type", "entity", "source_file", "source_type", "deal_id",
+    "enrichment_confidence", "enrichment_method", "status",
+)
+
+
+@dataclass(slots=True)
 class InventoryItem:
     """
     A structured inventory record.
@@ -113,6 +123,8 @@ class InventoryItem:
         if not self.deal_id:
             logger.warning(f"InventoryItem {self.item_id} created without deal_id - data isolation may be compromised")
 
+        intern_fields(self, INVENTORY_INTERNED_FIELDS)
+
     # ----- Convenience Properties -----
 
     @property
@@ -239,7 +251,7 @@ class InventoryItem:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        return record_to_dict(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "InventoryItem":
@@ -0,0 +1,117 @@
+"""
+Tests for the precompiled activity catalog.
+
+Catalog lookups must return the same activities as walking the nested
+phase templates, and snapshots must round-trip and reject stale data.
+
+Run with: pytest tests/test_activity_catalog.py -v
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools_v2.activity_catalog import (
+    ActivityCatalog,
+    get_activity_catalog,
+    load_catalog_snapshot,
+    save_catalog_snapshot,
+)
+from tools_v2.activity_templates_phase10 import (
+    get_all_templates,
+    get_activity_count_by_phase,
+    get_activities_by_workstream,
+    get_tsa_activities,
+    get_unified_activity_catalog,
+)
+from tools_v2.activity_templates_phase3 import get_phase3_activity_by_id, get_phase3_templates
+from tools_v2.activity_templates_v2 import get_activities_by_phase, get_activity_by_id
+
+
+def _walk(all_templates):
+    for phase_name, phase_templates in all_templates.items():
+        for category, workstreams in phase_templates.items():
+            for workstream, activities in workstreams.items():
+                for activity in activities:
+                    yield phase_name, category, workstream, activity
+
+
+class TestCatalogLookups:
+    """Indexed lookups agree with a full template walk."""
+
+    def test_every_activity_is_indexed_by_id(self):
+        catalog = get_activity_catalog()
+        walked = list(_walk(get_all_templates()))
+
+        assert len(catalog) == len(walked)
+        for phase_name, category, workstream, activity in walked:
+            assert catalog.get(activity["id"]) is activity
+            assert catalog.get(activity["id"], source_phase=phase_name) is activity
+            assert tuple(catalog.location(activity["id"])) == (phase_name, category, workstream)
+
+    def test_phase_module_lookup_is_scoped_to_its_phase(self):
+        phase3_activity = next(iter(_walk({"p3": get_phase3_templates()})))[3]
+
+        assert get_phase3_activity_by_id(phase3_activity["id"]) is phase3_activity
+        assert get_activity_by_id(phase3_activity["id"]) is None
+        assert get_phase3_activity_by_id("NOT-AN-ID") is None
+
+    def test_activities_by_phase_matches_walk(self):
+        expected = [
+            {**a, "workstream": ws, "category": cat}
+            for src, cat, ws, a in _walk(get_all_templates())
+            if src == "phase1_foundation" and a.get("phase") == "assessment"
+        ]
+
+        assert expected
+        assert get_activities_by_phase("assessment") == expected
+
+    def test_unified_catalog_views(self):
+        unified = get_unified_activity_catalog()
+
+        assert [a["id"] for a in get_tsa_activities()] == [a["id"] for a in unified if a.get("requires_tsa")]
+        assert [a["id"] for a in get_activities_by_workstream("identity")] == [
+            a["id"] for a in unified if a["_source_workstream"] == "identity"
+        ]
+        assert sum(get_activity_count_by_phase().values()) == len(unified)
+
+    def test_keyword_search_ranks_by_matches(self):
+        catalog = ActivityCatalog([
+            ("p1", "cat", "ws", {"id": "A-1", "name": "Email migration", "description": "Move mailboxes"}),
+            ("p1", "cat", "ws", {"id": "A-2", "name": "Identity migration", "description": "Email cutover"}),
+            ("p1", "cat", "ws", {"id": "A-3", "name": "Network design", "description": ""}),
+        ])
+
+        results = catalog.search("email migration")
+
+        assert [r["id"] for r in results] == ["A-1", "A-2"]
+        assert results[0]["_source_workstream"] == "ws"
+
+
+class TestCatalogSnapshot:
+    """Pickle snapshots of the compiled catalog."""
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "catalog.pkl")
+        save_catalog_snapshot(path)
+
+        loaded = load_catalog_snapshot(path)
+
+        assert loaded is not None
+        assert len(loaded) == len(get_activity_catalog())
+        some_id = get_unified_activity_catalog()[0]["id"]
+        assert loaded.get(some_id)["name"] == get_activity_catalog().get(some_id)["name"]
+
+    def test_stale_snapshot_is_ignored(self, tmp_path):
+        path = tmp_path / "catalog.pkl"
+        path.write_bytes(pickle.dumps({"version": 1, "fingerprint": "old", "catalog": None}))
+
+        assert load_catalog_snapshot(str(path)) is None
+
+    def test_missing_snapshot(self, tmp_path):
+        assert load_catalog_snapshot(str(tmp_path / "missing.pkl")) is None
@@ -0,0 +1,141 @@
+"""
+Tests for the fanned-out Celery analysis workflow.
+
+Covers lane planning under the per-deal concurrency cap, the shape of the
+chord built for an analysis run, and aggregation of per-domain results.
+
+Run with: pytest tests/test_analysis_fanout.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("celery")
+
+from web.tasks.analysis_tasks import (
+    aggregate_domain_results,
+    build_analysis_workflow,
+    plan_domain_lanes,
+)
+
+DOMAINS = ["infrastructure", "network", "cybersecurity", "applications", "identity_access", "organization"]
+
+
+class TestPlanDomainLanes:
+
+    def test_caps_parallel_lanes(self):
+        lanes = plan_domain_lanes(DOMAINS, 4)
+
+        assert len(lanes) == 4
+        assert sorted(d for lane in lanes for d in lane) == sorted(DOMAINS)
+        assert max(len(lane) for lane in lanes) == 2
+
+    def test_one_lane_per_domain_when_cap_allows(self):
+        assert plan_domain_lanes(DOMAINS[:3], 10) == [[d] for d in DOMAINS[:3]]
+
+    def test_cap_of_one_is_sequential(self):
+        assert plan_domain_lanes(DOMAINS, 1) == [DOMAINS]
+        assert plan_domain_lanes(DOMAINS, 0) == [DOMAINS]
+
+
+class TestBuildAnalysisWorkflow:
+
+    def test_chord_of_lane_chains(self):
+        lanes = plan_domain_lanes(DOMAINS, 3)
+
+        workflow = build_analysis_workflow(
+            deal_id="deal-1", run_id="run-1", lanes=lanes, entity="target",
+            options={}, parent_task_id="parent-1", started_at="2026-01-01T00:00:00"
+        )
+
+        header = workflow.tasks
+        assert len(header) == 3
+        for lane, lane_chain in zip(lanes, header):
+            steps = lane_chain.tasks
+            assert [s.kwargs["domain"] for s in steps] == lane
+            assert steps[0].args == ([],)
+            assert all(s.args == () for s in steps[1:])
+            assert all(s.kwargs["total_domains"] == len(DOMAINS) for s in steps)
+            assert all(s.kwargs["parent_task_id"] == "parent-1" for s in steps)
+
+        assert workflow.body.task == "web.tasks.finalize_analysis_run"
+        assert workflow.body.kwargs["run_id"] == "run-1"
+
+    def test_chord_failure_marks_run_failed(self):
+        workflow = build_analysis_workflow(
+            deal_id="deal-1", run_id="run-1", lanes=[["network"]], entity="target",
+            options={}, parent_task_id=None, started_at="2026-01-01T00:00:00"
+        )
+
+        errbacks = workflow.body.options["link_error"]
+        assert [e["task"] for e in errbacks] == ["web.tasks.fail_analysis_run"]
+        assert errbacks[0]["kwargs"] == {"deal_id": "deal-1", "run_id": "run-1"}
+
+
+class TestIdempotentFactSave:
+
+    @pytest.fixture
+    def app(self, tmp_path):
+        from flask import Flask
+        from web.database import db
+
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'facts.db'}"
+        app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            yield app
+            db.session.remove()
+            db.engine.dispose()
+
+    @staticmethod
+    def _facts(run_id, items, domain="network"):
+        return [{"id": f"F-NET-{i:03d}", "deal_id": "deal-1", "analysis_run_id": run_id, "domain": domain,
+                 "entity": "target", "item": item} for i, item in enumerate(items)]
+
+    def test_retry_replaces_facts_from_earlier_attempt(self, app):
+        from web.database import Fact
+        from web.repositories.fact_repository import FactRepository
+
+        repo = FactRepository()
+        repo.replace_for_run("deal-1", "run-1", "network", "target", self._facts("run-1", ["Cisco core", "Firewall"]))
+        repo.replace_for_run("deal-1", "run-1", "network", "target", self._facts("run-1", ["Cisco core"]))
+
+        assert [f.item for f in Fact.query.all()] == ["Cisco core"]
+
+    def test_other_domains_untouched_and_failed_save_rolled_back(self, app):
+        from web.database import Fact
+        from web.repositories.fact_repository import FactRepository
+
+        repo = FactRepository()
+        repo.create_many([{"id": "F-APP-001", "deal_id": "deal-1", "analysis_run_id": "run-1",
+                           "domain": "applications", "entity": "target", "item": "SAP"}])
+        repo.replace_for_run("deal-1", "run-1", "network", "target", self._facts("run-1", ["Cisco core"]))
+
+        with pytest.raises(Exception):
+            repo.replace_for_run("deal-1", "run-1", "network", "target",
+                                 self._facts("run-1", ["Router"]) * 2)  # Duplicate IDs fail the insert
+
+        assert sorted(f.item for f in Fact.query.all()) == ["Cisco core", "SAP"]
+
+
+class TestAggregateDomainResults:
+
+    def test_sums_completed_domains_and_collects_errors(self):
+        results = aggregate_domain_results([
+            {"domain": "network", "facts_count": 5, "findings_count": 2, "status": "completed"},
+            {"domain": "applications", "facts_count": 0, "status": "no_documents"},
+            {"domain": "cybersecurity", "facts_count": 0, "status": "error", "error": "API timeout"},
+            {"domain": "infrastructure", "facts_count": 7, "findings_count": 1, "status": "completed"},
+        ])
+
+        assert results["domains_analyzed"] == ["network", "applications", "infrastructure"]
+        assert results["total_facts"] == 12
+        assert results["total_findings"] == 3
+        assert results["errors"] == [{"domain": "cybersecurity", "error": "API timeout"}]
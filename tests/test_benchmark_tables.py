@@ -0,0 +1,136 @@
+"""
+Tests for the compiled benchmark lookup tables used by BenchmarkService and
+StaffingComparisonService.
+
+Lookups are checked against straightforward scans of the same benchmark
+data (the behaviour the tables replace).
+
+Run with: pytest tests/test_benchmark_tables.py -v
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.benchmark_service import BenchmarkService, DEFAULT_BENCHMARKS_DIR
+from services.benchmark_tables import RoleTitleTrie, estimate_percentile
+from services.staffing_comparison_service import ROLE_EQUIVALENCY_MAP, StaffingComparisonService
+
+
+@pytest.fixture
+def service(tmp_path):
+    benchmarks_dir = tmp_path / "benchmarks"
+    shutil.copytree(DEFAULT_BENCHMARKS_DIR, benchmarks_dir)
+    svc = BenchmarkService(benchmarks_dir)
+    assert svc.load_benchmarks()
+    return svc
+
+
+def _scan_match(profiles, revenue, employees, industry):
+    scored = [(p.match_score(revenue, employees, industry), p) for p in profiles]
+    scored = [s for s in scored if s[0] > 0]
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return scored[0][1] if scored else None
+
+
+def _scan_normalize(mapping, role_title):
+    title_lower = role_title.lower().strip()
+    if title_lower in mapping:
+        return mapping[title_lower]
+    for key, normalized in mapping.items():
+        if key in title_lower:
+            return normalized
+    return role_title.lower()
+
+
+class TestProfileMatching:
+
+    @pytest.mark.parametrize("industry", ["general", "Healthcare", "banking", "manufacturing", "retail"])
+    def test_same_profile_as_scoring_every_profile(self, service, industry):
+        for revenue in [0, 10e6, 25e6, 49_999_999, 50e6, 120e6, 250e6, 400e6, 2e9, 20e9]:
+            for employees in [0, 50, 100, 250, 600, 1000, 2500, 60000]:
+                expected = _scan_match(service.get_profiles(), revenue, employees, industry)
+                assert service.match_profile(revenue, employees, industry) is expected
+
+    def test_profile_by_id(self, service):
+        assert service.get_profile_by_id("midmarket_healthcare").profile_id == "midmarket_healthcare"
+        assert service.get_profile_by_id("missing") is None
+
+    def test_compare_staffing_uses_profile_bounds(self, service):
+        profile = service.get_profile_by_id("midmarket_manufacturing")
+        staff = {category: int(r.max_value) + 1 for category, r in profile.expected_staffing.items()}
+
+        result = service.compare_staffing(staff, profile)
+
+        assert result.overall_status == "overstaffed"
+        assert result.total_expected_max == sum(int(r.max_value) for r in profile.expected_staffing.values())
+        assert all(c.category_display for c in result.category_comparisons)
+
+
+class TestCompensation:
+
+    def test_matches_scan_with_adjustments(self, service):
+        comp = service._compensation_benchmarks
+        for category, roles in comp.items():
+            for role in list(roles)[:3]:
+                result = service.get_compensation_benchmark(f"Senior {role}", category, "tier_1_metro", "healthcare")
+                mult = (service._location_adjustments["tier_1_metro"]["multiplier"] *
+                        service._industry_adjustments["healthcare"]["multiplier"])
+                base = roles[result["role_matched"]]
+                assert result["p50"] == int(base["p50"] * mult)
+                assert result["location_adjustment"] == service._location_adjustments["tier_1_metro"]["multiplier"]
+
+    def test_unknown_role_and_tiers(self, service):
+        assert service.get_compensation_benchmark("Astronaut", "security") is None
+        role = next(iter(service._compensation_benchmarks["security"]))
+        result = service.get_compensation_benchmark(role, "security", "moon_base", "unknown")
+        assert result["location_adjustment"] == result["industry_adjustment"] == 1.0
+
+    def test_upload_rebuilds_tables(self, service):
+        assert service.get_compensation_benchmark("Quantum Engineer", "infrastructure") is None
+        ok = service.upload_custom_benchmarks({"compensation_benchmarks": {
+            "infrastructure": {"Quantum Engineer": {"p25": 150000, "p50": 180000, "p75": 210000}}}})
+
+        assert ok
+        assert service.get_compensation_benchmark("Quantum Engineer", "infrastructure")["p50"] == 180000
+
+    @pytest.mark.parametrize("value,expected", [
+        (50000, 25), (100000, 25), (112500, 37), (125000, 50), (137500, 62), (150000, 75), (999999, 75)])
+    def test_percentile_interpolation(self, service, value, expected):
+        assert estimate_percentile(value, 100000, 125000, 150000) == expected
+        assert service._estimate_percentile(value, {"p25": 100000, "p50": 125000, "p75": 150000}) == expected
+
+
+class TestRoleNormalization:
+
+    TITLES = ["Sys Admin", "  SysAdmin ", "Senior Linux Admin II", "Helpdesk Lead", "IT Support Specialist",
+              "Lead DBA", "Sr. Developer", "Chief Information Officer", "pm", "Netengineer", "",
+              "Cloud Admin (AWS)", "badge admin"]
+
+    @pytest.mark.parametrize("title", TITLES)
+    def test_trie_matches_scan(self, title):
+        assert RoleTitleTrie(ROLE_EQUIVALENCY_MAP).normalize(title) == _scan_normalize(ROLE_EQUIVALENCY_MAP, title)
+
+    def test_batch_mapping_and_custom_equivalency(self, service):
+        from models.organization_models import EmploymentType, RoleCategory, StaffMember
+
+        staffing = StaffingComparisonService(benchmark_service=service)
+        staff = [StaffMember(id=f"S{i}", name=f"Person {i}", role_title=title,
+                             role_category=RoleCategory.INFRASTRUCTURE, department="IT",
+                             employment_type=EmploymentType.FTE, base_compensation=90000)
+                 for i, title in enumerate(["Sys Admin", "Sys Admin", "Platform Wrangler"])]
+
+        groups = staffing.map_roles_to_benchmarks(staff)
+        assert {k: len(v) for k, v in groups.items()} == {"systems administrator": 2, "platform wrangler": 1}
+
+        staffing.add_role_equivalency("Platform Wrangler", "Cloud Engineer")
+        assert staffing.normalize_role_title("Platform Wrangler") == "cloud engineer"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
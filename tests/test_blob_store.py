@@ -0,0 +1,194 @@
+"""
+Tests for content-addressed S3 storage with a local read-through cache.
+
+S3Storage runs against LocalS3Client, the directory-backed stand-in for
+the boto3 client.
+
+Run with: pytest tests/test_blob_store.py -v
+"""
+
+import hashlib
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web.blob_store import BlobCache, LocalS3Client, blob_key
+from web.storage import S3Storage
+
+PDF = b"%PDF-1.4\n" + bytes(range(256)) * 200 + b"\n%%EOF"
+PDF_HASH = hashlib.sha256(PDF).hexdigest()
+
+
+@pytest.fixture
+def client(tmp_path):
+    return LocalS3Client(tmp_path / "s3")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return BlobCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+
+
+@pytest.fixture
+def storage(client, cache):
+    return S3Storage(bucket="docs", client=client, cache=cache, content_addressed=True)
+
+
+class TestBlobCache:
+
+    def test_put_verifies_hash(self, cache):
+        with pytest.raises(ValueError):
+            cache.put(PDF_HASH, io.BytesIO(b"not the pdf"))
+        assert cache.get(PDF_HASH) is None
+
+        path = cache.put(PDF_HASH, io.BytesIO(PDF))
+        assert cache.get(PDF_HASH) == path
+        assert path.read_bytes() == PDF
+
+    def test_lru_eviction(self, tmp_path):
+        cache = BlobCache(tmp_path / "small", max_bytes=250)
+        blobs = {name: name.encode() * 100 for name in ("a", "b", "c")}
+        hashes = {name: hashlib.sha256(data).hexdigest() for name, data in blobs.items()}
+
+        cache.put(hashes["a"], io.BytesIO(blobs["a"]))
+        cache.put(hashes["b"], io.BytesIO(blobs["b"]))
+        cache.get(hashes["a"])  # b is now least recently used
+        cache.put(hashes["c"], io.BytesIO(blobs["c"]))
+
+        assert cache.get(hashes["b"]) is None
+        assert cache.get(hashes["a"]) is not None
+        assert cache.stats()["bytes"] <= 250
+
+    def test_processes_sharing_a_directory_stay_within_budget(self, tmp_path):
+        first = BlobCache(tmp_path / "shared", max_bytes=250)
+        second = BlobCache(tmp_path / "shared", max_bytes=250)
+        blobs = {name: name.encode() * 100 for name in ("a", "b", "c")}
+        hashes = {name: hashlib.sha256(data).hexdigest() for name, data in blobs.items()}
+
+        first.put(hashes["a"], io.BytesIO(blobs["a"]))
+        second.put(hashes["b"], io.BytesIO(blobs["b"]))
+        assert second.get(hashes["a"]) is not None  # written by the other process
+        os.utime(second.get(hashes["a"]), (1000, 1000))  # a is least recently used
+        first.put(hashes["c"], io.BytesIO(blobs["c"]))
+
+        on_disk = sum(p.stat().st_size for p in (tmp_path / "shared").glob("*/*"))
+        assert on_disk <= 250
+        assert first.get(hashes["a"]) is None
+        assert first.get(hashes["b"]) is not None
+
+    def test_index_survives_restart(self, tmp_path, cache):
+        cache.put(PDF_HASH, io.BytesIO(PDF))
+        reopened = BlobCache(cache.cache_dir, max_bytes=cache.max_bytes)
+        assert reopened.get(PDF_HASH) is not None
+
+
+class TestContentAddressedS3:
+
+    def test_identical_files_stored_once(self, storage, client):
+        first = storage.upload(io.BytesIO(PDF), "deals/d1/documents/target/a.pdf", "a.pdf")
+        second = storage.upload(io.BytesIO(PDF), "deals/d2/documents/target/b.pdf", "b.pdf")
+
+        assert first.hash == second.hash == PDF_HASH
+        assert client.calls["upload_fileobj"] == 1
+        assert client.head_object(Bucket="docs", Key=blob_key(PDF_HASH))["ContentLength"] == len(PDF)
+        assert client.head_object(Bucket="docs", Key="deals/d2/documents/target/b.pdf")["ContentLength"] == 0
+
+    def test_download_reads_through_cache(self, client, tmp_path):
+        writer = S3Storage(bucket="docs", client=client, content_addressed=True)
+        writer.upload(io.BytesIO(PDF), "deals/d1/documents/target/a.pdf", "a.pdf")
+        cache = BlobCache(tmp_path / "reader-cache", max_bytes=10 * 1024 * 1024)
+        reader = S3Storage(bucket="docs", client=client, cache=cache, content_addressed=True)
+
+        for _ in range(3):
+            file, stored = reader.download("deals/d1/documents/target/a.pdf")
+            with file:
+                assert file.read() == PDF
+            assert stored.size == len(PDF)
+            assert stored.filename == "a.pdf"
+
+        assert client.calls["get_object"] == 1
+        assert cache.stats()["hits"] == 2
+
+    def test_range_read_without_full_download(self, client):
+        writer = S3Storage(bucket="docs", client=client, content_addressed=True)
+        writer.upload(io.BytesIO(PDF), "deals/d1/documents/target/a.pdf", "a.pdf")
+
+        tail = writer.read_range("deals/d1/documents/target/a.pdf", len(PDF) - 6, 6)
+
+        assert tail == b"\n%%EOF"
+
+    def test_range_read_served_from_cache(self, storage, client):
+        storage.upload(io.BytesIO(PDF), "deals/d1/documents/target/a.pdf", "a.pdf")
+        assert storage.read_range("deals/d1/documents/target/a.pdf", 0, 8) == b"%PDF-1.4"
+        assert client.calls.get("get_object", 0) == 0
+
+    def test_legacy_objects_still_readable(self, client, cache):
+        legacy = S3Storage(bucket="docs", client=client, content_addressed=False)
+        legacy.upload(io.BytesIO(PDF), "deals/d1/documents/target/old.pdf", "old.pdf")
+        storage = S3Storage(bucket="docs", client=client, cache=cache, content_addressed=True)
+
+        file, stored = storage.download("deals/d1/documents/target/old.pdf")
+        with file:
+            assert file.read() == PDF
+        assert cache.get(PDF_HASH) is not None
+
+    def test_listing_and_blob_garbage_collection(self, storage, client):
+        storage.upload(io.BytesIO(PDF), "deals/d1/documents/target/a.pdf", "a.pdf")
+        storage.upload(io.BytesIO(PDF), "deals/d2/documents/target/a.pdf", "a.pdf")
+        storage.upload(io.BytesIO(b"other"), "deals/d2/documents/buyer/b.txt", "b.txt")
+
+        listed = storage.list_files("")
+        assert sorted(f.key for f in listed) == ["deals/d1/documents/target/a.pdf",
+                                                  "deals/d2/documents/buyer/b.txt",
+                                                  "deals/d2/documents/target/a.pdf"]
+        assert {f.size for f in listed if f.filename == "a.pdf"} == {len(PDF)}
+
+        storage.delete("deals/d1/documents/target/a.pdf")
+        storage.delete("deals/d2/documents/buyer/b.txt")
+        heads = client.calls["head_object"]
+        assert storage.delete_unreferenced_blobs(grace_hours=0) == 1
+        assert storage.exists(blob_key(PDF_HASH))
+        assert client.calls["head_object"] == heads + 1  # only the exists() above
+
+        storage.delete("deals/d2/documents/target/a.pdf")
+        assert storage.delete_unreferenced_blobs(grace_hours=0) == 1
+        assert not storage.exists(blob_key(PDF_HASH))
+
+    def test_recent_blobs_survive_garbage_collection(self, storage):
+        storage.upload(io.BytesIO(PDF), "deals/d1/documents/target/a.pdf", "a.pdf")
+        storage.delete("deals/d1/documents/target/a.pdf")
+
+        assert storage.delete_unreferenced_blobs(grace_hours=1) == 0
+        assert storage.exists(blob_key(PDF_HASH))
+
+    def test_reupload_after_delete_keeps_blob(self, storage):
+        storage.upload(io.BytesIO(PDF), "deals/d1/documents/target/a.pdf", "a.pdf")
+        storage.delete("deals/d1/documents/target/a.pdf")
+        storage.upload(io.BytesIO(PDF), "deals/d1/documents/target/a.pdf", "a.pdf")
+
+        assert storage.delete_unreferenced_blobs(grace_hours=0) == 0
+        file, _ = storage.download("deals/d1/documents/target/a.pdf")
+        with file:
+            assert file.read() == PDF
+
+    def test_overwritten_content_is_collected(self, storage):
+        storage.upload(io.BytesIO(b"draft contract"), "deals/d1/documents/target/c.txt", "c.txt")
+        storage.upload(io.BytesIO(PDF), "deals/d1/documents/target/c.txt", "c.txt")
+
+        assert storage.delete_unreferenced_blobs(grace_hours=0) == 1
+        assert not storage.exists(blob_key(hashlib.sha256(b"draft contract").hexdigest()))
+        assert storage.exists(blob_key(PDF_HASH))
+
+    def test_presigned_url_points_at_blob(self, storage):
+        storage.upload(io.BytesIO(PDF), "deals/d1/documents/target/a.pdf", "a.pdf")
+        assert storage.get_url("deals/d1/documents/target/a.pdf").endswith(blob_key(PDF_HASH))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,263 @@
+"""
+Tests for tools_v2.cache.
+
+Covers the LRU cache (ordering, TTL, byte budget, stats, concurrent use),
+the Redis shared tier, and the analyzer decorators' pluggable key functions.
+
+Run with: pytest tests/test_cache.py -v
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from stores.fact_store import FactStore
+from tools_v2 import cache as cache_module
+from tools_v2.cache import RedisCacheTier, SimpleCache, get_cache, set_key_function
+from tools_v2.coverage import CoverageAnalyzer
+from tools_v2.reasoning_tools import ReasoningStore, Risk
+from tools_v2.synthesis import SynthesisAnalyzer
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis client methods the shared tier uses."""
+
+    def __init__(self, fail=False):
+        self.data = {}
+        self.fail = fail
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("redis unavailable")
+
+    def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        self._check()
+        self.data[key] = value
+
+    def delete(self, *keys):
+        self._check()
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match=None, count=None):
+        self._check()
+        prefix = match.rstrip("*")
+        return [key for key in self.data if key.startswith(prefix)]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _add(fact_store, item, source="doc1.md"):
+    return fact_store.add_fact(domain="infrastructure", category="hosting", item=item, details={},
+                               status="documented", evidence={"exact_quote": "Documented in the IT deck"},
+                               source_document=source)
+
+
+class TestSimpleCache:
+
+    def test_evicts_least_recently_used(self):
+        cache = SimpleCache(max_size=2)
+        cache.set("a", "k1")
+        cache.set("b", "k2")
+        assert cache.get("k1") == "a"  # k2 is now least recently used
+
+        cache.set("c", "k3")
+
+        assert cache.get("k2") is None
+        assert cache.get("k1") == "a" and cache.get("k3") == "c"
+        assert cache.stats()["evictions"] == 1
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(cache_module.time, "monotonic", clock)
+        cache = SimpleCache(ttl_seconds=10)
+        cache.set("a", "k1")
+
+        clock.now += 5
+        assert cache.get("k1") == "a"
+        clock.now += 6
+        assert cache.get("k1") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_byte_budget(self):
+        cache = SimpleCache(max_size=100, max_bytes=10, sizeof=len)
+        cache.set("xxxx", "k1")
+        cache.set("yyyy", "k2")
+        cache.set("zzzz", "k3")
+
+        assert cache.get("k1") is None
+        assert cache.stats()["bytes"] == 8
+
+        cache.set("w" * 11, "k4")  # larger than the whole budget
+        assert cache.get("k4") is None
+        assert len(cache) == 2
+
+    def test_pluggable_key_function(self):
+        fact_store = FactStore(deal_id="deal-1")
+        cache = SimpleCache(key_fn=lambda store: f"{store.deal_id}:{len(store.facts)}")
+        cache.set("summary", fact_store)
+
+        assert "deal-1:0" in cache
+        _add(fact_store, "Primary data center")
+        assert cache.get(fact_store) is None
+
+    def test_stats(self):
+        cache = SimpleCache(max_size=10)
+        assert cache.stats()["hit_rate"] == "N/A"
+        cache.set(1, "k1")
+        cache.get("k1")
+        cache.get("k2")
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_concurrent_access_keeps_limits(self):
+        cache = SimpleCache(max_size=50, max_bytes=400, sizeof=lambda value: 10)
+
+        def worker(n):
+            for i in range(500):
+                cache.set(i, f"{n}-{i}")
+                cache.get(f"{n}-{i - 3}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert stats["size"] == 40 and stats["bytes"] == 400
+        assert stats["hits"] + stats["misses"] == 8 * 500
+
+
+class TestRedisCacheTier:
+
+    def test_local_miss_falls_through_to_shared_tier(self):
+        redis = FakeRedis()
+        worker_a = SimpleCache(shared=RedisCacheTier(client=redis))
+        worker_b = SimpleCache(shared=RedisCacheTier(client=redis))
+        worker_a.set({"coverage": 42}, "deal-1")
+
+        assert worker_b.get("deal-1") == {"coverage": 42}
+        assert worker_b.stats()["shared_hits"] == 1
+        assert len(worker_b) == 1  # promoted to the local tier
+
+    def test_decoded_responses_are_supported(self):
+        redis = FakeRedis()
+        tier = RedisCacheTier(client=redis, prefix="p")
+        tier.set("k", [1, 2])
+        redis.data[tier._key("k")] = redis.data[tier._key("k")].decode("ascii")
+
+        assert tier.get("k") == [1, 2]
+
+    def test_redis_errors_degrade_to_local_cache(self):
+        cache = SimpleCache(shared=RedisCacheTier(client=FakeRedis(fail=True)))
+        cache.set("a", "k1")
+
+        assert cache.get("k1") == "a"
+        assert cache.get("k2") is None
+        assert cache.stats()["shared_errors"] == 2
+
+    def test_unreadable_payload_is_a_miss(self):
+        redis = FakeRedis()
+        tier = RedisCacheTier(client=redis, prefix="p")
+        redis.data[tier._key("k")] = b"not a pickle"
+
+        assert tier.get("k") is cache_module._MISSING
+        assert tier.errors == 1
+        assert redis.data == {}
+
+    def test_keys_carry_schema_version(self, monkeypatch):
+        redis = FakeRedis()
+        tier = RedisCacheTier(client=redis, prefix="p")
+        tier.set("k", "old")
+
+        monkeypatch.setattr(cache_module, "CACHE_SCHEMA_VERSION", cache_module.CACHE_SCHEMA_VERSION + 1)
+
+        assert tier.get("k") is cache_module._MISSING
+
+    def test_clear_only_removes_prefixed_keys(self):
+        redis = FakeRedis()
+        redis.data["other:k"] = b"x"
+        cache = SimpleCache(shared=RedisCacheTier(client=redis, prefix="analysis-cache:coverage"))
+        cache.set("a", "k1")
+
+        cache.clear()
+
+        assert list(redis.data) == ["other:k"]
+
+
+class TestAnalyzerCaching:
+
+    def test_analyzers_over_same_content_share_keys(self):
+        stores = [FactStore(deal_id="deal-1"), FactStore(deal_id="deal-1")]
+        for fact_store in stores:
+            _add(fact_store, "Primary data center")
+        first, second = (CoverageAnalyzer(s) for s in stores)
+
+        assert first.cache_key() == second.cache_key()
+
+        _add(stores[1], "DR site")
+        assert first.cache_key() != second.cache_key()
+
+    def test_cache_key_returns_after_removal(self):
+        fact_store = FactStore(deal_id="deal-1")
+        _add(fact_store, "Primary data center", source="a.md")
+        analyzer = CoverageAnalyzer(fact_store)
+        before = analyzer.cache_key()
+
+        _add(fact_store, "DR site", source="b.md")
+        fact_store.remove_facts_from_source("b.md")
+
+        assert analyzer.cache_key() == before
+
+    def test_synthesis_key_tracks_integration_dependent(self):
+        reasoning_store = ReasoningStore()
+        risk = Risk(finding_id="R-001", domain="infrastructure", title="Single DC",
+                    description="No DR site", category="resilience", severity="high",
+                    integration_dependent=False, mitigation="", based_on_facts=[],
+                    confidence="high", reasoning="")
+        reasoning_store.risks.append(risk)
+        analyzer = SynthesisAnalyzer(FactStore(deal_id="deal-1"), reasoning_store)
+        before = analyzer.cache_key()
+
+        risk.integration_dependent = True
+
+        assert analyzer.cache_key() != before
+
+    def test_custom_key_function(self):
+        calls = []
+
+        def key_fn(analyzer, func, args, kwargs):
+            calls.append(func.__name__)
+            return None  # never cache
+
+        set_key_function("coverage", key_fn)
+        try:
+            fact_store = FactStore(deal_id="deal-1")
+            CoverageAnalyzer(fact_store).calculate_domain_coverage("network")
+        finally:
+            set_key_function("coverage", None)
+
+        assert calls == ["calculate_domain_coverage"]
+        assert get_cache("coverage").stats()["name"] == "coverage"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,225 @@
+"""
+Tests for chunked (map-reduce) discovery in BaseDiscoveryAgent.
+
+A scripted client stands in for the model: it extracts every "Host:" and
+"Backup:" line of the chunk it is shown, flags a backup gap (with a
+configurable description) when the chunk has no "Backup:" line, then
+completes discovery.
+
+Run with: pytest tests/test_chunked_discovery.py -v
+"""
+
+import re
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents_v2 import base_discovery_agent as agent_module
+from agents_v2.base_discovery_agent import BaseDiscoveryAgent
+from stores.fact_store import FactStore
+from tools_v2.discovery_logger import DiscoveryLogger
+
+
+class ScriptedMessages:
+    def __init__(self, gap_description="No backup tooling documented"):
+        self.gap_description = gap_description
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def create(self, messages, **kwargs):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if len(messages) > 1:
+                return self._response([("complete_discovery", {"domain": "infrastructure", "summary": "done"})])
+            text = messages[0]["content"][0]["text"]
+            document = text.split("## Document to Analyze", 1)[1].split("## Your Task", 1)[0]
+            calls = [
+                ("create_inventory_entry", {
+                    "domain": "infrastructure", "category": "compute", "item": host, "entity": "target",
+                    "status": "documented", "details": {"os": os_name},
+                    "evidence": {"exact_quote": f"Host: {host} running {os_name}"},
+                })
+                for host, os_name in re.findall(r"Host: (\S+) running (\S+)", document)
+            ]
+            for tool in re.findall(r"Backup: (.+)", document):
+                calls.append(("create_inventory_entry", {
+                    "domain": "infrastructure", "category": "backup", "item": tool.strip(), "entity": "target",
+                    "status": "documented", "details": {}, "evidence": {"exact_quote": f"Backup: {tool.strip()}"},
+                }))
+            if "Backup:" not in document:
+                calls.append(("flag_gap", {"domain": "infrastructure", "category": "backup", "entity": "target",
+                                           "description": self.gap_description, "importance": "high"}))
+            return self._response(calls)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    @staticmethod
+    def _response(calls):
+        content = [SimpleNamespace(type="tool_use", id=f"toolu_{i}", name=name, input=tool_input)
+                   for i, (name, tool_input) in enumerate(calls)]
+        return SimpleNamespace(content=content, stop_reason="tool_use",
+                               usage=SimpleNamespace(input_tokens=100, output_tokens=20))
+
+
+class InfrastructureTestAgent(BaseDiscoveryAgent):
+
+    @property
+    def domain(self):
+        return "infrastructure"
+
+    @property
+    def system_prompt(self):
+        return "Extract infrastructure facts."
+
+
+def _agent(tmp_path, **script):
+    fact_store = FactStore(deal_id="deal-1")
+    agent = InfrastructureTestAgent(fact_store=fact_store, api_key="test-key")
+    agent.client = SimpleNamespace(messages=ScriptedMessages(**script))
+    agent.audit_logger = DiscoveryLogger(domain="infrastructure", output_dir=tmp_path)
+    agent.rate_limiter = None
+    agent.circuit_breaker = None
+    return agent
+
+
+def _document(hosts=24):
+    paragraphs = [f"Host: srv{i:02d} running RHEL{i % 3 + 7}\n" + "Filler text about the data center. " * 8
+                  for i in range(hosts)]
+    paragraphs.insert(hosts // 2, "Backup: Veeam Backup & Replication 12\n")
+    return "\n\n".join(paragraphs)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(agent_module, "DISCOVERY_CHUNK_SIZE_TOKENS", 300)
+    monkeypatch.setattr(agent_module, "DISCOVERY_CHUNK_OVERLAP_CHARS", 400)
+    monkeypatch.setattr(agent_module, "DISCOVERY_CHUNK_CONCURRENCY", 2)
+
+
+class TestModeSelection:
+
+    def test_auto_uses_token_estimate(self, tmp_path, monkeypatch):
+        agent = _agent(tmp_path)
+        monkeypatch.setattr(agent_module, "DISCOVERY_CHUNK_THRESHOLD_TOKENS", 1000)
+
+        assert agent._select_discovery_mode("x" * 3000) == "single"
+        assert agent._select_discovery_mode("x" * 5000) == "chunked"
+        assert agent._select_discovery_mode("x" * 5000, mode="single") == "single"
+
+    def test_invalid_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            _agent(tmp_path)._select_discovery_mode("text", mode="parallel")
+
+
+class TestChunkedDiscovery:
+
+    def test_facts_from_overlapping_chunks_are_merged(self, tmp_path, small_chunks):
+        agent = _agent(tmp_path)
+
+        result = agent.discover(_document(), document_name="vdr_dump.md", mode="chunked")
+
+        items = sorted(f["item"] for f in result["facts"] if f["category"] == "compute")
+        assert items == [f"srv{i:02d}" for i in range(24)]
+        assert agent.client.messages.calls > 2
+        assert agent.client.messages.max_active <= 2
+        assert agent.discovery_complete
+
+    def test_gaps_answered_by_another_chunk_are_dropped(self, tmp_path, small_chunks):
+        agent = _agent(tmp_path, gap_description="Veeam Backup & Replication 12 configuration not in this part")
+
+        result = agent.discover(_document(), mode="chunked")
+
+        assert [f["item"] for f in result["facts"] if f["category"] == "backup"] == ["Veeam Backup & Replication 12"]
+        assert result["gaps"] == []
+
+    def test_gaps_in_same_category_but_not_answered_are_kept(self, tmp_path, small_chunks):
+        agent = _agent(tmp_path)
+
+        result = agent.discover(_document(), mode="chunked")
+
+        assert [f["item"] for f in result["facts"] if f["category"] == "backup"] == ["Veeam Backup & Replication 12"]
+        assert [g["description"] for g in result["gaps"]] == ["No backup tooling documented"]
+
+    def test_each_chunk_logs_separately(self, tmp_path, small_chunks):
+        agent = _agent(tmp_path)
+
+        agent.discover(_document(), mode="chunked")
+
+        transcript = agent.audit_logger.to_transcript()
+        numbers = [it["iteration"] for it in transcript["iterations"]]
+        assert numbers == list(range(1, agent.client.messages.calls + 1))
+        # Every chunk contributes an extraction turn followed by its own completion turn
+        tool_names = [{c["tool_name"] for c in it["tool_calls"]} for it in transcript["iterations"]]
+        assert tool_names[1::2] == [{"complete_discovery"}] * (len(numbers) // 2)
+
+    def test_repeated_gaps_are_deduplicated(self, tmp_path, small_chunks):
+        agent = _agent(tmp_path)
+
+        result = agent.discover(_document().replace("Backup:", "Archive:"), mode="chunked")
+
+        assert [g["category"] for g in result["gaps"]] == ["backup"]
+
+    def test_metrics_combine_workers(self, tmp_path, small_chunks):
+        agent = _agent(tmp_path)
+
+        result = agent.discover(_document(), mode="chunked")
+
+        calls = agent.client.messages.calls
+        assert result["metrics"]["api_calls"] == calls
+        assert result["metrics"]["tokens_used"] == calls * 120
+        assert result["metrics"]["prompt_cache"]["iterations"] == calls
+
+    def test_single_chunk_falls_back_to_single_loop(self, tmp_path):
+        agent = _agent(tmp_path)
+
+        result = agent.discover("Host: srv01 running RHEL9\n", mode="chunked")
+
+        assert [f["item"] for f in result["facts"]] == ["srv01"]
+        assert agent.client.messages.calls == 2
+
+
+class TestMergeDuplicateFacts:
+
+    def test_keeps_first_and_fills_details(self):
+        store = FactStore(deal_id="deal-1")
+        first = store.add_fact(domain="infrastructure", category="compute", item="VMware  vSphere",
+                               details={"version": "7"}, status="documented",
+                               evidence={"exact_quote": "vSphere 7"})
+        second = store.add_fact(domain="infrastructure", category="compute", item="vmware vsphere",
+                                details={"hosts": 12}, status="documented",
+                                evidence={"exact_quote": "vSphere 7 cluster with 12 hosts"})
+        other = store.add_fact(domain="infrastructure", category="storage", item="VMware vSphere",
+                               details={}, status="documented", evidence={"exact_quote": "vSAN datastore"})
+
+        merged = store.merge_duplicate_facts([first, second, other])
+
+        assert merged == {second: first}
+        kept = store.get_fact(first)
+        assert kept.details == {"version": "7", "hosts": 12}
+        assert kept.evidence["exact_quote"] == "vSphere 7 cluster with 12 hosts"
+        assert store.get_all_fact_ids() == [first, other]
+
+    def test_only_listed_facts_are_considered(self):
+        store = FactStore(deal_id="deal-1")
+        ids = [store.add_fact(domain="infrastructure", category="compute", item="Hyper-V", details={},
+                              status="documented", evidence={"exact_quote": "Hyper-V hosts"})
+               for _ in range(3)]
+
+        assert store.merge_duplicate_facts(ids[1:]) == {ids[2]: ids[1]}
+        assert len(store.facts) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
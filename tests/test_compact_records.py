@@ -0,0 +1,100 @@
+"""
+Tests for the compact (slotted, interned) record dataclasses.
+
+Fact, Gap, OpenQuestion and InventoryItem must serialize exactly as the
+dataclasses.asdict-based implementation did.
+
+Run with: pytest tests/test_compact_records.py -v
+"""
+
+import json
+import pickle
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from stores.fact_store import Fact, Gap, OpenQuestion
+from stores.inventory_item import InventoryItem
+
+
+def _decoded(payload):
+    """Round-trip through JSON so strings are fresh, non-interned objects."""
+    return json.loads(json.dumps(payload))
+
+
+def _fact(**overrides):
+    payload = {
+        "fact_id": "F-INFRA-001",
+        "domain": "infrastructure",
+        "category": "hosting",
+        "item": "Primary data center",
+        "details": {"vendor": "Equinix", "sites": ["DAL", "PHX"], "nested": {"tier": 3}},
+        "status": "documented",
+        "evidence": {"exact_quote": "Primary DC is Equinix Dallas"},
+        "source_document": "it_overview.pdf",
+        "deal_id": "deal-001",
+    }
+    payload.update(overrides)
+    return Fact(**_decoded(payload))
+
+
+class TestCompactLayout:
+
+    @pytest.mark.parametrize("record", [
+        _fact(),
+        Gap(gap_id="G-INFRA-001", domain="infrastructure", category="hosting",
+            description="No DR site", importance="high"),
+        OpenQuestion(question_id="Q-INFRA-001", question_text="Where is DR?",
+                     domain="infrastructure", category="hosting", priority="high"),
+        InventoryItem(item_id="I-APP-1", inventory_type="application", entity="target",
+                      data={"name": "SAP"}, deal_id="deal-001"),
+    ], ids=["fact", "gap", "question", "inventory"])
+    def test_records_have_no_instance_dict(self, record):
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.not_a_field = 1
+
+    def test_low_cardinality_strings_are_shared(self):
+        first = _fact()
+        second = _fact(fact_id="F-INFRA-002")
+
+        assert first.domain is second.domain
+        assert first.deal_id is second.deal_id
+        assert first.source_document is second.source_document
+
+
+class TestSerialization:
+
+    def test_fact_to_dict_matches_asdict(self):
+        fact = _fact()
+
+        expected = asdict(fact)
+        expected["review_priority"] = fact.review_priority
+        result = fact.to_dict()
+
+        assert result == expected
+        assert list(result) == list(expected)
+
+    def test_to_dict_copies_containers(self):
+        fact = _fact()
+
+        result = fact.to_dict()
+        result["details"]["nested"]["tier"] = 4
+        result["details"]["sites"].append("NYC")
+
+        assert fact.details == {"vendor": "Equinix", "sites": ["DAL", "PHX"], "nested": {"tier": 3}}
+
+    def test_round_trips(self):
+        fact = _fact()
+        item = InventoryItem(item_id="I-APP-1", inventory_type="application", entity="target",
+                             data={"name": "SAP"}, deal_id="deal-001")
+
+        assert Fact.from_dict(fact.to_dict()) == fact
+        assert InventoryItem.from_dict(item.to_dict()) == item
+        assert item.to_dict() == asdict(item)
+        assert pickle.loads(pickle.dumps(fact)) == fact
@@ -0,0 +1,132 @@
+"""
+Tests for tools_v2.conversation_manager.
+
+Covers cache breakpoint placement, compaction of old tool exchanges into
+an ID ledger, and per-iteration cache usage tracking.
+
+Run with: pytest tests/test_conversation_manager.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools_v2.conversation_manager import LEDGER_MARKER, ConversationManager
+
+
+def _exchange(n, tool="create_inventory_entry", filler=400):
+    tool_id = f"toolu_{n}"
+    return [
+        {"role": "assistant", "content": [
+            {"type": "text", "text": "x" * filler},
+            {"type": "tool_use", "id": tool_id, "name": tool, "input": {"item": f"Item {n}"}},
+        ]},
+        {"role": "user", "content": [
+            {"type": "tool_result", "tool_use_id": tool_id,
+             "content": json.dumps({"status": "success", "fact_id": f"F-TGT-INFRA-{n:03d}"})},
+        ]},
+    ]
+
+
+def _conversation(exchanges):
+    messages = [{"role": "user", "content": "## Document to Analyze\n" + "doc " * 1000}]
+    for n in range(1, exchanges + 1):
+        messages.extend(_exchange(n))
+    return messages
+
+
+class TestCacheBreakpoints:
+
+    def test_marks_document_and_last_message(self):
+        manager = ConversationManager()
+        messages = _conversation(3)
+
+        prepared = manager.prepare(messages)
+
+        marked = [i for i, m in enumerate(prepared) if isinstance(m["content"], list)
+                  and any("cache_control" in b for b in m["content"])]
+        assert marked == [0, len(messages) - 1]
+        assert prepared[-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_history_is_not_modified(self):
+        manager = ConversationManager()
+        messages = _conversation(2)
+
+        manager.prepare(messages)
+
+        assert isinstance(messages[0]["content"], str)
+        assert all("cache_control" not in b for m in messages[1:] for b in m["content"])
+
+
+class TestCompaction:
+
+    def test_below_threshold_is_untouched(self):
+        manager = ConversationManager(compact_threshold=100000)
+        messages = _conversation(6)
+
+        assert manager.compact(messages) == 0
+        assert len(messages) == 13
+
+    def test_old_exchanges_become_ledger(self):
+        manager = ConversationManager(compact_threshold=200, keep_recent_turns=2)
+        messages = _conversation(6)
+
+        removed = manager.compact(messages)
+
+        assert removed == 8 and len(messages) == 5
+        roles = [m["role"] for m in messages]
+        assert roles == ["user", "assistant", "user", "assistant", "user"]
+        document, ledger = messages[0]["content"]
+        assert document["text"].startswith("## Document to Analyze")
+        assert ledger["text"].startswith(LEDGER_MARKER)
+        assert "F-TGT-INFRA-001" in ledger["text"] and "F-TGT-INFRA-005" not in ledger["text"]
+        assert "create_inventory_entry x4" in ledger["text"]
+
+    def test_repeated_compaction_keeps_one_ledger(self):
+        manager = ConversationManager(compact_threshold=200, keep_recent_turns=2)
+        messages = _conversation(4)
+        manager.compact(messages)
+        for n in range(5, 8):
+            messages.extend(_exchange(n))
+
+        manager.compact(messages)
+
+        blocks = messages[0]["content"]
+        assert len(blocks) == 2
+        assert "(5): F-TGT-INFRA-001" in blocks[1]["text"]
+        # Cache breakpoint stays on the document block
+        assert "cache_control" in manager.prepare(messages)[0]["content"][0]
+
+
+class TestUsageTracking:
+
+    def test_records_cached_and_uncached_tokens(self):
+        manager = ConversationManager()
+        manager.record_usage(SimpleNamespace(input_tokens=5000, output_tokens=300,
+                                             cache_creation_input_tokens=4000, cache_read_input_tokens=0))
+        manager.record_usage(SimpleNamespace(input_tokens=200, output_tokens=250,
+                                             cache_creation_input_tokens=500, cache_read_input_tokens=4000,))
+
+        summary = manager.summary()
+
+        assert summary["iterations"] == 2
+        assert summary["cache_read_tokens"] == 4000
+        assert summary["per_iteration"][1]["input_tokens"] == 200
+        assert summary["cache_hit_rate"] == round(4000 / 13700, 3)
+
+    def test_missing_fields_count_as_zero(self):
+        manager = ConversationManager()
+        record = manager.record_usage(SimpleNamespace(input_tokens=10, output_tokens=5,
+                                                      cache_read_input_tokens=None))
+
+        assert (record.cache_read_tokens, record.cache_creation_tokens) == (0, 0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
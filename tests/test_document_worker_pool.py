@@ -0,0 +1,343 @@
+"""
+Tests for the document processing worker pool: ProcessingQueue scheduling
+(priority, per-deal turns, cancellation, in-flight content dedup, stats) and
+DocumentProcessor running queued documents on several threads.
+
+Fact analysis is replaced by an in-test hook so no LLM is called.
+
+Run with: pytest tests/test_document_worker_pool.py -v
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools_v2 import document_processor
+from tools_v2.document_processor import (
+    DocumentProcessor,
+    ProcessingPriority,
+    ProcessingProgress,
+    ProcessingQueue,
+    ProcessingStatus,
+)
+
+
+def _progress(doc_id, deal_id="", priority=ProcessingPriority.NORMAL, content_hash=""):
+    return ProcessingProgress(doc_id=doc_id, filename=f"{doc_id}.txt", priority=priority,
+                              deal_id=deal_id, content_hash=content_hash, file_path=f"/tmp/{doc_id}.txt")
+
+
+def _drain(queue):
+    order = []
+    while True:
+        progress = queue.get_next()
+        if not progress:
+            return order
+        order.append(progress.doc_id)
+
+
+class FakeRegistry:
+    """Registry that knows content hashes and records processing outcomes."""
+
+    def __init__(self, hashes=None):
+        self.hashes = hashes or {}
+        self.processed = {}
+        self.failed = {}
+
+    def get_document(self, doc_id):
+        return SimpleNamespace(content_hash=self.hashes.get(doc_id, ""))
+
+    def mark_processed(self, doc_id, fact_ids, duration_ms=0):
+        self.processed[doc_id] = fact_ids
+
+    def mark_failed(self, doc_id, error=""):
+        self.failed[doc_id] = error
+
+
+class HookedProcessor(DocumentProcessor):
+    """Processor whose analysis step calls a test hook instead of the LLM."""
+
+    def __init__(self, analyze=None, **kwargs):
+        kwargs.setdefault("parse_processes", 0)
+        super().__init__(**kwargs)
+        self.analyze = analyze or (lambda filename: None)
+        self.analyzed = []
+
+    def _analyze_content(self, extraction, filename):
+        self.analyzed.append(filename)
+        self.analyze(filename)
+        return []
+
+    def save_pending_changes(self, output_dir=None):
+        return ""
+
+
+def _write_docs(tmp_path, names):
+    paths = {}
+    for name in names:
+        path = tmp_path / f"{name}.txt"
+        path.write_text(f"{name} runs on VMware with 40 hosts.")
+        paths[name] = str(path)
+    return paths
+
+
+def _wait_until(predicate, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestScheduling:
+
+    def test_priority_then_deals_take_turns(self):
+        queue = ProcessingQueue()
+        for doc_id in ["A1", "A2", "A3"]:
+            queue.add(_progress(doc_id, deal_id="deal-a"))
+        for doc_id in ["B1", "B2"]:
+            queue.add(_progress(doc_id, deal_id="deal-b"))
+        queue.add(_progress("C1", deal_id="deal-c", priority=ProcessingPriority.LOW))
+        queue.add(_progress("U1", deal_id="deal-b", priority=ProcessingPriority.URGENT))
+
+        assert _drain(queue) == ["U1", "A1", "B1", "A2", "B2", "A3", "C1"]
+
+    def test_get_next_blocks_until_added(self):
+        queue = ProcessingQueue()
+        assert queue.get_next(timeout=0.01) is None
+
+        timer = threading.Timer(0.05, queue.add, args=(_progress("D1"),))
+        timer.start()
+        progress = queue.get_next(timeout=5)
+        timer.join()
+
+        assert progress.doc_id == "D1"
+
+    def test_requeue_of_queued_document_is_ignored(self):
+        queue = ProcessingQueue()
+        first = queue.add(_progress("D1"))
+
+        assert queue.add(_progress("D1")) is first
+        assert _drain(queue) == ["D1"]
+
+    def test_stats_report_depth_and_latency(self):
+        queue = ProcessingQueue()
+        queue.add(_progress("A1", deal_id="deal-a"))
+        queue.add(_progress("A2", deal_id="deal-a", priority=ProcessingPriority.HIGH))
+        queue.add(_progress("B1", deal_id="deal-b"))
+
+        stats = queue.get_queue_stats()
+        assert stats["queued"] == 3
+        assert stats["queued_by_priority"] == {"high": 1, "normal": 2}
+        assert stats["queued_by_deal"] == {"deal-a": 2, "deal-b": 1}
+
+        time.sleep(0.02)
+        progress = queue.get_next()
+        time.sleep(0.02)
+        queue.mark_complete(progress.doc_id)
+
+        stats = queue.get_queue_stats()
+        assert stats["queued"] == 2 and stats["completed"] == 1
+        assert stats["wait_seconds"]["samples"] == 1
+        assert stats["wait_seconds"]["max"] >= 0.02
+        assert stats["processing_seconds"]["avg"] >= 0.02
+
+
+class TestCancellation:
+
+    def test_cancel_queued_document(self):
+        queue = ProcessingQueue()
+        for doc_id in ["A1", "A2"]:
+            queue.add(_progress(doc_id, deal_id="deal-a"))
+
+        assert queue.cancel("A1")
+        assert not queue.cancel("missing")
+        assert _drain(queue) == ["A2"]
+        assert queue.get_status("A1").status == ProcessingStatus.CANCELLED
+        assert queue.get_queue_stats()["cancelled"] == 1
+
+    def test_cancel_active_stops_between_stages(self, tmp_path):
+        paths = _write_docs(tmp_path, ["D1"])
+        registry = FakeRegistry()
+        processor = HookedProcessor(document_registry=registry,
+                                    analyze=lambda filename: processor.cancel_document("D1"))
+
+        processor.queue_document("D1", "D1.txt", paths["D1"])
+        processor._process_queued(processor.queue.get_next())
+
+        progress = processor.queue.get_status("D1")
+        assert progress.status == ProcessingStatus.CANCELLED
+        assert "merging" not in progress.stages_completed
+        assert registry.processed == registry.failed == {}
+
+
+class TestInFlightDedup:
+
+    def test_identical_content_processed_once(self, tmp_path):
+        paths = _write_docs(tmp_path, ["D1", "D2", "D3"])
+        registry = FakeRegistry({"D1": "h1", "D2": "h1", "D3": "h2"})
+        processor = HookedProcessor(document_registry=registry)
+        for doc_id, path in paths.items():
+            processor.queue_document(doc_id, f"{doc_id}.txt", path)
+
+        assert processor.get_queue_stats()["waiting_on_duplicate"] == 1
+        while True:
+            progress = processor.queue.get_next()
+            if not progress:
+                break
+            processor._process_queued(progress)
+
+        assert processor.analyzed == ["D1.txt", "D3.txt"]
+        follower = processor.queue.get_status("D2")
+        assert follower.status == ProcessingStatus.COMPLETE
+        assert follower.duplicate_of == "D1"
+        assert set(registry.processed) == {"D1", "D2", "D3"}
+        assert processor.get_queue_stats()["deduplicated"] == 1
+
+    def test_same_content_in_other_deal_is_processed_separately(self, tmp_path):
+        paths = _write_docs(tmp_path, ["A1", "B1"])
+        registry = FakeRegistry({"A1": "h1", "B1": "h1"})
+        processor = HookedProcessor(document_registry=registry)
+        processor.queue_document("A1", "A1.txt", paths["A1"], deal_id="deal-a")
+        processor.queue_document("B1", "B1.txt", paths["B1"], deal_id="deal-b")
+
+        assert processor.get_queue_stats()["waiting_on_duplicate"] == 0
+        while True:
+            progress = processor.queue.get_next()
+            if not progress:
+                break
+            processor._process_queued(progress)
+
+        assert processor.analyzed == ["A1.txt", "B1.txt"]
+        assert processor.queue.get_status("B1").duplicate_of == ""
+        assert processor.get_queue_stats()["deduplicated"] == 0
+
+    def test_same_content_after_completion_is_processed_again(self):
+        queue = ProcessingQueue()
+        queue.add(_progress("D1", content_hash="h1"))
+        queue.mark_complete(queue.get_next().doc_id)
+
+        queue.add(_progress("D2", content_hash="h1"))
+        assert _drain(queue) == ["D2"]
+
+    def test_cancelled_leader_hands_over_to_duplicate(self):
+        queue = ProcessingQueue()
+        for doc_id in ["D1", "D2", "D3"]:
+            queue.add(_progress(doc_id, content_hash="h1"))
+
+        queue.cancel("D1")
+
+        assert _drain(queue) == ["D2"]
+        assert queue.get_status("D3").duplicate_of == "D2"
+
+    def test_followers_wait_through_retries_then_fail_with_leader(self):
+        queue = ProcessingQueue()
+        queue.add(_progress("D1", content_hash="h1"))
+        queue.add(_progress("D2", content_hash="h1"))
+
+        for attempt in range(3):
+            progress = queue.get_next()
+            assert progress.doc_id == "D1"
+            followers = queue.mark_failed("D1", "corrupt file")
+
+        assert [f.doc_id for f in followers] == ["D2"]
+        assert queue.get_status("D2").status == ProcessingStatus.FAILED
+        assert queue.get_queue_stats()["failed"] == 2
+
+
+class TestWorkerPool:
+
+    def test_workers_process_documents_concurrently(self, tmp_path):
+        names = [f"D{i}" for i in range(6)]
+        paths = _write_docs(tmp_path, names)
+        barrier = threading.Barrier(3, timeout=5)
+        processor = HookedProcessor(workers=3, analyze=lambda filename: barrier.wait())
+
+        for name in names:
+            processor.queue_document(name, f"{name}.txt", paths[name], deal_id=f"deal-{name[-1]}")
+        processor.start_worker()
+        try:
+            assert _wait_until(lambda: processor.get_queue_stats()["completed"] == 6)
+        finally:
+            processor.stop_worker()
+
+        stats = processor.get_queue_stats()
+        assert stats["failed"] == 0 and stats["workers"] == 3
+        assert stats["metrics"]["total_processed"] == 6
+        assert not processor._worker_threads
+
+    def test_extraction_in_parse_process(self, tmp_path):
+        from docx import Document
+
+        path = tmp_path / "overview.docx"
+        doc = Document()
+        doc.add_paragraph("The data center hosts 40 VMware servers.")
+        doc.save(str(path))
+        extracted = []
+        processor = HookedProcessor(parse_processes=1)
+        processor._analyze_content = lambda extraction, filename: extracted.append(extraction) or []
+
+        progress = processor.process_single("D1", str(path))
+
+        assert progress.status == ProcessingStatus.COMPLETE
+        assert "40 VMware servers" in extracted[0].content
+        assert extracted[0].extraction_method == "docx"
+
+    def test_hung_parse_times_out_and_discards_pool(self, tmp_path, monkeypatch):
+        class HungPool:
+            shut_down = False
+
+            def submit(self, fn, *args):
+                return Future()  # Never completes
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                self.shut_down = True
+
+        pool = HungPool()
+        monkeypatch.setitem(document_processor._parse_pools, 7, pool)
+        paths = _write_docs(tmp_path, ["D1"])
+        processor = HookedProcessor(parse_processes=7, parse_timeout=0.05)
+
+        result = processor._extract(paths["D1"])
+
+        assert not result.success and "timed out" in result.error
+        assert pool.shut_down
+        assert 7 not in document_processor._parse_pools
+
+    def test_documents_in_a_timed_out_pool_are_parsed_again(self, tmp_path, monkeypatch):
+        class KilledPool:
+            def submit(self, fn, *args):
+                future = Future()
+                future.set_exception(BrokenProcessPool("killed"))
+                return future
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                pass
+
+        killed, fresh = KilledPool(), ThreadPoolExecutor(1)
+        document_processor._timed_out_pools.add(killed)
+        pools = iter([killed, fresh])
+        monkeypatch.setattr(document_processor, "get_parse_pool", lambda processes: next(pools))
+        paths = _write_docs(tmp_path, ["D1"])
+        processor = HookedProcessor(parse_processes=7)
+
+        try:
+            result = processor._extract(paths["D1"])
+        finally:
+            fresh.shutdown()
+
+        assert result.success and "VMware" in result.content
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,153 @@
+"""
+Tests for the DossierBuilder mention index.
+
+The indexed related-finding and narrative lookups must return exactly what
+the original per-item scans returned, with and without pyahocorasick.
+
+Run with: pytest tests/test_dossier_mentions.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import services.inventory_dossier as inventory_dossier
+from services.inventory_dossier import DossierBuilder, MentionIndex
+
+
+APPS = ["SAP", "SAP ECC", "Workday", "Salesforce", "ServiceNow", "Okta", "Jira", "Confluence", "Slack", "Box"]
+
+FACTS = [
+    {"fact_id": f"F-APP-{i:03d}", "domain": "applications", "entity": "target", "item": name,
+     "details": {"vendor": "Vendor"}}
+    for i, name in enumerate(APPS)
+] + [
+    {"fact_id": "F-APP-100", "domain": "applications", "entity": "buyer", "item": "Workday"},
+]
+
+FINDINGS = {
+    "risks": [
+        {"finding_id": "R-001", "title": "SAP ECC end of support", "description": "Mainstream support ends 2027",
+         "based_on_facts": ["F-APP-001"]},
+        {"finding_id": "R-002", "title": "Identity sprawl", "description": "Okta and legacy AD both in use"},
+        {"finding_id": "R-003", "title": "Licensing", "description": "workday and SALESFORCE renewals are due"},
+        {"finding_id": "", "title": "Untitled", "description": "Box storage is shared"},
+        {"finding_id": "", "title": "Untitled", "description": "Slack retention is unset"},
+    ],
+    "work_items": [
+        {"finding_id": "W-001", "title": "Migrate SAP ECC", "description": "Plan S/4 move",
+         "based_on_facts": ["F-APP-000"]},
+        {"finding_id": "R-002", "title": "Okta tenant split", "description": "Shares an ID with a risk"},
+        {"finding_id": "W-003", "title": "Jira to Confluence links", "description": "Re-point after TSA"},
+    ],
+    "recommendations": [
+        {"finding_id": "REC-1", "title": "Keep ServiceNow", "based_on_facts": ["F-APP-004"]},
+    ],
+}
+
+NARRATIVES = {
+    "applications": (
+        "The estate is anchored on SAP ECC running in the Dallas data center. "
+        "Workday covers HR and payroll for all staff.\n"
+        "Okta fronts most SaaS apps. Box. "
+        "Collaboration relies on Slack, Jira and Confluence across engineering. "
+        "SAP licensing is a perpetual agreement negotiated in 2015. "
+        "Salesforce is the CRM of record for the sales organization."
+    ),
+}
+
+
+def _legacy_related_findings(builder, fact_ids, item_name):
+    """The original scan: list-equality membership and per-finding substring tests."""
+    related_risks, related_work_items, seen_ids = [], [], set()
+    for fact_id in fact_ids:
+        for finding in builder.findings_by_fact_id.get(fact_id, []):
+            finding_id = finding.get('finding_id', finding.get('id', ''))
+            if finding_id and finding_id not in seen_ids:
+                seen_ids.add(finding_id)
+                if finding in builder.risks:
+                    related_risks.append(finding)
+                elif finding in builder.work_items:
+                    related_work_items.append(finding)
+    item_lower = item_name.lower()
+    for findings, related in ((builder.risks, related_risks), (builder.work_items, related_work_items)):
+        for finding in findings:
+            finding_id = finding.get('finding_id', finding.get('id', ''))
+            if finding_id in seen_ids:
+                continue
+            if item_lower in finding.get('title', '').lower() or item_lower in finding.get('description', '').lower():
+                seen_ids.add(finding_id)
+                related.append(finding)
+    return related_risks, related_work_items
+
+
+def _legacy_narrative_mentions(builder, item_name, domain):
+    narrative = builder.narratives.get(domain, '')
+    if not narrative or not item_name:
+        return []
+    item_lower = item_name.lower()
+    return [
+        s.strip() + '.' for s in narrative.replace('\n', ' ').split('.')
+        if item_lower in s.lower() and len(s.strip()) > 20
+    ][:3]
+
+
+@pytest.fixture(params=[True, False], ids=["automaton", "find"])
+def builder(request, monkeypatch):
+    if request.param and not inventory_dossier.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(inventory_dossier, "AHOCORASICK_AVAILABLE", request.param)
+    return DossierBuilder(FACTS, FINDINGS, NARRATIVES)
+
+
+class TestMentionIndex:
+
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_matches_substring_semantics(self, monkeypatch, use_automaton):
+        if use_automaton and not inventory_dossier.AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick not installed")
+        monkeypatch.setattr(inventory_dossier, "AHOCORASICK_AVAILABLE", use_automaton)
+        texts = ["SAP ECC on-prem", "no match here", "wisapp and sap", "", "Okta"]
+
+        index = MentionIndex(APPS, texts)
+
+        for name in APPS + ["ecc", "not indexed", ""]:
+            assert index.lookup(name) == [i for i, t in enumerate(texts) if name.lower() in t.lower()]
+
+    def test_names_do_not_match_across_texts(self):
+        index = MentionIndex(["ab"], ["xa", "bx"])
+
+        assert index.lookup("ab") == []
+
+
+class TestDossierBuilderMentions:
+
+    @pytest.mark.parametrize("item_name", APPS + ["Unknown System", ""])
+    def test_related_findings_match_legacy_scan(self, builder, item_name):
+        fact_ids = [f["fact_id"] for f in FACTS if f["item"].lower() == item_name.lower()]
+
+        assert builder._find_related_findings(fact_ids, item_name) == \
+            _legacy_related_findings(builder, fact_ids, item_name)
+
+    @pytest.mark.parametrize("item_name", APPS + ["Unknown System", ""])
+    def test_narrative_mentions_match_legacy_scan(self, builder, item_name):
+        for domain in ("applications", "infrastructure"):
+            assert builder._extract_narrative_mentions(item_name, domain) == \
+                _legacy_narrative_mentions(builder, item_name, domain)
+
+    def test_recommendations_are_not_counted_as_risks(self, builder):
+        risks, work_items = builder._find_related_findings(["F-APP-004"], "ServiceNow")
+
+        assert risks == [] and work_items == []
+
+    def test_build_all_dossiers_links_by_name(self, builder):
+        dossiers = {(d.entity, d.name): d for d in builder.build_all_dossiers()["applications"]}
+
+        assert [r.risk_id for r in dossiers[("target", "SAP")].risks] == ["R-001"]
+        assert [w.work_item_id for w in dossiers[("target", "SAP")].work_items] == ["W-001"]
+        assert [r.risk_id for r in dossiers[("buyer", "Workday")].risks] == ["R-003"]
+        assert len(dossiers[("target", "SAP")].narrative_excerpts) == 2
@@ -0,0 +1,143 @@
+"""
+Tests for batch evidence verification.
+
+verify_facts_batch must return exactly what per-fact verify_quote_exists
+returns, whichever exact-match path (Aho-Corasick or str.find) is used.
+
+Run with: pytest tests/test_evidence_batch.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import tools_v2.evidence_verifier as evidence_verifier
+from tools_v2.evidence_verifier import (
+    PreparedDocument,
+    PreparedDocumentCache,
+    find_first_occurrences,
+    verify_facts_batch,
+    verify_quote_exists,
+)
+
+
+DOC_A = (
+    "The company runs SAP ECC 6.0 on-premises in the Dallas data center.\n"
+    "Active Directory   is hosted by the parent company and shared across divisions.\n"
+    "Backups are taken nightly to Veeam repositories with 30-day retention."
+)
+DOC_B = (
+    "Network: Cisco Meraki SD-WAN across 12 sites. MPLS contract expires in 2026.\n"
+    "Email is Microsoft 365 with 1,200 mailboxes."
+)
+
+QUOTES = {
+    "F-001": "SAP ECC 6.0 on-premises",                          # exact
+    "F-002": "active directory is hosted by the parent company",   # normalized exact
+    "F-003": "Backups are taken weekly to Veeam repositories",     # fuzzy
+    "F-004": "Mainframe running COBOL batch payroll jobs",         # not found
+    "F-005": "short",                                              # skipped
+    "F-006": "Cisco Meraki SD-WAN across 12 sites",                # exact in DOC_B
+    "F-007": "",                                                   # no quote
+}
+
+
+def _facts(source_for=None):
+    source_for = source_for or {}
+    return [
+        {"fact_id": fid, "evidence": {"exact_quote": q}, "source_document": source_for.get(fid, "")}
+        for fid, q in QUOTES.items()
+    ]
+
+
+def _report_signature(report):
+    return (
+        report.total_facts, report.verified_count, report.partial_match_count,
+        report.not_found_count, report.skipped_count, report.problematic_facts,
+        {fid: r.to_dict() for fid, r in report.results.items()},
+    )
+
+
+@pytest.fixture(params=[True, False], ids=["aho-corasick", "str-find"])
+def exact_backend(request, monkeypatch):
+    if request.param and not evidence_verifier.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(evidence_verifier, "AHOCORASICK_AVAILABLE", request.param)
+    monkeypatch.setattr(evidence_verifier, "AHOCORASICK_MIN_PATTERNS", 1)
+    return request.param
+
+
+class TestFindFirstOccurrences:
+
+    def test_leftmost_offsets(self, exact_backend):
+        text = "abc xyz abc xyz"
+        found = find_first_occurrences(["xyz", "abc", "zzz", "c x"], text)
+        assert found == {"abc": 0, "xyz": 4, "c x": 2}
+
+
+class TestVerifyFactsBatch:
+
+    def test_single_document_matches_per_fact(self, exact_backend):
+        text = DOC_A + "\n" + DOC_B
+        report = verify_facts_batch(_facts(), document_text=text, domain="infrastructure")
+
+        for fid, quote in QUOTES.items():
+            if not quote:
+                assert fid not in report.results
+                continue
+            assert report.results[fid] == verify_quote_exists(quote, text)
+
+        assert report.skipped_count == 2
+        assert report.problematic_facts == [
+            fid for fid in QUOTES if report.results.get(fid) and
+            report.results[fid].status in ("partial_match", "not_found")
+        ]
+
+    def test_groups_by_source_document(self, exact_backend):
+        facts = _facts({"F-001": "a.pdf", "F-002": "a.pdf", "F-006": "b.pdf"})
+        documents = {"a.pdf": DOC_A, "b.pdf": DOC_B}
+
+        report = verify_facts_batch(facts, document_text=DOC_A, documents=documents)
+
+        assert report.results["F-006"] == verify_quote_exists(QUOTES["F-006"], DOC_B)
+        assert report.results["F-001"] == verify_quote_exists(QUOTES["F-001"], DOC_A)
+        # Unknown source falls back to document_text
+        assert report.results["F-004"] == verify_quote_exists(QUOTES["F-004"], DOC_A)
+
+    def test_process_pool_matches_in_process(self):
+        facts = _facts({"F-001": "a.pdf", "F-006": "b.pdf"})
+        documents = {"a.pdf": DOC_A, "b.pdf": DOC_B}
+
+        serial = verify_facts_batch(facts, document_text=DOC_A, documents=documents)
+        pooled = verify_facts_batch(facts, document_text=DOC_A, documents=documents, max_workers=2)
+
+        assert _report_signature(pooled) == _report_signature(serial)
+
+    def test_empty_document(self):
+        report = verify_facts_batch(_facts(), document_text="")
+
+        assert report.results["F-001"].status == "not_found"
+        assert report.results["F-001"].search_method == "none"
+
+
+class TestPreparedDocumentCache:
+
+    def test_reuses_normalized_document(self):
+        cache = PreparedDocumentCache(max_entries=2)
+
+        first = cache.get(DOC_A)
+
+        assert cache.get(DOC_A) is first
+        assert first.normalized == PreparedDocument.from_text(DOC_A).normalized
+
+    def test_evicts_oldest(self):
+        cache = PreparedDocumentCache(max_entries=2)
+        first = cache.get("one")
+        cache.get("two")
+        cache.get("three")
+
+        assert cache.get("one") is not first
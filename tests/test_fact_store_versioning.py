@@ -0,0 +1,143 @@
+"""
+Tests for FactStore version counters and change feed.
+
+Run with: pytest tests/test_fact_store_versioning.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from stores import fact_store as fact_store_module
+from stores.fact_store import FactStore
+
+
+def _add(store, domain="infrastructure", item="VMware vSphere", entity="target", source="doc1.md"):
+    return store.add_fact(domain=domain, category="compute", item=item, details={},
+                          status="documented", evidence={"exact_quote": "VMware vSphere 7 cluster"},
+                          entity=entity, source_document=source)
+
+
+class TestVersions:
+
+    def test_mutations_bump_versions(self):
+        store = FactStore(deal_id="deal-1")
+        fact_id = _add(store)
+        store.add_gap(domain="network", category="wan", description="No WAN diagram", importance="high")
+        assert store.version == 2
+
+        store.verify_fact(fact_id, "analyst@example.com")
+        store.update_verification_status(fact_id, "needs_info", "analyst@example.com")
+        store.unverify_fact(fact_id)
+        assert store.version == 5
+
+        store.remove_facts_from_source("doc1.md")
+        assert store.version == 6
+
+    def test_domain_and_entity_versions_are_independent(self):
+        store = FactStore(deal_id="deal-1")
+        _add(store, domain="infrastructure")
+        _add(store, domain="applications", item="SAP ECC", entity="buyer")
+
+        assert store.domain_version("infrastructure") == 1
+        assert store.domain_version("network") == 0
+        assert (store.entity_version("target"), store.entity_version("buyer")) == (1, 1)
+
+    def test_noop_operations_do_not_bump(self):
+        store = FactStore(deal_id="deal-1")
+        _add(store)
+
+        store.verify_fact("F-TGT-INFRA-999", "analyst@example.com")
+        store.remove_facts_from_source("missing.md")
+
+        assert store.version == 1
+
+    def test_merge_and_load(self, tmp_path):
+        source = FactStore(deal_id="deal-1")
+        _add(source)
+        _add(source, item="Hyper-V")
+        store = FactStore(deal_id="deal-1")
+        store.merge_from(source)
+        store.merge_from(source)  # all duplicates
+
+        assert store.version == 2
+
+        path = tmp_path / "facts.json"
+        store.save(str(path))
+        loaded = FactStore.load(str(path))
+        assert loaded.version == 1
+        assert [c.op for c in loaded.changes_since(0)] == ["reload"]
+        assert loaded.domain_version("infrastructure") == 1
+
+
+class TestChangeFeed:
+
+    def test_subscribers_receive_changes(self):
+        store = FactStore(deal_id="deal-1")
+        events = []
+        unsubscribe = store.subscribe(events.append)
+
+        fact_id = _add(store)
+        store.remove_facts_from_source("doc1.md")
+        unsubscribe()
+        _add(store)
+
+        assert [(c.op, c.item_id, c.version) for c in events] == [
+            ("add_fact", fact_id, 1),
+            ("remove_fact", fact_id, 2),
+        ]
+
+    def test_failing_subscriber_does_not_break_writes(self):
+        store = FactStore(deal_id="deal-1")
+        seen = []
+
+        def broken(change):
+            raise RuntimeError("boom")
+
+        store.subscribe(broken)
+        store.subscribe(seen.append)
+        _add(store)
+
+        assert len(store.facts) == 1 and len(seen) == 1
+
+    def test_subscriber_may_read_store(self):
+        store = FactStore(deal_id="deal-1")
+        counts = []
+        store.subscribe(lambda change: counts.append(len(store.get_all_fact_ids())))
+
+        _add(store)
+        _add(store, item="Hyper-V")
+
+        assert counts == [1, 2]
+
+    def test_changes_since(self):
+        store = FactStore(deal_id="deal-1")
+        first = _add(store)
+        second = _add(store, item="Hyper-V")
+
+        assert [c.item_id for c in store.changes_since(0)] == [first, second]
+        assert [c.item_id for c in store.changes_since(1)] == [second]
+        assert store.changes_since(2) == []
+
+    def test_changes_since_beyond_log_requires_rebuild(self, monkeypatch):
+        monkeypatch.setattr(fact_store_module, "FACT_CHANGE_LOG_SIZE", 2)
+        store = FactStore(deal_id="deal-1")
+        for i in range(4):
+            _add(store, item=f"Host {i}")
+
+        assert store.changes_since(1) is None
+        assert [c.version for c in store.changes_since(2)] == [3, 4]
+
+    def test_mark_changed_records_reload(self):
+        store = FactStore(deal_id="deal-1")
+        _add(store)
+        events = []
+        store.subscribe(events.append)
+
+        store.facts.clear()
+        store.mark_changed()
+
+        assert [c.op for c in events] == ["reload"]
+        assert store.domain_version("infrastructure") == 2
@@ -0,0 +1,153 @@
+"""
+Tests for the finding consolidation engine (Point 78).
+
+The blocked/pruned engine must flag exactly the same pairs, with the same
+scores and ordering, as the original all-pairs SequenceMatcher scan.
+
+Run with: pytest tests/test_finding_consolidation.py -v
+"""
+
+import random
+import sys
+from difflib import SequenceMatcher
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools_v2.finding_consolidation import find_similar_pairs
+from tools_v2.reasoning_tools import ReasoningStore
+
+
+RISK_ATTRS = (("same_category", "category"), ("same_lens", "mna_lens"))
+
+TITLE_WORDS = [
+    "legacy", "ERP", "SAP", "license", "expiry", "VMware", "EOL", "backup",
+    "gap", "MFA", "not", "enforced", "TSA", "exposure", "network", "firewall",
+    "Oracle", "database", "upgrade", "key", "person", "dependency",
+]
+
+
+def _reference_pairs(findings, facts_attr, match_attrs, threshold):
+    """Original Point 78 pairwise scan, kept verbatim as the oracle."""
+    (key_a, attr_a), (key_b, attr_b) = match_attrs
+    pairs = []
+    for i, a in enumerate(findings):
+        for b in findings[i + 1:]:
+            title_sim = SequenceMatcher(None, a.title.lower(), b.title.lower()).ratio()
+            facts_a, facts_b = getattr(a, facts_attr), getattr(b, facts_attr)
+            if not facts_a or not facts_b:
+                fact_sim = 0.0
+            else:
+                set_a, set_b = set(facts_a), set(facts_b)
+                fact_sim = len(set_a & set_b) / len(set_a | set_b)
+            same_a = getattr(a, attr_a) == getattr(b, attr_a)
+            same_b = getattr(a, attr_b) == getattr(b, attr_b)
+            similarity = (
+                0.4 * title_sim +
+                0.3 * fact_sim +
+                0.15 * (1.0 if same_a else 0.0) +
+                0.15 * (1.0 if same_b else 0.0)
+            )
+            if similarity >= threshold:
+                pairs.append((a.finding_id, b.finding_id, round(similarity, 3)))
+    return pairs
+
+
+def _random_findings(seed: int, count: int):
+    rng = random.Random(seed)
+    findings = []
+    for idx in range(count):
+        title = " ".join(rng.choice(TITLE_WORDS) for _ in range(rng.randint(2, 5)))
+        if findings and rng.random() < 0.15:
+            # Exact and near duplicates of an earlier title
+            title = rng.choice(findings).title
+            if rng.random() < 0.5:
+                title = title.upper()
+        findings.append(SimpleNamespace(
+            finding_id=f"R-{idx:03d}",
+            title=title,
+            domain=rng.choice(["infrastructure", "applications", "network"]),
+            based_on_facts=[f"F-{rng.randint(1, 40):03d}" for _ in range(rng.randint(0, 3))],
+            category=rng.choice(["technical_debt", "security", "vendor"]),
+            mna_lens=rng.choice(["day_1_continuity", "tsa_exposure", ""]),
+        ))
+    return findings
+
+
+class TestFindSimilarPairs:
+    """Engine output must match the original pairwise scan."""
+
+    @pytest.mark.parametrize("threshold", [0.3, 0.5, 0.6, 0.7, 0.85, 0.95])
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_pairwise_reference(self, seed, threshold):
+        findings = _random_findings(seed, 60)
+
+        expected = _reference_pairs(findings, "based_on_facts", RISK_ATTRS, threshold)
+        actual = [
+            (p["item_a"]["id"], p["item_b"]["id"], p["similarity_score"])
+            for p in find_similar_pairs(findings, "based_on_facts", RISK_ATTRS, threshold)
+        ]
+
+        assert actual == expected
+
+    def test_identical_titles_without_shared_facts(self):
+        findings = [
+            SimpleNamespace(finding_id="R-1", title="SAP license expiry", domain="applications",
+                            based_on_facts=[], category="vendor", mna_lens="tsa_exposure"),
+            SimpleNamespace(finding_id="R-2", title="SAP License Expiry", domain="applications",
+                            based_on_facts=["F-001"], category="vendor", mna_lens="tsa_exposure"),
+        ]
+
+        pairs = find_similar_pairs(findings, "based_on_facts", RISK_ATTRS, 0.7)
+
+        assert len(pairs) == 1
+        assert pairs[0]["breakdown"]["title_similarity"] == 1.0
+        assert pairs[0]["breakdown"]["fact_overlap"] == 0.0
+
+    def test_fewer_than_two_findings(self):
+        assert find_similar_pairs([], "based_on_facts", RISK_ATTRS) == []
+
+
+class TestConsolidateFindings:
+    """ReasoningStore.consolidate_findings wiring."""
+
+    def test_flags_duplicate_risks_and_work_items(self):
+        store = ReasoningStore()
+        for domain in ("infrastructure", "network"):
+            store.add_risk(
+                domain=domain,
+                title="EOL VMware Version",
+                description="VMware 6.7 reached end of life",
+                category="technical_debt",
+                severity="high",
+                integration_dependent=False,
+                mitigation="Upgrade",
+                based_on_facts=["F-INFRA-001"],
+                confidence="high",
+                reasoning="EOL"
+            )
+            store.add_work_item(
+                domain=domain,
+                title="Upgrade VMware cluster",
+                description="Upgrade to 8.0",
+                phase="Day_100",
+                priority="high",
+                owner_type="target",
+                triggered_by=["F-INFRA-001"],
+                based_on_facts=["F-INFRA-001"],
+                confidence="high",
+                reasoning="EOL",
+                cost_estimate="25k_to_100k"
+            )
+
+        result = store.consolidate_findings()
+
+        assert result["summary"]["potential_risk_duplicates"] == 1
+        assert result["summary"]["potential_work_item_duplicates"] == 1
+        wi_pair = result["consolidation_candidates"]["work_items"][0]
+        assert wi_pair["breakdown"]["same_phase"] is True
+        assert wi_pair["recommendation"] == "Consider merging"
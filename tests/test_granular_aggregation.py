@@ -0,0 +1,126 @@
+"""
+Tests for the indexed numeric aggregation and streaming export of
+GranularFactsStore.
+
+Aggregates are checked against a brute-force scan over the same facts.
+
+Run with: pytest tests/test_granular_aggregation.py -v
+"""
+
+import io
+import csv
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from stores.granular_facts_store import GranularFactsStore
+
+ITEMS = ["EC2 Instances", "Salesforce Licenses", "AWS monthly spend", "IT Staff (FTE)",
+         "Contractor FTEs", "Storage capacity", "NetSuite version"]
+DOMAINS = ["infrastructure", "applications", "organization"]
+TYPES = ["count", "cost", "capacity"]
+
+
+def _populate(store, n, seed=7):
+    rng = random.Random(seed)
+    for i in range(n):
+        item = rng.choice(ITEMS)
+        value = "2024.1" if item == "NetSuite version" else rng.choice([rng.randint(1, 500), rng.random() * 1000])
+        store.add_fact(domain=rng.choice(DOMAINS), category="general", fact_type=rng.choice(TYPES),
+                       item=f"{item} #{i % 40}", value=value, unit=rng.choice(["USD", "users", None]),
+                       parent_system_id=rng.choice(["SYS-1", "SYS-2", None]))
+    return store
+
+
+def _brute_sum(store, pattern, **filters):
+    return sum(f.value for f in store.get_all_facts()
+               if isinstance(f.value, (int, float)) and pattern.lower() in f.item.lower()
+               and all(getattr(f, k) == v for k, v in filters.items()))
+
+
+@pytest.fixture
+def store():
+    return _populate(GranularFactsStore(), 2000)
+
+
+class TestItemAggregation:
+
+    @pytest.mark.parametrize("pattern", ["instances", "FTE", "licen", "s #1", "#3", "", " ", "spend #", "zzz"])
+    def test_matches_substring_scan(self, store, pattern):
+        assert store.sum_by_item(pattern) == pytest.approx(_brute_sum(store, pattern))
+
+    def test_match_unit_and_count(self, store):
+        total, count = store.aggregate_by_item("usd", match_unit=True)
+        expected = [f for f in store.get_numeric_facts()
+                    if "usd" in f.item.lower() or "usd" in (f.unit or "").lower()]
+        assert count == len(expected)
+        assert total == pytest.approx(sum(f.value for f in expected))
+
+    def test_cache_invalidated_on_add_and_merge(self, store):
+        before = store.sum_by_item("ec2")
+        store.add_fact("infrastructure", "compute", "count", "EC2 instances (new)", 10)
+        assert store.sum_by_item("ec2") == pytest.approx(before + 10)
+
+        other = GranularFactsStore()
+        other.add_fact("infrastructure", "compute", "count", "Extra EC2", 5)
+        store.merge_from(other)
+        assert store.sum_by_item("ec2") == pytest.approx(before + 15)
+
+    def test_index_rebuilt_on_load(self, store, tmp_path):
+        store.save(tmp_path / "granular.json")
+        loaded = GranularFactsStore.load(tmp_path / "granular.json")
+        assert loaded.sum_by_item("staff") == pytest.approx(store.sum_by_item("staff"))
+        assert len(loaded.get_numeric_facts()) == len(store.get_numeric_facts())
+
+
+class TestGroupedTotals:
+
+    def test_sum_values_with_filters(self, store):
+        assert store.sum_values(domain="applications", fact_type="cost") == pytest.approx(
+            _brute_sum(store, "", domain="applications", fact_type="cost"))
+        assert store.sum_values(system_id="SYS-2") == pytest.approx(
+            _brute_sum(store, "", parent_system_id="SYS-2"))
+
+    def test_totals_by_group(self, store):
+        totals = store.totals_by("domain", fact_type="cost")
+        for domain in DOMAINS:
+            assert totals[domain] == pytest.approx(_brute_sum(store, "", domain=domain, fact_type="cost"))
+
+        by_system = store.totals_by("system")
+        assert by_system[""] == pytest.approx(_brute_sum(store, "", parent_system_id=None))
+
+    def test_cached_result_not_shared(self, store):
+        store.totals_by("unit")["USD"] = -1
+        assert store.totals_by("unit")["USD"] > 0
+
+    def test_rejects_unknown_group(self, store):
+        with pytest.raises(ValueError):
+            store.totals_by("value")
+
+
+class TestStreamingExport:
+
+    def test_csv_rows_unchanged(self):
+        store = _populate(GranularFactsStore(), 20)
+        rows = store.to_csv_rows()
+        assert rows[0] == list(store.get_all_facts()[0].to_row().keys())
+        assert len(rows) == 21
+        assert GranularFactsStore().to_csv_rows() == []
+
+    def test_write_csv_streams_rows(self, store):
+        out = io.StringIO()
+        written = store.write_csv(out, domain="infrastructure")
+
+        parsed = list(csv.reader(io.StringIO(out.getvalue())))
+        assert written == len(store.get_facts_by_domain("infrastructure")) == len(parsed) - 1
+        assert parsed[0][0] == "ID"
+        assert GranularFactsStore().write_csv(io.StringIO()) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,162 @@
+"""
+Tests for incremental coverage and synthesis analysis.
+
+CoverageAnalyzer and SynthesisAnalyzer keep per-checklist-item match state
+and per-domain keyword counts that are updated from FactStore deltas. These
+tests check the incremental results against a freshly built analyzer as
+facts and gaps are added and removed.
+
+Run with: pytest tests/test_incremental_analyzers.py -v
+"""
+
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from stores.fact_store import FactStore
+from tools_v2.coverage import CoverageAnalyzer, compile_checklist_item, compile_name
+from tools_v2.reasoning_tools import ReasoningStore
+from tools_v2.store_delta import StoreDeltaTracker
+from tools_v2.synthesis import SynthesisAnalyzer
+
+
+def _add(fact_store, domain, category, item, source="doc1.md", quote="Documented in the IT overview deck"):
+    return fact_store.add_fact(domain=domain, category=category, item=item, details={},
+                               status="documented", evidence={"exact_quote": quote},
+                               source_document=source)
+
+
+def _fresh_coverage(fact_store):
+    return asdict(CoverageAnalyzer(fact_store).calculate_domain_coverage("infrastructure"))
+
+
+class TestStoreDeltaTracker:
+
+    def test_reports_only_new_tail(self):
+        fact_store = FactStore(deal_id="deal-1")
+        tracker = StoreDeltaTracker(fact_store)
+        _add(fact_store, "infrastructure", "hosting", "Primary data center")
+        assert len(tracker.poll()[0]) == 1
+
+        _add(fact_store, "infrastructure", "compute", "VMware vSphere")
+
+        added, removed = tracker.poll()
+        assert [f.item for f in added] == ["VMware vSphere"] and removed == []
+        assert tracker.poll() == ([], [])
+
+    def test_reports_removed_entries(self):
+        fact_store = FactStore(deal_id="deal-1")
+        _add(fact_store, "infrastructure", "hosting", "Primary data center", source="a.md")
+        _add(fact_store, "infrastructure", "compute", "VMware vSphere", source="b.md")
+        tracker = StoreDeltaTracker(fact_store)
+        tracker.poll()
+
+        fact_store.remove_facts_from_source("a.md")
+        _add(fact_store, "infrastructure", "storage", "NetApp SAN")
+
+        added, removed = tracker.poll()
+        assert [f.item for f in removed] == ["Primary data center"]
+        assert [f.item for f in added] == ["NetApp SAN"]
+
+    def test_insert_in_middle_replays_whole_list(self):
+        fact_store = FactStore(deal_id="deal-1")
+        _add(fact_store, "infrastructure", "hosting", "Primary data center")
+        tracker = StoreDeltaTracker(fact_store)
+        tracker.poll()
+
+        _add(fact_store, "infrastructure", "compute", "VMware vSphere")
+        fact_store.facts.insert(0, fact_store.facts.pop())
+
+        added, removed = tracker.poll()
+        assert [f.item for f in added] == ["VMware vSphere", "Primary data center"]
+        assert [f.item for f in removed] == ["Primary data center"]
+
+
+class TestCoverageAnalyzer:
+
+    def test_compiled_matching(self):
+        assert compile_checklist_item("hypervisor_platform").matches(compile_name("VMware ESXi 7"))
+        assert compile_checklist_item("primary_data_center").matches(compile_name("Primary DC"))
+        assert not compile_checklist_item("primary_san").matches(compile_name("Okta"))
+
+    def test_refresh_applies_only_changes(self):
+        fact_store = FactStore(deal_id="deal-1")
+        analyzer = CoverageAnalyzer(fact_store)
+        _add(fact_store, "infrastructure", "hosting", "Primary data center")
+        fact_store.add_gap(domain="infrastructure", category="hosting", description="No DR site", importance="high")
+
+        assert analyzer.refresh() == 2
+        assert analyzer.refresh() == 0
+
+    def test_live_updates_match_fresh_analysis(self):
+        fact_store = FactStore(deal_id="deal-1")
+        analyzer = CoverageAnalyzer(fact_store)
+        assert analyzer.calculate_domain_coverage("infrastructure").total_found == 0
+
+        _add(fact_store, "infrastructure", "compute", "Hypervisor cluster", source="a.md")
+        _add(fact_store, "infrastructure", "compute", "VMware ESXi", source="b.md")
+        _add(fact_store, "infrastructure", "hosting", "Primary data center", source="b.md")
+        fact_store.add_gap(domain="infrastructure", category="storage", description="No SAN", importance="high")
+        live = analyzer.calculate_domain_coverage("infrastructure")
+
+        assert asdict(live) == _fresh_coverage(fact_store)
+        hypervisor = live.categories["compute"].items[0]
+        assert hypervisor.matched_fact_item == "Hypervisor cluster"
+
+        fact_store.remove_facts_from_source("a.md")
+        live = analyzer.calculate_domain_coverage("infrastructure")
+
+        assert asdict(live) == _fresh_coverage(fact_store)
+        assert live.categories["compute"].items[0].matched_fact_item == "VMware ESXi"
+
+    def test_domains_are_not_served_from_each_others_cache(self):
+        fact_store = FactStore(deal_id="deal-1")
+        _add(fact_store, "infrastructure", "hosting", "Primary data center")
+        analyzer = CoverageAnalyzer(fact_store)
+
+        infra = analyzer.calculate_domain_coverage("infrastructure")
+        network = analyzer.calculate_domain_coverage("network")
+
+        assert (infra.domain, network.domain) == ("infrastructure", "network")
+
+    def test_overall_coverage_follows_fact_removal(self):
+        fact_store = FactStore(deal_id="deal-1")
+        analyzer = CoverageAnalyzer(fact_store)
+        _add(fact_store, "infrastructure", "hosting", "Primary data center", source="a.md")
+        before = analyzer.calculate_overall_coverage()["summary"]["total_found"]
+
+        fact_store.remove_facts_from_source("a.md")
+        _add(fact_store, "infrastructure", "hosting", "Unrelated tooling", source="b.md")
+
+        assert before == 1
+        assert analyzer.calculate_overall_coverage()["summary"]["total_found"] == 0
+
+
+class TestSynthesisAnalyzer:
+
+    def test_domain_keywords_follow_fact_changes(self):
+        fact_store = FactStore(deal_id="deal-1")
+        analyzer = SynthesisAnalyzer(fact_store, ReasoningStore(fact_store=fact_store))
+        _add(fact_store, "identity_access", "sso", "Okta SSO", source="a.md")
+        _add(fact_store, "identity_access", "directory", "Azure AD tenant", source="b.md")
+
+        assert analyzer._get_domain_keywords("identity_access") == {"okta", "azure_ad", "azure"}
+
+        fact_store.remove_facts_from_source("b.md")
+
+        assert analyzer._get_domain_keywords("identity_access") == {"okta"}
+
+    def test_analyze_reflects_new_facts(self):
+        fact_store = FactStore(deal_id="deal-1")
+        analyzer = SynthesisAnalyzer(fact_store, ReasoningStore(fact_store=fact_store))
+        _add(fact_store, "identity_access", "sso", "Okta SSO")
+        assert analyzer.analyze()["consistency"]["total_issues"] == 0
+
+        _add(fact_store, "applications", "saas", "Ping Identity federation")
+        result = analyzer.analyze()
+
+        assert result["consistency"]["high_severity_issues"] == 1
+        assert result["totals"]["facts"] == 2
@@ -0,0 +1,247 @@
+"""
+Tests for delta-based incremental persistence during analysis.
+
+IncrementalPersistence reads the FactStore change feed and the
+ReasoningStore outbox instead of rescanning the stores; BackgroundFlusher
+coalesces fact/gap writes during discovery.
+
+Run with: pytest tests/test_incremental_persistence.py -v
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from stores import fact_store as fact_store_module
+from stores.fact_store import FactStore
+from tools_v2.reasoning_tools import ReasoningStore
+from web.analysis_runner import BackgroundFlusher, IncrementalPersistence
+
+
+class FakeSession:
+    def __init__(self):
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+
+
+class FakeWriter:
+    """Records the write_* calls IncrementalPersistence makes."""
+
+    def __init__(self, fail_ids=()):
+        self.facts = []
+        self.gaps = []
+        self.findings = []
+        self.deleted = []
+        self.session = FakeSession()
+        self.fail_ids = set(fail_ids)
+
+    @contextmanager
+    def session_scope(self):
+        yield self.session
+
+    def write_fact(self, session, data, deal_id, run_id, commit=True):
+        if data['fact_id'] in self.fail_ids:
+            return False
+        self.facts.append(data['fact_id'])
+        return True
+
+    def write_gap(self, session, data, deal_id, run_id, commit=True):
+        self.gaps.append(data['gap_id'])
+        return True
+
+    def write_finding(self, session, data, deal_id, run_id, commit=True):
+        self.findings.append((data['finding_type'], data['finding_id']))
+        return True
+
+    def soft_delete_facts(self, session, fact_ids, deal_id, commit=True):
+        self.deleted.extend(fact_ids)
+        return True
+
+    def soft_delete_gaps(self, session, gap_ids, deal_id, commit=True):
+        self.deleted.extend(gap_ids)
+        return True
+
+
+def _persistence(writer):
+    incremental = IncrementalPersistence(app=None, deal_id="deal-1", run_id="run-1")
+    incremental._writer = writer
+    return incremental
+
+
+def _add(store, item, source="doc1.md"):
+    return store.add_fact(domain="infrastructure", category="compute", item=item, details={},
+                          status="documented", evidence={"exact_quote": f"{item} in production"},
+                          source_document=source)
+
+
+class TestFactPersistence:
+
+    def test_only_new_facts_are_written(self):
+        store = FactStore(deal_id="deal-1")
+        writer = FakeWriter()
+        incremental = _persistence(writer)
+        first = _add(store, "VMware vSphere")
+
+        assert incremental.persist_new_facts(store) == 1
+        second = _add(store, "Hyper-V")
+        assert incremental.persist_new_facts(store) == 1
+        assert incremental.persist_new_facts(store) == 0
+
+        assert writer.facts == [first, second]
+        assert writer.session.commits == 2
+
+    def test_updated_facts_are_rewritten(self):
+        store = FactStore(deal_id="deal-1")
+        writer = FakeWriter()
+        incremental = _persistence(writer)
+        fact_id = _add(store, "VMware vSphere")
+        incremental.persist_new_facts(store)
+
+        store.verify_fact(fact_id, "analyst@example.com")
+        incremental.persist_new_facts(store)
+
+        assert writer.facts == [fact_id, fact_id]
+        assert incremental.get_stats()["facts"] == 1
+
+    def test_failed_writes_are_retried(self):
+        store = FactStore(deal_id="deal-1")
+        fact_id = _add(store, "VMware vSphere")
+        writer = FakeWriter(fail_ids={fact_id})
+        incremental = _persistence(writer)
+        incremental.persist_new_facts(store)
+
+        writer.fail_ids.clear()
+        incremental.persist_new_facts(store)
+
+        assert writer.facts == [fact_id]
+
+    def test_overrun_change_log_falls_back_to_rescan(self, monkeypatch):
+        monkeypatch.setattr(fact_store_module, "FACT_CHANGE_LOG_SIZE", 2)
+        store = FactStore(deal_id="deal-1")
+        writer = FakeWriter()
+        incremental = _persistence(writer)
+        incremental.persist_new_facts(store)
+
+        ids = [_add(store, f"Host {i}") for i in range(5)]
+        incremental.persist_new_facts(store)
+
+        assert writer.facts == ids
+
+    def test_gaps(self):
+        store = FactStore(deal_id="deal-1")
+        writer = FakeWriter()
+        incremental = _persistence(writer)
+        _add(store, "VMware vSphere")
+        gap_id = store.add_gap(domain="network", category="wan", description="No WAN diagram", importance="high")
+
+        incremental.persist_new_gaps(store)
+        incremental.persist_new_gaps(store)
+
+        assert writer.gaps == [gap_id]
+
+    def test_merged_facts_are_soft_deleted(self):
+        store = FactStore(deal_id="deal-1")
+        writer = FakeWriter()
+        incremental = _persistence(writer)
+        kept = _add(store, "VMware vSphere", source="a.md")
+        duplicate = _add(store, "VMware  vsphere", source="b.md")
+        incremental.persist_new_facts(store)
+
+        store.merge_duplicate_facts([kept, duplicate])
+        incremental.persist_new_facts(store)
+        incremental.persist_new_facts(store)
+
+        assert writer.deleted == [duplicate]
+        assert writer.facts == [kept, duplicate, kept]  # kept fact re-written with merged details
+        assert incremental.get_stats()["facts"] == 1
+
+    def test_removed_gaps_are_soft_deleted(self):
+        store = FactStore(deal_id="deal-1")
+        writer = FakeWriter()
+        incremental = _persistence(writer)
+        gap_id = store.add_gap(domain="network", category="wan", description="No WAN diagram", importance="high")
+        incremental.persist_new_gaps(store)
+
+        store.remove_gaps([gap_id])
+        incremental.persist_new_gaps(store)
+
+        assert writer.deleted == [gap_id]
+        assert incremental.get_stats()["gaps"] == 0
+
+
+class TestFindingPersistence:
+
+    def test_outbox_delivers_findings_once_in_order(self):
+        fact_store = FactStore(deal_id="deal-1")
+        reasoning = ReasoningStore(fact_store=fact_store)
+        writer = FakeWriter()
+        incremental = _persistence(writer)
+        risk_id = reasoning.add_risk(domain="network", title="Single WAN link", description="No redundancy",
+                                     category="resilience", severity="high", mitigation="Add a second link",
+                                     integration_dependent=False, confidence="high", reasoning="Diagram shows one link",
+                                     based_on_facts=[])
+        incremental.persist_new_findings(reasoning)
+
+        other = ReasoningStore(fact_store=fact_store)
+        rec_id = other.add_recommendation(domain="network", title="Add WAN redundancy", description="Second carrier",
+                                          action_type="remediate", urgency="high", rationale="Single point of failure",
+                                          confidence="high", reasoning="See risk", based_on_facts=[])
+        reasoning.merge_from(other)
+        incremental.persist_new_findings(reasoning)
+        incremental.persist_new_findings(reasoning)
+
+        assert writer.findings == [("risk", risk_id), ("recommendation", rec_id)]
+        assert reasoning.pending_findings(0)[1] == 2
+
+
+class TestBackgroundFlusher:
+
+    def test_flushes_after_threshold(self):
+        store = FactStore(deal_id="deal-1")
+        writer = FakeWriter()
+        flusher = BackgroundFlusher(_persistence(writer), store, flush_every=3, interval=60).start()
+        try:
+            for i in range(3):
+                _add(store, f"Host {i}")
+            deadline = time.monotonic() + 5
+            while len(writer.facts) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert len(writer.facts) == 3
+        finally:
+            flusher.stop()
+
+    def test_stop_flushes_remaining(self):
+        store = FactStore(deal_id="deal-1")
+        writer = FakeWriter()
+        flusher = BackgroundFlusher(_persistence(writer), store, flush_every=100, interval=60).start()
+        fact_id = _add(store, "VMware vSphere")
+
+        flusher.stop()
+        _add(store, "Hyper-V")  # after stop: not flushed
+
+        assert writer.facts == [fact_id]
+
+    def test_second_stop_is_a_no_op(self):
+        store = FactStore(deal_id="deal-1")
+        writer = FakeWriter()
+        flusher = BackgroundFlusher(_persistence(writer), store, flush_every=100, interval=60).start()
+        fact_id = _add(store, "VMware vSphere")
+        flusher.stop()
+        _add(store, "Hyper-V")
+
+        flusher.stop()  # run_analysis stops on cancel and again in its finally block
+
+        assert writer.facts == [fact_id]
+        assert flusher._thread is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,168 @@
+"""
+Tests for snapshot-based organization builds.
+
+Covers planning from an immutable snapshot, the per-version build memo,
+and atomic assumption replacement via FactStore.replace_facts().
+
+Run with: pytest tests/test_org_bridge_snapshot.py -v
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from stores.fact_store import FactStore
+from services import organization_bridge as bridge
+from services.organization_bridge import (
+    build_organization_from_facts,
+    plan_organization_from_snapshot,
+    snapshot_org_facts,
+)
+
+
+def _missing_hierarchy_store(entity="target"):
+    fact_store = FactStore(deal_id="deal-1")
+    for i in range(3):
+        fact_store.add_fact(domain="organization", category="roles", item=f"Role {i}",
+                            details={}, status="documented",
+                            evidence={"exact_quote": f"Role {i} exists"}, entity=entity)
+    return fact_store
+
+
+def _assumed(fact_store, entity="target"):
+    return [f for f in fact_store.facts if bridge._is_assumed_org_fact(f, entity)]
+
+
+class TestPlanning:
+
+    def test_plan_does_not_modify_fact_store(self):
+        fact_store = _missing_hierarchy_store()
+        snapshot = snapshot_org_facts(fact_store)
+
+        plan = plan_organization_from_snapshot(snapshot, deal_id="deal-1", assumptions_enabled=True)
+
+        assert plan.status == "success_with_assumptions" and plan.assumptions
+        assert len(fact_store.facts) == 3 and fact_store.version == snapshot.version == 3
+
+    def test_snapshot_is_immutable(self):
+        fact_store = _missing_hierarchy_store()
+        snapshot = snapshot_org_facts(fact_store)
+        fact_store.add_fact(domain="organization", category="roles", item="Role 9", details={},
+                            status="documented", evidence={"exact_quote": "Role 9 exists"})
+
+        assert len(snapshot.facts) == 3
+        assert snapshot_org_facts(fact_store).version == 4
+
+
+class TestMemoization:
+
+    def test_repeated_builds_reuse_result(self, monkeypatch):
+        fact_store = _missing_hierarchy_store()
+        build_organization_from_facts(fact_store, enable_assumptions=True)
+        first, status = build_organization_from_facts(fact_store, enable_assumptions=True)
+
+        calls = []
+        original = bridge.plan_organization_from_snapshot
+        monkeypatch.setattr(bridge, "plan_organization_from_snapshot",
+                            lambda *a, **kw: calls.append(1) or original(*a, **kw))
+        second, second_status = build_organization_from_facts(fact_store, enable_assumptions=True)
+
+        assert calls == []
+        assert status == second_status == "success_with_assumptions"
+        assert second is not first
+        assert [s.name for s in second.staff_members] == [s.name for s in first.staff_members]
+
+    def test_fact_changes_invalidate_memo(self):
+        fact_store = _missing_hierarchy_store()
+        before, _ = build_organization_from_facts(fact_store, enable_assumptions=False)
+
+        fact_store.add_fact(domain="organization", category="roles", item="Role 9", details={},
+                            status="documented", evidence={"exact_quote": "Role 9 exists"})
+        after, _ = build_organization_from_facts(fact_store, enable_assumptions=False)
+
+        assert len(after.staff_members) == len(before.staff_members) + 1
+
+    def test_returned_store_can_be_modified(self):
+        fact_store = _missing_hierarchy_store()
+        build_organization_from_facts(fact_store, enable_assumptions=False)
+        store, _ = build_organization_from_facts(fact_store, enable_assumptions=False)
+        store.staff_members.clear()
+
+        again, _ = build_organization_from_facts(fact_store, enable_assumptions=False)
+
+        assert len(again.staff_members) == 3
+
+
+class TestAssumptionReplacement:
+
+    def test_rebuild_keeps_assumed_fact_ids(self):
+        fact_store = _missing_hierarchy_store()
+        build_organization_from_facts(fact_store, enable_assumptions=True)
+        ids = [f.fact_id for f in _assumed(fact_store)]
+        version = fact_store.version
+        bridge.clear_organization_build_cache()
+
+        build_organization_from_facts(fact_store, enable_assumptions=True)
+
+        assert [f.fact_id for f in _assumed(fact_store)] == ids
+        assert fact_store.version == version
+
+    def test_replace_facts_is_atomic_for_readers(self):
+        fact_store = _missing_hierarchy_store()
+        build_organization_from_facts(fact_store, enable_assumptions=True)
+        expected = len(_assumed(fact_store))
+        assumptions = plan_organization_from_snapshot(
+            snapshot_org_facts(fact_store), deal_id="deal-1", assumptions_enabled=True
+        ).assumptions
+        stale = [a.to_fact("deal-1") for a in assumptions]
+        for spec in stale:
+            spec["details"] = {**spec["details"], "revision": 1}
+
+        seen = set()
+        stop = threading.Event()
+
+        def reader():
+            while not stop.is_set():
+                seen.add(len(snapshot_org_facts(fact_store).facts))
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        for _ in range(50):
+            fact_store.replace_facts(lambda f: bridge._is_assumed_org_fact(f, "target"), stale)
+            bridge._merge_assumptions_into_fact_store(fact_store, assumptions, "deal-1", "target")
+        stop.set()
+        thread.join()
+
+        assert seen == {3 + expected}
+
+    def test_concurrent_builds_do_not_duplicate_assumptions(self):
+        fact_store = _missing_hierarchy_store()
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(5):
+                    bridge.clear_organization_build_cache()
+                    build_organization_from_facts(fact_store, enable_assumptions=True)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        keys = [(f.category, f.item) for f in _assumed(fact_store)]
+        assert errors == []
+        assert keys and len(keys) == len(set(keys))
+        assert len(fact_store.get_assumed_fact_keys("target")) == len(keys)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
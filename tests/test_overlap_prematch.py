@@ -0,0 +1,184 @@
+"""
+Tests for local overlap pre-matching and the pre-matched OverlapGenerator path.
+
+Run with: pytest tests/test_overlap_prematch.py -v
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.overlap_generator import OverlapGenerator
+from services.overlap_matcher import batch_candidates, CandidatePair, prematch_facts, profile_fact
+
+
+def _fact(fact_id, item, category="erp", **details):
+    return {"fact_id": fact_id, "item": item, "category": category, "details": details}
+
+
+class FakeMessages:
+    """Returns one capability_overlap per candidate pair listed in the prompt."""
+
+    def __init__(self):
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def create(self, messages, **kwargs):
+        prompt = messages[0]["content"]
+        with self._lock:
+            self.prompts.append(prompt)
+        overlaps = []
+        for line in prompt.splitlines():
+            if " <-> " in line:
+                target_id, buyer_id = line[2:].split(" (")[0].split(" <-> ")
+                overlaps.append({
+                    "overlap_type": "capability_overlap", "target_fact_ids": [target_id],
+                    "buyer_fact_ids": [buyer_id], "target_summary": "t", "buyer_summary": "b",
+                    "why_it_matters": "Consolidation decision", "confidence": 0.7,
+                })
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(overlaps))])
+
+
+def _generator(**kwargs):
+    messages = FakeMessages()
+    return OverlapGenerator(anthropic_client=SimpleNamespace(messages=messages), **kwargs), messages
+
+
+class TestProfiles:
+
+    def test_version_and_noise_tokens_are_separated(self):
+        profile = profile_fact(_fact("F-TGT-INFRA-001", "Microsoft Windows Server 2012 R2", "compute",
+                                     vendor="Microsoft Corp."))
+
+        assert profile.name_key == "microsoft windows server r2"
+        assert profile.version == "2012"
+        assert profile.vendor == "microsoft corp."
+
+    def test_product_detail_wins_over_item(self):
+        profile = profile_fact(_fact("F-TGT-APP-001", "Primary ERP", product="SAP S/4HANA", version="2021"))
+
+        assert profile.name == "SAP S/4HANA" and profile.version == "2021"
+
+
+class TestPrematch:
+
+    def test_exact_matches_and_candidates(self):
+        target = [_fact("F-TGT-APP-001", "SAP S/4HANA", version="2021"),
+                  _fact("F-TGT-APP-002", "Workday HCM", "hcm")]
+        buyer = [_fact("F-BYR-APP-001", "SAP S/4HANA", version="2023"),
+                 _fact("F-BYR-APP-002", "Oracle ERP Cloud"),
+                 _fact("F-BYR-APP-003", "Salesforce", "crm")]
+
+        result = prematch_facts(target, buyer)
+
+        assert [(m.target_fact_ids, m.buyer_fact_ids) for m in result.exact_matches] == [
+            (["F-TGT-APP-001"], ["F-BYR-APP-001"])
+        ]
+        assert [(c.target_fact_id, c.buyer_fact_id) for c in result.candidates] == [
+            ("F-TGT-APP-001", "F-BYR-APP-002")
+        ]
+        assert result.comparisons == 2 and result.cross_product == 6
+
+    def test_conflicting_vendors_are_not_exact(self):
+        result = prematch_facts([_fact("F-TGT-NET-001", "Firewall", "security", vendor="Palo Alto")],
+                                [_fact("F-BYR-NET-001", "Firewall", "security", vendor="Fortinet")])
+
+        assert result.exact_matches == []
+        assert len(result.candidates) == 1
+
+    def test_candidates_per_fact_limit(self):
+        buyer = [_fact(f"F-BYR-APP-{i:03d}", f"Custom App {i}") for i in range(10)]
+
+        result = prematch_facts([_fact("F-TGT-APP-001", "Custom Portal")], buyer, candidates_per_fact=2)
+
+        assert [c.buyer_fact_id for c in result.candidates] == ["F-BYR-APP-000", "F-BYR-APP-001"]
+
+    def test_batches_keep_target_pairs_together(self):
+        pairs = [CandidatePair(f"F-TGT-APP-{t}", f"F-BYR-APP-{b}", 0.5) for t in range(3) for b in range(3)]
+
+        batches = batch_candidates(pairs, max_pairs=4)
+
+        assert [len(b) for b in batches] == [3, 3, 3]
+        assert all(len({p.target_fact_id for p in b}) == 1 for b in batches)
+
+
+class TestGenerator:
+
+    def test_exact_matches_skip_llm(self):
+        generator, messages = _generator(prematch=True)
+
+        overlaps = generator.generate_overlap_map_for_domain(
+            "applications",
+            [_fact("F-TGT-APP-001", "SAP S/4HANA", version="2021")],
+            [_fact("F-BYR-APP-001", "SAP S/4HANA", version="2023")],
+        )
+
+        assert messages.prompts == []
+        assert [(o.overlap_id, o.overlap_type) for o in overlaps] == [("OVL-APP-001", "version_gap")]
+        assert overlaps[0].validate() == []
+
+    def test_exact_matches_go_to_llm_outside_platform_domains(self):
+        generator, messages = _generator(prematch=True)
+
+        overlaps = generator.generate_overlap_map_for_domain(
+            "organization",
+            [_fact("F-TGT-ORG-001", "Chief Information Officer", "leadership")],
+            [_fact("F-BYR-ORG-001", "Chief Information Officer", "leadership")],
+        )
+
+        assert len(messages.prompts) == 1
+        assert "F-TGT-ORG-001 <-> F-BYR-ORG-001" in messages.prompts[0]
+        assert [o.overlap_type for o in overlaps] == ["capability_overlap"]
+        assert generator.prematch_stats["organization"]["auto_accepted"] == 0
+
+    def test_only_candidate_facts_are_sent(self):
+        generator, messages = _generator(prematch=True)
+        target = [_fact("F-TGT-APP-001", "SAP S/4HANA"), _fact("F-TGT-APP-002", "Kronos", "timekeeping")]
+        buyer = [_fact("F-BYR-APP-001", "Oracle ERP Cloud"), _fact("F-BYR-APP-002", "Salesforce", "crm")]
+
+        overlaps = generator.generate_overlap_map_for_domain("applications", target, buyer)
+
+        assert len(messages.prompts) == 1
+        assert "F-TGT-APP-002" not in messages.prompts[0] and "F-BYR-APP-002" not in messages.prompts[0]
+        assert [(o.target_fact_ids, o.buyer_fact_ids) for o in overlaps] == [(["F-TGT-APP-001"], ["F-BYR-APP-001"])]
+
+    def test_all_domains_number_overlaps_per_domain(self):
+        generator, messages = _generator(prematch=True, max_concurrency=3)
+        facts_by_domain = {
+            "applications": {"target": [_fact("F-TGT-APP-001", "SAP ECC"), _fact("F-TGT-APP-002", "Workday", "hcm")],
+                             "buyer": [_fact("F-BYR-APP-001", "Oracle ERP"), _fact("F-BYR-APP-002", "Workday", "hcm")]},
+            "network": {"target": [_fact("F-TGT-NET-001", "Cisco ASA", "firewall")],
+                        "buyer": [_fact("F-BYR-NET-001", "Palo Alto PA-5200", "firewall")]},
+        }
+
+        overlaps = generator.generate_overlap_map_all_domains(facts_by_domain)
+
+        assert [o.overlap_id for o in overlaps["applications"]] == ["OVL-APP-001", "OVL-APP-002"]
+        assert overlaps["applications"][0].overlap_type == "platform_alignment"
+        assert [o.overlap_id for o in overlaps["network"]] == ["OVL-NET-001"]
+        assert overlaps["infrastructure"] == []
+        assert len(messages.prompts) == 2
+        assert generator.prematch_stats["applications"]["exact_matches"] == 1
+
+    def test_legacy_mode_sends_full_inventories(self):
+        generator, messages = _generator(prematch=False)
+
+        generator.generate_overlap_map_for_domain(
+            "applications",
+            [_fact("F-TGT-APP-001", "SAP S/4HANA")],
+            [_fact("F-BYR-APP-001", "SAP S/4HANA"), _fact("F-BYR-APP-002", "Salesforce", "crm")],
+        )
+
+        assert len(messages.prompts) == 1
+        assert "F-BYR-APP-002" in messages.prompts[0] and "CANDIDATE PAIRS" not in messages.prompts[0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
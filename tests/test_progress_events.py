@@ -0,0 +1,242 @@
+"""
+Tests for push-based progress events (web/progress_events.py).
+
+Covers event numbering and resume via Last-Event-ID, the SSE stream format
+and termination, and publishing from AnalysisTaskManager.
+
+Run with: pytest tests/test_progress_events.py -v
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web.progress_events import (
+    InMemoryProgressBus,
+    RedisProgressBus,
+    parse_last_event_id,
+    publish_progress,
+    set_progress_bus,
+    stream_progress,
+    task_channel,
+)
+from web.task_manager import AnalysisTask, AnalysisTaskManager, TaskStatus
+
+
+@pytest.fixture
+def bus():
+    bus = InMemoryProgressBus(backlog_size=50)
+    set_progress_bus(bus)
+    yield bus
+    set_progress_bus(None)
+
+
+def _sse_events(chunks):
+    """Parse SSE chunks into (id, event, data) tuples, skipping comments and retry hints."""
+    parsed = []
+    for chunk in chunks:
+        fields = dict(
+            line.split(": ", 1) for line in chunk.strip().splitlines()
+            if ": " in line and not line.startswith(":")
+        )
+        if "data" in fields:
+            parsed.append((fields.get("id"), fields.get("event"), json.loads(fields["data"])))
+    return parsed
+
+
+class TestInMemoryProgressBus:
+
+    def test_ids_increase_per_channel(self, bus):
+        first = bus.publish("task:a", {"progress": 10})
+        second = bus.publish("task:a", {"progress": 20})
+        other = bus.publish("task:b", {"progress": 5})
+
+        assert (first.id, second.id, other.id) == (1, 2, 1)
+        assert [e.data["progress"] for e in bus.events_since("task:a", 1)] == [20]
+
+    def test_backlog_is_bounded(self):
+        bus = InMemoryProgressBus(backlog_size=3)
+        for i in range(10):
+            bus.publish("task:a", {"i": i})
+
+        assert [e.id for e in bus.events_since("task:a")] == [8, 9, 10]
+        assert bus.last_event_id("task:a") == 10
+
+    def test_subscribe_wakes_on_publish(self, bus):
+        subscription = bus.subscribe("task:a", last_id=0, heartbeat=5)
+        threading.Timer(0.05, bus.publish, args=("task:a", {"progress": 50})).start()
+
+        event = next(subscription)
+
+        assert event.data == {"progress": 50}
+
+    def test_subscribe_heartbeat_when_idle(self, bus):
+        assert next(bus.subscribe("task:a", heartbeat=0.01)) is None
+
+    def test_finished_channels_are_dropped_after_retention(self):
+        bus = InMemoryProgressBus(terminal_retention=0)
+        bus.publish("task:a", {"progress": 100, "complete": True})
+        bus.publish("task:b", {"progress": 10})
+
+        assert bus.events_since("task:a") == []
+        assert bus.last_event_id("task:a") == 0
+        assert bus.last_event_id("task:b") == 1
+
+
+class FakePubSub:
+    def subscribe(self, channel):
+        self.channel = channel
+
+    def get_message(self, timeout=None):
+        return None
+
+    def close(self):
+        pass
+
+
+class TestRedisProgressBus:
+
+    def test_subscriptions_use_dedicated_client(self):
+        shared = type("Shared", (), {"lrange": lambda self, *a: [], "pubsub": None})()
+        pubsub_client = type("PubSubClient", (), {"pubsub": lambda self, **kw: FakePubSub()})()
+        bus = RedisProgressBus(shared, pubsub_client=pubsub_client)
+
+        assert next(bus.subscribe("task:a", heartbeat=0.01)) is None
+
+
+class TestStreamProgress:
+
+    def test_snapshot_then_events_until_terminal(self, bus):
+        bus.publish("task:a", {"progress": 40, "complete": False})
+        bus.publish("task:a", {"progress": 100, "complete": True})
+        bus.publish("task:a", {"progress": 100, "complete": True, "late": True})
+
+        events = _sse_events(stream_progress("task:a", snapshot={"progress": 30}, heartbeat=0.01))
+
+        assert events == [
+            (None, "snapshot", {"progress": 30}),
+            ("1", "progress", {"progress": 40, "complete": False}),
+            ("2", "progress", {"progress": 100, "complete": True}),
+        ]
+
+    def test_resume_from_last_event_id(self, bus):
+        for progress in (10, 20, 30):
+            bus.publish("task:a", {"progress": progress})
+        bus.publish("task:a", {"progress": 100, "complete": True})
+
+        events = _sse_events(stream_progress("task:a", last_id=parse_last_event_id("2"), heartbeat=0.01))
+
+        assert [e[0] for e in events] == ["3", "4"]
+
+    def test_completed_snapshot_closes_stream(self, bus):
+        events = _sse_events(stream_progress("task:a", snapshot={"complete": True}, heartbeat=0.01))
+
+        assert events == [(None, "snapshot", {"complete": True})]
+
+    def test_stream_ends_at_deadline(self, bus):
+        chunks = list(stream_progress("task:a", max_seconds=0, heartbeat=0.01))
+
+        assert chunks[-1] == ": keep-alive\n\n"
+
+    def test_stale_last_event_id_restarts_from_beginning(self, bus):
+        bus.publish("task:a", {"progress": 100, "complete": True})
+
+        events = _sse_events(stream_progress("task:a", last_id=40, heartbeat=0.01))
+
+        assert [e[0] for e in events] == ["1"]
+
+    def test_over_stream_cap_sends_missed_events_and_ends(self, bus):
+        bus.publish("task:a", {"progress": 10})
+        bus.publish("task:a", {"progress": 20})
+        slots = threading.BoundedSemaphore(1)
+        slots.acquire()
+
+        events = _sse_events(stream_progress("task:a", last_id=1, heartbeat=5, slots=slots))
+
+        assert events == [("2", "progress", {"progress": 20})]
+
+    def test_process_local_bus_polls_refreshed_snapshot(self, bus, monkeypatch):
+        monkeypatch.setattr("web.progress_events.PROGRESS_REFRESH_SECONDS", 0.01)
+        statuses = iter([{"progress": 30}, {"progress": 60}, {"progress": 100, "complete": True}])
+
+        events = _sse_events(stream_progress("deal:d1", snapshot={"progress": 30},
+                                             refresh=lambda: next(statuses)))
+
+        assert [e[2] for e in events] == [{"progress": 30}, {"progress": 60}, {"progress": 100, "complete": True}]
+
+    def test_analysis_stream_follows_other_worker_on_local_bus(self, bus, monkeypatch):
+        import web.app as web_app
+
+        # Progress is published by another worker, so this bus sees no events
+        monkeypatch.setattr("web.progress_events.PROGRESS_REFRESH_SECONDS", 0.01)
+        monkeypatch.setattr(web_app, "AUTH_REQUIRED", False)
+        statuses = iter([{"progress": 10}, {"progress": 10}, {"progress": 50},
+                         {"progress": 100, "complete": True}])
+
+        class OtherWorkerTasks:
+            def get_task_status(self, task_id):
+                return next(statuses)
+
+        monkeypatch.setattr(web_app, "task_manager", OtherWorkerTasks())
+        assert not bus.shared
+
+        response = web_app.app.test_client().get("/analysis/events?task_id=t1")
+        events = _sse_events(response.get_data(as_text=True).split("\n\n"))
+
+        assert [e[2] for e in events] == [{"progress": 10}, {"progress": 50},
+                                          {"progress": 100, "complete": True}]
+
+    def test_parse_last_event_id(self):
+        assert parse_last_event_id(None) == 0
+        assert parse_last_event_id("abc") == 0
+        assert parse_last_event_id("7") == 7
+
+
+class TestPublishing:
+
+    def test_publish_to_task_and_deal_channels(self, bus):
+        publish_progress({"progress": 5}, task_id="t1", deal_id="d1")
+
+        assert bus.last_event_id("task:t1") == 1
+        assert bus.last_event_id("deal:d1") == 1
+
+    def test_publish_never_raises(self):
+        class BrokenBus:
+            def publish(self, *args, **kwargs):
+                raise ConnectionError("redis down")
+
+        set_progress_bus(BrokenBus())
+        try:
+            publish_progress({"progress": 5}, task_id="t1")
+        finally:
+            set_progress_bus(None)
+
+    def test_task_manager_publishes_progress_and_cancellation(self, bus):
+        AnalysisTaskManager._instance = None
+        AnalysisTaskManager._initialized = False
+        manager = AnalysisTaskManager()
+        task = AnalysisTask(task_id="sse-task", file_paths=[], deal_context={"deal_id": "deal-9"})
+        task.status = TaskStatus.RUNNING
+        with manager._tasks_lock:
+            manager._tasks[task.task_id] = task
+
+        manager._update_progress("sse-task", {
+            "facts_extracted": 12,
+            "tokens_used": 3400,
+            "domain_progress": {"target:network": "complete"},
+        })
+        manager.cancel_task("sse-task")
+
+        events = bus.events_since(task_channel("sse-task"))
+        assert events[0].data["progress"]["facts_extracted"] == 12
+        assert events[0].data["progress"]["tokens_used"] == 3400
+        assert events[0].data["progress"]["domain_progress"] == {"target:network": "complete"}
+        assert events[-1].is_terminal
+        assert events[-1].data["status"] == "cancelled"
+        assert bus.last_event_id("deal:deal-9") == 2
@@ -0,0 +1,158 @@
+"""
+Tests for the offline replay harness (benchmarks/replay_client.py).
+
+Covers the DiscoveryLogger JSON transcript, transcript loading, and that
+discovery and reasoning agents run to completion against the replay client.
+
+Run with: pytest tests/test_replay_client.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.replay_client import ReplayAnthropicClient, load_transcripts, replay_anthropic
+from benchmarks.synthetic_vdr import generate_corpus
+from stores.fact_store import FactStore
+from tools_v2.discovery_logger import DiscoveryLogger
+from tools_v2.reasoning_tools import ReasoningStore, execute_reasoning_tool
+
+
+QUOTE = "Primary WAN is an MPLS network from AT&T linking 12 sites."
+
+
+def _network_entry(item):
+    return {
+        "domain": "network", "category": "wan", "item": item, "entity": "target",
+        "status": "documented", "details": {"vendor": "AT&T"},
+        "evidence": {"exact_quote": QUOTE},
+    }
+
+
+@pytest.fixture
+def transcript_dir(tmp_path):
+    audit = DiscoveryLogger(domain="network", output_dir=tmp_path)
+    audit.start(document_name="target_network.md", document_length=500, entity="target")
+    audit.log_tool_call("create_inventory_entry", _network_entry("MPLS WAN"), {"status": "success"}, iteration=1)
+    audit.log_tool_call("create_inventory_entry", _network_entry("SD-WAN"), {"status": "success"}, iteration=1)
+    audit.log_tool_call("flag_gap", {"domain": "network", "category": "lan", "description": "No LAN diagram",
+                                     "importance": "medium"}, {"status": "success"}, iteration=2)
+    audit.save()
+    return tmp_path
+
+
+@pytest.fixture
+def offline_output(tmp_path, monkeypatch):
+    import config_v2
+    monkeypatch.setattr(config_v2, "OUTPUT_DIR", tmp_path / "output")
+
+
+class TestTranscripts:
+
+    def test_save_writes_json_transcript_next_to_markdown(self, transcript_dir):
+        transcript = json.loads(next(transcript_dir.glob("*.json")).read_text())
+
+        assert transcript["entity"] == "target"
+        assert [len(i["tool_calls"]) for i in transcript["iterations"]] == [2, 1]
+        assert list(transcript_dir.glob("*.md"))
+
+    def test_load_transcripts_keys_by_domain_and_entity(self, transcript_dir):
+        transcripts = load_transcripts(transcript_dir)
+
+        iterations = transcripts[("network", "target")]
+        assert [call["tool_name"] for call in iterations[0]] == ["create_inventory_entry"] * 2
+        assert iterations[1][0]["tool_input"]["description"] == "No LAN diagram"
+
+
+class TestReplayAnthropicClient:
+
+    def test_discovery_replays_iterations_then_completes(self, transcript_dir):
+        client = ReplayAnthropicClient(load_transcripts(transcript_dir))
+        task = {"role": "user", "content": "**TARGET COMPANY**\nExtract all network information from the document above."}
+
+        names = []
+        for turn in range(3):
+            messages = [task] + [{"role": "assistant", "content": []}] * turn
+            names.append([b.name for b in client.messages.create(messages=messages).content])
+
+        assert names == [["create_inventory_entry"] * 2, ["flag_gap"], ["complete_discovery"]]
+        assert client.calls_by_kind == {"discovery": 3}
+
+    def test_reasoning_findings_cite_prompt_facts_and_validate(self):
+        fact_store = FactStore(deal_id="deal-1")
+        fact_ids = [
+            fact_store.add_fact(domain="network", category="wan", item=f"Circuit {i}", details={},
+                                status="documented", evidence={"exact_quote": QUOTE}, entity="target")
+            for i in range(4)
+        ]
+        system = fact_store.format_for_reasoning_with_buyer_context("network")
+        client = ReplayAnthropicClient()
+        request = {"system": [{"type": "text", "text": system}],
+                   "messages": [{"role": "user", "content": "signal completion of the network domain."}]}
+
+        blocks = client.messages.create(**request).content
+
+        reasoning_store = ReasoningStore(fact_store=fact_store)
+        results = [execute_reasoning_tool(b.name, b.input, reasoning_store) for b in blocks]
+        assert [b.name for b in blocks] == ["identify_risk", "create_work_item"]
+        assert all(r["status"] == "success" for r in results), results
+        assert blocks[0].input["based_on_facts"] == fact_ids[:3]
+
+    def test_unrecognized_request_ends_turn(self):
+        response = ReplayAnthropicClient().messages.create(messages=[{"role": "user", "content": "Summarize."}])
+
+        assert response.stop_reason == "end_turn"
+        assert response.content[0].type == "text"
+
+    def test_jitter_is_seeded(self, monkeypatch):
+        delays = []
+        monkeypatch.setattr("benchmarks.replay_client.time.sleep", delays.append)
+
+        for _ in range(2):
+            client = ReplayAnthropicClient(latency=0.01, jitter=0.05, seed=3)
+            for _ in range(3):
+                client.messages.create(messages=[])
+
+        assert delays[:3] == delays[3:]
+        assert all(0.01 <= d <= 0.06 for d in delays)
+
+
+class TestReplayedAgents:
+
+    def test_discovery_agent_replays_synthetic_corpus(self, tmp_path, offline_output):
+        from agents_v2.discovery import DISCOVERY_AGENTS
+
+        corpus = generate_corpus("tiny", 3, root=tmp_path)
+        document = (corpus / "documents" / "target_network.md").read_text()
+        fact_store = FactStore(deal_id="deal-1")
+        client = ReplayAnthropicClient(load_transcripts(corpus / "transcripts"))
+
+        with replay_anthropic(client):
+            agent = DISCOVERY_AGENTS["network"](fact_store=fact_store, api_key="offline")
+            result = agent.discover(document, document_name="target_network.md", entity="target")
+
+        assert len(result["facts"]) == 3
+        assert len(result["gaps"]) == 1
+        assert agent.discovery_complete
+        assert list((tmp_path / "output" / "logs").glob("network_discovery_log_*.json"))
+
+    def test_reasoning_agent_completes(self, offline_output):
+        from agents_v2.reasoning import REASONING_AGENTS
+
+        fact_store = FactStore(deal_id="deal-1")
+        for i in range(6):
+            fact_store.add_fact(domain="network", category="wan", item=f"Circuit {i}", details={},
+                                status="documented", evidence={"exact_quote": QUOTE}, entity="target")
+
+        with replay_anthropic(ReplayAnthropicClient()):
+            agent = REASONING_AGENTS["network"](fact_store=fact_store, api_key="offline")
+            result = agent.reason()
+
+        assert agent.reasoning_complete
+        assert result["findings"]["summary"]["risks"] == 1
+        assert result["findings"]["summary"]["work_items"] == 1
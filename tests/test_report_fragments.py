@@ -0,0 +1,186 @@
+"""
+Tests for fragment-cached, streaming HTML report rendering.
+
+Covers the fragment cache itself, and that the domain report renderer,
+the full HTML report and the dossier HTML exporter stream the same output
+they used to build in one piece while re-rendering only changed sections.
+
+Run with: pytest tests/test_report_fragments.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.inventory_dossier import DossierHTMLExporter, ItemDossier, RelatedRisk
+from stores.fact_store import FactStore
+from tools_v2 import html_report
+from tools_v2.pe_report_schemas import DomainReportData
+from tools_v2.reasoning_tools import ReasoningStore
+from tools_v2.renderers.fragment_cache import FragmentCache, content_hash
+from tools_v2.renderers.html_renderer import DomainReportRenderer
+
+
+def _domain_data(**overrides):
+    values = dict(
+        domain="applications",
+        domain_display_name="Applications",
+        run_rate_cost=(100_000, 250_000),
+        cost_breakdown={"saas": (50_000, 80_000)},
+        top_implications=["ERP upgrade is on the critical path"],
+    )
+    values.update(overrides)
+    return DomainReportData(**values)
+
+
+def _count_calls(monkeypatch, owner, name):
+    calls = []
+    original = getattr(owner, name)
+
+    def counted(*args, **kwargs):
+        calls.append(name)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(owner, name, counted)
+    return calls
+
+
+class TestFragmentCache:
+
+    def test_content_hash_follows_values_not_identity(self):
+        def risk(severity):
+            return RelatedRisk(risk_id="R-1", title="EOL", description="Support ends", severity=severity)
+
+        assert content_hash(risk("high")) == content_hash(risk("high"))
+        assert content_hash(risk("high")) != content_hash(risk("low"))
+
+    def test_render_caches_by_key(self):
+        cache = FragmentCache()
+        calls = []
+
+        def render():
+            calls.append(1)
+            return "<p>x</p>"
+
+        assert cache.render("risks", "network", "target", "h1", render) == "<p>x</p>"
+        assert cache.render("risks", "network", "target", "h1", render) == "<p>x</p>"
+        cache.render("risks", "network", "buyer", "h1", render)
+
+        assert len(calls) == 2
+        assert cache.stats() == {"entries": 2, "hits": 1, "misses": 2}
+
+    def test_least_recently_used_fragment_is_evicted(self):
+        cache = FragmentCache(max_entries=2)
+        cache.put(("a", "all", "all", "1"), "a")
+        cache.put(("b", "all", "all", "1"), "b")
+        cache.get(("a", "all", "all", "1"))
+        cache.put(("c", "all", "all", "1"), "c")
+
+        assert cache.get(("b", "all", "all", "1")) is None
+        assert cache.get(("a", "all", "all", "1")) == "a"
+
+
+class TestDomainReportRenderer:
+
+    def test_stream_joins_to_rendered_document(self):
+        renderer = DomainReportRenderer(cache=FragmentCache())
+        data = _domain_data()
+
+        chunks = list(renderer.iter_render(data, "Acme"))
+
+        assert chunks[0].startswith("<!DOCTYPE html>")
+        assert "".join(chunks) == renderer.render(data, "Acme")
+        assert "".join(chunks).endswith("</body>\n</html>")
+
+    def test_only_changed_section_is_re_rendered(self, monkeypatch):
+        renderer = DomainReportRenderer(cache=FragmentCache())
+        renderer.render(_domain_data(), "Acme")
+        costs_calls = _count_calls(monkeypatch, renderer, "_render_section_2_costs")
+        inventory_calls = _count_calls(monkeypatch, renderer, "_render_section_1_inventory")
+
+        html = renderer.render(_domain_data(run_rate_cost=(1, 2)), "Acme")
+
+        assert costs_calls == ["_render_section_2_costs"]
+        assert inventory_calls == []
+        assert "$1 - $2" in html
+
+    def test_entities_are_cached_separately(self):
+        cache = FragmentCache()
+        DomainReportRenderer(entity="target", cache=cache).render(_domain_data(), "Acme")
+        DomainReportRenderer(entity="buyer", cache=cache).render(_domain_data(), "Acme")
+
+        assert cache.stats()["hits"] == 0
+
+
+class TestHtmlReport:
+
+    @pytest.fixture
+    def stores(self):
+        fact_store = FactStore(deal_id="deal-1")
+        fact_id = fact_store.add_fact(
+            domain="applications", category="erp", item="SAP ECC",
+            details={"vendor": "SAP"}, status="documented",
+            evidence={"exact_quote": "SAP ECC 6.0 runs finance", "source_section": "Apps"},
+            entity="target",
+        )
+        fact_store.add_gap(domain="network", category="wan", description="No WAN diagram", importance="high")
+        reasoning_store = ReasoningStore(fact_store=fact_store)
+        reasoning_store.add_risk(
+            domain="applications", title="SAP ECC end of support", description="Support ends 2027",
+            category="lifecycle", severity="high", integration_dependent=False, mitigation="Plan S/4",
+            based_on_facts=[fact_id], confidence="high", reasoning="Vendor roadmap",
+        )
+        return fact_store, reasoning_store
+
+    def test_unchanged_sections_come_from_cache(self, stores, monkeypatch):
+        fact_store, reasoning_store = stores
+        cache = FragmentCache()
+        first = "".join(html_report._iter_html(fact_store, reasoning_store, "ts", "Acme", cache=cache))
+        risk_calls = _count_calls(monkeypatch, html_report, "_build_risks_section")
+        gap_calls = _count_calls(monkeypatch, html_report, "_build_gaps_section")
+
+        fact_store.add_gap(domain="network", category="lan", description="No LAN inventory", importance="medium")
+        second = "".join(html_report._iter_html(fact_store, reasoning_store, "ts", "Acme", cache=cache))
+
+        assert risk_calls == []
+        assert gap_calls == ["_build_gaps_section"]
+        assert "No LAN inventory" in second and "No LAN inventory" not in first
+
+    def test_generate_html_report_writes_streamed_document(self, stores, tmp_path):
+        fact_store, reasoning_store = stores
+
+        output = html_report.generate_html_report(fact_store, reasoning_store, tmp_path, timestamp="t1")
+
+        html = output.read_text()
+        assert html.startswith("<!DOCTYPE html>") and html.endswith("</html>")
+        assert "SAP ECC end of support" in html
+
+
+class TestDossierHTMLExporter:
+
+    def _dossiers(self, severity="high"):
+        return [
+            ItemDossier(name="SAP ECC", domain="applications", entity="target", item_type="Application",
+                        risks=[RelatedRisk(risk_id="R-1", title="EOL", description="Support ends",
+                                           severity=severity)]),
+            ItemDossier(name="Workday", domain="applications", entity="buyer", item_type="Application"),
+        ]
+
+    def test_only_changed_card_is_re_rendered(self, monkeypatch):
+        cache = FragmentCache()
+        "".join(DossierHTMLExporter.iter_domain(self._dossiers(), "applications", cache=cache))
+        card_calls = _count_calls(monkeypatch, DossierHTMLExporter, "_render_dossier_card")
+
+        html = "".join(DossierHTMLExporter.iter_domain(self._dossiers("low"), "applications", cache=cache))
+
+        assert card_calls == ["_render_dossier_card"]
+        assert 'class="severity low"' in html
+
+    def test_export_domain_matches_string_export(self, tmp_path):
+        output = DossierHTMLExporter.export_domain(self._dossiers(), "applications", tmp_path / "d.html")
+
+        assert output.read_text() == DossierHTMLExporter.export_to_string(self._dossiers(), "applications")
@@ -0,0 +1,217 @@
+"""
+Tests for the batched retention engine and the cleanup tasks built on it.
+
+Redis sweeps run against an in-memory stand-in that implements SCAN and
+fails on KEYS; SQL purges run against SQLite.
+
+Run with: pytest tests/test_retention.py -v
+"""
+
+import fnmatch
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web.tasks import cleanup_tasks
+from web.tasks.retention import RetentionEngine
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.calls.append((name, args))
+            return self
+        return queue
+
+    def execute(self):
+        results = [getattr(self.client, name)(*args) for name, args in self.calls]
+        self.calls = []
+        return results
+
+
+class FakeRedis:
+    """Minimal Redis stand-in: SCAN, TTL, GET, EXPIRE, UNLINK, pipelines."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.scan_calls = 0
+        self._order = []  # Stable key order, so deletes during a scan don't shift the cursor
+
+    def set(self, key, value, ex=None):
+        key = key.encode() if isinstance(key, str) else key
+        if key not in self.data:
+            self._order.append(key)
+        self.data[key] = value.encode() if isinstance(value, str) else value
+        if ex:
+            self.ttls[key] = ex
+
+    def keys(self, pattern):
+        raise AssertionError("KEYS blocks the server; use SCAN")
+
+    def scan(self, cursor=0, match=None, count=10):
+        self.scan_calls += 1
+        batch = [k for k in self._order[cursor:cursor + count] if k in self.data]
+        next_cursor = cursor + count if cursor + count < len(self._order) else 0
+        return next_cursor, [k for k in batch if fnmatch.fnmatch(k.decode(), match or "*")]
+
+    def ttl(self, key):
+        return self.ttls.get(key, -1) if key in self.data else -2
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def expire(self, key, seconds):
+        if key not in self.data:
+            return False
+        self.ttls[key] = seconds
+        return True
+
+    def unlink(self, *keys):
+        removed = 0
+        for key in keys:
+            if self.data.pop(key, None) is not None:
+                self.ttls.pop(key, None)
+                removed += 1
+        return removed
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def _task_result(days_ago):
+    done = (datetime.utcnow() - timedelta(days=days_ago)).isoformat()
+    return json.dumps({"status": "SUCCESS", "date_done": done})
+
+
+@pytest.fixture
+def sqlite_session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'retention.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE flask_sessions (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                          "session_id VARCHAR(255) UNIQUE NOT NULL, data BLOB, expiry TIMESTAMP)"))
+    session = Session(engine)
+    yield session
+    session.close()
+
+
+def _insert_sessions(session, expired, live):
+    now = datetime.utcnow()
+    for i in range(expired):
+        session.execute(text("INSERT INTO flask_sessions (session_id, expiry) VALUES (:sid, :expiry)"),
+                        {"sid": f"old-{i}", "expiry": now - timedelta(days=30)})
+    for i in range(live):
+        session.execute(text("INSERT INTO flask_sessions (session_id, expiry) VALUES (:sid, :expiry)"),
+                        {"sid": f"live-{i}", "expiry": now + timedelta(days=1)})
+    session.commit()
+
+
+class TestRedisSweep:
+
+    def test_scan_in_batches_and_pause_between(self):
+        client = FakeRedis()
+        for i in range(25):
+            client.set(f"cache:{i:02d}", "x")
+        client.set("keep:me", "x")
+        sleeps = []
+        engine = RetentionEngine(batch_size=10, pause_seconds=0.01, max_seconds=0, sleep=sleeps.append)
+
+        report = engine.sweep_redis(client, "cache:*", job="cache")
+
+        assert report.complete
+        assert report.affected == 25
+        assert list(client.data) == [b"keep:me"]
+        assert client.scan_calls == report.batches == 3
+        assert sleeps == [0.01, 0.01]
+
+    def test_expire_instead_of_delete(self):
+        client = FakeRedis()
+        client.set("session:a", "x")
+        client.set("session:b", "x", ex=60)
+
+        report = RetentionEngine(batch_size=10, pause_seconds=0).sweep_redis(
+            client, "session:*", job="sessions", select=cleanup_tasks._sessions_without_ttl, expire_seconds=3600)
+
+        assert report.affected == 1
+        assert client.ttls == {b"session:a": 3600, b"session:b": 60}
+
+    def test_time_budget_stops_early(self):
+        client = FakeRedis()
+        for i in range(30):
+            client.set(f"cache:{i:02d}", "x")
+        progress = []
+        engine = RetentionEngine(batch_size=10, pause_seconds=0, max_seconds=1e-9, progress=progress.append)
+
+        report = engine.sweep_redis(client, "cache:*", job="cache")
+
+        assert not report.complete
+        assert report.affected == 10
+        assert len(progress) == 1
+        assert report.to_dict()["throughput_per_second"] >= 0
+
+
+class TestCleanupOldTasks:
+
+    def test_removes_only_old_results_without_ttl(self, monkeypatch):
+        import redis
+        client = FakeRedis()
+        client.set("celery-task-meta-old", _task_result(days_ago=3))
+        client.set("celery-task-meta-recent", _task_result(days_ago=0))
+        client.set("celery-task-meta-ttl", _task_result(days_ago=3), ex=100)
+        client.set("unrelated", "x")
+        monkeypatch.setattr(redis, "from_url", lambda url: client)
+
+        result = cleanup_tasks.cleanup_old_tasks()
+
+        assert result["status"] == "success"
+        assert result["task_count"] == 3
+        assert result["removed"] == 1
+        assert b"celery-task-meta-old" not in client.data
+        assert b"unrelated" in client.data
+
+
+class TestSqlPurge:
+
+    def test_deletes_in_committed_batches(self, sqlite_session):
+        _insert_sessions(sqlite_session, expired=23, live=5)
+        engine = RetentionEngine(batch_size=10, pause_seconds=0)
+
+        report = engine.purge_sql(sqlite_session, "flask_sessions", "expiry < :cutoff OR expiry IS NULL",
+                                  {"cutoff": datetime.utcnow()})
+
+        assert report.complete
+        assert report.affected == 23
+        assert report.batches == 3  # The partial third batch ends the sweep
+        remaining = sqlite_session.execute(text("SELECT COUNT(*) FROM flask_sessions")).scalar()
+        assert remaining == 5
+
+    def test_time_budget_leaves_rest_for_next_run(self, sqlite_session):
+        _insert_sessions(sqlite_session, expired=30, live=0)
+        engine = RetentionEngine(batch_size=10, pause_seconds=0, max_seconds=1e-9)
+
+        first = engine.purge_sql(sqlite_session, "flask_sessions", "expiry < :cutoff", {"cutoff": datetime.utcnow()})
+        second = RetentionEngine(batch_size=10, pause_seconds=0, max_seconds=0).purge_sql(
+            sqlite_session, "flask_sessions", "expiry < :cutoff", {"cutoff": datetime.utcnow()})
+
+        assert (first.affected, first.complete) == (10, False)
+        assert (second.affected, second.complete) == (20, True)
+
+    def test_rejects_unsafe_identifiers(self, sqlite_session):
+        with pytest.raises(ValueError):
+            RetentionEngine().purge_sql(sqlite_session, "flask_sessions; DROP TABLE x", "1=1")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,251 @@
+"""
+Tests for streaming uploads with single-pass hashing.
+
+Uploads are spooled to disk in chunks while SHA-256 is computed in the
+same pass (DocumentStore.add_document_from_stream, LocalStorage.upload),
+and large files can be uploaded in resumable chunks (ChunkedUploadManager).
+
+Run with: pytest tests/test_streaming_uploads.py -v
+"""
+
+import hashlib
+import io
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from stores.document_store import DocumentStore
+from tools_v2.document_registry import DocumentRegistry
+from utils.file_hasher import compute_sha256, copy_and_hash
+from web.chunked_uploads import ChunkedUploadManager, UploadError, UploadNotFoundError, UploadOffsetError
+from web.storage import LocalStorage
+
+CONTENT = b"%PDF-1.4 " + bytes(range(256)) * 400
+
+
+class OneShotStream(io.RawIOBase):
+    """Non-seekable stream, like a request body."""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+        self.reads = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        self.reads += 1
+        return self._data.read(size)
+
+
+class FailingStream(OneShotStream):
+    """Drops the connection after `limit` bytes."""
+
+    def __init__(self, data, limit):
+        super().__init__(data)
+        self.limit = limit
+
+    def read(self, size=-1):
+        if self._data.tell() >= self.limit:
+            raise ConnectionError("client disconnected")
+        return super().read(min(size, self.limit - self._data.tell()))
+
+
+@pytest.fixture
+def document_store(tmp_path):
+    return DocumentStore(deal_id="deal-1", base_dir=tmp_path / "documents")
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ChunkedUploadManager(spool_dir=tmp_path / "spool", chunk_size=4096)
+
+
+class TestCopyAndHash:
+
+    def test_hash_matches_file_hash(self, tmp_path):
+        dest = tmp_path / "copy.bin"
+        with open(dest, "wb") as f:
+            file_hash, size = copy_and_hash(OneShotStream(CONTENT), f, chunk_size=1000)
+
+        assert size == len(CONTENT)
+        assert file_hash == compute_sha256(dest) == hashlib.sha256(CONTENT).hexdigest()
+
+    def test_max_bytes(self, tmp_path):
+        with open(tmp_path / "copy.bin", "wb") as f:
+            with pytest.raises(ValueError):
+                copy_and_hash(io.BytesIO(CONTENT), f, max_bytes=100)
+
+
+class TestDocumentStoreStreaming:
+
+    def test_add_document_from_stream(self, document_store):
+        doc = document_store.add_document_from_stream(OneShotStream(CONTENT), "contracts.pdf", "target")
+
+        assert doc.hash_sha256 == hashlib.sha256(CONTENT).hexdigest()
+        assert doc.file_size_bytes == len(CONTENT)
+        assert Path(doc.raw_file_path).read_bytes() == CONTENT
+        assert doc.mime_type == "application/pdf"
+        assert list((document_store.base_dir / DocumentStore.INCOMING_DIR).iterdir()) == []
+
+    def test_duplicate_stream_discards_spool(self, document_store):
+        first = document_store.add_document_from_stream(io.BytesIO(CONTENT), "a.pdf", "target")
+        second = document_store.add_document_from_stream(io.BytesIO(CONTENT), "b.pdf", "target")
+
+        assert second.doc_id == first.doc_id
+        assert list((document_store.base_dir / DocumentStore.INCOMING_DIR).iterdir()) == []
+
+    def test_bytes_path_matches_stream_path(self, document_store):
+        doc = document_store.add_document_from_bytes(CONTENT, "a.pdf", "buyer")
+        assert doc.hash_sha256 == hashlib.sha256(CONTENT).hexdigest()
+        assert doc.entity == "buyer"
+
+
+class TestRegistryStreaming:
+
+    def test_save_and_hash_matches_text_hash(self, tmp_path):
+        # Multi-byte characters split across chunk boundaries, plus invalid bytes
+        raw = ("Überblick – Rechenzentrum 東京 " * 50).encode("utf-8") + b"\xff\xfe tail"
+        registry = DocumentRegistry()
+
+        content_hash, size = registry.save_and_hash(io.BytesIO(raw), str(tmp_path / "doc.md"), chunk_size=7)
+
+        assert size == len(raw)
+        assert content_hash == registry.compute_hash(raw.decode("utf-8", errors="ignore"))
+        assert (tmp_path / "doc.md").read_bytes() == raw
+
+
+class TestLocalStorage:
+
+    def test_upload_is_single_pass(self, tmp_path):
+        storage = LocalStorage(base_path=tmp_path)
+        stream = OneShotStream(CONTENT)
+
+        stored = storage.upload(stream, "deal-1/target/a.pdf", "a.pdf")
+
+        assert stored.hash == hashlib.sha256(CONTENT).hexdigest()
+        assert stored.size == len(CONTENT)
+        assert (tmp_path / "deal-1/target/a.pdf").read_bytes() == CONTENT
+        assert not (tmp_path / "deal-1/target/a.pdf.part").exists()
+
+
+class TestChunkedUploads:
+
+    def _upload(self, manager, data, chunk):
+        upload = manager.start("data_room.pdf", entity="target", deal_id="deal-1", total_size=len(data))
+        for offset in range(0, len(data), chunk):
+            manager.append(upload.upload_id, io.BytesIO(data[offset:offset + chunk]), offset=offset)
+        return upload.upload_id
+
+    def test_complete_registers_document_by_path(self, manager, document_store):
+        upload_id = self._upload(manager, CONTENT, 10000)
+
+        doc = manager.complete(upload_id, document_store, expected_hash=hashlib.sha256(CONTENT).hexdigest())
+
+        assert doc.hash_sha256 == hashlib.sha256(CONTENT).hexdigest()
+        assert Path(doc.raw_file_path).read_bytes() == CONTENT
+        assert list(manager.spool_dir.iterdir()) == []
+        with pytest.raises(UploadNotFoundError):
+            manager.status(upload_id)
+
+    def test_wrong_offset_is_rejected(self, manager):
+        upload = manager.start("a.pdf", entity="target", total_size=len(CONTENT))
+        manager.append(upload.upload_id, io.BytesIO(CONTENT[:100]), offset=0)
+
+        with pytest.raises(UploadOffsetError) as exc:
+            manager.append(upload.upload_id, io.BytesIO(CONTENT[:100]), offset=0)
+
+        assert exc.value.expected == 100
+        assert manager.status(upload.upload_id).received == 100
+
+    def test_resume_after_disconnect_and_restart(self, manager, document_store, tmp_path):
+        upload = manager.start("a.pdf", entity="target", deal_id="deal-1", total_size=len(CONTENT))
+        with pytest.raises(ConnectionError):
+            manager.append(upload.upload_id, FailingStream(CONTENT, limit=30000), offset=0)
+
+        # A new manager (worker restart) has no running hash; it is rebuilt from disk
+        restarted = ChunkedUploadManager(spool_dir=manager.spool_dir, chunk_size=4096)
+        offset = restarted.status(upload.upload_id).received
+        assert 0 < offset <= 30000
+        restarted.append(upload.upload_id, io.BytesIO(CONTENT[offset:]), offset=offset)
+
+        doc = restarted.complete(upload.upload_id, document_store)
+        assert doc.hash_sha256 == hashlib.sha256(CONTENT).hexdigest()
+
+    def test_incomplete_or_oversized_uploads_fail(self, manager, document_store):
+        upload = manager.start("a.pdf", entity="target", total_size=100)
+        manager.append(upload.upload_id, io.BytesIO(b"x" * 50), offset=0)
+
+        with pytest.raises(UploadError):
+            manager.complete(upload.upload_id, document_store)
+        with pytest.raises(UploadError):
+            manager.append(upload.upload_id, io.BytesIO(b"x" * 80), offset=50)
+        assert manager.status(upload.upload_id).received == 50
+
+    def test_hash_mismatch(self, manager, document_store):
+        upload_id = self._upload(manager, CONTENT, 50000)
+        with pytest.raises(UploadError):
+            manager.complete(upload_id, document_store, expected_hash="0" * 64)
+
+    def test_cleanup_stale(self, manager):
+        upload = manager.start("a.pdf", entity="target")
+        assert manager.cleanup_stale(max_age_hours=1) == []
+        assert manager.cleanup_stale(max_age_hours=-1) == [upload.upload_id]
+        assert list(manager.spool_dir.iterdir()) == []
+
+    def test_cleanup_task_removes_stale_uploads(self, manager, monkeypatch):
+        from web.tasks.cleanup_tasks import cleanup_stale_uploads
+
+        manager.start("a.pdf", entity="target")
+        monkeypatch.setattr("web.chunked_uploads.get_upload_manager", lambda: manager)
+        monkeypatch.setattr("web.chunked_uploads.UPLOAD_SPOOL_MAX_AGE_HOURS", -1)
+
+        result = cleanup_stale_uploads()
+
+        assert result['status'] == 'success' and result['uploads_removed'] == 1
+        assert list(manager.spool_dir.iterdir()) == []
+
+
+class TestChunkedUploadRoutes:
+    """Only the user who started an upload can act on it."""
+
+    @pytest.fixture
+    def web_app(self, manager, monkeypatch):
+        import web.app as web_app
+
+        monkeypatch.setattr(web_app, "USE_DATABASE", False)
+        monkeypatch.setattr("web.chunked_uploads.get_upload_manager", lambda: manager)
+        web_app.app.config["TESTING"] = True
+        return web_app
+
+    def _login(self, web_app, monkeypatch, user_id):
+        monkeypatch.setattr(web_app, "current_user", SimpleNamespace(is_authenticated=True, id=user_id))
+
+    def test_other_user_cannot_touch_upload(self, web_app, manager, document_store, monkeypatch):
+        upload = manager.start("a.pdf", entity="target", uploaded_by="user-a", total_size=len(CONTENT))
+        upload_id = upload.upload_id
+        client = web_app.app.test_client()
+
+        self._login(web_app, monkeypatch, "user-b")
+        responses = [
+            client.get(f"/api/uploads/{upload_id}"),
+            client.put(f"/api/uploads/{upload_id}?offset=0", data=CONTENT),
+            client.post(f"/api/uploads/{upload_id}/complete", json={}),
+            client.delete(f"/api/uploads/{upload_id}"),
+        ]
+        assert [r.status_code for r in responses] == [403, 403, 403, 403]
+        assert manager.status(upload_id).received == 0
+
+        self._login(web_app, monkeypatch, "user-a")
+        assert client.put(f"/api/uploads/{upload_id}?offset=0", data=CONTENT).status_code == 200
+        assert client.get(f"/api/uploads/{upload_id}").get_json()["upload"]["received"] == len(CONTENT)
+        assert client.delete(f"/api/uploads/{upload_id}").status_code == 200
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,109 @@
+"""
+Tests for multi-domain validation (ValidationPipeline.validate_domains).
+
+Parallel mode must produce the same results as validating one domain at a
+time, with per-stage timings recorded for every stage that ran.
+
+Run with: pytest tests/test_validation_pipeline_parallel.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.validation_pipeline import ValidationPipeline
+from tools_v2.domain_validator import DomainValidationResult
+
+
+DOCUMENT = (
+    "The company runs SAP ECC 6.0 on-premises in the Dallas data center.\n"
+    "Active Directory is hosted by the parent company.\n"
+    "Network: Cisco Meraki SD-WAN across 12 sites."
+)
+
+FACTS_BY_DOMAIN = {
+    "infrastructure": [
+        {"fact_id": "F-INFRA-001", "category": "hosting",
+         "evidence": {"exact_quote": "SAP ECC 6.0 on-premises in the Dallas data center"}},
+        {"fact_id": "F-INFRA-002", "category": "hosting",
+         "evidence": {"exact_quote": "Mainframe running COBOL batch payroll jobs"}},
+    ],
+    "network": [
+        {"fact_id": "F-NET-001", "category": "wan",
+         "evidence": {"exact_quote": "Cisco Meraki SD-WAN across 12 sites"}},
+    ],
+    "identity_access": [
+        {"fact_id": "F-IAM-001", "category": "directory",
+         "evidence": {"exact_quote": "Active Directory is hosted by the parent company"}},
+    ],
+}
+
+
+def _fake_domain_validation(domain, document_text, facts, gaps):
+    return DomainValidationResult(
+        domain=domain,
+        is_valid=True,
+        completeness_score=0.9,
+        quality_score=0.8,
+        requires_rerun=domain == "network",
+    )
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    pipeline = ValidationPipeline(
+        api_key="test-key",
+        enable_category=False,
+        enable_adversarial=True,
+    )
+    monkeypatch.setattr(pipeline, "_run_domain_validation", _fake_domain_validation)
+    monkeypatch.setattr(
+        pipeline, "_run_adversarial_review",
+        lambda domain, document_text, facts: [{"domain": domain, "finding": "check"}]
+    )
+    return pipeline
+
+
+def _signature(result):
+    return (
+        result.overall_valid, result.overall_confidence, result.requires_rerun,
+        result.rerun_guidance, result.human_review_needed, result.critical_issues,
+        [(flag.severity, flag.message) for flag in result.all_flags],
+        result.evidence_report.results, result.adversarial_findings,
+        sorted(result.layer_times),
+    )
+
+
+class TestValidateDomains:
+
+    def test_parallel_matches_sequential(self, pipeline):
+        sequential = pipeline.validate_domains(DOCUMENT, FACTS_BY_DOMAIN, parallel=False)
+        parallel = pipeline.validate_domains(DOCUMENT, FACTS_BY_DOMAIN, parallel=True, max_workers=2)
+
+        assert list(parallel) == list(FACTS_BY_DOMAIN)
+        for domain in FACTS_BY_DOMAIN:
+            assert _signature(parallel[domain]) == _signature(sequential[domain])
+
+    def test_stage_timings_recorded(self, pipeline):
+        results = pipeline.validate_domains(
+            DOCUMENT, FACTS_BY_DOMAIN, run_cross_domain=True, max_workers=2
+        )
+
+        infra = results["infrastructure"]
+        assert set(infra.layer_times) == {"evidence", "domain", "adversarial", "cross_domain"}
+        assert infra.to_dict()["layer_times"] == infra.layer_times
+        assert infra.total_time_ms >= max(infra.layer_times.values())
+
+    def test_speculative_adversarial_review_is_dropped_when_skipped(self, pipeline):
+        results = pipeline.validate_domains(DOCUMENT, FACTS_BY_DOMAIN, max_workers=2)
+
+        # Domain validation asks network for a rerun, so adversarial review is skipped
+        assert results["network"].adversarial_findings == []
+        assert "adversarial" not in results["network"].layer_times
+        assert results["identity_access"].adversarial_findings == [
+            {"domain": "identity_access", "finding": "check"}
+        ]
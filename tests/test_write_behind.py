@@ -0,0 +1,227 @@
+"""
+Tests for the write-behind mode of DualWriteFactStore.
+
+FactWriteBehind is exercised with an in-test batch writer; the store's
+multi-row upserts run against a SQLite database behind a minimal Flask app.
+
+Run with: pytest tests/test_write_behind.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from stores.dual_write_store import DualWriteFactStore, FactWriteBehind
+from web.database import db, Fact as DBFact
+
+
+class RecordingWriter:
+    """Batch writer that records batches and can be held to let the queue fill."""
+
+    def __init__(self, fail=()):
+        self.batches = []
+        self.fail = set(fail)
+        self.release = threading.Event()
+        self.release.set()
+        self.started = threading.Event()
+
+    def __call__(self, fact_ids):
+        self.started.set()
+        self.release.wait(5)
+        self.batches.append(list(fact_ids))
+        return {fid: "boom" for fid in fact_ids if fid in self.fail}
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'facts.db'}"
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def store(app):
+    store = DualWriteFactStore(deal_id="deal-1", enable_dual_write=True, write_behind=True, app=app)
+    yield store
+    store.close()
+
+
+def _add(store, item, **kwargs):
+    return store.add_fact(domain="infrastructure", category="compute", item=item,
+                          details={"platform": "VMware"}, status="documented",
+                          evidence={"exact_quote": f"{item} is in use"}, **kwargs)
+
+
+def _db_rows(app):
+    with app.app_context():
+        return {f.id: f for f in DBFact.query.all()}
+
+
+class TestFactWriteBehind:
+
+    def test_batches_and_coalesces_while_writer_is_busy(self):
+        writer = RecordingWriter()
+        writer.release.clear()
+        queue = FactWriteBehind(writer, max_pending=100, batch_size=10).start()
+
+        queue.enqueue("F-1")
+        assert writer.started.wait(5)  # F-1 is being written; the rest queue up
+        for i in range(2, 8):
+            queue.enqueue(f"F-{i}")
+        queue.enqueue("F-3")
+        time.sleep(0.02)
+        writer.release.set()
+        queue.stop()
+
+        assert writer.batches == [["F-1"], ["F-2", "F-3", "F-4", "F-5", "F-6", "F-7"]]
+        metrics = queue.metrics()
+        assert metrics['coalesced'] == 1
+        assert metrics['max_batch_size'] == 6
+        assert metrics['facts_written'] == 7
+        assert metrics['max_lag_seconds'] >= metrics['avg_lag_seconds'] > 0
+
+    def test_backpressure_falls_back_to_inline_write(self):
+        writer = RecordingWriter()
+        writer.release.clear()
+        queue = FactWriteBehind(writer, max_pending=1, batch_size=10, enqueue_timeout=0.05).start()
+
+        queue.enqueue("F-1")
+        assert writer.started.wait(5)
+        queue.enqueue("F-2")  # Fills the queue
+        inline = threading.Thread(target=queue.enqueue, args=("F-3",))
+        inline.start()
+        inline.join(0.5)
+        assert inline.is_alive()  # Blocked behind the busy writer, then written inline
+        writer.release.set()
+        inline.join(5)
+        queue.stop()
+
+        assert sorted(fid for batch in writer.batches for fid in batch) == ["F-1", "F-2", "F-3"]
+        metrics = queue.metrics()
+        assert metrics['backpressure_waits'] == 1
+        assert metrics['inline_writes'] == 1
+
+    def test_failures_reported_and_not_counted_as_written(self):
+        failures = {}
+        queue = FactWriteBehind(RecordingWriter(fail={"F-2"}), on_failed=failures.update).start()
+        for fid in ("F-1", "F-2"):
+            queue.enqueue(fid)
+        queue.flush()
+
+        assert failures == {"F-2": "boom"}
+        assert queue.metrics()['facts_failed'] == 1
+        queue.stop()
+
+
+class TestWriteBehindStore:
+
+    def test_sync_flushes_queue_into_database(self, app, store):
+        ids = [_add(store, f"Server {i}") for i in range(5)]
+
+        stats = store.sync_to_db()
+
+        assert stats['total'] == 5 and stats['errors'] == 0
+        rows = _db_rows(app)
+        assert set(rows) == set(ids)
+        assert rows[ids[0]].source_quote == "Server 0 is in use"
+        assert store.synced_fact_count == 5
+        assert store.get_write_metrics()['pending'] == 0
+
+    def test_updates_are_upserted(self, app, store):
+        fact_id = _add(store, "Oracle DB")
+        store.flush_writes()
+
+        store.update_fact(fact_id, status="partial")
+        store.verify_fact(fact_id, verified_by="analyst")
+        store.flush_writes()
+
+        row = _db_rows(app)[fact_id]
+        assert row.status == "partial"
+        assert row.verified is True
+        assert row.updated_at is not None
+
+    def test_failed_writes_are_retried(self, app, store, monkeypatch):
+        good = _add(store, "Firewall")
+        store.flush_writes()
+
+        original = DualWriteFactStore._execute_upsert
+
+        def fail_for_switch(db_, model, records):
+            if any(r['item'] == "Core switch" for r in records):
+                raise RuntimeError("connection reset")
+            original(db_, model, records)
+
+        monkeypatch.setattr(DualWriteFactStore, "_execute_upsert", staticmethod(fail_for_switch))
+        bad = _add(store, "Core switch")
+        store.update_fact(good, status="gap")
+        store.flush_writes()
+
+        errors = store.get_write_errors()
+        assert [e['fact_id'] for e in errors] == [bad]
+        assert _db_rows(app)[good].status == "gap"  # Other facts still written
+
+        assert store.retry_write_errors() == {'retried': 1, 'succeeded': 0, 'failed': 1}
+        assert store.get_write_errors()[0]['attempts'] == 2
+
+        monkeypatch.setattr(DualWriteFactStore, "_execute_upsert", staticmethod(original))
+        assert store.retry_write_errors() == {'retried': 1, 'succeeded': 1, 'failed': 0}
+        assert store.get_write_errors() == []
+        assert bad in _db_rows(app)
+
+    def test_synchronous_retries_keep_one_error_entry(self, app, monkeypatch):
+        store = DualWriteFactStore(deal_id="deal-1", enable_dual_write=True, write_behind=False, app=app)
+
+        def fail_commit():
+            raise RuntimeError("connection reset")
+
+        with app.app_context():
+            monkeypatch.setattr(db.session, "commit", fail_commit)
+            fact_id = _add(store, "Exchange server")
+            assert store.retry_write_errors() == {'retried': 1, 'succeeded': 0, 'failed': 1}
+
+            errors = store.get_write_errors()
+            assert [(e['fact_id'], e['attempts']) for e in errors] == [(fact_id, 2)]
+
+            monkeypatch.undo()
+            assert store.retry_write_errors() == {'retried': 1, 'succeeded': 1, 'failed': 0}
+            assert store.get_write_errors() == []
+        assert fact_id in _db_rows(app)
+
+    def test_without_app_uses_module_level_web_app(self, app, monkeypatch):
+        # web.app exposes a module-level app and no create_app factory
+        monkeypatch.setitem(sys.modules, "web.app", SimpleNamespace(app=app))
+        store = DualWriteFactStore(deal_id="deal-1", enable_dual_write=True, write_behind=False)
+        try:
+            fact_id = _add(store, "Citrix farm")
+            store.update_fact(fact_id, status="partial")
+            store.flush_writes()
+
+            queued = DualWriteFactStore(deal_id="deal-1", enable_dual_write=True, write_behind=True)
+            queued_id = _add(queued, "NetApp filer")
+            queued.flush_writes()
+            queued.close()
+        finally:
+            store.close()
+
+        rows = _db_rows(app)
+        assert fact_id in rows and queued_id in rows
+        assert store.get_write_errors() == queued.get_write_errors() == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,358 @@
+"""
+Activity Catalog - Precompiled Index Over All Activity Templates
+
+The phase template modules (activity_templates_v2, phase2-phase9) define
+activities as nested category -> workstream -> [activity] dicts. Lookups
+used to rebuild those nested dicts and walk every activity on each call.
+
+This module compiles all phases once, at first use, into a single
+immutable catalog shared by every template module:
+- id -> activity (globally and per source phase)
+- activity phase -> activities
+- (category, workstream) and workstream -> activities
+- activity_type and TSA indexes
+- keyword index over activity names/descriptions
+
+Activity dicts are the template dicts themselves (not copies), so lookups
+return the same objects the nested templates hold. Index containers are
+read-only (tuples / MappingProxyType).
+
+Optionally, a compiled catalog can be written to a pickle snapshot and
+loaded by other workers (see save_catalog_snapshot / load_catalog_snapshot,
+or set ACTIVITY_CATALOG_SNAPSHOT). Snapshots carry a fingerprint of the
+template sources and are ignored when the templates have changed.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import re
+import threading
+from collections import defaultdict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Template modules compiled into the catalog, used for the snapshot fingerprint
+TEMPLATE_MODULES = [
+    "activity_templates_v2.py",
+    "activity_templates_phase2.py",
+    "activity_templates_phase3.py",
+    "activity_templates_phase4.py",
+    "activity_templates_phase5.py",
+    "activity_templates_phase6.py",
+    "activity_templates_phase8.py",
+    "activity_templates_phase9.py",
+]
+
+SNAPSHOT_VERSION = 1
+
+# Words too common in activity text to be useful as keywords
+_STOPWORDS = frozenset({
+    "a", "an", "and", "as", "at", "by", "for", "from", "in", "into", "of",
+    "on", "or", "the", "to", "with", "all", "any", "etc",
+})
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase keyword tokens (stopwords removed)."""
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in _STOPWORDS]
+
+
+class ActivityLocation(NamedTuple):
+    """Where an activity lives in the template hierarchy."""
+    source_phase: str   # e.g. "phase1_foundation"
+    category: str       # e.g. "parent_dependency"
+    workstream: str     # e.g. "identity"
+
+
+class ActivityCatalog:
+    """
+    Immutable, indexed view over every activity template.
+
+    Build once with ActivityCatalog.from_templates() (or use the shared
+    get_activity_catalog()); all lookups are dict/tuple reads afterwards.
+    """
+
+    def __init__(self, records: Iterable[Tuple[str, str, str, Dict]]):
+        """
+        Args:
+            records: (source_phase, category, workstream, activity) tuples
+                in template order. First occurrence wins for duplicate IDs.
+        """
+        self._records: Tuple[Tuple[ActivityLocation, Dict], ...] = tuple(
+            (ActivityLocation(source, category, workstream), activity)
+            for source, category, workstream, activity in records
+        )
+
+        by_id: Dict[str, Dict] = {}
+        by_source_id: Dict[Tuple[str, str], Dict] = {}
+        location_of: Dict[str, ActivityLocation] = {}
+        by_phase: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        by_category_workstream: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        by_workstream: Dict[str, List[int]] = defaultdict(list)
+        by_type: Dict[str, List[int]] = defaultdict(list)
+        keywords: Dict[str, set] = defaultdict(set)
+        tsa: List[int] = []
+        counts: Dict[str, int] = defaultdict(int)
+
+        for idx, (loc, activity) in enumerate(self._records):
+            activity_id = activity.get("id")
+            if activity_id is not None:
+                by_id.setdefault(activity_id, activity)
+                by_source_id.setdefault((loc.source_phase, activity_id), activity)
+                location_of.setdefault(activity_id, loc)
+
+            by_phase[(loc.source_phase, activity.get("phase"))].append(idx)
+            by_phase[("", activity.get("phase"))].append(idx)
+            by_category_workstream[(loc.category, loc.workstream)].append(idx)
+            by_workstream[loc.workstream].append(idx)
+            by_type[activity.get("activity_type")].append(idx)
+            if activity.get("requires_tsa"):
+                tsa.append(idx)
+            counts[loc.source_phase] += 1
+
+            for token in tokenize(f"{activity.get('name', '')} {activity.get('description', '')}"):
+                keywords[token].add(idx)
+
+        def freeze(index: Dict[Any, List[int]]) -> Mapping[Any, Tuple[int, ...]]:
+            return MappingProxyType({k: tuple(v) for k, v in index.items()})
+
+        self._by_id = MappingProxyType(by_id)
+        self._by_source_id = MappingProxyType(by_source_id)
+        self._location_of = MappingProxyType(location_of)
+        self._by_phase = freeze(by_phase)
+        self._by_category_workstream = freeze(by_category_workstream)
+        self._by_workstream = freeze(by_workstream)
+        self._by_type = freeze(by_type)
+        self._keywords = MappingProxyType({k: frozenset(v) for k, v in keywords.items()})
+        self._tsa = tuple(tsa)
+        self._counts = MappingProxyType(dict(counts))
+
+    # -------------------------------------------------------------------------
+    # Construction
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_templates(cls, all_templates: Optional[Dict[str, Dict]] = None) -> "ActivityCatalog":
+        """
+        Compile a catalog from phase -> category -> workstream -> activities.
+
+        Args:
+            all_templates: Defaults to activity_templates_phase10.get_all_templates()
+        """
+        if all_templates is None:
+            # Imported lazily: the template modules themselves use this catalog
+            from tools_v2.activity_templates_phase10 import get_all_templates
+            all_templates = get_all_templates()
+
+        records = []
+        for source_phase, phase_templates in all_templates.items():
+            for category, workstreams in phase_templates.items():
+                for workstream, activities in workstreams.items():
+                    for activity in activities:
+                        records.append((source_phase, category, workstream, activity))
+        return cls(records)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Indexes are rebuilt on load; only the ordered records are stored
+        return {
+            "records": [(loc.source_phase, loc.category, loc.workstream, activity)
+                        for loc, activity in self._records]
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state["records"])
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, activity_id: str, source_phase: Optional[str] = None) -> Optional[Dict]:
+        """Look up an activity by ID, optionally restricted to one source phase."""
+        if source_phase is None:
+            return self._by_id.get(activity_id)
+        return self._by_source_id.get((source_phase, activity_id))
+
+    def location(self, activity_id: str) -> Optional[ActivityLocation]:
+        """Get the (source_phase, category, workstream) of an activity."""
+        return self._location_of.get(activity_id)
+
+    def activities_for_phase(self, phase: str, source_phase: Optional[str] = None) -> List[Dict]:
+        """
+        Get activities whose "phase" field matches (assessment, build, ...).
+
+        Returns copies annotated with "workstream" and "category".
+        """
+        return [
+            {**activity, "workstream": loc.workstream, "category": loc.category}
+            for loc, activity in self._select(self._by_phase.get((source_phase or "", phase), ()))
+        ]
+
+    def activities_for(self, category: str, workstream: str) -> List[Dict]:
+        """Get template activities for a category/workstream pair."""
+        return [activity for _, activity in
+                self._select(self._by_category_workstream.get((category, workstream), ()))]
+
+    def entries(self, indices: Optional[Iterable[int]] = None) -> List[Dict]:
+        """
+        Flat copies of activities with _source_phase/_source_category/_source_workstream.
+
+        Args:
+            indices: Optional record indices; defaults to every activity in order
+        """
+        selected = self._records if indices is None else self._select(indices)
+        return [
+            {
+                **activity,
+                "_source_phase": loc.source_phase,
+                "_source_category": loc.category,
+                "_source_workstream": loc.workstream,
+            }
+            for loc, activity in selected
+        ]
+
+    def entries_by_workstream(self, workstream: str) -> List[Dict]:
+        """Flat catalog entries for one workstream."""
+        return self.entries(self._by_workstream.get(workstream, ()))
+
+    def entries_by_type(self, activity_type: str) -> List[Dict]:
+        """Flat catalog entries for one activity_type."""
+        return self.entries(self._by_type.get(activity_type, ()))
+
+    def tsa_entries(self) -> List[Dict]:
+        """Flat catalog entries for activities that require a TSA."""
+        return self.entries(self._tsa)
+
+    def counts_by_source(self) -> Dict[str, int]:
+        """Activity counts per source phase."""
+        return dict(self._counts)
+
+    def search(self, text: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Keyword search over activity names and descriptions.
+
+        Activities are ranked by the number of query tokens they contain,
+        then by template order.
+        """
+        hits: Dict[int, int] = defaultdict(int)
+        for token in set(tokenize(text)):
+            for idx in self._keywords.get(token, ()):
+                hits[idx] += 1
+
+        ranked = sorted(hits, key=lambda idx: (-hits[idx], idx))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return self.entries(ranked)
+
+    def _select(self, indices: Iterable[int]) -> List[Tuple[ActivityLocation, Dict]]:
+        return [self._records[idx] for idx in indices]
+
+
+# =============================================================================
+# SNAPSHOTS
+# =============================================================================
+
+def template_fingerprint() -> str:
+    """Hash of the template module sources, used to validate snapshots."""
+    digest = hashlib.sha256()
+    base = Path(__file__).parent
+    for name in TEMPLATE_MODULES:
+        path = base / name
+        digest.update(name.encode())
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def save_catalog_snapshot(path: str, catalog: Optional["ActivityCatalog"] = None) -> str:
+    """
+    Write a compiled catalog to a pickle snapshot.
+
+    Returns:
+        The fingerprint stored with the snapshot
+    """
+    catalog = catalog or get_activity_catalog()
+    fingerprint = template_fingerprint()
+    payload = {"version": SNAPSHOT_VERSION, "fingerprint": fingerprint, "catalog": catalog}
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    logger.info(f"Saved activity catalog snapshot ({len(catalog)} activities) to {path}")
+    return fingerprint
+
+
+def load_catalog_snapshot(path: str) -> Optional[ActivityCatalog]:
+    """
+    Load a catalog snapshot if it exists and matches the current templates.
+
+    Returns:
+        The catalog, or None if missing, unreadable or stale
+    """
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+        logger.warning(f"Could not read activity catalog snapshot {path}: {e}")
+        return None
+
+    if payload.get("version") != SNAPSHOT_VERSION or payload.get("fingerprint") != template_fingerprint():
+        logger.info(f"Ignoring stale activity catalog snapshot {path}")
+        return None
+    return payload["catalog"]
+
+
+# =============================================================================
+# SHARED INSTANCE
+# =============================================================================
+
+_catalog: Optional[ActivityCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_activity_catalog() -> ActivityCatalog:
+    """Get the shared catalog, compiling it (or loading a snapshot) on first use."""
+    global _catalog
+    if _catalog is not None:
+        return _catalog
+
+    with _catalog_lock:
+        if _catalog is None:
+            snapshot_path = os.getenv("ACTIVITY_CATALOG_SNAPSHOT", "")
+            catalog = load_catalog_snapshot(snapshot_path) if snapshot_path else None
+            if catalog is None:
+                catalog = ActivityCatalog.from_templates()
+            _catalog = catalog
+            logger.debug(f"Activity catalog ready: {len(catalog)} activities")
+    return _catalog
+
+
+def reset_activity_catalog():
+    """Drop the shared catalog so it is rebuilt on next use (tests, template edits)."""
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
+
+
+__all__ = [
+    'ActivityCatalog',
+    'ActivityLocation',
+    'get_activity_catalog',
+    'reset_activity_catalog',
+    'save_catalog_snapshot',
+    'load_catalog_snapshot',
+    'template_fingerprint',
+    'tokenize',
+]
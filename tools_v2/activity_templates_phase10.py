@@ -47,6 +47,7 @@ from tools_v2.activity_templates_phase9 import (
     get_phase9_templates,
     calculate_phase9_activity_cost,
 )
+from tools_v2.activity_catalog import get_activity_catalog
 
 
 # =============================================================================
@@ -82,19 +83,16 @@ def get_activity_by_id(activity_id: str) -> Optional[Dict]:
     Returns:
         Activity dict or None if not found
     """
-    all_templates = get_all_templates()
+    catalog = get_activity_catalog()
+    activity = catalog.get(activity_id)
+    if activity is None:
+        return None
 
-    for phase_name, phase_templates in all_templates.items():
-        for category, workstreams in phase_templates.items():
-            for workstream, activities in workstreams.items():
-                for activity in activities:
-                    if activity.get("id") == activity_id:
-                        activity["_source_phase"] = phase_name
-                        activity["_source_category"] = category
-                        activity["_source_workstream"] = workstream
-                        return activity
-
-    return None
+    location = catalog.location(activity_id)
+    activity["_source_phase"] = location.source_phase
+    activity["_source_category"] = location.category
+    activity["_source_workstream"] = location.workstream
+    return activity
 
 
 def get_unified_activity_catalog() -> List[Dict]:
@@ -104,35 +102,13 @@ def get_unified_activity_catalog() -> List[Dict]:
     Returns:
         List of all activities with source metadata
     """
-    catalog = []
-    all_templates = get_all_templates()
-
-    for phase_name, phase_templates in all_templates.items():
-        for category, workstreams in phase_templates.items():
-            for workstream, activities in workstreams.items():
-                for activity in activities:
-                    entry = activity.copy()
-                    entry["_source_phase"] = phase_name
-                    entry["_source_category"] = category
-                    entry["_source_workstream"] = workstream
-                    catalog.append(entry)
-
-    return catalog
+    return get_activity_catalog().entries()
 
 
 def get_activity_count_by_phase() -> Dict[str, int]:
     """Get activity counts by phase."""
-    counts = {}
-    all_templates = get_all_templates()
-
-    for phase_name, phase_templates in all_templates.items():
-        count = 0
-        for category, workstreams in phase_templates.items():
-            for workstream, activities in workstreams.items():
-                count += len(activities)
-        counts[phase_name] = count
-
-    return counts
+    counts = get_activity_catalog().counts_by_source()
+    return {phase_name: counts.get(phase_name, 0) for phase_name in get_all_templates()}
 
 
 # =============================================================================
@@ -458,20 +434,17 @@ def analyze_activity_coverage() -> Dict[str, Any]:
 
 def get_activities_by_type(activity_type: str) -> List[Dict]:
     """Get all activities of a specific type."""
-    catalog = get_unified_activity_catalog()
-    return [a for a in catalog if a.get("activity_type") == activity_type]
+    return get_activity_catalog().entries_by_type(activity_type)
 
 
 def get_tsa_activities() -> List[Dict]:
     """Get all activities that require TSA."""
-    catalog = get_unified_activity_catalog()
-    return [a for a in catalog if a.get("requires_tsa")]
+    return get_activity_catalog().tsa_entries()
 
 
 def get_activities_by_workstream(workstream: str) -> List[Dict]:
     """Get all activities in a specific workstream."""
-    catalog = get_unified_activity_catalog()
-    return [a for a in catalog if a.get("_source_workstream") == workstream]
+    return get_activity_catalog().entries_by_workstream(workstream)
 
 
 # =============================================================================
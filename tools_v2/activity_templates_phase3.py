@@ -1400,15 +1400,8 @@ def get_phase3_templates() -> Dict[str, Dict[str, List[Dict]]]:
 
 def get_phase3_activity_by_id(activity_id: str) -> Dict:
     """Look up a Phase 3 activity by its ID."""
-    all_templates = get_phase3_templates()
-
-    for category, workstreams in all_templates.items():
-        for workstream, activities in workstreams.items():
-            for activity in activities:
-                if activity.get("id") == activity_id:
-                    return activity
-
-    return None
+    from tools_v2.activity_catalog import get_activity_catalog
+    return get_activity_catalog().get(activity_id, source_phase="phase3_infrastructure")
 
 
 def calculate_phase3_activity_cost(
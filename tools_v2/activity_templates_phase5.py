@@ -833,15 +833,8 @@ def get_phase5_templates() -> Dict[str, Dict[str, List[Dict]]]:
 
 def get_phase5_activity_by_id(activity_id: str) -> Dict:
     """Look up a Phase 5 activity by its ID."""
-    all_templates = get_phase5_templates()
-
-    for category, workstreams in all_templates.items():
-        for workstream, activities in workstreams.items():
-            for activity in activities:
-                if activity.get("id") == activity_id:
-                    return activity
-
-    return None
+    from tools_v2.activity_catalog import get_activity_catalog
+    return get_activity_catalog().get(activity_id, source_phase="phase5_security")
 
 
 def calculate_phase5_activity_cost(
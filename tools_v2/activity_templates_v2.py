@@ -1021,29 +1021,14 @@ def get_phase1_templates() -> Dict[str, Dict[str, List[Dict]]]:
 
 def get_activity_by_id(activity_id: str) -> Dict:
     """Look up an activity by its ID."""
-    all_templates = get_phase1_templates()
-
-    for category, workstreams in all_templates.items():
-        for workstream, activities in workstreams.items():
-            for activity in activities:
-                if activity.get("id") == activity_id:
-                    return activity
-
-    return None
+    from tools_v2.activity_catalog import get_activity_catalog
+    return get_activity_catalog().get(activity_id, source_phase="phase1_foundation")
 
 
 def get_activities_by_phase(phase: str) -> List[Dict]:
     """Get all activities for a given phase."""
-    activities = []
-    all_templates = get_phase1_templates()
-
-    for category, workstreams in all_templates.items():
-        for workstream, acts in workstreams.items():
-            for activity in acts:
-                if activity.get("phase") == phase:
-                    activities.append({**activity, "workstream": workstream, "category": category})
-
-    return activities
+    from tools_v2.activity_catalog import get_activity_catalog
+    return get_activity_catalog().activities_for_phase(phase, source_phase="phase1_foundation")
 
 
 def calculate_activity_cost(
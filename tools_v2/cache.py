@@ -2,159 +2,450 @@
 Simple caching utility for expensive operations.
 
 Uses input hash to cache results and avoid recomputation.
+
+SimpleCache is a lock-protected LRU (OrderedDict, O(1) get/set) with an
+entry limit, an optional byte budget and TTL, hit/miss/eviction stats and a
+pluggable key function. An optional Redis tier lets several workers share
+cached results: local misses fall through to Redis, and sets write to both.
+
+cached_coverage / cached_synthesis memoize analyzer methods. Their keys
+come from a per-kind key function (see set_key_function); by default that
+is the analyzer's own cache_key(), a content fingerprint maintained
+incrementally, so building a key never serializes the whole FactStore.
 """
 
+import base64
 import hashlib
 import json
-from typing import Any, Callable, Optional
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
 from functools import wraps
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.environ.get('ANALYSIS_CACHE_MAX_ENTRIES', '50'))
+ANALYSIS_CACHE_MAX_BYTES = int(os.environ.get('ANALYSIS_CACHE_MAX_BYTES', '0'))  # 0 = no byte budget
+ANALYSIS_CACHE_TTL_SECONDS = float(os.environ.get('ANALYSIS_CACHE_TTL_SECONDS', '0'))  # 0 = no expiry
+ANALYSIS_CACHE_REDIS_URL = os.environ.get('ANALYSIS_CACHE_REDIS_URL', '')  # empty = no shared tier
+# Expiry for shared entries when ANALYSIS_CACHE_TTL_SECONDS is 0, so keys from
+# old deals and old releases do not pile up in Redis (0 = no expiry)
+ANALYSIS_CACHE_REDIS_TTL_SECONDS = float(os.environ.get('ANALYSIS_CACHE_REDIS_TTL_SECONDS', '86400'))
+
+# Bump when the pickled result classes change shape; old entries are then ignored
+CACHE_SCHEMA_VERSION = 1
+
+_MISSING = object()
+
+
+def json_hash_key(*args, **kwargs) -> Optional[str]:
+    """Default key function: SHA-256 of the JSON-serialized arguments."""
+    try:
+        key_data = {
+            "args": args,
+            "kwargs": kwargs
+        }
+        key_str = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha256(key_str.encode()).hexdigest()
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Could not create cache key: {e}")
+        return None
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate size of a cached value in bytes (pickled length)."""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+# =============================================================================
+# SHARED TIER (REDIS)
+# =============================================================================
+
+class RedisCacheTier:
+    """
+    Redis-backed second tier shared by all workers.
+
+    Values are pickled, so only point this at a Redis instance the
+    application trusts. Redis errors and payloads that no longer unpickle
+    are logged and treated as misses; the local tier keeps working when
+    Redis is down. Keys carry CACHE_SCHEMA_VERSION so a deploy that changes
+    the cached classes never reads the previous release's entries.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        url: Optional[str] = None,
+        prefix: str = 'analysis-cache',
+        ttl_seconds: Optional[float] = None
+    ):
+        self._client = client
+        self.url = url
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self.errors = 0
+
+    def _redis(self):
+        if self._client is None:
+            import redis
+            self._client = redis.from_url(self.url)
+        return self._client
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:v{CACHE_SCHEMA_VERSION}:{key}"
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or _MISSING."""
+        try:
+            payload = self._redis().get(self._key(key))
+        except Exception as e:
+            self.errors += 1
+            logger.debug(f"Shared cache get failed: {e}")
+            return _MISSING
+        if payload is None:
+            return _MISSING
+        try:
+            if isinstance(payload, str):  # clients created with decode_responses=True
+                payload = payload.encode('ascii')
+            return pickle.loads(base64.b64decode(payload))
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Discarding unreadable shared cache entry {self._key(key)}: {e}")
+            self.delete(key)
+            return _MISSING
+
+    def set(self, key: str, value: Any) -> None:
+        payload = base64.b64encode(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        try:
+            if self.ttl_seconds:
+                self._redis().set(self._key(key), payload, px=int(self.ttl_seconds * 1000))
+            else:
+                self._redis().set(self._key(key), payload)
+        except Exception as e:
+            self.errors += 1
+            logger.debug(f"Shared cache set failed: {e}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self._redis().delete(self._key(key))
+        except Exception as e:
+            self.errors += 1
+            logger.debug(f"Shared cache delete failed: {e}")
+
+    def clear(self) -> None:
+        try:
+            client = self._redis()
+            keys = list(client.scan_iter(match=f"{self.prefix}:*", count=500))
+            if keys:
+                client.delete(*keys)
+        except Exception as e:
+            self.errors += 1
+            logger.debug(f"Shared cache clear failed: {e}")
+
+
+# =============================================================================
+# LOCAL LRU
+# =============================================================================
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: Optional[float]
+
+
 class SimpleCache:
     """
-    Simple in-memory cache with hash-based keys.
-    
-    Thread-safe for read operations, but not for concurrent writes.
-    For this use case (coverage/synthesis), that's acceptable since
-    these operations are typically sequential.
+    Thread-safe in-memory LRU cache with hash-based keys.
+
+    Eviction removes least recently used entries until both the entry limit
+    and the byte budget (if any) are met. Entries older than ttl_seconds are
+    dropped on access.
     """
-    
-    def __init__(self, max_size: int = 100):
+
+    def __init__(
+        self,
+        max_size: int = 100,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        key_fn: Callable[..., Optional[str]] = json_hash_key,
+        sizeof: Callable[[Any], int] = estimate_size,
+        shared: Optional[RedisCacheTier] = None,
+        name: str = 'cache'
+    ):
         """
         Initialize cache.
-        
+
         Args:
             max_size: Maximum number of entries (LRU eviction)
+            max_bytes: Byte budget across entries, measured with sizeof (None = unlimited)
+            ttl_seconds: Entry lifetime (None = no expiry)
+            key_fn: Maps get/set arguments to a string key (None result = uncacheable)
+            sizeof: Size estimate for the byte budget
+            shared: Optional shared tier consulted on local misses
+            name: Name reported in stats
         """
-        self._cache: dict = {}
-        self._access_order: list = []  # For LRU
+        self._cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
         self.max_size = max_size
-    
-    def _make_key(self, *args, **kwargs) -> str:
+        self.max_bytes = max_bytes or None
+        self.ttl_seconds = ttl_seconds or None
+        self.key_fn = key_fn
+        self.sizeof = sizeof
+        self.shared = shared
+        self.name = name
+
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _make_key(self, *args, **kwargs) -> Optional[str]:
         """Create cache key from arguments."""
-        # Serialize to JSON for hashing
-        try:
-            key_data = {
-                "args": args,
-                "kwargs": kwargs
-            }
-            key_str = json.dumps(key_data, sort_keys=True, default=str)
-            return hashlib.sha256(key_str.encode()).hexdigest()
-        except (TypeError, ValueError) as e:
-            logger.warning(f"Could not create cache key: {e}")
-            return None
-    
+        return self.key_fn(*args, **kwargs)
+
     def get(self, *args, **kwargs) -> Optional[Any]:
         """Get cached value if exists."""
         key = self._make_key(*args, **kwargs)
         if key is None:
             return None
-        
-        if key in self._cache:
-            # Update access order (move to end)
-            if key in self._access_order:
-                self._access_order.remove(key)
-            self._access_order.append(key)
-            return self._cache[key]
-        
-        return None
-    
+        value = self.get_by_key(key)
+        return None if value is _MISSING else value
+
     def set(self, value: Any, *args, **kwargs):
         """Set cached value."""
         key = self._make_key(*args, **kwargs)
         if key is None:
             return
-        
-        # Evict oldest if at capacity
-        if len(self._cache) >= self.max_size and self._access_order:
-            oldest_key = self._access_order.pop(0)
-            del self._cache[oldest_key]
-        
-        self._cache[key] = value
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
-    
+        self.set_by_key(key, value)
+
+    def delete(self, *args, **kwargs) -> None:
+        """Remove the entry for these arguments, locally and from the shared tier."""
+        key = self._make_key(*args, **kwargs)
+        if key is None:
+            return
+        with self._lock:
+            self._remove(key)
+        if self.shared:
+            self.shared.delete(key)
+
+    def get_by_key(self, key: str) -> Any:
+        """Look up a precomputed key; returns _MISSING on a miss."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return entry.value
+
+        if self.shared:
+            value = self.shared.get(key)
+            if value is not _MISSING:
+                with self._lock:
+                    self.shared_hits += 1
+                    self._store(key, value)
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return _MISSING
+
+    def set_by_key(self, key: str, value: Any) -> None:
+        """Store a value under a precomputed key."""
+        with self._lock:
+            self._store(key, value)
+        if self.shared:
+            self.shared.set(key, value)
+
+    def _store(self, key: str, value: Any) -> None:
+        size = self.sizeof(value) if self.max_bytes else 0
+        self._remove(key)
+        if self.max_bytes and size > self.max_bytes:
+            return  # Larger than the whole budget: never cached locally
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        self._cache[key] = _Entry(value=value, size=size, expires_at=expires_at)
+        self._bytes += size
+
+        # Evict least recently used entries until within limits
+        while len(self._cache) > self.max_size or (self.max_bytes and self._bytes > self.max_bytes):
+            _, evicted = self._cache.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry; returns how many were dropped."""
+        if not self.ttl_seconds:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, e in self._cache.items() if e.expires_at is not None and e.expires_at <= now]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+            return len(expired)
+
     def clear(self):
-        """Clear all cached entries."""
-        self._cache.clear()
-        self._access_order.clear()
-    
+        """Clear all cached entries (and the shared tier, if any)."""
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+        if self.shared:
+            self.shared.clear()
+
     def stats(self) -> dict:
         """Get cache statistics."""
-        return {
-            "size": len(self._cache),
-            "max_size": self.max_size,
-            "hit_rate": "N/A"  # Would need to track hits/misses
-        }
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round((self.hits + self.shared_hits) / lookups, 3) if lookups else "N/A",
+                "shared_errors": self.shared.errors if self.shared else 0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._cache
+
+
+# =============================================================================
+# ANALYZER CACHES
+# =============================================================================
+
+def _analysis_cache(name: str) -> SimpleCache:
+    shared = None
+    if ANALYSIS_CACHE_REDIS_URL:
+        shared = RedisCacheTier(url=ANALYSIS_CACHE_REDIS_URL, prefix=f"analysis-cache:{name}",
+                                ttl_seconds=ANALYSIS_CACHE_TTL_SECONDS or ANALYSIS_CACHE_REDIS_TTL_SECONDS or None)
+    return SimpleCache(
+        max_size=ANALYSIS_CACHE_MAX_ENTRIES,
+        max_bytes=ANALYSIS_CACHE_MAX_BYTES,
+        ttl_seconds=ANALYSIS_CACHE_TTL_SECONDS,
+        shared=shared,
+        name=name,
+    )
 
 
 # Global cache instances
-_coverage_cache = SimpleCache(max_size=50)
-_synthesis_cache = SimpleCache(max_size=50)
+_coverage_cache = _analysis_cache('coverage')
+_synthesis_cache = _analysis_cache('synthesis')
+
+
+def analyzer_cache_key(analyzer: Any, func: Callable, args: tuple, kwargs: dict) -> Optional[Hashable]:
+    """
+    Default key function for analyzer methods.
+
+    Uses the analyzer's cache_key() (a fingerprint of its inputs) when it
+    has one, otherwise fact/gap counts and, for synthesis, finding counts.
+    """
+    key_hook = getattr(analyzer, 'cache_key', None)
+    if callable(key_hook):
+        return (func.__name__, key_hook(), args, kwargs)
+
+    fact_store = getattr(analyzer, 'fact_store', None)
+    if fact_store is None:
+        return (func.__name__, args, kwargs)
+    # Use fact count and gap count as part of key (simple but effective)
+    key = [
+        func.__name__,
+        len(fact_store.facts),
+        len(fact_store.gaps),
+        tuple(sorted(set(f.domain for f in fact_store.facts))),
+        args,
+        kwargs,
+    ]
+    reasoning_store = getattr(analyzer, 'reasoning_store', None)
+    if reasoning_store is not None:
+        key += [len(reasoning_store.risks), len(reasoning_store.work_items)]
+    return tuple(key)
+
+
+_caches: Dict[str, SimpleCache] = {'coverage': _coverage_cache, 'synthesis': _synthesis_cache}
+_key_functions: Dict[str, Callable] = {'coverage': analyzer_cache_key, 'synthesis': analyzer_cache_key}
+
+
+def get_cache(kind: str) -> SimpleCache:
+    """Get the cache behind cached_coverage ('coverage') or cached_synthesis ('synthesis')."""
+    return _caches[kind]
+
+
+def set_key_function(kind: str, key_fn: Optional[Callable]) -> None:
+    """
+    Replace the key function for a cache kind.
+
+    key_fn(analyzer, func, args, kwargs) returns a JSON-serializable key, or
+    None to skip caching for that call. Pass None to restore the default.
+    """
+    _key_functions[kind] = key_fn or analyzer_cache_key
+
+
+def _cached(kind: str) -> Callable[[Callable], Callable]:
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache_key = _key_functions[kind](self, func, args, kwargs)
+            if cache_key is None:
+                return func(self, *args, **kwargs)
+            key = json_hash_key(cache_key)
+            if key is None:
+                return func(self, *args, **kwargs)
+
+            # Try cache
+            cached = _caches[kind].get_by_key(key)
+            if cached is not _MISSING:
+                logger.debug(f"Cache hit for {func.__name__}")
+                return cached
+
+            # Compute and cache
+            result = func(self, *args, **kwargs)
+            _caches[kind].set_by_key(key, result)
+            return result
+
+        return wrapper
+    return decorator
 
 
 def cached_coverage(func: Callable) -> Callable:
     """Decorator to cache coverage calculation results."""
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        # Create cache key from fact_store state
-        fact_store = self.fact_store if hasattr(self, 'fact_store') else args[0] if args else None
-        if fact_store:
-            # Use fact count and gap count as part of key (simple but effective)
-            cache_key = (
-                len(fact_store.facts),
-                len(fact_store.gaps),
-                tuple(sorted(set(f.domain for f in fact_store.facts)))
-            )
-        else:
-            cache_key = (args, kwargs)
-        
-        # Try cache
-        cached = _coverage_cache.get(cache_key)
-        if cached is not None:
-            logger.debug(f"Cache hit for {func.__name__}")
-            return cached
-        
-        # Compute and cache
-        result = func(self, *args, **kwargs)
-        _coverage_cache.set(result, cache_key)
-        return result
-    
-    return wrapper
+    return _cached('coverage')(func)
 
 
 def cached_synthesis(func: Callable) -> Callable:
     """Decorator to cache synthesis calculation results."""
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        # Create cache key from fact_store and reasoning_store state
-        fact_store = self.fact_store if hasattr(self, 'fact_store') else None
-        reasoning_store = self.reasoning_store if hasattr(self, 'reasoning_store') else None
-        
-        if fact_store and reasoning_store:
-            cache_key = (
-                len(fact_store.facts),
-                len(fact_store.gaps),
-                len(reasoning_store.risks),
-                len(reasoning_store.work_items),
-                tuple(sorted(set(f.domain for f in fact_store.facts)))
-            )
-        else:
-            cache_key = (args, kwargs)
-        
-        # Try cache
-        cached = _synthesis_cache.get(cache_key)
-        if cached is not None:
-            logger.debug(f"Cache hit for {func.__name__}")
-            return cached
-        
-        # Compute and cache
-        result = func(self, *args, **kwargs)
-        _synthesis_cache.set(result, cache_key)
-        return result
-    
-    return wrapper
+    return _cached('synthesis')(func)
@@ -0,0 +1,240 @@
+"""
+Conversation Manager for Agent Tool Loops
+
+Discovery and reasoning agents resend their whole conversation on every
+iteration: the first user message (for discovery, the full document text)
+plus every assistant turn and tool_result so far. This module keeps that
+cheap:
+
+- Prompt-cache breakpoints on the first user message (the document block)
+  and on the most recent turn, so each call reads the previous call's
+  prefix from cache instead of paying for it again.
+- Compaction: once the history passes a token threshold, old
+  tool_use/tool_result exchanges are replaced by a short ledger of the
+  IDs they created (facts, gaps, findings).
+- Per-iteration usage records (uncached, cache-write and cache-read input
+  tokens) to measure the effect.
+
+Usage:
+    conversation = ConversationManager()
+    response = client.messages.create(..., messages=conversation.prepare(self.messages))
+    conversation.record_usage(response.usage)
+    ...
+    conversation.compact(self.messages)
+"""
+
+import copy
+import json
+import logging
+from collections import Counter
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config_v2 import CONVERSATION_COMPACT_TOKENS, CONVERSATION_KEEP_RECENT_TURNS
+except ImportError:
+    CONVERSATION_COMPACT_TOKENS = 30000  # Compact once the history (after the first message) exceeds this
+    CONVERSATION_KEEP_RECENT_TURNS = 4   # Assistant/tool-result exchanges always kept verbatim
+
+CHARS_PER_TOKEN = 4  # Rough estimate; only used to decide when to compact
+LEDGER_MARKER = "## Progress ledger (earlier turns compacted)"
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+@dataclass
+class IterationUsage:
+    """Input/output tokens for one model call."""
+    iteration: int
+    input_tokens: int = 0           # Uncached input
+    cache_creation_tokens: int = 0  # Written to the prompt cache
+    cache_read_tokens: int = 0      # Served from the prompt cache
+    output_tokens: int = 0
+    history_messages: int = 0
+
+    @property
+    def total_input_tokens(self) -> int:
+        return self.input_tokens + self.cache_creation_tokens + self.cache_read_tokens
+
+
+def estimate_tokens(content: Any) -> int:
+    """Rough token estimate for message content (str or list of blocks)."""
+    if isinstance(content, str):
+        return len(content) // CHARS_PER_TOKEN
+    if isinstance(content, list):
+        return sum(estimate_tokens(block) for block in content)
+    if isinstance(content, dict):
+        if content.get("type") == "text":
+            return estimate_tokens(content.get("text", ""))
+        if content.get("type") == "tool_use":
+            return len(json.dumps(content.get("input", {}), default=str)) // CHARS_PER_TOKEN
+        return estimate_tokens(content.get("content", ""))
+    return 0
+
+
+def _as_blocks(content: Any) -> List[Dict]:
+    if isinstance(content, str):
+        return [{"type": "text", "text": content}]
+    return list(content)
+
+
+class ConversationManager:
+    """
+    Cache breakpoints, history compaction and usage tracking for one agent loop.
+
+    The agent keeps owning its messages list; prepare() returns the request
+    copy with breakpoints and compact() edits the history in place.
+    """
+
+    def __init__(self, compact_threshold: Optional[int] = None, keep_recent_turns: Optional[int] = None):
+        self.compact_threshold = compact_threshold if compact_threshold is not None else CONVERSATION_COMPACT_TOKENS
+        self.keep_recent_turns = max(1, keep_recent_turns if keep_recent_turns is not None
+                                     else CONVERSATION_KEEP_RECENT_TURNS)
+        self.usage: List[IterationUsage] = []
+        self.compactions = 0
+        self._ledger_ids: Dict[str, List[str]] = {}
+        self._ledger_tools: Counter = Counter()
+
+    # =========================================================================
+    # CACHE BREAKPOINTS
+    # =========================================================================
+
+    def prepare(self, messages: List[Dict]) -> List[Dict]:
+        """
+        Return the messages to send, with cache breakpoints on the first
+        user message and on the last message.
+
+        Only the two marked messages are copied; the history is not modified,
+        so breakpoints move forward with the conversation. Together with the
+        system prompt this uses three of the API's four breakpoints.
+        """
+        if not messages:
+            return messages
+        prepared = list(messages)
+        for index in {0, len(messages) - 1}:
+            message = messages[index]
+            blocks = copy.deepcopy(_as_blocks(message["content"]))
+            if not blocks:
+                continue
+            # On the first message, mark the document block, not a trailing ledger
+            target = 0 if index == 0 else len(blocks) - 1
+            blocks[target]["cache_control"] = CACHE_CONTROL
+            prepared[index] = {**message, "content": blocks}
+        return prepared
+
+    # =========================================================================
+    # COMPACTION
+    # =========================================================================
+
+    def history_tokens(self, messages: List[Dict]) -> int:
+        """Estimated tokens in everything after the first message."""
+        return sum(estimate_tokens(m.get("content")) for m in messages[1:])
+
+    def compact(self, messages: List[Dict]) -> int:
+        """
+        Replace old tool exchanges with a ledger once over the threshold.
+
+        Cuts at an assistant message so tool_use/tool_result pairs stay
+        together and roles keep alternating; the ledger is added as a second
+        block of the first user message, after the cached document block.
+
+        Returns:
+            Number of messages removed
+        """
+        if self.history_tokens(messages) <= self.compact_threshold:
+            return 0
+
+        assistant_indexes = [i for i, m in enumerate(messages) if i > 0 and m.get("role") == "assistant"]
+        if len(assistant_indexes) <= self.keep_recent_turns:
+            return 0
+        cut = assistant_indexes[-self.keep_recent_turns]
+
+        for message in messages[1:cut]:
+            self._add_to_ledger(message)
+
+        removed = cut - 1
+        del messages[1:cut]
+
+        first_blocks = [block for block in _as_blocks(messages[0]["content"])
+                        if not (block.get("type") == "text" and block.get("text", "").startswith(LEDGER_MARKER))]
+        first_blocks.append({"type": "text", "text": self.ledger_text()})
+        messages[0] = {**messages[0], "content": first_blocks}
+
+        self.compactions += 1
+        logger.info(f"Compacted {removed} messages into ledger "
+                    f"({sum(len(ids) for ids in self._ledger_ids.values())} IDs, "
+                    f"history now ~{self.history_tokens(messages)} tokens)")
+        return removed
+
+    def _add_to_ledger(self, message: Dict) -> None:
+        content = message.get("content")
+        if not isinstance(content, list):
+            return
+        for block in content:
+            if not isinstance(block, dict):
+                continue
+            if block.get("type") == "tool_use":
+                self._ledger_tools[block.get("name", "unknown")] += 1
+            elif block.get("type") == "tool_result":
+                try:
+                    result = json.loads(block.get("content") or "{}")
+                except (TypeError, ValueError):
+                    continue
+                if not isinstance(result, dict) or result.get("status") != "success":
+                    continue
+                for key, value in result.items():
+                    if key.endswith("_id") and isinstance(value, str):
+                        ids = self._ledger_ids.setdefault(key, [])
+                        if value not in ids:
+                            ids.append(value)
+
+    def ledger_text(self) -> str:
+        """Ledger summarizing the compacted turns."""
+        lines = [LEDGER_MARKER, ""]
+        if self._ledger_tools:
+            calls = ", ".join(f"{name} x{count}" for name, count in sorted(self._ledger_tools.items()))
+            lines.append(f"Tool calls already made: {calls}")
+        for key, ids in sorted(self._ledger_ids.items()):
+            lines.append(f"Created {key.replace('_id', '')}s ({len(ids)}): {', '.join(ids)}")
+        lines.append("")
+        lines.append("These entries already exist - do not create them again. Continue with what remains.")
+        return "\n".join(lines)
+
+    # =========================================================================
+    # USAGE TRACKING
+    # =========================================================================
+
+    def record_usage(self, usage: Any, history_messages: int = 0) -> IterationUsage:
+        """Record one call's token usage (an API usage object)."""
+        def tokens(name: str) -> int:
+            value = getattr(usage, name, 0)
+            return value if isinstance(value, int) else 0  # None when the API omits a field
+
+        record = IterationUsage(
+            iteration=len(self.usage) + 1,
+            input_tokens=tokens("input_tokens"),
+            cache_creation_tokens=tokens("cache_creation_input_tokens"),
+            cache_read_tokens=tokens("cache_read_input_tokens"),
+            output_tokens=tokens("output_tokens"),
+            history_messages=history_messages,
+        )
+        self.usage.append(record)
+        logger.debug(f"Iteration {record.iteration}: input uncached={record.input_tokens}, "
+                     f"cache_write={record.cache_creation_tokens}, cache_read={record.cache_read_tokens}")
+        return record
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals and the per-iteration usage records."""
+        total_input = sum(u.total_input_tokens for u in self.usage)
+        cache_read = sum(u.cache_read_tokens for u in self.usage)
+        return {
+            "iterations": len(self.usage),
+            "input_tokens": sum(u.input_tokens for u in self.usage),
+            "cache_creation_tokens": sum(u.cache_creation_tokens for u in self.usage),
+            "cache_read_tokens": cache_read,
+            "cache_hit_rate": round(cache_read / total_input, 3) if total_input else 0.0,
+            "compactions": self.compactions,
+            "per_iteration": [asdict(u) for u in self.usage],
+        }
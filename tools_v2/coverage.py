@@ -5,9 +5,13 @@ Defines expected items per domain/category and functions to calculate
 coverage quality based on FactStore contents.
 """
 
+import threading
+from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, List, Any, Optional
-from stores.fact_store import FactStore
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
+from stores.fact_store import Fact, FactStore
+from tools_v2.store_delta import FINGERPRINT_MASK, StoreDeltaTracker, entry_fingerprint
 
 # Import caching
 try:
@@ -232,6 +236,113 @@ COVERAGE_CHECKLISTS: Dict[str, Dict[str, List[Dict[str, str]]]] = {
 }
 
 
+# =============================================================================
+# CHECKLIST MATCHING TABLES (compiled once)
+# =============================================================================
+
+# Words ignored when comparing fact and checklist item names
+COMMON_WORDS = frozenset({"the", "a", "an", "and", "or", "of", "for", "to", "in"})
+
+# Keyword mappings for common variations: a checklist item containing the key
+# matches facts that mention any of the variations
+KEYWORD_MAPPINGS: Dict[str, List[str]] = {
+    "hypervisor": ["vmware", "hyper-v", "hyperv", "esxi", "vsphere"],
+    "vm": ["virtual machine", "vms", "virtualization"],
+    "san": ["storage area network", "netapp", "dell emc", "pure"],
+    "edr": ["endpoint detection", "crowdstrike", "sentinelone", "defender"],
+    "siem": ["splunk", "sentinel", "qradar", "log management"],
+    "erp": ["sap", "oracle", "netsuite", "dynamics"],
+    "crm": ["salesforce", "hubspot", "dynamics crm"],
+    "pam": ["privileged access", "cyberark", "beyondtrust"],
+    "mfa": ["multi-factor", "two-factor", "2fa", "authenticator"],
+    "sso": ["single sign-on", "okta", "ping", "azure ad"],
+    "ad": ["active directory", "domain controller"],
+    "vpn": ["remote access", "globalprotect", "anyconnect"],
+    "firewall": ["palo alto", "fortinet", "checkpoint", "cisco asa"],
+}
+
+
+def _normalize_name(name: str) -> str:
+    return name.lower().replace("_", " ").replace("-", " ")
+
+
+@dataclass(frozen=True)
+class CompiledName:
+    """A normalized name with its significant words, ready for matching."""
+    text: str
+    words: FrozenSet[str]
+
+
+@dataclass(frozen=True)
+class CompiledChecklistItem:
+    """A checklist item with its normalized name and applicable keyword variations."""
+    name: str
+    importance: str
+    description: str
+    compiled: CompiledName
+    variations: Tuple[str, ...]
+
+    def matches(self, fact: CompiledName) -> bool:
+        """Fuzzy match against a compiled fact item name."""
+        check = self.compiled
+
+        # Direct contains
+        if check.text in fact.text or fact.text in check.text:
+            return True
+
+        # Significant word overlap
+        if fact.words and check.words:
+            overlap = fact.words & check.words
+            if len(overlap) >= min(len(fact.words), len(check.words)) * 0.5:
+                return True
+
+        # Keyword variations
+        return any(var in fact.text for var in self.variations)
+
+
+@lru_cache(maxsize=4096)
+def compile_name(name: str) -> CompiledName:
+    """Normalize a fact or checklist item name for matching."""
+    text = _normalize_name(name)
+    return CompiledName(text=text, words=frozenset(text.split()) - COMMON_WORDS)
+
+
+@lru_cache(maxsize=1024)
+def compile_checklist_item(name: str, importance: str = "", description: str = "") -> CompiledChecklistItem:
+    """Precompute everything matching needs to know about a checklist item."""
+    compiled = compile_name(name)
+    variations = tuple(
+        var
+        for key, key_variations in KEYWORD_MAPPINGS.items()
+        if key in compiled.text
+        for var in key_variations
+    )
+    return CompiledChecklistItem(
+        name=name,
+        importance=importance,
+        description=description,
+        compiled=compiled,
+        variations=variations,
+    )
+
+
+def compile_checklists(
+    checklists: Dict[str, Dict[str, List[Dict[str, str]]]]
+) -> Dict[Tuple[str, str], List[CompiledChecklistItem]]:
+    """Compile checklists into (domain, category) -> compiled items."""
+    return {
+        (domain, category): [
+            compile_checklist_item(item["name"], item["importance"], item["description"])
+            for item in items
+        ]
+        for domain, categories in checklists.items()
+        for category, items in categories.items()
+    }
+
+
+COMPILED_CHECKLISTS = compile_checklists(COVERAGE_CHECKLISTS)
+
+
 # =============================================================================
 # COVERAGE RESULT DATACLASSES
 # =============================================================================
@@ -342,6 +453,11 @@ class CoverageAnalyzer:
     """
     Analyzes FactStore contents against coverage checklists.
 
+    Match state is kept per checklist item and updated incrementally: each
+    calculation first applies only the facts and gaps added or removed
+    since the previous one, so a long-lived analyzer can recalculate
+    coverage live while discovery is still adding facts.
+
     Usage:
         analyzer = CoverageAnalyzer(fact_store)
         domain_coverage = analyzer.calculate_domain_coverage("infrastructure")
@@ -350,6 +466,104 @@ class CoverageAnalyzer:
 
     def __init__(self, fact_store: FactStore):
         self.fact_store = fact_store
+        self._lock = threading.RLock()
+        self._fact_tracker = StoreDeltaTracker(fact_store, "facts")
+        self._gap_tracker = StoreDeltaTracker(fact_store, "gaps")
+        self._fingerprint = 0  # sum of entry fingerprints of tracked facts and gaps
+
+        # (domain, category, checklist item name) -> matching facts in FactStore order
+        self._matches: Dict[Tuple[str, str, str], Dict[int, Fact]] = {}
+        self._category_facts: Counter = Counter()  # (domain, category) -> fact count
+        self._domain_facts: Counter = Counter()  # domain -> fact count
+        self._category_gaps: Counter = Counter()
+        self._domain_gaps: Counter = Counter()
+
+    # -------------------------------------------------------------------------
+    # Incremental state
+    # -------------------------------------------------------------------------
+
+    def refresh(self) -> int:
+        """
+        Apply facts and gaps added or removed since the last refresh.
+
+        Cost is proportional to the number of changes, not the store size.
+
+        Returns:
+            Number of facts and gaps applied
+        """
+        with self._lock:
+            added_facts, removed_facts = self._fact_tracker.poll()
+            added_gaps, removed_gaps = self._gap_tracker.poll()
+
+            for fact in removed_facts:
+                self._apply_fact(fact, -1)
+            for fact in added_facts:
+                self._apply_fact(fact, +1)
+            for gap in removed_gaps:
+                self._apply_gap(gap, -1)
+            for gap in added_gaps:
+                self._apply_gap(gap, +1)
+
+            return len(added_facts) + len(removed_facts) + len(added_gaps) + len(removed_gaps)
+
+    def rebuild(self) -> None:
+        """Discard match state and recompute it from the whole FactStore."""
+        with self._lock:
+            self._fact_tracker.reset()
+            self._gap_tracker.reset()
+            self._matches.clear()
+            self._category_facts.clear()
+            self._domain_facts.clear()
+            self._category_gaps.clear()
+            self._domain_gaps.clear()
+            self._fingerprint = 0
+            self.refresh()
+
+    def cache_key(self) -> Tuple:
+        """
+        Key identifying the current coverage inputs (used by cached_coverage).
+
+        Built from the facts and gaps themselves rather than this instance,
+        so analyzers in other workers over the same content share entries.
+        """
+        with self._lock:
+            self.refresh()
+            return (
+                "coverage",
+                self.fact_store.deal_id,
+                sum(self._domain_facts.values()),
+                sum(self._domain_gaps.values()),
+                f"{self._fingerprint:016x}",
+            )
+
+    def _apply_gap(self, gap: Any, delta: int) -> None:
+        self._category_gaps[(gap.domain, gap.category)] += delta
+        self._domain_gaps[gap.domain] += delta
+        self._fingerprint = (self._fingerprint + delta * entry_fingerprint(
+            "gap", gap.gap_id, gap.domain, gap.category)) & FINGERPRINT_MASK
+
+    def _apply_fact(self, fact: Fact, delta: int) -> None:
+        key = (fact.domain, fact.category)
+        self._fingerprint = (self._fingerprint + delta * entry_fingerprint(
+            "fact", fact.fact_id, fact.domain, fact.category, fact.item)) & FINGERPRINT_MASK
+        self._category_facts[key] += delta
+        self._domain_facts[fact.domain] += delta
+
+        checklist = COMPILED_CHECKLISTS.get(key)
+        if not checklist:
+            return
+        compiled_item = compile_name(fact.item)
+        for check_item in checklist:
+            if check_item.matches(compiled_item):
+                matches = self._matches.setdefault((fact.domain, fact.category, check_item.name), {})
+                if delta > 0:
+                    matches[id(fact)] = fact
+                else:
+                    matches.pop(id(fact), None)
+
+    # -------------------------------------------------------------------------
+    # Coverage calculation
+    # -------------------------------------------------------------------------
 
     def _match_fact_to_checklist(
         self,
@@ -360,53 +574,7 @@ class CoverageAnalyzer:
         Determine if a fact matches a checklist item.
         Uses fuzzy matching on item names.
         """
-        # Normalize strings
-        fact_lower = fact_item.lower().replace("_", " ").replace("-", " ")
-        check_lower = checklist_item_name.lower().replace("_", " ").replace("-", " ")
-
-        # Direct contains
-        if check_lower in fact_lower or fact_lower in check_lower:
-            return True
-
-        # Word overlap
-        fact_words = set(fact_lower.split())
-        check_words = set(check_lower.split())
-
-        # Remove common words
-        common_words = {"the", "a", "an", "and", "or", "of", "for", "to", "in"}
-        fact_words -= common_words
-        check_words -= common_words
-
-        # Check for significant word overlap
-        if len(fact_words) > 0 and len(check_words) > 0:
-            overlap = fact_words & check_words
-            if len(overlap) >= min(len(fact_words), len(check_words)) * 0.5:
-                return True
-
-        # Keyword mappings for common variations
-        keyword_mappings = {
-            "hypervisor": ["vmware", "hyper-v", "hyperv", "esxi", "vsphere"],
-            "vm": ["virtual machine", "vms", "virtualization"],
-            "san": ["storage area network", "netapp", "dell emc", "pure"],
-            "edr": ["endpoint detection", "crowdstrike", "sentinelone", "defender"],
-            "siem": ["splunk", "sentinel", "qradar", "log management"],
-            "erp": ["sap", "oracle", "netsuite", "dynamics"],
-            "crm": ["salesforce", "hubspot", "dynamics crm"],
-            "pam": ["privileged access", "cyberark", "beyondtrust"],
-            "mfa": ["multi-factor", "two-factor", "2fa", "authenticator"],
-            "sso": ["single sign-on", "okta", "ping", "azure ad"],
-            "ad": ["active directory", "domain controller"],
-            "vpn": ["remote access", "globalprotect", "anyconnect"],
-            "firewall": ["palo alto", "fortinet", "checkpoint", "cisco asa"],
-        }
-
-        for key, variations in keyword_mappings.items():
-            if key in check_lower:
-                for var in variations:
-                    if var in fact_lower:
-                        return True
-
-        return False
+        return compile_checklist_item(checklist_item_name).matches(compile_name(fact_item))
 
     def calculate_category_coverage(
         self,
@@ -414,58 +582,50 @@ class CoverageAnalyzer:
         category: str
     ) -> CategoryCoverage:
         """Calculate coverage for a single category."""
-        checklist = COVERAGE_CHECKLISTS.get(domain, {}).get(category, [])
-
-        # Get facts for this domain/category
-        domain_facts = [f for f in self.fact_store.facts if f.domain == domain]
-        category_facts = [f for f in domain_facts if f.category == category]
-        category_gaps = [g for g in self.fact_store.gaps
-                        if g.domain == domain and g.category == category]
-
-        items = []
-        for check_item in checklist:
-            item = ChecklistItem(
-                name=check_item["name"],
-                importance=check_item["importance"],
-                description=check_item["description"]
-            )
-
-            # Try to match against facts
-            for fact in category_facts:
-                if self._match_fact_to_checklist(fact.item, check_item["name"]):
+        with self._lock:
+            self.refresh()
+
+            items = []
+            for check_item in COMPILED_CHECKLISTS.get((domain, category), []):
+                item = ChecklistItem(
+                    name=check_item.name,
+                    importance=check_item.importance,
+                    description=check_item.description
+                )
+
+                # First matching fact, in FactStore order
+                matches = self._matches.get((domain, category, check_item.name))
+                if matches:
+                    fact = next(iter(matches.values()))
                     item.found = True
                     item.matched_fact_id = fact.fact_id
                     item.matched_fact_item = fact.item
-                    break
 
-            items.append(item)
+                items.append(item)
 
-        return CategoryCoverage(
-            category=category,
-            items=items,
-            facts_found=len(category_facts),
-            gaps_found=len(category_gaps)
-        )
+            return CategoryCoverage(
+                category=category,
+                items=items,
+                facts_found=self._category_facts[(domain, category)],
+                gaps_found=self._category_gaps[(domain, category)]
+            )
 
     @cached_coverage
     def calculate_domain_coverage(self, domain: str) -> DomainCoverage:
         """Calculate coverage for an entire domain."""
         domain_checklist = COVERAGE_CHECKLISTS.get(domain, {})
 
-        categories = {}
-        for category in domain_checklist.keys():
-            categories[category] = self.calculate_category_coverage(domain, category)
+        with self._lock:
+            categories = {}
+            for category in domain_checklist.keys():
+                categories[category] = self.calculate_category_coverage(domain, category)
 
-        # Get total facts and gaps for domain
-        domain_facts = [f for f in self.fact_store.facts if f.domain == domain]
-        domain_gaps = [g for g in self.fact_store.gaps if g.domain == domain]
-
-        return DomainCoverage(
-            domain=domain,
-            categories=categories,
-            total_facts=len(domain_facts),
-            total_gaps=len(domain_gaps)
-        )
+            return DomainCoverage(
+                domain=domain,
+                categories=categories,
+                total_facts=self._domain_facts[domain],
+                total_gaps=self._domain_gaps[domain]
+            )
 
     @cached_coverage
     def calculate_overall_coverage(self) -> Dict[str, Any]:
@@ -9,17 +9,23 @@ Creates detailed .md logs for each discovery run to provide:
 
 Each discovery run generates a log file:
   {domain}_discovery_log_{timestamp}.md
+
+and a machine-readable transcript of every tool call, grouped by iteration,
+that the offline replay harness (benchmarks/replay_client.py) can play back:
+  {domain}_discovery_log_{timestamp}.json
 """
 
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+TRANSCRIPT_VERSION = 1
+
 
 @dataclass
 class ToolCallRecord:
@@ -38,6 +44,7 @@ class DiscoveryLogEntry:
     timestamp: str
     document_name: str
     document_length: int
+    entity: str = "target"
 
     # Execution tracking
     tool_calls: List[ToolCallRecord] = field(default_factory=list)
@@ -92,7 +99,7 @@ class DiscoveryLogger:
         self.start_time: Optional[datetime] = None
         self._current_iteration = 0
 
-    def start(self, document_name: str, document_length: int):
+    def start(self, document_name: str, document_length: int, entity: str = "target"):
         """Start logging a new discovery run."""
         self.start_time = datetime.now()
         self.log_entry = DiscoveryLogEntry(
@@ -100,6 +107,7 @@ class DiscoveryLogger:
             timestamp=self.start_time.isoformat(),
             document_name=document_name,
             document_length=document_length,
+            entity=entity,
         )
         logger.info(f"Started discovery logging for {self.domain}")
 
@@ -152,6 +160,26 @@ class DiscoveryLogger:
             if result.get("status") == "success":
                 self.log_entry.gaps_flagged += 1
 
+    def absorb(self, other: "DiscoveryLogger") -> None:
+        """
+        Append another logger's tool calls and counts after this one's.
+
+        Chunked discovery gives every chunk worker its own logger and folds
+        them in chunk order; the absorbed iterations are renumbered to follow
+        the ones already recorded, so the transcript replays chunk by chunk
+        instead of interleaving iterations of different chunks.
+        """
+        if not self.log_entry or not other.log_entry:
+            return
+        entry, part = self.log_entry, other.log_entry
+        offset = entry.iterations
+        entry.tool_calls.extend(replace(tc, iteration=tc.iteration + offset) for tc in part.tool_calls)
+        entry.iterations = offset + part.iterations
+        for name in ("facts_extracted", "facts_accepted", "facts_flagged", "facts_rejected", "gaps_flagged"):
+            setattr(entry, name, getattr(entry, name) + getattr(part, name))
+        entry.rejected_items.extend(part.rejected_items)
+        entry.flagged_items.extend(part.flagged_items)
+
     def finish(self, metrics: Any = None, facts_file: str = None,
                findings_file: str = None):
         """Finalize the log entry with metrics and output files."""
@@ -173,7 +201,11 @@ class DiscoveryLogger:
         self.log_entry.findings_file = findings_file
 
     def save(self) -> Optional[Path]:
-        """Save the log to a markdown file and return the path."""
+        """
+        Save the log to a markdown file and return the path.
+
+        The JSON transcript is written alongside it with the same stem.
+        """
         if not self.log_entry:
             return None
 
@@ -186,9 +218,44 @@ class DiscoveryLogger:
         with open(filepath, 'w') as f:
             f.write(content)
 
+        with open(filepath.with_suffix('.json'), 'w') as f:
+            json.dump(self.to_transcript(), f, indent=2, default=str)
+
         logger.info(f"Saved discovery log: {filepath}")
         return filepath
 
+    def to_transcript(self) -> Dict[str, Any]:
+        """
+        Return the run as a replayable transcript.
+
+        Tool calls are grouped by iteration in the order the model issued
+        them; each keeps the tool input and the result the tool returned.
+        """
+        if not self.log_entry:
+            return {}
+
+        e = self.log_entry
+        iterations: Dict[int, List[Dict[str, Any]]] = {}
+        for tc in e.tool_calls:
+            iterations.setdefault(tc.iteration, []).append({
+                "tool_name": tc.tool_name,
+                "tool_input": tc.tool_input,
+                "result": tc.result,
+            })
+
+        return {
+            "transcript_version": TRANSCRIPT_VERSION,
+            "domain": e.domain,
+            "entity": e.entity,
+            "document_name": e.document_name,
+            "document_length": e.document_length,
+            "timestamp": e.timestamp,
+            "iterations": [
+                {"iteration": number, "tool_calls": calls}
+                for number, calls in sorted(iterations.items())
+            ],
+        }
+
     def _format_markdown(self) -> str:
         """Format the log entry as markdown."""
         if not self.log_entry:
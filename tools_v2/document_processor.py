@@ -6,22 +6,35 @@ Connects uploaded documents to the analysis engine:
 - Extracts content from various document types
 - Tracks processing status and progress
 - Integrates with fact extraction and merging
+- Processes the queue on a pool of worker threads, with parsing in a
+  shared process pool
 
 Steps 1-15 of Phase 1
 """
 
 import logging
 import hashlib
+import multiprocessing
 import os
 import threading
 import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Callable
 from enum import Enum
-from queue import PriorityQueue
 import json
 
+try:
+    from config_v2 import DOCUMENT_WORKERS, DOCUMENT_PARSE_PROCESSES, DOCUMENT_PARSE_TIMEOUT_SECONDS
+except ImportError:
+    DOCUMENT_WORKERS = 4          # Worker threads per processor
+    DOCUMENT_PARSE_PROCESSES = 4  # Shared parsing processes (0 = parse in worker threads)
+    DOCUMENT_PARSE_TIMEOUT_SECONDS = 300  # Hung parsers are killed after this
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +47,7 @@ class ProcessingStatus(Enum):
     MERGING = "merging"
     COMPLETE = "complete"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
 class ProcessingPriority(Enum):
@@ -67,12 +81,19 @@ class ProcessingProgress:
     facts_added: int = 0
     facts_updated: int = 0
     conflicts_found: int = 0
+    fact_ids: List[str] = field(default_factory=list)
 
     # Error handling
     error_message: str = ""
     retry_count: int = 0
     max_retries: int = 3
 
+    # Scheduling
+    deal_id: str = ""        # Deals take turns within a priority
+    content_hash: str = ""   # Identical in-flight content in a deal is processed once
+    file_path: str = ""
+    duplicate_of: str = ""   # Leader doc_id when waiting on identical content
+
     # Processing log
     log_entries: List[Dict[str, Any]] = field(default_factory=list)
 
@@ -102,6 +123,8 @@ class ProcessingProgress:
             "conflicts_found": self.conflicts_found,
             "error_message": self.error_message,
             "retry_count": self.retry_count,
+            "deal_id": self.deal_id,
+            "duplicate_of": self.duplicate_of,
             "log_entries": self.log_entries
         }
 
@@ -400,133 +423,431 @@ class ContentExtractor:
         return chunks
 
 
+class ProcessingCancelled(Exception):
+    """Raised inside the pipeline when a document's cancellation was requested."""
+
+
+# Parsing runs in shared process pools (one per size) so CPU-bound PDF/Excel
+# parsing uses every core and doesn't hold the GIL for the worker threads
+_parse_pools: Dict[int, ProcessPoolExecutor] = {}
+_parse_pools_lock = threading.Lock()
+# Pools killed because one parse timed out; the other documents that were
+# parsing in them did nothing wrong and are parsed again on the next pool
+_timed_out_pools: "weakref.WeakSet[ProcessPoolExecutor]" = weakref.WeakSet()
+_process_extractor: Optional[ContentExtractor] = None
+
+
+def _extract_document(file_path: str) -> ExtractionResult:
+    """Extract a document inside a parsing process (one extractor per process)."""
+    global _process_extractor
+    if _process_extractor is None:
+        _process_extractor = ContentExtractor()
+    return _process_extractor.extract(file_path)
+
+
+def get_parse_pool(processes: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared parsing pool with this many processes.
+
+    Shared by every DocumentProcessor in the server process, so sessions
+    don't each start their own parsers. Returns None when processes is 0.
+
+    The server runs worker threads, so parsers are started from a
+    forkserver (or spawned) rather than forked from this process, which
+    could copy a lock held by another thread.
+    """
+    if processes <= 0:
+        return None
+    with _parse_pools_lock:
+        pool = _parse_pools.get(processes)
+        if pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            pool = ProcessPoolExecutor(max_workers=processes, mp_context=context)
+            _parse_pools[processes] = pool
+        return pool
+
+
+def _discard_parse_pool(processes: int, pool: ProcessPoolExecutor) -> None:
+    """Drop a broken or hung pool so the next extraction starts a fresh one."""
+    with _parse_pools_lock:
+        if _parse_pools.get(processes) is pool:
+            del _parse_pools[processes]
+    # shutdown() doesn't stop a running parse, so hung parsers are killed
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.kill()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
 class ProcessingQueue:
     """
     Priority-based queue for document processing.
 
     Features:
     - Priority ordering (urgent first)
-    - FIFO within same priority
-    - Thread-safe operations
+    - Deals take turns within a priority, FIFO within a deal
+    - Cancellation (queued documents immediately, active ones between stages)
+    - A document whose content hash matches one already queued or active in
+      the same deal waits for that document's result instead of being
+      processed again
+    - Queue depth and wait/processing latency stats
+    - Thread-safe; get_next() can block so pool workers don't poll
     """
 
+    LATENCY_WINDOW = 500  # Recent documents kept for latency stats
+
     def __init__(self):
-        self._queue = PriorityQueue()
-        self._lock = threading.Lock()
-        self._counter = 0  # For FIFO ordering within priority
+        self._lock = threading.RLock()
+        self._not_empty = threading.Condition(self._lock)
+
+        # priority value -> deal_id -> queued documents; the OrderedDict's
+        # order is the order in which deals get their next turn
+        self._lanes: Dict[int, "OrderedDict[str, deque]"] = {}
+        self._queued: Dict[str, ProcessingProgress] = {}
         self._active: Dict[str, ProcessingProgress] = {}
         self._completed: Dict[str, ProcessingProgress] = {}
         self._failed: Dict[str, ProcessingProgress] = {}
+        self._cancelled: Dict[str, ProcessingProgress] = {}
+        self._cancel_requested: set = set()
+
+        # In-flight dedup: (deal_id, content_hash) -> leader doc_id,
+        # leader -> followers. Scoped to a deal because the follower is
+        # marked processed with the leader's fact IDs
+        self._leaders: Dict[tuple, str] = {}
+        self._followers: Dict[str, List[ProcessingProgress]] = {}
+        self._waiting: Dict[str, ProcessingProgress] = {}
+        self._deduplicated = 0
+
+        # Latency tracking (monotonic seconds)
+        self._enqueued_at: Dict[str, float] = {}
+        self._started_at: Dict[str, float] = {}
+        self._wait_times: deque = deque(maxlen=self.LATENCY_WINDOW)
+        self._processing_times: deque = deque(maxlen=self.LATENCY_WINDOW)
+
+    def add(self, progress: ProcessingProgress) -> ProcessingProgress:
+        """
+        Add document to processing queue.
 
-    def add(self, progress: ProcessingProgress) -> None:
-        """Add document to processing queue."""
+        Returns the progress being tracked for the document, which is the
+        existing one if the document is already queued or processing.
+        """
         with self._lock:
-            self._counter += 1
-            # Priority tuple: (priority_value, counter, progress)
-            # Lower priority value = higher priority
-            self._queue.put((progress.priority.value, self._counter, progress))
+            existing = (self._queued.get(progress.doc_id) or self._active.get(progress.doc_id)
+                        or self._waiting.get(progress.doc_id))
+            if existing and existing is not progress:
+                existing.add_log("Already queued; duplicate request ignored")
+                return existing
+
             progress.queued_at = datetime.now().isoformat()
+            dedup_key = (progress.deal_id, progress.content_hash)
+            leader_id = self._leaders.get(dedup_key) if progress.content_hash else None
+            if leader_id and leader_id != progress.doc_id:
+                self._follow(progress, leader_id)
+                self._deduplicated += 1
+                return progress
+
+            if progress.content_hash:
+                self._leaders[dedup_key] = progress.doc_id
+            lane = self._lanes.setdefault(progress.priority.value, OrderedDict())
+            lane.setdefault(progress.deal_id, deque()).append(progress)
+            self._queued[progress.doc_id] = progress
+            self._enqueued_at[progress.doc_id] = time.monotonic()
             progress.add_log(f"Added to queue with priority {progress.priority.name}")
+            self._not_empty.notify()
+            return progress
 
-    def get_next(self) -> Optional[ProcessingProgress]:
-        """Get next document for processing."""
-        try:
-            with self._lock:
-                if self._queue.empty():
+    def _follow(self, progress: ProcessingProgress, leader_id: str) -> None:
+        """Park a document until the leader with identical content finishes."""
+        progress.status = ProcessingStatus.QUEUED
+        progress.duplicate_of = leader_id
+        progress.add_log(f"Identical content already in progress ({leader_id}); waiting for its result")
+        self._followers.setdefault(leader_id, []).append(progress)
+        self._waiting[progress.doc_id] = progress
+
+    def get_next(self, timeout: float = 0) -> Optional[ProcessingProgress]:
+        """
+        Get next document for processing.
+
+        Args:
+            timeout: Seconds to wait for a document (0 = don't wait)
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            while True:
+                progress = self._pop_next()
+                if progress:
+                    now = time.monotonic()
+                    self._wait_times.append(now - self._enqueued_at.pop(progress.doc_id, now))
+                    self._started_at[progress.doc_id] = now
+                    self._active[progress.doc_id] = progress
+                    return progress
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     return None
-                _, _, progress = self._queue.get_nowait()
-                self._active[progress.doc_id] = progress
-                return progress
-        except:
-            return None
+                self._not_empty.wait(remaining)
+
+    def _pop_next(self) -> Optional[ProcessingProgress]:
+        """Take the next deal's oldest document at the highest priority."""
+        for priority in sorted(self._lanes):
+            lane = self._lanes[priority]
+            deal_id, items = lane.popitem(last=False)
+            progress = items.popleft()
+            if items:
+                lane[deal_id] = items  # Back of the line for this priority
+            if not lane:
+                del self._lanes[priority]
+            del self._queued[progress.doc_id]
+            return progress
+        return None
+
+    def wake_all(self) -> None:
+        """Wake every worker blocked in get_next (used when stopping)."""
+        with self._lock:
+            self._not_empty.notify_all()
 
     def mark_active(self, doc_id: str) -> None:
         """Mark document as actively processing."""
-        if doc_id in self._active:
-            progress = self._active[doc_id]
-            progress.status = ProcessingStatus.EXTRACTING
-            progress.started_at = datetime.now().isoformat()
-            progress.add_log("Processing started")
-
-    def mark_complete(self, doc_id: str) -> None:
-        """Mark document as complete."""
-        if doc_id in self._active:
-            progress = self._active.pop(doc_id)
+        with self._lock:
+            if doc_id in self._active:
+                progress = self._active[doc_id]
+                progress.status = ProcessingStatus.EXTRACTING
+                progress.started_at = datetime.now().isoformat()
+                progress.add_log("Processing started")
+
+    def mark_complete(self, doc_id: str) -> List[ProcessingProgress]:
+        """
+        Mark document as complete.
+
+        Returns:
+            Documents with identical content that were waiting on this one
+            (now complete with the same results)
+        """
+        with self._lock:
+            progress = self._finish(doc_id)
+            if progress is None:
+                return []
             progress.status = ProcessingStatus.COMPLETE
             progress.completed_at = datetime.now().isoformat()
             progress.progress_percent = 100
             progress.add_log("Processing complete")
             self._completed[doc_id] = progress
 
-    def mark_failed(self, doc_id: str, error: str) -> None:
-        """Mark document as failed."""
-        if doc_id in self._active:
-            progress = self._active[doc_id]
+            followers = self._release(progress)
+            for follower in followers:
+                follower.status = ProcessingStatus.COMPLETE
+                follower.current_stage = "complete"
+                follower.stages_completed = list(progress.stages_completed)
+                follower.completed_at = progress.completed_at
+                follower.progress_percent = 100
+                follower.facts_extracted = progress.facts_extracted
+                follower.facts_added = progress.facts_added
+                follower.facts_updated = progress.facts_updated
+                follower.conflicts_found = progress.conflicts_found
+                follower.fact_ids = list(progress.fact_ids)
+                follower.add_log(f"Processing complete (identical content processed as {doc_id})")
+                self._completed[follower.doc_id] = follower
+            return followers
+
+    def mark_failed(self, doc_id: str, error: str) -> List[ProcessingProgress]:
+        """
+        Mark document as failed.
+
+        Returns:
+            Documents with identical content that were waiting on this one,
+            failed along with it once its retries are exhausted
+        """
+        with self._lock:
+            cancel_requested = doc_id in self._cancel_requested
+            progress = self._finish(doc_id)
+            if progress is None:
+                return []
             progress.retry_count += 1
             progress.error_message = error
             progress.add_log(f"Processing failed: {error}", "error")
 
+            if cancel_requested:
+                self._set_cancelled(progress)
+                self._promote_follower(progress)
+                return []
+
             if progress.retry_count < progress.max_retries:
-                # Requeue for retry
+                # Requeue for retry (keeps its followers)
                 progress.status = ProcessingStatus.QUEUED
                 progress.add_log(f"Requeuing for retry ({progress.retry_count}/{progress.max_retries})")
-                self._active.pop(doc_id)
                 self.add(progress)
-            else:
-                # Max retries exceeded
-                progress.status = ProcessingStatus.FAILED
-                progress.add_log("Max retries exceeded, marking as failed", "error")
-                self._active.pop(doc_id)
-                self._failed[doc_id] = progress
+                return []
+
+            # Max retries exceeded
+            progress.status = ProcessingStatus.FAILED
+            progress.add_log("Max retries exceeded, marking as failed", "error")
+            self._failed[doc_id] = progress
+
+            followers = self._release(progress)
+            for follower in followers:
+                follower.status = ProcessingStatus.FAILED
+                follower.error_message = error
+                follower.add_log(f"Processing failed (identical content failed as {doc_id}): {error}", "error")
+                self._failed[follower.doc_id] = follower
+            return followers
+
+    def cancel(self, doc_id: str) -> bool:
+        """
+        Cancel a document.
+
+        Queued documents are removed straight away. Active documents are
+        flagged and stop at the next stage boundary (see is_cancel_requested).
+
+        Returns:
+            True if the document was queued, waiting or active
+        """
+        with self._lock:
+            if doc_id in self._queued:
+                progress = self._queued.pop(doc_id)
+                self._enqueued_at.pop(doc_id, None)
+                lane = self._lanes[progress.priority.value]
+                lane[progress.deal_id].remove(progress)
+                if not lane[progress.deal_id]:
+                    del lane[progress.deal_id]
+                if not lane:
+                    del self._lanes[progress.priority.value]
+                self._set_cancelled(progress)
+                self._promote_follower(progress)
+                return True
+
+            if doc_id in self._waiting:
+                progress = self._waiting.pop(doc_id)
+                followers = self._followers[progress.duplicate_of]
+                followers.remove(progress)
+                if not followers:
+                    del self._followers[progress.duplicate_of]
+                self._set_cancelled(progress)
+                return True
+
+            if doc_id in self._active:
+                self._cancel_requested.add(doc_id)
+                self._active[doc_id].add_log("Cancellation requested")
+                return True
+
+            return False
+
+    def is_cancel_requested(self, doc_id: str) -> bool:
+        """Check whether an active document should stop."""
+        with self._lock:
+            return doc_id in self._cancel_requested
+
+    def mark_cancelled(self, doc_id: str) -> None:
+        """Mark an active document as cancelled after it stopped."""
+        with self._lock:
+            progress = self._finish(doc_id)
+            if progress is not None:
+                self._set_cancelled(progress)
+                self._promote_follower(progress)
+
+    def _set_cancelled(self, progress: ProcessingProgress) -> None:
+        progress.status = ProcessingStatus.CANCELLED
+        progress.completed_at = datetime.now().isoformat()
+        progress.add_log("Processing cancelled")
+        self._cancelled[progress.doc_id] = progress
+
+    def _promote_follower(self, progress: ProcessingProgress) -> None:
+        """Queue the first waiting duplicate of a cancelled leader in its place."""
+        followers = self._release(progress)
+        if not followers:
+            return
+        leader, rest = followers[0], followers[1:]
+        leader.duplicate_of = ""
+        leader.add_log(f"{progress.doc_id} was cancelled; processing this copy instead")
+        self.add(leader)
+        for follower in rest:
+            self._follow(follower, leader.doc_id)
+
+    def _finish(self, doc_id: str) -> Optional[ProcessingProgress]:
+        """Remove a document from the active set and record its processing time."""
+        progress = self._active.pop(doc_id, None)
+        if progress is not None:
+            started = self._started_at.pop(doc_id, None)
+            if started is not None:
+                self._processing_times.append(time.monotonic() - started)
+            self._cancel_requested.discard(doc_id)
+        return progress
+
+    def _release(self, progress: ProcessingProgress) -> List[ProcessingProgress]:
+        """Stop tracking a leader's content hash; returns its followers."""
+        dedup_key = (progress.deal_id, progress.content_hash)
+        if progress.content_hash and self._leaders.get(dedup_key) == progress.doc_id:
+            del self._leaders[dedup_key]
+        followers = self._followers.pop(progress.doc_id, [])
+        for follower in followers:
+            self._waiting.pop(follower.doc_id, None)
+        return followers
 
     def update_progress(self, doc_id: str, stage: str, percent: int) -> None:
         """Update processing progress."""
-        if doc_id in self._active:
-            progress = self._active[doc_id]
-            progress.current_stage = stage
-            progress.progress_percent = percent
-            if stage not in progress.stages_completed:
-                progress.stages_completed.append(stage)
-            progress.add_log(f"Stage: {stage} ({percent}%)")
+        with self._lock:
+            if doc_id in self._active:
+                progress = self._active[doc_id]
+                progress.current_stage = stage
+                progress.progress_percent = percent
+                if stage not in progress.stages_completed:
+                    progress.stages_completed.append(stage)
+                progress.add_log(f"Stage: {stage} ({percent}%)")
 
     def get_status(self, doc_id: str) -> Optional[ProcessingProgress]:
         """Get status for a document."""
-        if doc_id in self._active:
-            return self._active[doc_id]
-        if doc_id in self._completed:
-            return self._completed[doc_id]
-        if doc_id in self._failed:
-            return self._failed[doc_id]
+        with self._lock:
+            for bucket in (self._active, self._queued, self._waiting,
+                           self._completed, self._failed, self._cancelled):
+                if doc_id in bucket:
+                    return bucket[doc_id]
         return None
 
     def get_queue_stats(self) -> Dict[str, Any]:
-        """Get queue statistics."""
+        """Get queue statistics (depth by priority and deal, latencies)."""
+        with self._lock:
+            by_priority: Dict[str, int] = {}
+            by_deal: Dict[str, int] = {}
+            for priority, lane in sorted(self._lanes.items()):
+                for deal_id, items in lane.items():
+                    name = ProcessingPriority(priority).name.lower()
+                    by_priority[name] = by_priority.get(name, 0) + len(items)
+                    by_deal[deal_id] = by_deal.get(deal_id, 0) + len(items)
+
+            now = time.monotonic()
+            return {
+                "queued": len(self._queued),
+                "active": len(self._active),
+                "completed": len(self._completed),
+                "failed": len(self._failed),
+                "cancelled": len(self._cancelled),
+                "waiting_on_duplicate": len(self._waiting),
+                "deduplicated": self._deduplicated,
+                "queued_by_priority": by_priority,
+                "queued_by_deal": by_deal,
+                "oldest_queued_seconds": round(max((now - t for t in self._enqueued_at.values()), default=0.0), 3),
+                "wait_seconds": self._latency_stats(self._wait_times),
+                "processing_seconds": self._latency_stats(self._processing_times),
+            }
+
+    @staticmethod
+    def _latency_stats(samples: deque) -> Dict[str, float]:
+        if not samples:
+            return {"avg": 0.0, "max": 0.0, "samples": 0}
         return {
-            "queued": self._queue.qsize(),
-            "active": len(self._active),
-            "completed": len(self._completed),
-            "failed": len(self._failed)
+            "avg": round(sum(samples) / len(samples), 3),
+            "max": round(max(samples), 3),
+            "samples": len(samples)
         }
 
     def get_all_status(self) -> List[Dict[str, Any]]:
         """Get status of all documents."""
-        all_progress = []
-
-        # Get queued items (need to peek without removing)
         with self._lock:
-            queued_items = list(self._queue.queue)
-            for _, _, progress in queued_items:
-                all_progress.append(progress.to_dict())
-
-        # Active, completed, failed
-        for progress in self._active.values():
-            all_progress.append(progress.to_dict())
-        for progress in self._completed.values():
-            all_progress.append(progress.to_dict())
-        for progress in self._failed.values():
-            all_progress.append(progress.to_dict())
-
-        return all_progress
+            return [
+                progress.to_dict()
+                for bucket in (self._queued, self._waiting, self._active,
+                               self._completed, self._failed, self._cancelled)
+                for progress in bucket.values()
+            ]
 
 
 class DocumentProcessor:
@@ -534,6 +855,11 @@ class DocumentProcessor:
     Main orchestrator for document processing pipeline.
 
     Manages the flow: Upload -> Extract -> Analyze -> Classify -> Merge
+
+    Queued documents are processed by a pool of worker threads. Extraction
+    runs in the shared parsing processes; analysis runs concurrently in the
+    threads; classification and merging touch the shared fact store, so
+    they run one document at a time.
     """
 
     # Processing stages and their progress percentages
@@ -546,17 +872,32 @@ class DocumentProcessor:
         "complete": 100
     }
 
-    def __init__(self, document_registry=None, fact_store=None, fact_merger=None):
+    IDLE_WAIT_SECONDS = 1.0  # How long an idle worker blocks waiting for work
+
+    def __init__(
+        self,
+        document_registry=None,
+        fact_store=None,
+        fact_merger=None,
+        workers: Optional[int] = None,
+        parse_processes: Optional[int] = None,
+        parse_timeout: Optional[float] = None
+    ):
         self.queue = ProcessingQueue()
         self.extractor = ContentExtractor()
         self.document_registry = document_registry
         self.fact_store = fact_store
         self.fact_merger = fact_merger
 
-        # Background worker
-        self._worker_thread = None
+        # Background worker pool
+        self.workers = max(1, DOCUMENT_WORKERS if workers is None else workers)
+        self.parse_processes = DOCUMENT_PARSE_PROCESSES if parse_processes is None else parse_processes
+        self.parse_timeout = DOCUMENT_PARSE_TIMEOUT_SECONDS if parse_timeout is None else parse_timeout
+        self._worker_threads: List[threading.Thread] = []
         self._stop_worker = threading.Event()
         self._worker_running = False
+        self._merge_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
 
         # Callbacks for status updates
         self._status_callbacks: List[Callable] = []
@@ -581,7 +922,9 @@ class DocumentProcessor:
         doc_id: str,
         filename: str,
         file_path: str,
-        priority: ProcessingPriority = ProcessingPriority.NORMAL
+        priority: ProcessingPriority = ProcessingPriority.NORMAL,
+        deal_id: str = "",
+        content_hash: str = ""
     ) -> ProcessingProgress:
         """
         Add a document to the processing queue.
@@ -591,29 +934,49 @@ class DocumentProcessor:
             filename: Original filename
             file_path: Path to the file
             priority: Processing priority
+            deal_id: Deal the document belongs to (deals take turns)
+            content_hash: SHA-256 of the file (looked up in the registry if
+                not given); identical in-flight content in a deal is processed once
 
         Returns:
             ProcessingProgress for tracking
         """
+        if not content_hash and self.document_registry:
+            record = self.document_registry.get_document(doc_id)
+            content_hash = getattr(record, "content_hash", "") if record else ""
+
         progress = ProcessingProgress(
             doc_id=doc_id,
             filename=filename,
-            priority=priority
+            priority=priority,
+            deal_id=deal_id or "",
+            content_hash=content_hash or "",
+            file_path=file_path
         )
         progress.add_log(f"Document queued: {filename}")
 
-        # Store file path in metadata for processing
-        progress.log_entries.append({
-            "timestamp": datetime.now().isoformat(),
-            "level": "debug",
-            "message": f"file_path:{file_path}"
-        })
-
-        self.queue.add(progress)
+        progress = self.queue.add(progress)
         self._notify_status_change(progress)
 
         return progress
 
+    def cancel_document(self, doc_id: str) -> bool:
+        """
+        Cancel a queued or processing document.
+
+        A document already processing stops before its next stage; one that
+        has reached merging finishes.
+
+        Returns:
+            True if the document was found in the queue or processing
+        """
+        cancelled = self.queue.cancel(doc_id)
+        if cancelled:
+            progress = self.queue.get_status(doc_id)
+            if progress:
+                self._notify_status_change(progress)
+        return cancelled
+
     def process_single(self, doc_id: str, file_path: str) -> ProcessingProgress:
         """
         Process a single document immediately (synchronous).
@@ -637,48 +1000,53 @@ class DocumentProcessor:
         try:
             # Stage 1: Extract content
             self._update_stage(progress, "extracting", ProcessingStatus.EXTRACTING)
-            extraction = self.extractor.extract(file_path)
+            extraction = self._extract(file_path)
 
             if not extraction.success:
                 raise Exception(f"Extraction failed: {extraction.error}")
 
             progress.add_log(f"Extracted {extraction.word_count} words from {extraction.page_count} pages")
+            self._check_cancelled(progress)
 
             # Stage 2: Analyze content (extract facts)
             self._update_stage(progress, "analyzing", ProcessingStatus.ANALYZING)
             facts = self._analyze_content(extraction, progress.filename)
             progress.facts_extracted = len(facts)
             progress.add_log(f"Extracted {len(facts)} facts")
-
-            # Stage 3: Classify facts into tiers
-            self._update_stage(progress, "classifying", ProcessingStatus.CLASSIFYING)
-            classified = self._classify_facts(facts)
-            progress.add_log(f"Classified facts: {len(classified.get('tier1', []))} auto-apply, "
-                           f"{len(classified.get('tier2', []))} batch, "
-                           f"{len(classified.get('tier3', []))} individual")
-
-            # Store classified changes for review UI
-            for tier in ["tier1", "tier2", "tier3"]:
-                self.pending_changes[tier].extend(classified.get(tier, []))
-
-            # Persist pending changes to disk
-            self.save_pending_changes()
-
-            # Stage 4: Merge only auto-eligible tier 1 facts
-            # Tier 2 and 3 wait for human review
-            self._update_stage(progress, "merging", ProcessingStatus.MERGING)
-
-            # Get auto-eligible facts from tier 1
-            tier1_facts = classified.get("tier1", [])
-            auto_eligible_facts = [
-                item["fact"] for item in tier1_facts
-                if item.get("classification", {}).get("auto_apply_eligible", False)
-            ]
-
-            # Only merge auto-eligible facts
-            merge_result = {"added": [], "updated": [], "conflicts": []}
-            if auto_eligible_facts:
-                merge_result = self._merge_facts(auto_eligible_facts, progress.filename)
+            self._check_cancelled(progress)
+
+            # Classification compares against the fact store, so classify and
+            # merge one document at a time
+            with self._merge_lock:
+                # Stage 3: Classify facts into tiers
+                self._update_stage(progress, "classifying", ProcessingStatus.CLASSIFYING)
+                classified = self._classify_facts(facts)
+                progress.add_log(f"Classified facts: {len(classified.get('tier1', []))} auto-apply, "
+                               f"{len(classified.get('tier2', []))} batch, "
+                               f"{len(classified.get('tier3', []))} individual")
+
+                # Store classified changes for review UI
+                for tier in ["tier1", "tier2", "tier3"]:
+                    self.pending_changes[tier].extend(classified.get(tier, []))
+
+                # Persist pending changes to disk
+                self.save_pending_changes()
+
+                # Stage 4: Merge only auto-eligible tier 1 facts
+                # Tier 2 and 3 wait for human review
+                self._update_stage(progress, "merging", ProcessingStatus.MERGING)
+
+                # Get auto-eligible facts from tier 1
+                tier1_facts = classified.get("tier1", [])
+                auto_eligible_facts = [
+                    item["fact"] for item in tier1_facts
+                    if item.get("classification", {}).get("auto_apply_eligible", False)
+                ]
+
+                # Only merge auto-eligible facts
+                merge_result = {"added": [], "updated": [], "conflicts": []}
+                if auto_eligible_facts:
+                    merge_result = self._merge_facts(auto_eligible_facts, progress.filename)
 
             progress.facts_added = len(merge_result.get('added', []))
             progress.facts_updated = len(merge_result.get('updated', []))
@@ -702,12 +1070,18 @@ class DocumentProcessor:
             self._update_metrics(progress, elapsed_ms, success=True)
 
             # Update document registry
+            progress.fact_ids = merge_result.get('added', []) + merge_result.get('updated', [])
             if self.document_registry:
-                fact_ids = merge_result.get('added', []) + merge_result.get('updated', [])
-                self.document_registry.mark_processed(doc_id, fact_ids, elapsed_ms)
+                self.document_registry.mark_processed(doc_id, progress.fact_ids, elapsed_ms)
 
             return progress
 
+        except ProcessingCancelled:
+            progress.status = ProcessingStatus.CANCELLED
+            progress.add_log(f"Stopped after {progress.current_stage}")
+            self._notify_status_change(progress)
+            return progress
+
         except Exception as e:
             logger.error(f"Processing failed for {doc_id}: {e}")
             progress.status = ProcessingStatus.FAILED
@@ -721,6 +1095,36 @@ class DocumentProcessor:
 
             return progress
 
+    def _extract(self, file_path: str) -> ExtractionResult:
+        """Extract content, in the shared parsing processes when enabled."""
+        pool = get_parse_pool(self.parse_processes)
+        if pool is None:
+            return self.extractor.extract(file_path)
+
+        for attempt in range(2):
+            try:
+                return pool.submit(_extract_document, file_path).result(timeout=self.parse_timeout or None)
+            except BrokenProcessPool as e:
+                _discard_parse_pool(self.parse_processes, pool)
+                if attempt == 0 and pool in _timed_out_pools:
+                    # Killed for another document's timeout: parse again, without using a retry
+                    logger.info(f"Parsing pool was reset while parsing {file_path}; parsing again")
+                    pool = get_parse_pool(self.parse_processes)
+                    continue
+                # A parser crashed its process; the document is retried on a fresh pool
+                return ExtractionResult(content="", success=False, error=f"Parsing process died: {e}")
+            except FutureTimeoutError:
+                # A pool can't stop a single task, so a hung parser takes its pool down
+                _timed_out_pools.add(pool)
+                _discard_parse_pool(self.parse_processes, pool)
+                return ExtractionResult(content="", success=False,
+                                        error=f"Parsing timed out after {self.parse_timeout:g}s")
+
+    def _check_cancelled(self, progress: ProcessingProgress):
+        """Stop between stages if cancellation was requested."""
+        if self.queue.is_cancel_requested(progress.doc_id):
+            raise ProcessingCancelled(progress.doc_id)
+
     def _update_stage(self, progress: ProcessingProgress, stage: str, status: ProcessingStatus):
         """Update processing stage."""
         progress.current_stage = stage
@@ -803,74 +1207,92 @@ class DocumentProcessor:
 
     def _update_metrics(self, progress: ProcessingProgress, elapsed_ms: int, success: bool):
         """Update processing metrics."""
-        if success:
-            self.metrics["total_processed"] += 1
-            # Update rolling average
-            total = self.metrics["total_processed"]
-            current_avg = self.metrics["avg_processing_time_ms"]
-            self.metrics["avg_processing_time_ms"] = (
-                (current_avg * (total - 1) + elapsed_ms) / total
-            )
-        else:
-            self.metrics["total_failed"] += 1
+        with self._metrics_lock:
+            if success:
+                self.metrics["total_processed"] += 1
+                # Update rolling average
+                total = self.metrics["total_processed"]
+                current_avg = self.metrics["avg_processing_time_ms"]
+                self.metrics["avg_processing_time_ms"] = (
+                    (current_avg * (total - 1) + elapsed_ms) / total
+                )
+            else:
+                self.metrics["total_failed"] += 1
 
-        # Track by type
-        doc_type = os.path.splitext(progress.filename)[1].lower()
-        if doc_type not in self.metrics["by_type"]:
-            self.metrics["by_type"][doc_type] = {"processed": 0, "failed": 0}
+            # Track by type
+            doc_type = os.path.splitext(progress.filename)[1].lower()
+            if doc_type not in self.metrics["by_type"]:
+                self.metrics["by_type"][doc_type] = {"processed": 0, "failed": 0}
 
-        if success:
-            self.metrics["by_type"][doc_type]["processed"] += 1
-        else:
-            self.metrics["by_type"][doc_type]["failed"] += 1
+            if success:
+                self.metrics["by_type"][doc_type]["processed"] += 1
+            else:
+                self.metrics["by_type"][doc_type]["failed"] += 1
 
     # Background worker methods
     def start_worker(self):
-        """Start background processing worker."""
+        """Start the background worker pool."""
         if self._worker_running:
             return
 
         self._stop_worker.clear()
-        self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
-        self._worker_thread.start()
+        self._worker_threads = [
+            threading.Thread(target=self._worker_loop, name=f"document-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._worker_threads:
+            thread.start()
         self._worker_running = True
-        logger.info("Document processing worker started")
+        logger.info(f"Document processing workers started ({self.workers} threads, "
+                    f"{self.parse_processes} parsing processes)")
 
     def stop_worker(self, wait: bool = True):
-        """Stop background processing worker."""
+        """Stop the background worker pool."""
         if not self._worker_running:
             return
 
         self._stop_worker.set()
-        if wait and self._worker_thread:
-            self._worker_thread.join(timeout=30)
+        self.queue.wake_all()
+        if wait:
+            deadline = time.monotonic() + 30
+            for thread in self._worker_threads:
+                thread.join(timeout=max(0, deadline - time.monotonic()))
+        self._worker_threads = []
         self._worker_running = False
-        logger.info("Document processing worker stopped")
+        logger.info("Document processing workers stopped")
 
     def _worker_loop(self):
-        """Background worker loop."""
+        """Background worker loop (one per pool thread)."""
         while not self._stop_worker.is_set():
-            progress = self.queue.get_next()
-
+            progress = self.queue.get_next(timeout=self.IDLE_WAIT_SECONDS)
             if progress:
-                # Get file path from log entries
-                file_path = None
-                for entry in progress.log_entries:
-                    if entry.get("message", "").startswith("file_path:"):
-                        file_path = entry["message"].replace("file_path:", "")
-                        break
-
-                if file_path:
-                    self.queue.mark_active(progress.doc_id)
-                    result = self.process_single(progress.doc_id, file_path)
-
-                    if result.status == ProcessingStatus.COMPLETE:
-                        self.queue.mark_complete(progress.doc_id)
-                    elif result.status == ProcessingStatus.FAILED:
-                        self.queue.mark_failed(progress.doc_id, result.error_message)
-            else:
-                # No documents to process, wait a bit
-                time.sleep(1)
+                self._process_queued(progress)
+
+    def _process_queued(self, progress: ProcessingProgress):
+        """Run a dequeued document and record the outcome in the queue."""
+        doc_id = progress.doc_id
+        if not progress.file_path:
+            self.queue.mark_failed(doc_id, "No file path")
+            return
+
+        self.queue.mark_active(doc_id)
+        result = self.process_single(doc_id, progress.file_path)
+
+        if result.status == ProcessingStatus.COMPLETE:
+            followers = self.queue.mark_complete(doc_id)
+            for follower in followers:
+                if self.document_registry:
+                    self.document_registry.mark_processed(follower.doc_id, follower.fact_ids, 0)
+                self._notify_status_change(follower)
+        elif result.status == ProcessingStatus.FAILED:
+            followers = self.queue.mark_failed(doc_id, result.error_message)
+            for follower in followers:
+                if self.document_registry:
+                    self.document_registry.mark_failed(follower.doc_id, follower.error_message)
+                self._notify_status_change(follower)
+        elif result.status == ProcessingStatus.CANCELLED:
+            self.queue.mark_cancelled(doc_id)
+            self._notify_status_change(result)
 
     # Status callbacks
     def add_status_callback(self, callback: Callable):
@@ -897,6 +1319,8 @@ class DocumentProcessor:
     def get_queue_stats(self) -> Dict[str, Any]:
         """Get queue statistics."""
         stats = self.queue.get_queue_stats()
+        stats["workers"] = self.workers
+        stats["parse_processes"] = self.parse_processes
         stats["metrics"] = self.metrics
         return stats
 
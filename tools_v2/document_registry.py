@@ -8,6 +8,7 @@ Tracks which documents have been processed to enable:
 - Document version history
 """
 
+import codecs
 import hashlib
 import logging
 import json
@@ -134,6 +135,28 @@ class DocumentRegistry:
                 sha256.update(chunk)
         return sha256.hexdigest()
 
+    def save_and_hash(self, stream, file_path: str, chunk_size: int = 1024 * 1024) -> Tuple[str, int]:
+        """
+        Write an upload stream to file_path and hash it in the same pass.
+
+        The hash equals compute_hash(raw.decode('utf-8', errors='ignore')),
+        so records registered from streamed uploads match those registered
+        from in-memory content; only one chunk is held in memory at a time.
+
+        Returns:
+            (content_hash, bytes written)
+        """
+        sha256 = hashlib.sha256()
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        size = 0
+        with open(file_path, 'wb') as f:
+            for chunk in iter(lambda: stream.read(chunk_size), b''):
+                f.write(chunk)
+                size += len(chunk)
+                sha256.update(decoder.decode(chunk).encode('utf-8'))
+        sha256.update(decoder.decode(b'', final=True).encode('utf-8'))
+        return sha256.hexdigest(), size
+
     def detect_change(self, filename: str, content_hash: str) -> Tuple[ChangeType, Optional[str]]:
         """
         Detect what kind of change this document represents.
@@ -11,13 +11,21 @@ the entire due diligence process.
 
 import re
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Optional: C Aho-Corasick automaton for the multi-pattern exact pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 # =============================================================================
 # CONFIGURATION
@@ -32,6 +40,10 @@ MIN_QUOTE_LENGTH = 10                # Minimum quote length to verify
 WINDOW_SIZE_MULTIPLIER = 3           # Window = quote_length * this
 WINDOW_STEP_DIVISOR = 4              # Step = window_size / this
 
+# Batch verification
+AHOCORASICK_MIN_PATTERNS = 8         # Below this, per-quote str.find is faster
+PREPARED_DOCUMENT_CACHE_SIZE = 16    # Normalized documents kept per cache
+
 
 # =============================================================================
 # RESULT MODELS
@@ -239,6 +251,17 @@ def verify_quote_exists(
         )
 
     # Strategy 3: Fuzzy matching with sliding window
+    return _fuzzy_result(quote, norm_quote, norm_doc, verified_threshold, partial_threshold)
+
+
+def _fuzzy_result(
+    quote: str,
+    norm_quote: str,
+    norm_doc: str,
+    verified_threshold: float,
+    partial_threshold: float
+) -> VerificationResult:
+    """Build the result for a quote that had no exact or normalized match."""
     best_score, best_match, best_location = _fuzzy_match_sliding_window(
         norm_quote, norm_doc
     )
@@ -327,18 +350,226 @@ def _fuzzy_match_sliding_window(
 # BATCH VERIFICATION
 # =============================================================================
 
-def verify_all_facts(
-    facts: List[Dict[str, Any]],
+@dataclass
+class PreparedDocument:
+    """Document text normalized once for verifying many quotes against it."""
+    text: str
+    normalized: str
+
+    @classmethod
+    def from_text(cls, text: str) -> "PreparedDocument":
+        text = text or ""
+        return cls(text=text, normalized=normalize_text(text))
+
+
+class PreparedDocumentCache:
+    """
+    Small cache of PreparedDocuments keyed by document text.
+
+    Lets the validation pipeline normalize a document once and reuse it for
+    every domain validated against the same text. Keys are the text strings
+    themselves; Python caches str hashes, so repeat lookups are O(1).
+    """
+
+    def __init__(self, max_entries: int = PREPARED_DOCUMENT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._documents: Dict[str, PreparedDocument] = {}
+
+    def get(self, text: str) -> PreparedDocument:
+        text = text or ""
+        prepared = self._documents.get(text)
+        if prepared is None:
+            prepared = PreparedDocument.from_text(text)
+            if len(self._documents) >= self.max_entries:
+                # Evict oldest insertion (dicts preserve insertion order)
+                self._documents.pop(next(iter(self._documents)))
+            self._documents[text] = prepared
+        return prepared
+
+    def clear(self):
+        self._documents.clear()
+
+
+def find_first_occurrences(patterns: Iterable[str], text: str) -> Dict[str, int]:
+    """
+    Find the first start offset of each pattern in text in one pass.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed and there
+    are enough patterns to amortize building it; otherwise falls back to
+    per-pattern str.find. Both return identical offsets.
+
+    Args:
+        patterns: Strings to search for
+        text: Text to search
+
+    Returns:
+        Dict mapping each found pattern to its first start offset
+    """
+    unique = {p for p in patterns if p}
+    if not unique or not text:
+        return {}
+
+    found: Dict[str, int] = {}
+    if AHOCORASICK_AVAILABLE and len(unique) >= AHOCORASICK_MIN_PATTERNS:
+        automaton = ahocorasick.Automaton()
+        for pattern in unique:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+
+        # Matches are reported in order of end offset, so the first report
+        # for a pattern is its leftmost occurrence
+        for end, pattern in automaton.iter(text):
+            if pattern not in found:
+                found[pattern] = end - len(pattern) + 1
+                if len(found) == len(unique):
+                    break
+        return found
+
+    for pattern in unique:
+        position = text.find(pattern)
+        if position >= 0:
+            found[pattern] = position
+    return found
+
+
+def verify_quotes_in_document(
+    quotes: List[str],
+    document: PreparedDocument,
+    verified_threshold: float = DEFAULT_VERIFIED_THRESHOLD,
+    partial_threshold: float = DEFAULT_PARTIAL_THRESHOLD
+) -> List[VerificationResult]:
+    """
+    Verify many quotes against one document.
+
+    Produces the same results as calling verify_quote_exists() per quote,
+    but normalizes the document once, resolves exact and normalized-exact
+    matches for all quotes in a multi-pattern pass, and only runs the
+    sliding-window fuzzy match on the leftovers.
+
+    Args:
+        quotes: Evidence quotes (order preserved in the output)
+        document: Prepared source document
+        verified_threshold: Score above which quote is considered verified
+        partial_threshold: Score above which quote is considered partial match
+
+    Returns:
+        VerificationResult per quote, in input order
+    """
+    results: List[Optional[VerificationResult]] = [None] * len(quotes)
+    pending: List[int] = []
+
+    for idx, quote in enumerate(quotes):
+        if not quote or not document.text:
+            results[idx] = VerificationResult(
+                status="not_found",
+                match_score=0.0,
+                quote_provided=quote or "",
+                matched_text=None,
+                search_method="none"
+            )
+        elif len(quote.strip()) < MIN_QUOTE_LENGTH:
+            results[idx] = VerificationResult(
+                status="skipped",
+                match_score=0.0,
+                quote_provided=quote,
+                matched_text=None,
+                search_method="skipped_short"
+            )
+        else:
+            pending.append(idx)
+
+    # Pass 1: exact match for all quotes at once
+    exact = find_first_occurrences((quotes[idx] for idx in pending), document.text)
+    leftovers = []
+    for idx in pending:
+        quote = quotes[idx]
+        if quote in exact:
+            results[idx] = VerificationResult(
+                status="verified",
+                match_score=1.0,
+                quote_provided=quote,
+                matched_text=quote,
+                search_method="exact",
+                match_location=exact[quote]
+            )
+        else:
+            leftovers.append(idx)
+
+    # Pass 2: normalized exact match for the rest
+    normalized_quotes = {idx: normalize_text(quotes[idx]) for idx in leftovers}
+    normalized_exact = find_first_occurrences(normalized_quotes.values(), document.normalized)
+    for idx in leftovers:
+        quote, norm_quote = quotes[idx], normalized_quotes[idx]
+        if norm_quote in normalized_exact:
+            results[idx] = VerificationResult(
+                status="verified",
+                match_score=0.98,  # Slightly lower than exact
+                quote_provided=quote,
+                matched_text=norm_quote,
+                search_method="normalized_exact",
+                match_location=normalized_exact[norm_quote],
+                normalized_quote=norm_quote
+            )
+        else:
+            # Pass 3: fuzzy alignment only for quotes with no exact hit
+            results[idx] = _fuzzy_result(
+                quote, norm_quote, document.normalized,
+                verified_threshold, partial_threshold
+            )
+
+    return results
+
+
+def _verify_document_group(
     document_text: str,
-    domain: str = "unknown"
+    quotes: List[str],
+    verified_threshold: float,
+    partial_threshold: float
+) -> List[VerificationResult]:
+    """Process-pool entry point: prepare one document and verify its quotes."""
+    return verify_quotes_in_document(
+        quotes, PreparedDocument.from_text(document_text),
+        verified_threshold, partial_threshold
+    )
+
+
+def _extract_quote(fact: Dict[str, Any]) -> str:
+    """Get the evidence quote from a fact dictionary."""
+    evidence = fact.get("evidence", {})
+    if isinstance(evidence, dict):
+        return evidence.get("exact_quote", "")
+    elif isinstance(evidence, str):
+        return evidence
+    return ""
+
+
+def verify_facts_batch(
+    facts: List[Dict[str, Any]],
+    document_text: str = "",
+    domain: str = "unknown",
+    documents: Optional[Dict[str, str]] = None,
+    document_cache: Optional[PreparedDocumentCache] = None,
+    max_workers: int = 1,
+    verified_threshold: float = DEFAULT_VERIFIED_THRESHOLD,
+    partial_threshold: float = DEFAULT_PARTIAL_THRESHOLD
 ) -> EvidenceVerificationReport:
     """
-    Verify evidence for all facts in a domain.
+    Verify evidence for many facts, grouped by source document.
+
+    Facts whose source_document is in `documents` are checked against that
+    document's text; all others are checked against `document_text`. Each
+    document is normalized once and all of its quotes are verified together
+    (see verify_quotes_in_document).
 
     Args:
         facts: List of fact dictionaries with 'fact_id' and 'evidence' fields
-        document_text: The source document text
+        document_text: Fallback text for facts without a known source document
         domain: Domain name for reporting
+        documents: Optional mapping of source_document name -> document text
+        document_cache: Optional cache to reuse normalized documents across calls
+        max_workers: Fan documents out to a process pool when > 1
+        verified_threshold: Score above which quote is considered verified
+        partial_threshold: Score above which quote is considered partial match
 
     Returns:
         EvidenceVerificationReport with results for all facts
@@ -351,25 +582,52 @@ def verify_all_facts(
         total_facts=len(facts)
     )
 
-    for fact in facts:
-        fact_id = fact.get("fact_id", "unknown")
+    # Group quotes by the text they must be found in, remembering fact order
+    groups: Dict[str, List[Tuple[int, str]]] = {}
+    for idx, fact in enumerate(facts):
+        quote = _extract_quote(fact)
+        if not quote:
+            continue
+        source = fact.get("source_document", "")
+        text = documents[source] if documents and source in documents else document_text
+        groups.setdefault(text, []).append((idx, quote))
+
+    fact_results: Dict[int, VerificationResult] = {}
+    texts = list(groups)
+
+    if max_workers > 1 and len(texts) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(texts))) as executor:
+            futures = [
+                executor.submit(
+                    _verify_document_group, text, [q for _, q in groups[text]],
+                    verified_threshold, partial_threshold
+                )
+                for text in texts
+            ]
+            for text, future in zip(texts, futures):
+                for (idx, _), result in zip(groups[text], future.result()):
+                    fact_results[idx] = result
+    else:
+        cache = document_cache or PreparedDocumentCache()
+        for text in texts:
+            entries = groups[text]
+            group_results = verify_quotes_in_document(
+                [q for _, q in entries], cache.get(text),
+                verified_threshold, partial_threshold
+            )
+            for (idx, _), result in zip(entries, group_results):
+                fact_results[idx] = result
 
-        # Extract quote from evidence
-        evidence = fact.get("evidence", {})
-        if isinstance(evidence, dict):
-            quote = evidence.get("exact_quote", "")
-        elif isinstance(evidence, str):
-            quote = evidence
-        else:
-            quote = ""
+    # Aggregate in original fact order
+    for idx, fact in enumerate(facts):
+        fact_id = fact.get("fact_id", "unknown")
+        result = fact_results.get(idx)
 
         # Skip if no quote
-        if not quote:
+        if result is None:
             report.skipped_count += 1
             continue
 
-        # Verify the quote
-        result = verify_quote_exists(quote, document_text)
         report.results[fact_id] = result
 
         # Update counts
@@ -390,12 +648,32 @@ def verify_all_facts(
         f"Evidence verification for {domain}: "
         f"{report.verified_count}/{report.total_facts} verified, "
         f"{report.not_found_count} not found, "
+        f"{len(texts)} document(s), "
         f"{report.verification_time_ms:.1f}ms"
     )
 
     return report
 
 
+def verify_all_facts(
+    facts: List[Dict[str, Any]],
+    document_text: str,
+    domain: str = "unknown"
+) -> EvidenceVerificationReport:
+    """
+    Verify evidence for all facts in a domain.
+
+    Args:
+        facts: List of fact dictionaries with 'fact_id' and 'evidence' fields
+        document_text: The source document text
+        domain: Domain name for reporting
+
+    Returns:
+        EvidenceVerificationReport with results for all facts
+    """
+    return verify_facts_batch(facts, document_text=document_text, domain=domain)
+
+
 # =============================================================================
 # INTEGRATION HELPERS
 # =============================================================================
@@ -607,14 +885,7 @@ def extract_quotes_from_facts(facts: List[Dict[str, Any]]) -> Dict[str, str]:
     quotes = {}
     for fact in facts:
         fact_id = fact.get("fact_id", "")
-        evidence = fact.get("evidence", {})
-
-        if isinstance(evidence, dict):
-            quote = evidence.get("exact_quote", "")
-        elif isinstance(evidence, str):
-            quote = evidence
-        else:
-            quote = ""
+        quote = _extract_quote(fact)
 
         if quote and fact_id:
             quotes[fact_id] = quote
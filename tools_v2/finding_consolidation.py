@@ -0,0 +1,213 @@
+"""
+Finding Consolidation Engine
+
+Candidate search behind ReasoningStore.consolidate_findings (Point 78).
+
+The original implementation compared every pair of findings with
+SequenceMatcher, which is quadratic with an expensive inner kernel and
+takes tens of seconds on deals with 500+ findings. This engine produces
+the same pairs and scores while scoring far fewer pairs:
+
+- Blocking: candidates come from an inverted index of cited fact IDs
+  (pairs that share evidence) plus an exact normalized-title index
+  (pairs that can only reach the threshold with identical titles).
+  An exhaustive scan is used only when the threshold is low enough that
+  non-identical titles without shared evidence could still qualify.
+- Batched overlap: fact-overlap (Jaccard) for every candidate pair is
+  derived in one pass from the inverted index, not per-pair set math.
+- Pruning: each candidate is checked against score upper bounds
+  (title = 1.0, then SequenceMatcher.real_quick_ratio/quick_ratio)
+  before the full ratio is computed.
+- Reuse: one SequenceMatcher per second sequence, so its b2j index is
+  built once rather than once per pair.
+
+Scores use exactly the same weights and argument order as the pairwise
+loop, so the returned pairs are identical for any threshold.
+"""
+
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Sequence, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Weights for the consolidation score (must match Point 78 semantics)
+TITLE_WEIGHT = 0.4
+FACT_WEIGHT = 0.3
+ATTRIBUTE_WEIGHT = 0.15
+
+# Score above which a pair is recommended for merging rather than review
+MERGE_RECOMMENDATION_THRESHOLD = 0.85
+
+
+def weighted_similarity(title_sim: float, fact_sim: float, same_a: bool, same_b: bool) -> float:
+    """Combine component similarities into the consolidation score."""
+    return (
+        TITLE_WEIGHT * title_sim +
+        FACT_WEIGHT * fact_sim +
+        ATTRIBUTE_WEIGHT * (1.0 if same_a else 0.0) +
+        ATTRIBUTE_WEIGHT * (1.0 if same_b else 0.0)
+    )
+
+
+def _shared_fact_counts(fact_sets: List[Set[str]]) -> Dict[Tuple[int, int], int]:
+    """
+    Count shared cited facts for every pair of findings that shares any.
+
+    Returns:
+        Dict mapping (i, j) with i < j to the size of the intersection
+    """
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for idx, facts in enumerate(fact_sets):
+        for fact_id in facts:
+            postings[fact_id].append(idx)
+
+    shared: Dict[Tuple[int, int], int] = defaultdict(int)
+    for members in postings.values():
+        # Postings are built in index order, so members[x] < members[y]
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                shared[(members[x], members[y])] += 1
+    return shared
+
+
+def _title_block_pairs(titles: List[str]) -> Set[Tuple[int, int]]:
+    """Pairs of findings whose normalized titles are identical."""
+    blocks: Dict[str, List[int]] = defaultdict(list)
+    for idx, title in enumerate(titles):
+        blocks[title].append(idx)
+
+    pairs: Set[Tuple[int, int]] = set()
+    for members in blocks.values():
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                pairs.add((members[x], members[y]))
+    return pairs
+
+
+def _needs_exhaustive_scan(titles: List[str], similarity_threshold: float) -> Tuple[bool, bool]:
+    """
+    Decide how title-only candidates (no shared facts) must be found.
+
+    For two non-identical strings SequenceMatcher.ratio() is at most
+    (T - 1) / T where T is their combined length, so the longest titles
+    give an exact ceiling for any non-identical pair.
+
+    Returns:
+        (exhaustive, identical_titles) where exhaustive means non-identical
+        titles without shared facts may still qualify, and identical_titles
+        means identical titles without shared facts may qualify.
+    """
+    if weighted_similarity(1.0, 0.0, True, True) < similarity_threshold:
+        return False, False
+
+    max_total = 2 * max((len(t) for t in titles), default=0)
+    if max_total == 0:
+        return False, True
+
+    ceiling = (max_total - 1) / max_total
+    return weighted_similarity(ceiling, 0.0, True, True) >= similarity_threshold, True
+
+
+def find_similar_pairs(
+    findings: Sequence[Any],
+    facts_attr: str,
+    match_attrs: Sequence[Tuple[str, str]],
+    similarity_threshold: float = 0.7
+) -> List[Dict[str, Any]]:
+    """
+    Find pairs of findings that are likely duplicates.
+
+    Args:
+        findings: Findings with finding_id, title, domain attributes
+        facts_attr: Attribute holding the cited fact IDs (e.g. "based_on_facts")
+        match_attrs: Two (breakdown_key, attribute) pairs scored on equality,
+            e.g. (("same_category", "category"), ("same_lens", "mna_lens"))
+        similarity_threshold: Minimum similarity score to flag (0.0-1.0)
+
+    Returns:
+        Pair dicts in the same order as a nested i < j pairwise scan
+    """
+    n = len(findings)
+    if n < 2:
+        return []
+
+    (key_a, attr_a), (key_b, attr_b) = match_attrs
+    titles = [f.title.lower() for f in findings]
+    fact_sets = [set(getattr(f, facts_attr) or []) for f in findings]
+    values_a = [getattr(f, attr_a) for f in findings]
+    values_b = [getattr(f, attr_b) for f in findings]
+
+    shared = _shared_fact_counts(fact_sets)
+    exhaustive, identical_titles = _needs_exhaustive_scan(titles, similarity_threshold)
+
+    # Group candidate first-indices by second index so each title is
+    # loaded into a SequenceMatcher as seq2 exactly once
+    candidates_by_j: Dict[int, Set[int]] = defaultdict(set)
+    if not exhaustive:
+        for i, j in shared:
+            candidates_by_j[j].add(i)
+        if identical_titles:
+            for i, j in _title_block_pairs(titles):
+                candidates_by_j[j].add(i)
+
+    scored = 0
+    results: List[Tuple[int, int, Dict[str, Any]]] = []
+    matcher = SequenceMatcher(None)
+
+    for j in range(1, n):
+        first_indices = range(j) if exhaustive else sorted(candidates_by_j.get(j, ()))
+        if not first_indices:
+            continue
+
+        matcher.set_seq2(titles[j])
+        len_j = len(fact_sets[j])
+
+        for i in first_indices:
+            inter = shared.get((i, j), 0)
+            fact_sim = inter / (len(fact_sets[i]) + len_j - inter) if inter else 0.0
+            same_a = values_a[i] == values_a[j]
+            same_b = values_b[i] == values_b[j]
+
+            # Cheapest bound first: perfect title match
+            if weighted_similarity(1.0, fact_sim, same_a, same_b) < similarity_threshold:
+                continue
+
+            matcher.set_seq1(titles[i])
+            if weighted_similarity(matcher.real_quick_ratio(), fact_sim, same_a, same_b) < similarity_threshold:
+                continue
+            if weighted_similarity(matcher.quick_ratio(), fact_sim, same_a, same_b) < similarity_threshold:
+                continue
+
+            scored += 1
+            title_sim = matcher.ratio()
+            similarity = weighted_similarity(title_sim, fact_sim, same_a, same_b)
+            if similarity < similarity_threshold:
+                continue
+
+            finding_a, finding_b = findings[i], findings[j]
+            results.append((i, j, {
+                "item_a": {"id": finding_a.finding_id, "title": finding_a.title, "domain": finding_a.domain},
+                "item_b": {"id": finding_b.finding_id, "title": finding_b.title, "domain": finding_b.domain},
+                "similarity_score": round(similarity, 3),
+                "breakdown": {
+                    "title_similarity": round(title_sim, 2),
+                    "fact_overlap": round(fact_sim, 2),
+                    key_a: same_a,
+                    key_b: same_b
+                },
+                "recommendation": (
+                    "Consider merging" if similarity > MERGE_RECOMMENDATION_THRESHOLD
+                    else "Review for overlap"
+                )
+            }))
+
+    logger.debug(
+        f"Consolidation: {n} findings, {scored} pairs fully scored, "
+        f"{len(results)} flagged (exhaustive={exhaustive})"
+    )
+
+    results.sort(key=lambda r: (r[0], r[1]))
+    return [pair for _, _, pair in results]
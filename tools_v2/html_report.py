@@ -11,7 +11,7 @@ COST CALCULATION:
 """
 
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 from datetime import datetime
 from stores.fact_store import FactStore
 from tools_v2.reasoning_tools import ReasoningStore
@@ -22,6 +22,7 @@ from tools_v2.consistency_engine import (
     categorize_work_item
 )
 from tools_v2.cost_database import get_database_stats
+from tools_v2.renderers.fragment_cache import FragmentCache, content_hash, get_fragment_cache
 
 # Report version for tracking
 REPORT_VERSION = "2.1.0"
@@ -55,8 +56,8 @@ def generate_html_report(
 
     output_file = output_dir / f"it_dd_report_{timestamp}.html"
 
-    html = _build_html(fact_store, reasoning_store, timestamp, target_name, company_profile)
-    output_file.write_text(html)
+    with open(output_file, 'w') as f:
+        f.writelines(_iter_html(fact_store, reasoning_store, timestamp, target_name, company_profile))
 
     return output_file
 
@@ -90,6 +91,26 @@ def _build_html(
     company_profile: CompanyProfile = None
 ) -> str:
     """Build the complete HTML document."""
+    return ''.join(_iter_html(fact_store, reasoning_store, timestamp, target_name, company_profile))
+
+
+def _iter_html(
+    fact_store: FactStore,
+    reasoning_store: ReasoningStore,
+    timestamp: str,
+    target_name: str = None,
+    company_profile: CompanyProfile = None,
+    cache: FragmentCache = None
+) -> Iterator[str]:
+    """
+    Build the complete HTML document as a stream of chunks.
+
+    The summary and cost overview come first; the risks, work items, facts
+    and gaps sections follow from the fragment cache, so a report whose
+    findings did not change since the last run only re-renders the summary.
+    """
+    if cache is None:
+        cache = get_fragment_cache()
 
     # Use target name or default
     company_name = target_name or "Target Company"
@@ -137,21 +158,7 @@ def _build_html(
         if risk.severity in severity_counts:
             severity_counts[risk.severity] += 1
 
-    # Build risks HTML
-    risks_html = _build_risks_section(reasoning_store.risks, fact_store)
-
-    # Build work items HTML (with deterministic cost calculations)
-    work_items_html = _build_work_items_section(
-        reasoning_store.work_items, reasoning_store.risks, fact_store, company_profile
-    )
-
-    # Build facts HTML
-    facts_html = _build_facts_section(fact_store.facts)
-
-    # Build gaps HTML
-    gaps_html = _build_gaps_section(fact_store.gaps)
-
-    return f'''<!DOCTYPE html>
+    yield f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -716,19 +723,48 @@ def _build_html(
             </div>
         </section>
 
-        {risks_html}
+        '''
 
-        {work_items_html}
+    # Risks
+    yield cache.render(
+        "risks", "all", "all", content_hash(reasoning_store.risks),
+        lambda: _build_risks_section(reasoning_store.risks, fact_store)
+    )
+    yield "\n\n        "
+
+    # Work items (with deterministic cost calculations)
+    yield cache.render(
+        "work_items", "all", "all",
+        content_hash(reasoning_store.work_items, reasoning_store.risks, company_profile),
+        lambda: _build_work_items_section(
+            reasoning_store.work_items, reasoning_store.risks, fact_store, company_profile
+        )
+    )
+    yield "\n\n        "
+
+    # Facts
+    yield cache.render(
+        "facts", "all", "all", content_hash(fact_store.facts),
+        lambda: _build_facts_section(fact_store.facts)
+    )
+    yield "\n\n        "
+
+    # Gaps
+    yield cache.render(
+        "gaps", "all", "all", content_hash(fact_store.gaps),
+        lambda: _build_gaps_section(fact_store.gaps)
+    )
+    yield _REPORT_TAIL
 
-        {facts_html}
 
-        {gaps_html}
+# Closing markup and client-side filtering, after the last section
+_REPORT_TAIL = '''
 
     </div>
 
     <script>
     // Filtering functionality
-    function initFilters(sectionId) {{
+    function initFilters(sectionId) {
         const section = document.getElementById(sectionId);
         if (!section) return;
 
@@ -736,55 +772,55 @@ def _build_html(
         const items = section.querySelectorAll('.item[data-domain]');
         const countEl = section.querySelector('.filter-count');
 
-        function applyFilters() {{
-            const filterValues = {{}};
-            filters.forEach(f => {{
+        function applyFilters() {
+            const filterValues = {};
+            filters.forEach(f => {
                 filterValues[f.dataset.filter] = f.value;
-            }});
+            });
 
             let visible = 0;
-            items.forEach(item => {{
+            items.forEach(item => {
                 let show = true;
-                for (const [key, val] of Object.entries(filterValues)) {{
-                    if (val && item.dataset[key] !== val) {{
+                for (const [key, val] of Object.entries(filterValues)) {
+                    if (val && item.dataset[key] !== val) {
                         show = false;
                         break;
-                    }}
-                }}
+                    }
+                }
                 item.classList.toggle('hidden', !show);
                 if (show) visible++;
-            }});
+            });
 
-            if (countEl) {{
-                countEl.textContent = `Showing ${{visible}} of ${{items.length}}`;
-            }}
+            if (countEl) {
+                countEl.textContent = `Showing ${visible} of ${items.length}`;
+            }
 
             // Show/hide domain sections based on visible items
-            section.querySelectorAll('.domain-section').forEach(ds => {{
+            section.querySelectorAll('.domain-section').forEach(ds => {
                 const hasVisible = ds.querySelector('.item:not(.hidden)');
                 ds.style.display = hasVisible ? 'block' : 'none';
-            }});
-        }}
+            });
+        }
 
         filters.forEach(f => f.addEventListener('change', applyFilters));
 
         // Clear filters button
         const clearBtn = section.querySelector('.clear-filters');
-        if (clearBtn) {{
-            clearBtn.addEventListener('click', () => {{
+        if (clearBtn) {
+            clearBtn.addEventListener('click', () => {
                 filters.forEach(f => f.value = '');
                 applyFilters();
-            }});
-        }}
-    }}
+            });
+        }
+    }
 
     // Initialize all sections
-    document.addEventListener('DOMContentLoaded', () => {{
+    document.addEventListener('DOMContentLoaded', () => {
         initFilters('risks');
         initFilters('work-items');
         initFilters('facts');
         initFilters('gaps');
-    }});
+    });
     </script>
 </body>
 </html>'''
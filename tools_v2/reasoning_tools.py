@@ -12,7 +12,7 @@ Tool Functions:
 - complete_reasoning: Signal reasoning phase complete
 """
 
-from typing import Dict, List, Any, Optional, TYPE_CHECKING, Set
+from typing import Dict, List, Any, Optional, TYPE_CHECKING, Set, Tuple
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 import logging
@@ -636,6 +636,23 @@ class ReasoningStore:
         }
         # Thread safety: Lock for all mutating operations
         self._lock = threading.RLock()
+        # Outbox: append-only (finding_type, finding) log of added findings,
+        # read by cursor so persistence only handles what is new
+        self._outbox: List[Tuple[str, Any]] = []
+
+    def pending_findings(self, cursor: int = 0) -> Tuple[List[Tuple[str, Any]], int]:
+        """
+        Get findings added since cursor.
+
+        Args:
+            cursor: Value returned by the previous call (0 for everything)
+
+        Returns:
+            Tuple of ((finding_type, finding) pairs in insertion order, new cursor).
+            finding_type is risk, strategic_consideration, work_item or recommendation.
+        """
+        with self._lock:
+            return self._outbox[cursor:], len(self._outbox)
 
     def _generate_id(self, prefix: str) -> str:
         """
@@ -816,6 +833,7 @@ class ReasoningStore:
 
             risk = Risk(**kwargs)
             self.risks.append(risk)
+            self._outbox.append(("risk", risk))
             logger.debug(f"Added risk {risk_id}: {risk.title} [entity={risk.entity}]")
             return risk_id
 
@@ -846,6 +864,7 @@ class ReasoningStore:
 
             sc = StrategicConsideration(**kwargs)
             self.strategic_considerations.append(sc)
+            self._outbox.append(("strategic_consideration", sc))
             logger.debug(f"Added strategic consideration {sc_id}: {sc.title} [entity={sc.entity}]")
             return sc_id
 
@@ -893,6 +912,7 @@ class ReasoningStore:
 
             wi = WorkItem(**kwargs)
             self.work_items.append(wi)
+            self._outbox.append(("work_item", wi))
             buildup_info = ""
             if wi.cost_buildup is not None:
                 buildup_info = f" [buildup: {wi.cost_buildup.anchor_key} ${wi.cost_buildup.total_low:,.0f}-${wi.cost_buildup.total_high:,.0f}]"
@@ -926,6 +946,7 @@ class ReasoningStore:
 
             rec = Recommendation(**kwargs)
             self.recommendations.append(rec)
+            self._outbox.append(("recommendation", rec))
             logger.debug(f"Added recommendation {rec_id}: {rec.title} [entity={rec.entity}]")
             return rec_id
 
@@ -1361,87 +1382,25 @@ class ReasoningStore:
         Returns:
             Dict with consolidation recommendations
         """
-        from difflib import SequenceMatcher
-
-        def title_similarity(a: str, b: str) -> float:
-            """Calculate title similarity using SequenceMatcher."""
-            return SequenceMatcher(None, a.lower(), b.lower()).ratio()
-
-        def fact_overlap(facts_a: List[str], facts_b: List[str]) -> float:
-            """Calculate overlap in cited facts."""
-            if not facts_a or not facts_b:
-                return 0.0
-            set_a, set_b = set(facts_a), set(facts_b)
-            intersection = len(set_a & set_b)
-            union = len(set_a | set_b)
-            return intersection / union if union > 0 else 0.0
+        from tools_v2.finding_consolidation import find_similar_pairs
 
         with self._lock:
             consolidation_groups = {
-                "risks": [],
-                "work_items": [],
+                "risks": find_similar_pairs(
+                    self.risks,
+                    facts_attr="based_on_facts",
+                    match_attrs=(("same_category", "category"), ("same_lens", "mna_lens")),
+                    similarity_threshold=similarity_threshold
+                ),
+                "work_items": find_similar_pairs(
+                    self.work_items,
+                    facts_attr="triggered_by",
+                    match_attrs=(("same_phase", "phase"), ("same_owner", "owner_type")),
+                    similarity_threshold=similarity_threshold
+                ),
                 "strategic_considerations": []
             }
 
-            # Check risks for similarity
-            for i, risk_a in enumerate(self.risks):
-                for risk_b in self.risks[i+1:]:
-                    title_sim = title_similarity(risk_a.title, risk_b.title)
-                    fact_sim = fact_overlap(risk_a.based_on_facts, risk_b.based_on_facts)
-                    same_category = risk_a.category == risk_b.category
-                    same_lens = risk_a.mna_lens == risk_b.mna_lens
-
-                    # Weighted similarity score
-                    similarity = (
-                        0.4 * title_sim +
-                        0.3 * fact_sim +
-                        0.15 * (1.0 if same_category else 0.0) +
-                        0.15 * (1.0 if same_lens else 0.0)
-                    )
-
-                    if similarity >= similarity_threshold:
-                        consolidation_groups["risks"].append({
-                            "item_a": {"id": risk_a.finding_id, "title": risk_a.title, "domain": risk_a.domain},
-                            "item_b": {"id": risk_b.finding_id, "title": risk_b.title, "domain": risk_b.domain},
-                            "similarity_score": round(similarity, 3),
-                            "breakdown": {
-                                "title_similarity": round(title_sim, 2),
-                                "fact_overlap": round(fact_sim, 2),
-                                "same_category": same_category,
-                                "same_lens": same_lens
-                            },
-                            "recommendation": "Consider merging" if similarity > 0.85 else "Review for overlap"
-                        })
-
-            # Check work items for similarity
-            for i, wi_a in enumerate(self.work_items):
-                for wi_b in self.work_items[i+1:]:
-                    title_sim = title_similarity(wi_a.title, wi_b.title)
-                    fact_sim = fact_overlap(wi_a.triggered_by, wi_b.triggered_by)
-                    same_phase = wi_a.phase == wi_b.phase
-                    same_owner = wi_a.owner_type == wi_b.owner_type
-
-                    similarity = (
-                        0.4 * title_sim +
-                        0.3 * fact_sim +
-                        0.15 * (1.0 if same_phase else 0.0) +
-                        0.15 * (1.0 if same_owner else 0.0)
-                    )
-
-                    if similarity >= similarity_threshold:
-                        consolidation_groups["work_items"].append({
-                            "item_a": {"id": wi_a.finding_id, "title": wi_a.title, "domain": wi_a.domain},
-                            "item_b": {"id": wi_b.finding_id, "title": wi_b.title, "domain": wi_b.domain},
-                            "similarity_score": round(similarity, 3),
-                            "breakdown": {
-                                "title_similarity": round(title_sim, 2),
-                                "fact_overlap": round(fact_sim, 2),
-                                "same_phase": same_phase,
-                                "same_owner": same_owner
-                            },
-                            "recommendation": "Consider merging" if similarity > 0.85 else "Review for overlap"
-                        })
-
             return {
                 "consolidation_candidates": consolidation_groups,
                 "summary": {
@@ -1790,6 +1749,7 @@ class ReasoningStore:
                     counts["duplicates"] += 1
                     continue
                 self.risks.append(risk)
+                self._outbox.append(("risk", risk))
                 existing_risk_ids.add(risk.finding_id)
                 self._used_ids.add(risk.finding_id)  # Track stable ID
                 counts["risks"] += 1
@@ -1801,6 +1761,7 @@ class ReasoningStore:
                     counts["duplicates"] += 1
                     continue
                 self.strategic_considerations.append(sc)
+                self._outbox.append(("strategic_consideration", sc))
                 existing_sc_ids.add(sc.finding_id)
                 self._used_ids.add(sc.finding_id)  # Track stable ID
                 counts["strategic"] += 1
@@ -1812,6 +1773,7 @@ class ReasoningStore:
                     counts["duplicates"] += 1
                     continue
                 self.work_items.append(wi)
+                self._outbox.append(("work_item", wi))
                 existing_wi_ids.add(wi.finding_id)
                 self._used_ids.add(wi.finding_id)  # Track stable ID
                 counts["work_items"] += 1
@@ -1823,6 +1785,7 @@ class ReasoningStore:
                     counts["duplicates"] += 1
                     continue
                 self.recommendations.append(rec)
+                self._outbox.append(("recommendation", rec))
                 existing_rec_ids.add(rec.finding_id)
                 self._used_ids.add(rec.finding_id)  # Track stable ID
                 counts["recommendations"] += 1
@@ -1866,6 +1829,7 @@ class ReasoningStore:
             for risk_dict in findings_dict.get("risks", []):
                 risk = Risk.from_dict(risk_dict)
                 self.risks.append(risk)
+                self._outbox.append(("risk", risk))
                 self._used_ids.add(risk.finding_id)  # Track stable ID
                 counts["risks"] += 1
                 update_counter(risk.finding_id, "R")
@@ -1874,6 +1838,7 @@ class ReasoningStore:
             for sc_dict in findings_dict.get("strategic_considerations", []):
                 sc = StrategicConsideration.from_dict(sc_dict)
                 self.strategic_considerations.append(sc)
+                self._outbox.append(("strategic_consideration", sc))
                 self._used_ids.add(sc.finding_id)  # Track stable ID
                 counts["strategic"] += 1
                 update_counter(sc.finding_id, "SC")
@@ -1882,6 +1847,7 @@ class ReasoningStore:
             for wi_dict in findings_dict.get("work_items", []):
                 wi = WorkItem.from_dict(wi_dict)
                 self.work_items.append(wi)
+                self._outbox.append(("work_item", wi))
                 self._used_ids.add(wi.finding_id)  # Track stable ID
                 counts["work_items"] += 1
                 update_counter(wi.finding_id, "WI")
@@ -1890,6 +1856,7 @@ class ReasoningStore:
             for rec_dict in findings_dict.get("recommendations", []):
                 rec = Recommendation.from_dict(rec_dict)
                 self.recommendations.append(rec)
+                self._outbox.append(("recommendation", rec))
                 self._used_ids.add(rec.finding_id)  # Track stable ID
                 counts["recommendations"] += 1
                 update_counter(rec.finding_id, "REC")
@@ -1991,6 +1958,14 @@ class ReasoningStore:
                 seq = safe_parse_seq(rec.finding_id, "REC")
                 store._counters["REC"] = max(store._counters.get("REC", 0), seq)
 
+        # Loaded findings are new to this process's outbox
+        store._outbox = (
+            [("risk", r) for r in store.risks] +
+            [("strategic_consideration", sc) for sc in store.strategic_considerations] +
+            [("work_item", wi) for wi in store.work_items] +
+            [("recommendation", rec) for rec in store.recommendations]
+        )
+
         logger.info(f"Loaded {len(store.risks)} risks, {len(store.work_items)} work items from {path}")
         return store
 
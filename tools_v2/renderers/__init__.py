@@ -13,10 +13,18 @@ from tools_v2.renderers.dashboard_renderer import (
     DashboardRenderer,
     render_dashboard,
 )
+from tools_v2.renderers.fragment_cache import (
+    FragmentCache,
+    content_hash,
+    get_fragment_cache,
+)
 
 __all__ = [
     "DomainReportRenderer",
     "render_domain_report",
     "DashboardRenderer",
     "render_dashboard",
+    "FragmentCache",
+    "content_hash",
+    "get_fragment_cache",
 ]
@@ -0,0 +1,144 @@
+"""
+Report Fragment Cache
+
+Caches rendered HTML fragments so that regenerating a report after a small
+edit only re-renders the sections whose inputs changed.
+
+Fragments are keyed by (section, domain, entity, content hash of the inputs
+the section reads). Renderers that produce documents as a sequence of
+fragments expose an iter_* generator; callers can stream the chunks (Flask
+Response, file.writelines) or join them for the complete document.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+REPORT_FRAGMENT_CACHE_SIZE = int(os.environ.get('REPORT_FRAGMENT_CACHE_SIZE', '2000'))  # Fragments kept (LRU)
+
+FragmentKey = Tuple[str, str, str, str]  # (section, domain, entity, content hash)
+
+
+# =============================================================================
+# CONTENT HASHING
+# =============================================================================
+
+def _canonical(value: Any) -> Any:
+    """Convert report inputs to JSON-serializable data with a stable layout."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _canonical(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(v) for v in value), key=repr)
+    return value
+
+
+def content_hash(*inputs: Any) -> str:
+    """
+    Hash the inputs a fragment is rendered from.
+
+    Dataclasses are hashed field by field (nested dataclasses included), so
+    equal records give equal hashes regardless of identity. Values JSON
+    cannot encode are hashed by str().
+    """
+    payload = json.dumps([_canonical(value) for value in inputs], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+# =============================================================================
+# FRAGMENT CACHE
+# =============================================================================
+
+class FragmentCache:
+    """Thread-safe LRU cache of rendered HTML fragments."""
+
+    def __init__(self, max_entries: int = REPORT_FRAGMENT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._fragments: "OrderedDict[FragmentKey, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: FragmentKey) -> Optional[str]:
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is None:
+                self.misses += 1
+                return None
+            self._fragments.move_to_end(key)
+            self.hits += 1
+            return fragment
+
+    def put(self, key: FragmentKey, fragment: str) -> None:
+        with self._lock:
+            self._fragments[key] = fragment
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self.max_entries:
+                self._fragments.popitem(last=False)
+
+    def render(
+        self,
+        section: str,
+        domain: str,
+        entity: str,
+        inputs_hash: str,
+        render: Callable[[], str]
+    ) -> str:
+        """
+        Return the cached fragment for this key, rendering it on a miss.
+
+        Args:
+            section: Section name (e.g. "risks", "section_2_costs")
+            domain: Domain the fragment covers ("all" for cross-domain sections)
+            entity: Entity the fragment covers ("all" when not entity-specific)
+            inputs_hash: content_hash() of everything the fragment reads
+            render: Zero-argument callable producing the fragment
+        """
+        key = (section, domain or 'all', entity or 'all', inputs_hash)
+        fragment = self.get(key)
+        if fragment is None:
+            fragment = render()
+            self.put(key, fragment)
+        return fragment
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fragments.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._fragments), 'hits': self.hits, 'misses': self.misses}
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+
+_fragment_cache: Optional[FragmentCache] = None
+_fragment_cache_lock = threading.Lock()
+
+
+def get_fragment_cache() -> FragmentCache:
+    """Get the process-wide fragment cache."""
+    global _fragment_cache
+    if _fragment_cache is None:
+        with _fragment_cache_lock:
+            if _fragment_cache is None:
+                _fragment_cache = FragmentCache()
+    return _fragment_cache
@@ -10,7 +10,7 @@ Renders DomainReportData to HTML following the 5-section PE framework:
 """
 
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 from datetime import datetime
 
 from tools_v2.pe_report_schemas import (
@@ -22,6 +22,7 @@ from tools_v2.pe_report_schemas import (
     DOMAIN_DISPLAY_NAMES,
     DOMAIN_ICONS,
 )
+from tools_v2.renderers.fragment_cache import FragmentCache, content_hash, get_fragment_cache
 
 logger = logging.getLogger(__name__)
 
@@ -471,16 +472,33 @@ tr:hover td {
 class DomainReportRenderer:
     """Renders DomainReportData to HTML."""
 
-    def __init__(self, include_styles: bool = True, entity: str = "target"):
+    # DomainReportData fields each section reads; a section is re-rendered
+    # only when the hash of these fields changes
+    SECTION_INPUTS = {
+        "section_1_inventory": ("inventory_html", "inventory_summary"),
+        "section_2_costs": ("run_rate_cost", "cost_breakdown", "cost_facts_cited"),
+        "section_3_benchmark": ("benchmark_assessment",),
+        "section_4_actions": ("top_actions", "work_items", "total_investment"),
+        "section_5_implications": ("top_implications", "resource_needs", "integration_considerations"),
+    }
+
+    def __init__(
+        self,
+        include_styles: bool = True,
+        entity: str = "target",
+        cache: Optional[FragmentCache] = None
+    ):
         """
         Initialize renderer.
 
         Args:
             include_styles: Whether to include CSS in output
             entity: Entity being displayed ("target" or "buyer") - Phase 7
+            cache: Fragment cache for rendered sections (defaults to the shared cache)
         """
         self.include_styles = include_styles
         self.entity = entity
+        self.cache = cache if cache is not None else get_fragment_cache()
 
     def render(self, data: DomainReportData, target_name: str = "Target Company") -> str:
         """
@@ -493,23 +511,38 @@ class DomainReportRenderer:
         Returns:
             Complete HTML document string
         """
-        sections = [
-            self._render_section_1_inventory(data),
-            self._render_section_2_costs(data),
-            self._render_section_3_benchmark(data),
-            self._render_section_4_actions(data),
-            self._render_section_5_implications(data),
-        ]
-
-        body_content = f"""
-        {self._render_header(data, target_name)}
-        {''.join(sections)}
-        """
+        return ''.join(self.iter_render(data, target_name))
 
-        return self._wrap_in_document(body_content, data.domain_display_name or data.domain)
+    def iter_render(self, data: DomainReportData, target_name: str = "Target Company") -> Iterator[str]:
+        """
+        Render DomainReportData as a stream of HTML chunks.
 
-    def _wrap_in_document(self, content: str, title: str) -> str:
-        """Wrap content in HTML document structure."""
+        The document head and report header are produced first, then each
+        section from the fragment cache (rendered on a miss). Joining the
+        chunks gives exactly the output of render().
+        """
+        yield self._document_head(data.domain_display_name or data.domain)
+        yield "\n        "
+        yield self._render_header(data, target_name)
+        yield "\n        "
+
+        for section, render_section in (
+            ("section_1_inventory", self._render_section_1_inventory),
+            ("section_2_costs", self._render_section_2_costs),
+            ("section_3_benchmark", self._render_section_3_benchmark),
+            ("section_4_actions", self._render_section_4_actions),
+            ("section_5_implications", self._render_section_5_implications),
+        ):
+            inputs = [getattr(data, name) for name in self.SECTION_INPUTS[section]]
+            yield self.cache.render(
+                section, data.domain, self.entity, content_hash(*inputs),
+                lambda render_section=render_section: render_section(data)
+            )
+
+        yield "\n        " + self._document_tail()
+
+    def _document_head(self, title: str) -> str:
+        """HTML document structure up to and including the opening body tag."""
         styles = DOMAIN_REPORT_CSS if self.include_styles else ""
 
         return f"""<!DOCTYPE html>
@@ -521,10 +554,18 @@ class DomainReportRenderer:
     {styles}
 </head>
 <body>
-    {content}
+    """
+
+    def _document_tail(self) -> str:
+        """HTML document structure after the body content."""
+        return """
 </body>
 </html>"""
 
+    def _wrap_in_document(self, content: str, title: str) -> str:
+        """Wrap content in HTML document structure."""
+        return self._document_head(title) + content + self._document_tail()
+
     def _render_header(self, data: DomainReportData, target_name: str) -> str:
         """Render report header with entity banner (Phase 7)."""
         display_name = data.domain_display_name or DOMAIN_DISPLAY_NAMES.get(data.domain, data.domain)
@@ -0,0 +1,102 @@
+"""
+Store Delta Tracking
+
+Lets analyzers that derive state from a FactStore list (facts or gaps) apply
+only what changed since they last looked, instead of re-scanning the list.
+
+FactStore lists only ever grow at the tail (add_fact, add_gap, merge_from)
+or lose entries (remove_facts_from_source, deduplicate). The tracker checks
+the common append-only case in O(1) and returns the new tail; otherwise it
+diffs by object identity. If new entries turn up anywhere but the tail, it
+reports a full reset (everything removed, everything re-added in list
+order), so consumers that depend on list order stay correct.
+
+Entries are treated as immutable once added. Consumers that edit entries in
+place should call reset() on the tracker (or rebuild their derived state).
+
+entry_fingerprint() gives a process-independent hash of an entry's fields;
+summing it over added entries (and subtracting for removed ones) yields a
+content fingerprint that can key caches shared between workers.
+"""
+
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+FINGERPRINT_MASK = (1 << 64) - 1
+
+
+def entry_fingerprint(*fields: Any) -> int:
+    """Stable 64-bit hash of an entry's fields (the same in every process, unlike hash())."""
+    data = "\x1f".join(str(field) for field in fields).encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+class StoreDeltaTracker:
+    """
+    Reports entries added to / removed from one list attribute of a store.
+
+    Usage:
+        tracker = StoreDeltaTracker(fact_store, "facts")
+        added, removed = tracker.poll()   # everything on the first poll
+        ...
+        added, removed = tracker.poll()   # only the changes since
+    """
+
+    def __init__(self, store: Any, attribute: str = "facts"):
+        self.store = store
+        self.attribute = attribute
+        self._seen: Dict[int, Any] = {}  # id(entry) -> entry (holding the reference keeps ids unique)
+        self._entries: Optional[List[Any]] = None
+        self._count = 0
+        self._last: Any = None
+
+    def _store_lock(self):
+        return getattr(self.store, "_lock", None) or threading.RLock()
+
+    def poll(self) -> Tuple[List[Any], List[Any]]:
+        """
+        Return (added, removed) since the previous poll.
+
+        Apply removed before added; added is in list order.
+        """
+        with self._store_lock():
+            entries = getattr(self.store, self.attribute)
+            count = len(entries)
+
+            if (entries is self._entries and count >= self._count
+                    and (self._count == 0 or entries[self._count - 1] is self._last)):
+                # Append-only since last poll
+                added = entries[self._count:]
+                removed: List[Any] = []
+            else:
+                current = {id(entry) for entry in entries}
+                removed = [entry for key, entry in self._seen.items() if key not in current]
+                added_positions = [i for i, entry in enumerate(entries) if id(entry) not in self._seen]
+                if added_positions and added_positions[0] < count - len(added_positions):
+                    # New entries in the middle of the list: replay everything in order
+                    removed = list(self._seen.values())
+                    added = list(entries)
+                    self._seen = {}
+                else:
+                    added = [entries[i] for i in added_positions]
+
+            for entry in removed:
+                self._seen.pop(id(entry), None)
+            for entry in added:
+                self._seen[id(entry)] = entry
+
+            self._entries = entries
+            self._count = count
+            self._last = entries[-1] if entries else None
+            return added, removed
+
+    def reset(self) -> None:
+        """Forget everything seen, so the next poll reports the whole list as added."""
+        self._seen = {}
+        self._entries = None
+        self._count = 0
+        self._last = None
+
+    def __len__(self) -> int:
+        return len(self._seen)
@@ -9,12 +9,15 @@ Performs cross-domain analysis to:
 5. Generate executive summary data
 """
 
+import threading
+from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Set, Tuple
 from datetime import datetime
-from stores.fact_store import FactStore
+from stores.fact_store import Fact, FactStore
 from tools_v2.reasoning_tools import ReasoningStore, COST_RANGE_VALUES
 from tools_v2.coverage import CoverageAnalyzer
+from tools_v2.store_delta import FINGERPRINT_MASK, StoreDeltaTracker, entry_fingerprint
 
 # Import caching
 try:
@@ -52,6 +55,11 @@ CROSS_DOMAIN_KEYWORDS = {
     "palo_alto": ["palo alto", "pan-os", "cortex"],
 }
 
+# (keyword group, variations) pairs, compiled once for per-fact scanning
+_KEYWORD_TABLE: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+    (group, tuple(variations)) for group, variations in CROSS_DOMAIN_KEYWORDS.items()
+)
+
 
 @dataclass
 class ConsistencyIssue:
@@ -83,6 +91,10 @@ class SynthesisAnalyzer:
     """
     Performs cross-domain synthesis and consistency analysis.
 
+    Keywords are extracted once per fact and counted per domain; each
+    analysis applies only the facts added or removed since the previous
+    one, so consistency checks do not re-scan the FactStore.
+
     Usage:
         analyzer = SynthesisAnalyzer(fact_store, reasoning_store)
         results = analyzer.analyze()
@@ -99,6 +111,12 @@ class SynthesisAnalyzer:
         self._issue_counter = 0
         self._group_counter = 0
 
+        self._lock = threading.RLock()
+        self._fact_tracker = StoreDeltaTracker(fact_store, "facts")
+        self._fingerprint = 0  # sum of (fact, keywords) entry fingerprints
+        self._fact_keywords: Dict[int, Tuple[str, Set[str]]] = {}  # id(fact) -> (domain, keywords)
+        self._domain_keywords: Dict[str, Counter] = {}  # domain -> keyword group -> fact count
+
     def _next_issue_id(self) -> str:
         self._issue_counter += 1
         return f"CI-{self._issue_counter:03d}"
@@ -107,38 +125,98 @@ class SynthesisAnalyzer:
         self._group_counter += 1
         return f"RG-{self._group_counter:03d}"
 
+    # -------------------------------------------------------------------------
+    # Incremental keyword state
+    # -------------------------------------------------------------------------
+
+    def refresh(self) -> int:
+        """
+        Apply facts added or removed since the last refresh.
+
+        Returns:
+            Number of facts applied
+        """
+        with self._lock:
+            added, removed = self._fact_tracker.poll()
+            for fact in removed:
+                domain, keywords = self._fact_keywords.pop(id(fact), (fact.domain, set()))
+                self._domain_keywords.setdefault(domain, Counter()).subtract(keywords)
+                self._fingerprint = (self._fingerprint - self._keyword_fingerprint(fact, keywords)) & FINGERPRINT_MASK
+            for fact in added:
+                keywords = self._extract_fact_keywords(fact)
+                self._fact_keywords[id(fact)] = (fact.domain, keywords)
+                self._domain_keywords.setdefault(fact.domain, Counter()).update(keywords)
+                self._fingerprint = (self._fingerprint + self._keyword_fingerprint(fact, keywords)) & FINGERPRINT_MASK
+
+            return len(added) + len(removed)
+
+    def rebuild(self) -> None:
+        """Discard keyword state and recompute it from the whole FactStore."""
+        with self._lock:
+            self._fact_tracker.reset()
+            self._fact_keywords.clear()
+            self._domain_keywords.clear()
+            self._fingerprint = 0
+            self.refresh()
+        self.coverage_analyzer.rebuild()
+
+    @staticmethod
+    def _keyword_fingerprint(fact: Fact, keywords: Set[str]) -> int:
+        return entry_fingerprint(fact.fact_id, fact.domain, *sorted(keywords))
+
+    def _findings_fingerprint(self) -> str:
+        """Fingerprint of the findings that analyze() aggregates."""
+        fingerprint = 0
+        for risk in self.reasoning_store.risks:
+            fingerprint += entry_fingerprint(risk.finding_id, risk.domain, risk.severity,
+                                             risk.integration_dependent, risk.title, risk.description)
+        for wi in self.reasoning_store.work_items:
+            fingerprint += entry_fingerprint(wi.finding_id, wi.domain, wi.phase, wi.owner_type,
+                                             wi.cost_estimate, wi.title, wi.description)
+        return f"{fingerprint & FINGERPRINT_MASK:016x}"
+
+    def cache_key(self) -> Tuple:
+        """
+        Key identifying the current synthesis inputs (used by cached_synthesis).
+
+        Content-based like CoverageAnalyzer.cache_key(), so it is safe to
+        share results between workers through a shared cache tier.
+        """
+        with self._lock:
+            self.refresh()
+            fact_fingerprint = f"{self._fingerprint:016x}"
+        return (
+            "synthesis",
+            self.coverage_analyzer.cache_key(),
+            fact_fingerprint,
+            self._findings_fingerprint(),
+            len(self.reasoning_store.strategic_considerations),
+            len(self.reasoning_store.recommendations),
+        )
+
     def _extract_keywords_from_text(self, text: str) -> Set[str]:
         """Extract known keywords from text."""
         text_lower = text.lower()
-        found = set()
-
-        for keyword_group, variations in CROSS_DOMAIN_KEYWORDS.items():
-            for var in variations:
-                if var in text_lower:
-                    found.add(keyword_group)
-                    break
+        return {
+            group for group, variations in _KEYWORD_TABLE
+            if any(var in text_lower for var in variations)
+        }
 
-        return found
+    def _extract_fact_keywords(self, fact: Fact) -> Set[str]:
+        """Keywords mentioned in a fact's item name, string details and evidence quote."""
+        keywords = self._extract_keywords_from_text(fact.item)
+        for value in fact.details.values():
+            if isinstance(value, str):
+                keywords |= self._extract_keywords_from_text(value)
+        if "exact_quote" in fact.evidence:
+            keywords |= self._extract_keywords_from_text(fact.evidence["exact_quote"])
+        return keywords
 
     def _get_domain_keywords(self, domain: str) -> Set[str]:
         """Get all keywords mentioned in a domain's facts."""
-        keywords = set()
-
-        for fact in self.fact_store.facts:
-            if fact.domain == domain:
-                # Check item name
-                keywords.update(self._extract_keywords_from_text(fact.item))
-                # Check details
-                for key, value in fact.details.items():
-                    if isinstance(value, str):
-                        keywords.update(self._extract_keywords_from_text(value))
-                # Check evidence
-                if "exact_quote" in fact.evidence:
-                    keywords.update(
-                        self._extract_keywords_from_text(fact.evidence["exact_quote"])
-                    )
-
-        return keywords
+        with self._lock:
+            self.refresh()
+            return {group for group, count in self._domain_keywords.get(domain, {}).items() if count > 0}
 
     def check_cloud_provider_consistency(self) -> List[ConsistencyIssue]:
         """Check if cloud provider references are consistent across domains."""
@@ -611,6 +611,13 @@ ACTIVITY_TEMPLATES = {
     },
 }
 
+# Workstream -> templates from the first category that defines it.
+# Precomputed once so Stage 2's workstream-only fallback is a dict lookup.
+TEMPLATES_BY_WORKSTREAM: Dict[str, List[Dict]] = {}
+for _category_templates in ACTIVITY_TEMPLATES.values():
+    for _workstream, _templates in _category_templates.items():
+        TEMPLATES_BY_WORKSTREAM.setdefault(_workstream, _templates)
+
 # =========================================================================
 # OPERATIONAL RUN-RATE TEMPLATES - Post-separation ongoing costs
 # These are NOT implementation activities but ongoing operational costs
@@ -727,12 +734,9 @@ def stage2_match_activities(
                 templates = ACTIVITY_TEMPLATES.get("parent_dependency", {}).get(workstream, [])
 
         # Still no match? Try workstream-only matching across all categories
-        if not templates:
-            for cat_templates in ACTIVITY_TEMPLATES.values():
-                if workstream in cat_templates:
-                    templates = cat_templates[workstream]
-                    logger.info(f"Fallback match: {raw_category}/{workstream} → found via workstream")
-                    break
+        if not templates and workstream in TEMPLATES_BY_WORKSTREAM:
+            templates = TEMPLATES_BY_WORKSTREAM[workstream]
+            logger.info(f"Fallback match: {raw_category}/{workstream} → found via workstream")
 
         for template in templates:
             activity_counter += 1
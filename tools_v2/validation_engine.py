@@ -484,18 +484,11 @@ class ValidationEngine:
 
                 # Try to find matching granular facts
                 if unit_hint:
-                    related_facts = [
-                        f for f in granular_facts_store.get_numeric_facts()
-                        if unit_hint.lower() in f.item.lower()
-                        or unit_hint.lower() in (f.unit or "").lower()
-                    ]
-
-                    if related_facts:
-                        actual_sum = sum(
-                            f.value for f in related_facts
-                            if isinstance(f.value, (int, float))
-                        )
+                    actual_sum, matching_facts = granular_facts_store.aggregate_by_item(
+                        unit_hint, match_unit=True
+                    )
 
+                    if matching_facts:
                         if actual_sum > 0:
                             variance = abs(claimed_value - actual_sum) / claimed_value
 
@@ -523,7 +516,7 @@ class ValidationEngine:
                                     "actual_sum": actual_sum,
                                     "variance_pct": f"{variance:.1%}",
                                     "unit": unit_hint,
-                                    "matching_facts": len(related_facts)
+                                    "matching_facts": matching_facts
                                 },
                                 suggested_action="Verify count discrepancy" if status != "pass" else ""
                             ))
@@ -10,7 +10,7 @@ Text extraction can vary; bytes are immutable.
 
 import hashlib
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -81,6 +81,40 @@ def compute_sha256_from_bytes(data: bytes) -> str:
     return sha256_hash.hexdigest()
 
 
+def copy_and_hash(
+    stream: BinaryIO,
+    dest: BinaryIO,
+    chunk_size: int = HASH_BUFFER_SIZE,
+    hasher: Optional["hashlib._Hash"] = None,
+    max_bytes: Optional[int] = None
+) -> Tuple[str, int]:
+    """
+    Copy a stream to an open file while hashing it, in one pass.
+
+    Only one chunk is held in memory at a time, so uploads of any size can
+    be written and hashed without reading them twice or buffering them.
+
+    Args:
+        stream: Readable binary stream (e.g. an upload's request stream)
+        dest: Writable binary file
+        chunk_size: Bytes read per step
+        hasher: Existing sha256 object to continue (resumable uploads)
+        max_bytes: Stop with ValueError once more than this many bytes arrive
+
+    Returns:
+        (hexadecimal SHA-256 of everything hashed so far, bytes copied)
+    """
+    sha256_hash = hasher if hasher is not None else hashlib.sha256()
+    copied = 0
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        copied += len(chunk)
+        if max_bytes is not None and copied > max_bytes:
+            raise ValueError(f"Stream exceeds {max_bytes} bytes")
+        sha256_hash.update(chunk)
+        dest.write(chunk)
+    return sha256_hash.hexdigest(), copied
+
+
 def verify_file_hash(file_path: Union[str, Path], expected_hash: str) -> bool:
     """
     Verify that a file matches an expected hash.
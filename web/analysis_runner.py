@@ -10,10 +10,11 @@ if the process crashes, all data up to the last commit is preserved.
 """
 
 import sys
+import threading
 import traceback
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, List, Set
 from datetime import datetime
 from dataclasses import asdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -35,7 +36,14 @@ class IncrementalPersistence:
     """
     Helper class to track and persist facts/findings incrementally during analysis.
 
-    Tracks what has already been written to avoid duplicates.
+    Reads deltas instead of rescanning the stores: facts and gaps come from the
+    FactStore change feed (changes_since), findings from the ReasoningStore
+    outbox (pending_findings). Each keeps a cursor, so a call costs
+    O(new items) rather than O(all items). Written IDs are still tracked to
+    avoid duplicates when a full rescan is needed (store reloaded, change log
+    overrun, or a store without a change feed). Written facts/gaps that later
+    leave the store (duplicates merged by the chunked-discovery reduce step,
+    answered gaps) are soft-deleted so the database matches the session.
     """
 
     def __init__(self, app, deal_id: str, run_id: str):
@@ -45,6 +53,10 @@ class IncrementalPersistence:
         self._written_fact_ids = set()
         self._written_gap_ids = set()
         self._written_finding_ids = set()
+        self._fact_cursor: Optional[int] = None  # FactStore version already persisted (facts)
+        self._gap_cursor: Optional[int] = None   # FactStore version already persisted (gaps)
+        self._finding_cursor = 0                 # ReasoningStore outbox position
+        self._lock = threading.RLock()  # Serializes main-thread persists and the BackgroundFlusher
         self._writer = None
 
     def _get_writer(self):
@@ -54,202 +66,253 @@ class IncrementalPersistence:
             self._writer = get_db_writer(self.app)
         return self._writer
 
+    @staticmethod
+    def _pending_changes(fact_store, cursor: Optional[int], ops: Set[str]):
+        """
+        Get (changes with an op in ops, new cursor) from the FactStore change feed.
+
+        Returns (None, version) when a full rescan is needed.
+        """
+        changes_since = getattr(fact_store, 'changes_since', None)
+        if cursor is None or changes_since is None:
+            return None, getattr(fact_store, 'version', None)
+        changes = changes_since(cursor)
+        if changes is None or any(c.op == "reload" for c in changes):
+            return None, fact_store.version
+        if not changes:
+            return [], cursor
+        return [c for c in changes if c.op in ops], changes[-1].version
+
+    @staticmethod
+    def _fact_data(fact) -> Dict[str, Any]:
+        return {
+            'fact_id': fact.fact_id,
+            'domain': getattr(fact, 'domain', 'general'),
+            'category': getattr(fact, 'category', ''),
+            'entity': getattr(fact, 'entity', 'target'),
+            'item': getattr(fact, 'item', ''),
+            'status': getattr(fact, 'status', 'documented'),
+            'details': getattr(fact, 'details', {}),
+            'evidence': getattr(fact, 'evidence', {}),
+            'source_document': getattr(fact, 'source_document', ''),
+            'source_page_numbers': getattr(fact, 'source_page_numbers', []),
+            'source_quote': fact.evidence.get('exact_quote', '') if fact.evidence else '',
+            'confidence_score': getattr(fact, 'confidence_score', 0.5),
+        }
+
+    @staticmethod
+    def _gap_data(gap) -> Dict[str, Any]:
+        return {
+            'gap_id': gap.gap_id,
+            'domain': getattr(gap, 'domain', 'general'),
+            'category': getattr(gap, 'category', ''),
+            'entity': getattr(gap, 'entity', 'target'),
+            'description': getattr(gap, 'description', ''),
+            'importance': getattr(gap, 'importance', 'medium'),
+            'requested_item': getattr(gap, 'requested_item', ''),
+            'source_document': getattr(gap, 'source_document', ''),
+            'related_facts': getattr(gap, 'related_facts', []),
+        }
+
+    @staticmethod
+    def _finding_data(finding_type: str, finding) -> Dict[str, Any]:
+        finding_data = {
+            'finding_id': finding.finding_id,
+            'finding_type': finding_type,
+            'domain': getattr(finding, 'domain', 'general'),
+            'title': getattr(finding, 'title', ''),
+            'description': getattr(finding, 'description', ''),
+            'confidence': getattr(finding, 'confidence', 'medium'),
+            'reasoning': getattr(finding, 'reasoning', ''),
+            'based_on_facts': getattr(finding, 'based_on_facts', []),
+        }
+
+        if finding_type == 'risk':
+            finding_data.update({
+                'severity': getattr(finding, 'severity', 'medium'),
+                'category': getattr(finding, 'category', ''),
+                'mitigation': getattr(finding, 'mitigation', ''),
+                'integration_dependent': getattr(finding, 'integration_dependent', False),
+                'timeline': getattr(finding, 'timeline', None),
+            })
+        elif finding_type == 'work_item':
+            finding_data.update({
+                'phase': getattr(finding, 'phase', None),
+                'priority': getattr(finding, 'priority', 'medium'),
+                'owner_type': getattr(finding, 'owner_type', 'shared'),
+                'cost_estimate': getattr(finding, 'cost_estimate', ''),
+                'triggered_by_risks': getattr(finding, 'triggered_by_risks', []),
+                'dependencies': getattr(finding, 'dependencies', []),
+            })
+        elif finding_type == 'strategic_consideration':
+            finding_data.update({
+                'entity': getattr(finding, 'entity', 'target'),
+                'lens': getattr(finding, 'lens', ''),
+                'implication': getattr(finding, 'implication', ''),
+                'mna_lens': getattr(finding, 'mna_lens', ''),
+                'mna_implication': getattr(finding, 'mna_implication', ''),
+            })
+        elif finding_type == 'recommendation':
+            finding_data.update({
+                'entity': getattr(finding, 'entity', 'target'),
+                'action_type': getattr(finding, 'action_type', ''),
+                'urgency': getattr(finding, 'urgency', ''),
+                'rationale': getattr(finding, 'rationale', ''),
+                'mna_lens': getattr(finding, 'mna_lens', ''),
+                'mna_implication': getattr(finding, 'mna_implication', ''),
+            })
+
+        return finding_data
+
+    @staticmethod
+    def _removed_ids(changes, remove_op: str, written: Set[str], current_ids, lookup) -> List[str]:
+        """Written IDs that are no longer in the store (from the change feed, or all on a rescan)."""
+        if changes is None:
+            current = set(current_ids())
+            return [item_id for item_id in written if item_id not in current]
+        return list(dict.fromkeys(
+            c.item_id for c in changes
+            if c.op == remove_op and c.item_id in written and lookup(c.item_id) is None
+        ))
+
     def persist_new_facts(self, session_fact_store) -> int:
         """
-        Persist any facts not yet written to database.
+        Persist facts added or updated since the last call.
 
         Args:
             session_fact_store: The analysis session's fact store
 
         Returns:
-            Number of new facts persisted
+            Number of facts written
         """
-        writer = self._get_writer()
-        new_count = 0
-
-        with writer.session_scope() as db_session:
-            for fact in session_fact_store.facts:
-                fact_id = getattr(fact, 'fact_id', None)
-                if not fact_id or fact_id in self._written_fact_ids:
-                    continue
-
-                fact_data = {
-                    'fact_id': fact_id,
-                    'domain': getattr(fact, 'domain', 'general'),
-                    'category': getattr(fact, 'category', ''),
-                    'entity': getattr(fact, 'entity', 'target'),
-                    'item': getattr(fact, 'item', ''),
-                    'status': getattr(fact, 'status', 'documented'),
-                    'details': getattr(fact, 'details', {}),
-                    'evidence': getattr(fact, 'evidence', {}),
-                    'source_document': getattr(fact, 'source_document', ''),
-                    'source_page_numbers': getattr(fact, 'source_page_numbers', []),
-                    'source_quote': fact.evidence.get('exact_quote', '') if fact.evidence else '',
-                    'confidence_score': getattr(fact, 'confidence_score', 0.5),
-                }
-
-                # Write without commit (batch at end of this method)
-                if writer.write_fact(db_session, fact_data, self.deal_id, self.run_id, commit=False):
-                    self._written_fact_ids.add(fact_id)
-                    new_count += 1
-
-            # Single commit for all new facts
-            if new_count > 0:
-                db_session.commit()
-                logger.debug(f"Persisted {new_count} new facts incrementally")
+        with self._lock:
+            changes, cursor = self._pending_changes(
+                session_fact_store, self._fact_cursor, {"add_fact", "update_fact", "remove_fact"}
+            )
+            if changes is None:
+                # Full rescan: only facts not written yet
+                facts = [f for f in list(session_fact_store.facts)
+                         if getattr(f, 'fact_id', None) and f.fact_id not in self._written_fact_ids]
+            else:
+                # Updated facts are re-written (write_fact upserts); removed ones are skipped
+                fact_ids = dict.fromkeys(
+                    c.item_id for c in changes
+                    if c.op == "update_fact" or (c.op == "add_fact" and c.item_id not in self._written_fact_ids)
+                )
+                facts = [f for f in map(session_fact_store.get_fact, fact_ids) if f is not None]
+            removed = self._removed_ids(
+                changes, "remove_fact", self._written_fact_ids,
+                lambda: (f.fact_id for f in list(session_fact_store.facts)), session_fact_store.get_fact
+            )
 
-        return new_count
+            if not facts and not removed:
+                self._fact_cursor = cursor
+                return 0
+
+            writer = self._get_writer()
+            new_count = 0
+            deleted = not removed
+
+            with writer.session_scope() as db_session:
+                for fact in facts:
+                    # Write without commit (batch at end of this method)
+                    if writer.write_fact(db_session, self._fact_data(fact), self.deal_id, self.run_id, commit=False):
+                        self._written_fact_ids.add(fact.fact_id)
+                        new_count += 1
+                if removed and writer.soft_delete_facts(db_session, removed, self.deal_id, commit=False):
+                    self._written_fact_ids.difference_update(removed)
+                    deleted = True
+
+                # Single commit for all new facts
+                if new_count > 0 or removed:
+                    db_session.commit()
+                    logger.debug(f"Persisted {new_count} new facts incrementally, removed {len(removed)}")
+
+            # Failed writes are retried next call from the same cursor
+            if new_count == len(facts) and deleted:
+                self._fact_cursor = cursor
+            return new_count
 
     def persist_new_gaps(self, session_fact_store) -> int:
-        """Persist any gaps not yet written to database."""
-        writer = self._get_writer()
-        new_count = 0
+        """Persist gaps added since the last call, and soft-delete written gaps since removed."""
+        with self._lock:
+            changes, cursor = self._pending_changes(session_fact_store, self._gap_cursor, {"add_gap", "remove_gap"})
+            if changes is None:
+                gaps = [g for g in list(session_fact_store.gaps)
+                        if getattr(g, 'gap_id', None) and g.gap_id not in self._written_gap_ids]
+            else:
+                gap_ids = dict.fromkeys(c.item_id for c in changes
+                                        if c.op == "add_gap" and c.item_id not in self._written_gap_ids)
+                gaps = [g for g in map(session_fact_store.get_gap, gap_ids) if g is not None]
+            removed = self._removed_ids(
+                changes, "remove_gap", self._written_gap_ids,
+                lambda: (g.gap_id for g in list(session_fact_store.gaps)), session_fact_store.get_gap
+            )
 
-        with writer.session_scope() as db_session:
-            for gap in session_fact_store.gaps:
-                gap_id = getattr(gap, 'gap_id', None)
-                if not gap_id or gap_id in self._written_gap_ids:
-                    continue
-
-                gap_data = {
-                    'gap_id': gap_id,
-                    'domain': getattr(gap, 'domain', 'general'),
-                    'category': getattr(gap, 'category', ''),
-                    'entity': getattr(gap, 'entity', 'target'),
-                    'description': getattr(gap, 'description', ''),
-                    'importance': getattr(gap, 'importance', 'medium'),
-                    'requested_item': getattr(gap, 'requested_item', ''),
-                    'source_document': getattr(gap, 'source_document', ''),
-                    'related_facts': getattr(gap, 'related_facts', []),
-                }
+            if not gaps and not removed:
+                self._gap_cursor = cursor
+                return 0
 
-                if writer.write_gap(db_session, gap_data, self.deal_id, self.run_id, commit=False):
-                    self._written_gap_ids.add(gap_id)
-                    new_count += 1
+            writer = self._get_writer()
+            new_count = 0
+            deleted = not removed
 
-            if new_count > 0:
-                db_session.commit()
-                logger.debug(f"Persisted {new_count} new gaps incrementally")
+            with writer.session_scope() as db_session:
+                for gap in gaps:
+                    if writer.write_gap(db_session, self._gap_data(gap), self.deal_id, self.run_id, commit=False):
+                        self._written_gap_ids.add(gap.gap_id)
+                        new_count += 1
+                if removed and writer.soft_delete_gaps(db_session, removed, self.deal_id, commit=False):
+                    self._written_gap_ids.difference_update(removed)
+                    deleted = True
 
-        return new_count
+                if new_count > 0 or removed:
+                    db_session.commit()
+                    logger.debug(f"Persisted {new_count} new gaps incrementally, removed {len(removed)}")
 
-    def persist_new_findings(self, session_reasoning_store) -> int:
-        """Persist any findings (risks, work items, etc.) not yet written."""
-        writer = self._get_writer()
-        new_count = 0
-
-        with writer.session_scope() as db_session:
-            # Persist risks
-            for risk in session_reasoning_store.risks:
-                finding_id = getattr(risk, 'finding_id', None)
-                if not finding_id or finding_id in self._written_finding_ids:
-                    continue
-
-                finding_data = {
-                    'finding_id': finding_id,
-                    'finding_type': 'risk',
-                    'domain': getattr(risk, 'domain', 'general'),
-                    'title': getattr(risk, 'title', ''),
-                    'description': getattr(risk, 'description', ''),
-                    'severity': getattr(risk, 'severity', 'medium'),
-                    'category': getattr(risk, 'category', ''),
-                    'mitigation': getattr(risk, 'mitigation', ''),
-                    'integration_dependent': getattr(risk, 'integration_dependent', False),
-                    'timeline': getattr(risk, 'timeline', None),
-                    'confidence': getattr(risk, 'confidence', 'medium'),
-                    'reasoning': getattr(risk, 'reasoning', ''),
-                    'based_on_facts': getattr(risk, 'based_on_facts', []),
-                }
+            # Failed writes are retried next call from the same cursor
+            if new_count == len(gaps) and deleted:
+                self._gap_cursor = cursor
+            return new_count
 
-                if writer.write_finding(db_session, finding_data, self.deal_id, self.run_id, commit=False):
-                    self._written_finding_ids.add(finding_id)
-                    new_count += 1
-
-            # Persist work items
-            for wi in session_reasoning_store.work_items:
-                finding_id = getattr(wi, 'finding_id', None)
-                if not finding_id or finding_id in self._written_finding_ids:
-                    continue
-
-                finding_data = {
-                    'finding_id': finding_id,
-                    'finding_type': 'work_item',
-                    'domain': getattr(wi, 'domain', 'general'),
-                    'title': getattr(wi, 'title', ''),
-                    'description': getattr(wi, 'description', ''),
-                    'phase': getattr(wi, 'phase', None),
-                    'priority': getattr(wi, 'priority', 'medium'),
-                    'owner_type': getattr(wi, 'owner_type', 'shared'),
-                    'cost_estimate': getattr(wi, 'cost_estimate', ''),
-                    'triggered_by_risks': getattr(wi, 'triggered_by_risks', []),
-                    'dependencies': getattr(wi, 'dependencies', []),
-                    'confidence': getattr(wi, 'confidence', 'medium'),
-                    'reasoning': getattr(wi, 'reasoning', ''),
-                    'based_on_facts': getattr(wi, 'based_on_facts', []),
-                }
+    def persist_new_findings(self, session_reasoning_store) -> int:
+        """Persist findings (risks, work items, etc.) added since the last call."""
+        with self._lock:
+            if hasattr(session_reasoning_store, 'pending_findings'):
+                pending, cursor = session_reasoning_store.pending_findings(self._finding_cursor)
+            else:
+                pending = (
+                    [('risk', f) for f in session_reasoning_store.risks] +
+                    [('work_item', f) for f in session_reasoning_store.work_items] +
+                    [('strategic_consideration', f) for f in session_reasoning_store.strategic_considerations] +
+                    [('recommendation', f) for f in session_reasoning_store.recommendations]
+                )
+                cursor = self._finding_cursor
+            pending = [(t, f) for t, f in pending
+                       if getattr(f, 'finding_id', None) and f.finding_id not in self._written_finding_ids]
 
-                if writer.write_finding(db_session, finding_data, self.deal_id, self.run_id, commit=False):
-                    self._written_finding_ids.add(finding_id)
-                    new_count += 1
-
-            # Persist strategic considerations
-            for sc in session_reasoning_store.strategic_considerations:
-                finding_id = getattr(sc, 'finding_id', None)
-                if not finding_id or finding_id in self._written_finding_ids:
-                    continue
-
-                finding_data = {
-                    'finding_id': finding_id,
-                    'finding_type': 'strategic_consideration',
-                    'entity': getattr(sc, 'entity', 'target'),
-                    'domain': getattr(sc, 'domain', 'general'),
-                    'title': getattr(sc, 'title', ''),
-                    'description': getattr(sc, 'description', ''),
-                    'lens': getattr(sc, 'lens', ''),
-                    'implication': getattr(sc, 'implication', ''),
-                    'confidence': getattr(sc, 'confidence', 'medium'),
-                    'reasoning': getattr(sc, 'reasoning', ''),
-                    'mna_lens': getattr(sc, 'mna_lens', ''),
-                    'mna_implication': getattr(sc, 'mna_implication', ''),
-                    'based_on_facts': getattr(sc, 'based_on_facts', []),
-                }
+            if not pending:
+                self._finding_cursor = cursor
+                return 0
 
-                if writer.write_finding(db_session, finding_data, self.deal_id, self.run_id, commit=False):
-                    self._written_finding_ids.add(finding_id)
-                    new_count += 1
-
-            # Persist recommendations
-            for rec in session_reasoning_store.recommendations:
-                finding_id = getattr(rec, 'finding_id', None)
-                if not finding_id or finding_id in self._written_finding_ids:
-                    continue
-
-                finding_data = {
-                    'finding_id': finding_id,
-                    'finding_type': 'recommendation',
-                    'entity': getattr(rec, 'entity', 'target'),
-                    'domain': getattr(rec, 'domain', 'general'),
-                    'title': getattr(rec, 'title', ''),
-                    'description': getattr(rec, 'description', ''),
-                    'action_type': getattr(rec, 'action_type', ''),
-                    'urgency': getattr(rec, 'urgency', ''),
-                    'rationale': getattr(rec, 'rationale', ''),
-                    'confidence': getattr(rec, 'confidence', 'medium'),
-                    'reasoning': getattr(rec, 'reasoning', ''),
-                    'mna_lens': getattr(rec, 'mna_lens', ''),
-                    'mna_implication': getattr(rec, 'mna_implication', ''),
-                    'based_on_facts': getattr(rec, 'based_on_facts', []),
-                }
+            writer = self._get_writer()
+            new_count = 0
 
-                if writer.write_finding(db_session, finding_data, self.deal_id, self.run_id, commit=False):
-                    self._written_finding_ids.add(finding_id)
-                    new_count += 1
+            with writer.session_scope() as db_session:
+                for finding_type, finding in pending:
+                    if writer.write_finding(db_session, self._finding_data(finding_type, finding),
+                                            self.deal_id, self.run_id, commit=False):
+                        self._written_finding_ids.add(finding.finding_id)
+                        new_count += 1
 
-            if new_count > 0:
-                db_session.commit()
-                logger.debug(f"Persisted {new_count} new findings incrementally")
+                if new_count > 0:
+                    db_session.commit()
+                    logger.debug(f"Persisted {new_count} new findings incrementally")
 
-        return new_count
+            # Failed writes are retried next call from the same cursor
+            if new_count == len(pending):
+                self._finding_cursor = cursor
+            return new_count
 
     def update_progress(self, progress: float, current_step: str = ''):
         """Update analysis run progress (throttled)."""
@@ -310,6 +373,91 @@ class IncrementalPersistence:
         logger.debug(f"IncrementalPersistence cleanup: cleared tracking sets and forced GC")
 
 
+class BackgroundFlusher:
+    """
+    Coalesces incremental fact/gap writes during discovery.
+
+    Subscribes to the FactStore change feed and flushes on a daemon thread
+    once flush_every changes are pending, or every interval seconds, so
+    facts reach the database while a domain is still being extracted
+    instead of in one burst at the end of it.
+
+    Usage:
+        flusher = BackgroundFlusher(incremental, session.fact_store)
+        flusher.start()
+        ...  # discovery
+        flusher.stop()  # final flush
+    """
+
+    def __init__(self, incremental: IncrementalPersistence, fact_store,
+                 flush_every: Optional[int] = None, interval: Optional[float] = None):
+        from config_v2 import INCREMENTAL_FLUSH_EVERY, INCREMENTAL_FLUSH_INTERVAL
+
+        self.incremental = incremental
+        self.fact_store = fact_store
+        self.flush_every = max(1, flush_every if flush_every is not None else INCREMENTAL_FLUSH_EVERY)
+        self.interval = interval if interval is not None else INCREMENTAL_FLUSH_INTERVAL
+        self.flush_count = 0
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._unsubscribe = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _on_change(self, change) -> None:
+        if change.op not in ("add_fact", "add_gap", "update_fact", "remove_fact", "remove_gap", "reload"):
+            return
+        with self._pending_lock:
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._wake.set()
+
+    def start(self) -> "BackgroundFlusher":
+        """Subscribe to the fact store and start the flusher thread."""
+        self._unsubscribe = self.fact_store.subscribe(self._on_change)
+        self._thread = threading.Thread(target=self._run, name="incremental-flusher", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if not self._stopping:
+                self.flush()
+
+    def flush(self) -> int:
+        """Write pending facts and gaps now. Returns the number written."""
+        with self._pending_lock:
+            self._pending = 0
+        try:
+            written = (self.incremental.persist_new_facts(self.fact_store) +
+                       self.incremental.persist_new_gaps(self.fact_store))
+        except Exception as e:
+            # Non-fatal: the per-domain checkpoints and the next flush retry
+            logger.warning(f"Background flush failed (will retry): {e}")
+            return 0
+        if written:
+            self.flush_count += 1
+            logger.debug(f"Background flush wrote {written} facts/gaps")
+        return written
+
+    def stop(self) -> None:
+        """Stop the thread and flush whatever is still pending. Safe to call twice."""
+        if self._stopping:
+            return
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+        self._stopping = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+
 def create_analysis_run(app, deal_id: str, task_id: str = None) -> Optional[str]:
     """
     Create an analysis run record at the START of analysis.
@@ -816,121 +964,139 @@ def run_analysis(task: AnalysisTask, progress_callback: Callable, app=None) -> D
     # Determine which domains to analyze
     domains_to_analyze = task.domains if task.domains else DOMAINS
 
-    # =========================================================================
-    # PHASE 1: TARGET COMPANY ANALYSIS (Clean Extraction)
-    # =========================================================================
-    progress_callback({"phase": AnalysisPhase.TARGET_ANALYSIS_START})
-
-    if target_docs:
-        target_content = _combine_documents_for_entity(target_docs, "target")
-        target_doc_names = ", ".join([doc.get('filename', 'Unknown') for doc in target_docs])
-
-        logger.info(f"Starting Phase 1: TARGET analysis with {len(target_docs)} documents")
-
-        discovery_phases = {
-            "infrastructure": AnalysisPhase.DISCOVERY_INFRASTRUCTURE,
-            "network": AnalysisPhase.DISCOVERY_NETWORK,
-            "cybersecurity": AnalysisPhase.DISCOVERY_CYBERSECURITY,
-            "applications": AnalysisPhase.DISCOVERY_APPLICATIONS,
-            "identity_access": AnalysisPhase.DISCOVERY_IDENTITY,
-            "organization": AnalysisPhase.DISCOVERY_ORGANIZATION,
-        }
-
-        for domain in domains_to_analyze:
-            if task._cancelled:
-                if incremental:
-                    incremental.complete('cancelled')
-                return {}
-
-            phase = discovery_phases.get(domain, AnalysisPhase.DISCOVERY_INFRASTRUCTURE)
-            progress_callback({"phase": phase})
-
-            try:
-                # Phase 1: Only TARGET content, entity forced to "target"
-                facts, gaps = run_discovery_for_domain(
-                    domain, target_content, session, session._inventory_store,
-                    target_doc_names,
-                    entity="target", analysis_phase="target_extraction"
-                )
-
-                # INCREMENTAL WRITE: Persist facts/gaps immediately after each domain
-                if incremental:
-                    incremental.persist_new_facts(session.fact_store)
-                    incremental.persist_new_gaps(session.fact_store)
-                    incremental.update_progress(20.0, f"TARGET {domain} complete")
-
-                progress_callback({
-                    "facts_extracted": len(session.fact_store.facts),
-                })
-            except Exception as e:
-                logger.error(f"Error in TARGET {domain} discovery: {e}")
-
-    # Lock TARGET facts before Phase 2
-    progress_callback({"phase": AnalysisPhase.TARGET_ANALYSIS_COMPLETE})
-    target_fact_count = session.fact_store.lock_entity_facts("target")
-    logger.info(f"Phase 1 complete: Locked {target_fact_count} TARGET facts")
-
-    # MEMORY FIX: Log memory after document loading phase
-    log_memory_usage("After document loading and target discovery")
-
-    # Create snapshot of TARGET facts for Phase 2 context
-    target_snapshot = session.fact_store.create_snapshot("target")
-
-    # =========================================================================
-    # PHASE 2: BUYER COMPANY ANALYSIS (With Target Context)
-    # =========================================================================
-    if buyer_docs:
-        progress_callback({"phase": AnalysisPhase.BUYER_ANALYSIS_START})
+    # Flush facts/gaps in the background during discovery (Phases 1-2); the
+    # per-domain writes below remain as checkpoints
+    flusher = BackgroundFlusher(incremental, session.fact_store).start() if incremental else None
+    try:
+        # =========================================================================
+        # PHASE 1: TARGET COMPANY ANALYSIS (Clean Extraction)
+        # =========================================================================
+        progress_callback({"phase": AnalysisPhase.TARGET_ANALYSIS_START})
+
+        if target_docs:
+            target_content = _combine_documents_for_entity(target_docs, "target")
+            target_doc_names = ", ".join([doc.get('filename', 'Unknown') for doc in target_docs])
+
+            logger.info(f"Starting Phase 1: TARGET analysis with {len(target_docs)} documents")
+
+            discovery_phases = {
+                "infrastructure": AnalysisPhase.DISCOVERY_INFRASTRUCTURE,
+                "network": AnalysisPhase.DISCOVERY_NETWORK,
+                "cybersecurity": AnalysisPhase.DISCOVERY_CYBERSECURITY,
+                "applications": AnalysisPhase.DISCOVERY_APPLICATIONS,
+                "identity_access": AnalysisPhase.DISCOVERY_IDENTITY,
+                "organization": AnalysisPhase.DISCOVERY_ORGANIZATION,
+            }
 
-        buyer_content = _combine_documents_for_entity(buyer_docs, "buyer")
-        buyer_doc_names = ", ".join([doc.get('filename', 'Unknown') for doc in buyer_docs])
+            for domain in domains_to_analyze:
+                if task._cancelled:
+                    if flusher:
+                        flusher.stop()
+                    if incremental:
+                        incremental.complete('cancelled')
+                    return {}
 
-        logger.info(f"Starting Phase 2: BUYER analysis with {len(buyer_docs)} documents")
-        logger.info(f"Providing {len(target_snapshot.facts)} TARGET facts as read-only context")
+                phase = discovery_phases.get(domain, AnalysisPhase.DISCOVERY_INFRASTRUCTURE)
+                progress_callback({"phase": phase, "domain_progress": {f"target:{domain}": "running"}})
 
-        buyer_discovery_phases = {
-            "infrastructure": AnalysisPhase.BUYER_DISCOVERY_INFRASTRUCTURE,
-            "network": AnalysisPhase.BUYER_DISCOVERY_NETWORK,
-            "cybersecurity": AnalysisPhase.BUYER_DISCOVERY_CYBERSECURITY,
-            "applications": AnalysisPhase.BUYER_DISCOVERY_APPLICATIONS,
-            "identity_access": AnalysisPhase.BUYER_DISCOVERY_IDENTITY,
-            "organization": AnalysisPhase.BUYER_DISCOVERY_ORGANIZATION,
-        }
-
-        for domain in domains_to_analyze:
-            if task._cancelled:
-                if incremental:
-                    incremental.complete('cancelled')
-                return {}
-
-            phase = buyer_discovery_phases.get(domain, AnalysisPhase.BUYER_DISCOVERY_INFRASTRUCTURE)
-            progress_callback({"phase": phase})
+                try:
+                    # Phase 1: Only TARGET content, entity forced to "target"
+                    facts, gaps = run_discovery_for_domain(
+                        domain, target_content, session, session._inventory_store,
+                        target_doc_names,
+                        entity="target", analysis_phase="target_extraction"
+                    )
+
+                    # INCREMENTAL WRITE: Persist facts/gaps immediately after each domain
+                    if incremental:
+                        incremental.persist_new_facts(session.fact_store)
+                        incremental.persist_new_gaps(session.fact_store)
+                        incremental.update_progress(20.0, f"TARGET {domain} complete")
+
+                    progress_callback({
+                        "facts_extracted": len(session.fact_store.facts),
+                        "domain_progress": {f"target:{domain}": "complete"},
+                        **getattr(session, '_token_usage', {}),
+                    })
+                except Exception as e:
+                    logger.error(f"Error in TARGET {domain} discovery: {e}")
+                    progress_callback({"domain_progress": {f"target:{domain}": "failed"}})
+
+        # Lock TARGET facts before Phase 2
+        progress_callback({"phase": AnalysisPhase.TARGET_ANALYSIS_COMPLETE})
+        target_fact_count = session.fact_store.lock_entity_facts("target")
+        logger.info(f"Phase 1 complete: Locked {target_fact_count} TARGET facts")
+
+        # MEMORY FIX: Log memory after document loading phase
+        log_memory_usage("After document loading and target discovery")
+
+        # Create snapshot of TARGET facts for Phase 2 context
+        target_snapshot = session.fact_store.create_snapshot("target")
+
+        # =========================================================================
+        # PHASE 2: BUYER COMPANY ANALYSIS (With Target Context)
+        # =========================================================================
+        if buyer_docs:
+            progress_callback({"phase": AnalysisPhase.BUYER_ANALYSIS_START})
+
+            buyer_content = _combine_documents_for_entity(buyer_docs, "buyer")
+            buyer_doc_names = ", ".join([doc.get('filename', 'Unknown') for doc in buyer_docs])
+
+            logger.info(f"Starting Phase 2: BUYER analysis with {len(buyer_docs)} documents")
+            logger.info(f"Providing {len(target_snapshot.facts)} TARGET facts as read-only context")
+
+            buyer_discovery_phases = {
+                "infrastructure": AnalysisPhase.BUYER_DISCOVERY_INFRASTRUCTURE,
+                "network": AnalysisPhase.BUYER_DISCOVERY_NETWORK,
+                "cybersecurity": AnalysisPhase.BUYER_DISCOVERY_CYBERSECURITY,
+                "applications": AnalysisPhase.BUYER_DISCOVERY_APPLICATIONS,
+                "identity_access": AnalysisPhase.BUYER_DISCOVERY_IDENTITY,
+                "organization": AnalysisPhase.BUYER_DISCOVERY_ORGANIZATION,
+            }
 
-            try:
-                # Phase 2: Only BUYER content, with TARGET context, entity forced to "buyer"
-                facts, gaps = run_discovery_for_domain(
-                    domain, buyer_content, session, session._inventory_store,
-                    buyer_doc_names,
-                    entity="buyer", analysis_phase="buyer_extraction",
-                    target_context=target_snapshot
-                )
+            for domain in domains_to_analyze:
+                if task._cancelled:
+                    if flusher:
+                        flusher.stop()
+                    if incremental:
+                        incremental.complete('cancelled')
+                    return {}
 
-                # INCREMENTAL WRITE: Persist BUYER facts/gaps immediately
-                if incremental:
-                    incremental.persist_new_facts(session.fact_store)
-                    incremental.persist_new_gaps(session.fact_store)
-                    incremental.update_progress(50.0, f"BUYER {domain} complete")
+                phase = buyer_discovery_phases.get(domain, AnalysisPhase.BUYER_DISCOVERY_INFRASTRUCTURE)
+                progress_callback({"phase": phase, "domain_progress": {f"buyer:{domain}": "running"}})
 
-                progress_callback({
-                    "facts_extracted": len(session.fact_store.facts),
-                })
-            except Exception as e:
-                logger.error(f"Error in BUYER {domain} discovery: {e}")
+                try:
+                    # Phase 2: Only BUYER content, with TARGET context, entity forced to "buyer"
+                    facts, gaps = run_discovery_for_domain(
+                        domain, buyer_content, session, session._inventory_store,
+                        buyer_doc_names,
+                        entity="buyer", analysis_phase="buyer_extraction",
+                        target_context=target_snapshot
+                    )
+
+                    # INCREMENTAL WRITE: Persist BUYER facts/gaps immediately
+                    if incremental:
+                        incremental.persist_new_facts(session.fact_store)
+                        incremental.persist_new_gaps(session.fact_store)
+                        incremental.update_progress(50.0, f"BUYER {domain} complete")
+
+                    progress_callback({
+                        "facts_extracted": len(session.fact_store.facts),
+                        "domain_progress": {f"buyer:{domain}": "complete"},
+                        **getattr(session, '_token_usage', {}),
+                    })
+                except Exception as e:
+                    logger.error(f"Error in BUYER {domain} discovery: {e}")
+                    progress_callback({"domain_progress": {f"buyer:{domain}": "failed"}})
 
-        progress_callback({"phase": AnalysisPhase.BUYER_ANALYSIS_COMPLETE})
-        logger.info(f"Phase 2 complete: {len(session.fact_store.get_entity_facts('buyer'))} BUYER facts")
-    else:
-        logger.info("No BUYER documents - skipping Phase 2")
+            progress_callback({"phase": AnalysisPhase.BUYER_ANALYSIS_COMPLETE})
+            logger.info(f"Phase 2 complete: {len(session.fact_store.get_entity_facts('buyer'))} BUYER facts")
+        else:
+            logger.info("No BUYER documents - skipping Phase 2")
+    finally:
+        # Also reached when discovery raises, so the flusher thread never outlives the run
+        if flusher:
+            flusher.stop()
 
     # =========================================================================
     # PHASE 3.5: OVERLAP GENERATION (Buyer-Aware Reasoning)
@@ -1380,6 +1546,13 @@ def run_discovery_for_domain(
             analysis_phase=analysis_phase
         )
 
+        # Accumulate token spend on the session for progress reporting
+        metrics = agent.get_metrics()
+        usage = getattr(session, '_token_usage', None) or {"tokens_used": 0, "estimated_cost": 0.0}
+        usage["tokens_used"] += metrics.tokens_used
+        usage["estimated_cost"] = round(usage["estimated_cost"] + metrics.estimated_cost, 4)
+        session._token_usage = usage
+
         # Calculate what was added in this run
         facts_added = len(session.fact_store.facts) - facts_before
         gaps_added = len(session.fact_store.gaps) - gaps_before
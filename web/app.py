@@ -753,6 +753,7 @@ def get_session():
                     entity=db_gap.entity or 'target',
                 )
                 analysis_session.fact_store.gaps.append(gap)
+            analysis_session.fact_store.mark_changed()
             logger.info(f"Loaded {len(gaps_query)} gaps from database")
 
             # Cache with deal_id tracking
@@ -920,9 +921,9 @@ def calculate_upload_size_mb(file_list):
     """
     Calculate total size of uploaded files in MB.
 
-    MEMORY FIX: Prevents OOM crashes by rejecting oversized uploads.
-    Railway free tier has 512MB RAM limit; large document uploads
-    cause memory exhaustion when loaded into analysis pipeline.
+    Uploads are streamed to disk (see DocumentStore.add_document_from_stream),
+    but parsing loads each document's text into memory, so MAX_UPLOAD_SIZE_MB
+    also bounds analysis memory.
 
     Args:
         file_list: List of FileStorage objects from request.files.getlist()
@@ -998,14 +999,13 @@ def process_upload():
 
     # Calculate total size
     total_size_mb = calculate_upload_size_mb(target_files + buyer_files)
-    MAX_UPLOAD_SIZE_MB = int(os.environ.get('MAX_UPLOAD_SIZE_MB', '30'))
+    from config_v2 import MAX_UPLOAD_SIZE_MB
 
     if total_size_mb > MAX_UPLOAD_SIZE_MB:
         flash(
             f'⚠️ Total upload size ({total_size_mb:.1f}MB) exceeds limit ({MAX_UPLOAD_SIZE_MB}MB). '
-            f'Please reduce document count or file sizes. '
-            f'Large uploads cause memory issues on Railway free tier. '
-            f'Contact support about infrastructure upgrades if needed.',
+            f'Please reduce document count or file sizes, or upload large data rooms '
+            f'in chunks via /api/uploads (resumable).',
             'error'
         )
         return redirect(url_for('upload_documents'))
@@ -1021,9 +1021,9 @@ def process_upload():
             if doc_store:
                 # Use DocumentStore for proper entity separation
                 try:
-                    file_bytes = file.read()
-                    doc = doc_store.add_document_from_bytes(
-                        file_bytes=file_bytes,
+                    # Spooled to disk and hashed in one pass (never read into memory)
+                    doc = doc_store.add_document_from_stream(
+                        file.stream,
                         filename=safe_filename,
                         entity="target",
                         deal_id=current_deal_id,
@@ -1076,9 +1076,9 @@ def process_upload():
 
             if doc_store:
                 try:
-                    file_bytes = file.read()
-                    doc = doc_store.add_document_from_bytes(
-                        file_bytes=file_bytes,
+                    # Spooled to disk and hashed in one pass (never read into memory)
+                    doc = doc_store.add_document_from_stream(
+                        file.stream,
                         filename=safe_filename,
                         entity="buyer",
                         deal_id=current_deal_id,
@@ -1364,6 +1364,40 @@ def analysis_status():
     return jsonify(status)
 
 
+@app.route('/analysis/events')
+@auth_optional
+def analysis_events():
+    """
+    Stream analysis progress as Server-Sent Events.
+
+    Push alternative to polling /analysis/status: sends the current status
+    as a 'snapshot' event, then a numbered 'progress' event on every change.
+    Reconnects resume from the Last-Event-ID header (or ?last_event_id=).
+    Completion is still finalized by one /analysis/status call, which loads
+    results into the session.
+    """
+    from flask import Response
+    from web.progress_events import parse_last_event_id, stream_progress, task_channel
+
+    task_id = flask_session.get('current_task_id') or request.args.get('task_id')
+    if not task_id:
+        return jsonify({'error': 'missing_task_id'}), 400
+
+    last_id = parse_last_event_id(
+        request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    )
+    snapshot = task_manager.get_task_status(task_id) if last_id == 0 else None
+
+    # Events published by another worker's in-process bus never reach this
+    # stream; the task status is also in the database, so it is re-read
+    return Response(
+        stream_progress(task_channel(task_id), last_id=last_id, snapshot=snapshot,
+                        refresh=lambda: task_manager.get_task_status(task_id)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
 @app.route('/analysis/cancel', methods=['POST'])
 @auth_optional
 def cancel_analysis():
@@ -4175,6 +4209,40 @@ def get_deal_analysis_status(deal_id):
     })
 
 
+@app.route('/api/deal/<deal_id>/events')
+@auth_optional
+def stream_deal_analysis_events(deal_id):
+    """
+    Stream a deal's analysis progress as Server-Sent Events.
+
+    Push alternative to polling /api/deal/<deal_id>/status. Carries events
+    from both the threaded task manager and Celery analysis workers; see
+    web/progress_events.py. Resumable via Last-Event-ID.
+    """
+    from flask import Response, stream_with_context
+    from web.progress_events import deal_channel, parse_last_event_id, stream_progress
+
+    def current_status():
+        status = get_deal_analysis_status(deal_id).get_json()
+        status['complete'] = status.get('status') in ('completed', 'failed', 'cancelled')
+        return status
+
+    last_id = parse_last_event_id(
+        request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    )
+    snapshot = current_status() if last_id == 0 else None
+
+    # The run status is in the database, so a stream served by a different
+    # worker than the analysis can still follow it (see stream_progress)
+    return Response(
+        stream_with_context(stream_progress(
+            deal_channel(deal_id), last_id=last_id, snapshot=snapshot, refresh=current_status
+        )),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
 @app.route('/api/deal/<deal_id>/runs')
 @auth_optional
 def get_deal_analysis_runs(deal_id):
@@ -6611,7 +6679,7 @@ def api_upload_documents():
     s = get_session()
 
     # Get current deal_id from session
-    current_deal_id = session.get('current_deal_id')
+    current_deal_id = flask_session.get('current_deal_id')
 
     # Registry file path for persistence
     registry_file = OUTPUT_DIR / "document_registry.json"
@@ -6661,19 +6729,15 @@ def api_upload_documents():
             # Save file to disk
             safe_filename = file.filename.replace('/', '_').replace('\\', '_')
             file_path = uploads_dir / safe_filename
-            file.save(str(file_path))
-
-            # Read content for hash
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            content_text = content.decode('utf-8', errors='ignore')
+            # Write and hash in one streaming pass (no full read into memory)
+            content_hash, file_size = s.document_registry.save_and_hash(file.stream, str(file_path))
 
             # Register document
             record, change_type = s.document_registry.register_document(
                 filename=file.filename,
-                content=content_text,
+                content_hash=content_hash,
                 file_path=str(file_path),
-                file_size=len(content)
+                file_size=file_size
             )
 
             # Queue for processing if new or updated
@@ -6697,7 +6761,9 @@ def api_upload_documents():
                         doc_id=record.doc_id,
                         filename=file.filename,
                         file_path=str(file_path),
-                        priority=ProcessingPriority.NORMAL
+                        priority=ProcessingPriority.NORMAL,
+                        deal_id=current_deal_id or "",
+                        content_hash=content_hash
                     )
                     logger.info(f"Queued document {file.filename} to threading processor (dev mode)")
 
@@ -6725,6 +6791,201 @@ def api_upload_documents():
     })
 
 
+# =============================================================================
+# RESUMABLE CHUNKED UPLOADS (see web/chunked_uploads.py)
+# =============================================================================
+
+def _chunked_upload_error(e):
+    """JSON response for a ChunkedUploadManager error."""
+    from web.chunked_uploads import UploadNotFoundError, UploadOffsetError
+    if isinstance(e, UploadNotFoundError):
+        return jsonify({"status": "error", "message": str(e)}), 404
+    if isinstance(e, UploadOffsetError):
+        # Client resumes from the returned offset
+        return jsonify({"status": "error", "message": str(e), "offset": e.expected}), 409
+    return jsonify({"status": "error", "message": str(e)}), 400
+
+
+def _upload_deal_access_error(deal_id: str):
+    """Error response if the current user may not upload to deal_id, else None."""
+    if not USE_DATABASE or not deal_id:
+        return None
+
+    from web.database import Deal
+    from web.permissions import user_can_access_deal
+
+    deal = Deal.query.get(deal_id)
+    if not deal or deal.is_deleted:
+        return jsonify({"status": "error", "message": "Deal not found"}), 404
+    if current_user.is_authenticated:
+        allowed = user_can_access_deal(current_user, deal)
+    else:
+        allowed = not deal.owner_id  # Anonymous (auth disabled) uploads only reach unowned deals
+    if not allowed:
+        logger.warning(f"Upload to deal {deal_id} denied for user "
+                       f"{current_user.id if current_user.is_authenticated else 'anonymous'}")
+        return jsonify({"status": "error", "message": "Access denied"}), 403
+    return None
+
+
+def _upload_access_error(upload):
+    """Error response if the current user may not act on this upload, else None."""
+    user_id = current_user.id if current_user.is_authenticated else None
+    if upload.uploaded_by != user_id:
+        logger.warning(f"Access to upload {upload.upload_id} denied for user {user_id or 'anonymous'}")
+        return jsonify({"status": "error", "message": "Access denied"}), 403
+    return _upload_deal_access_error(upload.deal_id)
+
+
+def _load_own_upload(upload_id):
+    """(upload, None) if the current user may act on upload_id, else (None, error response)."""
+    from web.chunked_uploads import get_upload_manager, UploadError
+
+    try:
+        upload = get_upload_manager().status(upload_id)
+    except UploadError as e:
+        return None, _chunked_upload_error(e)
+    denied = _upload_access_error(upload)
+    if denied:
+        return None, denied
+    return upload, None
+
+
+@app.route('/api/uploads', methods=['POST'])
+@csrf.exempt
+@auth_optional
+def api_chunked_upload_start():
+    """
+    Start a resumable upload.
+
+    JSON body: filename, entity ('target'/'buyer'), total_size (bytes),
+    optional authority_level and deal_id (defaults to the session's deal;
+    checked against the user's deal access like the other deal routes).
+    """
+    from web.chunked_uploads import get_upload_manager, UploadError
+
+    data = request.get_json(silent=True) or {}
+    filename = (data.get('filename') or '').replace('..', '').replace('/', '_').replace('\\', '_')
+    if not filename:
+        return jsonify({"status": "error", "message": "filename is required"}), 400
+
+    deal_id = data.get('deal_id') or flask_session.get('current_deal_id') or ""
+    denied = _upload_deal_access_error(deal_id)
+    if denied:
+        return denied
+
+    try:
+        upload = get_upload_manager().start(
+            filename=filename,
+            entity=data.get('entity', 'target'),
+            deal_id=deal_id,
+            authority_level=int(data.get('authority_level', 1)),
+            uploaded_by=current_user.id if current_user.is_authenticated else None,
+            total_size=int(data['total_size']) if data.get('total_size') is not None else None
+        )
+    except (UploadError, ValueError) as e:
+        return _chunked_upload_error(e)
+
+    return jsonify({"status": "success", "upload": upload.to_dict()}), 201
+
+
+@app.route('/api/uploads/<upload_id>', methods=['GET'])
+@auth_optional
+def api_chunked_upload_status(upload_id):
+    """Bytes received so far; a client resumes by sending from this offset."""
+    upload, denied = _load_own_upload(upload_id)
+    if denied:
+        return denied
+    return jsonify({"status": "success", "upload": upload.to_dict()})
+
+
+@app.route('/api/uploads/<upload_id>', methods=['PUT', 'PATCH'])
+@csrf.exempt
+@auth_optional
+def api_chunked_upload_append(upload_id):
+    """
+    Append the raw request body at ?offset=N (or the Upload-Offset header).
+
+    The body is streamed to the part file; it is never read into memory.
+    """
+    from web.chunked_uploads import get_upload_manager, UploadError
+
+    offset = request.args.get('offset', request.headers.get('Upload-Offset'))
+    if offset is None:
+        return jsonify({"status": "error", "message": "offset is required"}), 400
+    _, denied = _load_own_upload(upload_id)
+    if denied:
+        return denied
+
+    try:
+        upload = get_upload_manager().append(upload_id, request.stream, offset=int(offset))
+    except (UploadError, ValueError) as e:
+        return _chunked_upload_error(e)
+    return jsonify({"status": "success", "upload": upload.to_dict()})
+
+
+@app.route('/api/uploads/<upload_id>/complete', methods=['POST'])
+@csrf.exempt
+@auth_optional
+def api_chunked_upload_complete(upload_id):
+    """
+    Register a finished upload with the deal's DocumentStore.
+
+    Optional JSON body: sha256 (client-side hash to verify).
+    """
+    from stores.document_store import DocumentStore
+    from web.chunked_uploads import get_upload_manager, UploadError
+
+    upload, denied = _load_own_upload(upload_id)
+    if denied:
+        return denied
+
+    manager = get_upload_manager()
+    data = request.get_json(silent=True) or {}
+    try:
+        doc_store = DocumentStore.get_instance(deal_id=upload.deal_id or None)
+        doc = manager.complete(upload_id, doc_store, expected_hash=data.get('sha256'))
+    except UploadError as e:
+        return _chunked_upload_error(e)
+
+    if USE_DATABASE and upload.deal_id:
+        try:
+            doc_repo = DocumentRepository()
+            doc_repo.create_document(
+                deal_id=upload.deal_id,
+                filename=doc.filename,
+                file_hash=doc.hash_sha256,
+                storage_path=doc.raw_file_path,
+                entity=doc.entity,
+                file_size=doc.file_size_bytes,
+                mime_type=doc.mime_type,
+                authority_level=doc.authority_level,
+                uploaded_by=upload.uploaded_by
+            )
+        except Exception as db_err:
+            logger.warning(f"Failed to save chunked upload {doc.filename} to DB: {db_err}")
+            db.session.rollback()
+
+    return jsonify({"status": "success", "document": doc.to_dict()})
+
+
+@app.route('/api/uploads/<upload_id>', methods=['DELETE'])
+@csrf.exempt
+@auth_optional
+def api_chunked_upload_abort(upload_id):
+    """Abort an upload and delete its data."""
+    from web.chunked_uploads import get_upload_manager, UploadError
+
+    _, denied = _load_own_upload(upload_id)
+    if denied:
+        return denied
+    try:
+        get_upload_manager().abort(upload_id)
+    except UploadError as e:
+        return _chunked_upload_error(e)
+    return jsonify({"status": "success"})
+
+
 @app.route('/api/documents/processing/status')
 def processing_status():
     """Get processing status for all documents in queue (supports both Celery and threading)."""
@@ -6810,7 +7071,9 @@ def process_document_now(doc_id):
         doc_id=doc.doc_id,
         filename=doc.filename,
         file_path=doc.file_path,
-        priority=priority
+        priority=priority,
+        deal_id=flask_session.get('current_deal_id') or "",
+        content_hash=doc.content_hash
     )
 
     return jsonify({
@@ -6820,6 +7083,24 @@ def process_document_now(doc_id):
     })
 
 
+@app.route('/api/documents/<doc_id>/cancel-processing', methods=['POST'])
+def cancel_document_processing(doc_id):
+    """Cancel queued or in-progress processing for a document."""
+    s = get_session()
+
+    if not hasattr(s, 'document_processor'):
+        return jsonify({"status": "error", "message": "No processor initialized"}), 400
+
+    if not s.document_processor.cancel_document(doc_id):
+        return jsonify({"status": "not_found", "message": "Document not queued or processing"}), 404
+
+    return jsonify({
+        "status": "success",
+        "message": "Processing cancelled",
+        "doc_id": doc_id
+    })
+
+
 @app.route('/api/documents/<doc_id>')
 @auth_optional
 def get_document(doc_id):
@@ -7791,13 +8072,15 @@ def api_storage_status():
             "type": None
         })
 
+    blob_cache = getattr(storage.backend, 'cache', None)
     return jsonify({
         "status": "active",
         "type": storage.storage_type,
         "config": {
             "storage_type": STORAGE_TYPE,
             "s3_configured": bool(os.environ.get('S3_ACCESS_KEY')),
-        }
+        },
+        "blob_cache": blob_cache.stats() if blob_cache is not None else None
     })
 
 
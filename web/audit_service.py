@@ -398,11 +398,12 @@ class AuditService:
         if self._use_database:
             try:
                 from web.database import db, AuditLog
-                deleted = AuditLog.query.filter(
-                    AuditLog.created_at < cutoff
-                ).delete()
-                db.session.commit()
-                logger.info(f"Cleaned up {deleted} old audit entries")
+                from web.tasks.retention import RetentionEngine
+                report = RetentionEngine().purge_sql(
+                    db.session, AuditLog.__tablename__, 'created_at < :cutoff', {'cutoff': cutoff},
+                    job='audit_log'
+                )
+                logger.info(f"Cleaned up {report.affected} old audit entries")
             except Exception as e:
                 logger.error(f"Failed to cleanup audit database: {e}")
         else:
@@ -0,0 +1,345 @@
+"""
+Content-Addressed Blobs for Document Storage
+
+S3 document keys (deals/{deal_id}/documents/{entity}/{filename}) become
+small reference objects; the bytes live once per SHA-256 under
+blobs/sha256/{hash[:2]}/{hash}. Identical files uploaded to several deals
+are stored once, and since a hash always names the same bytes, blobs can be
+cached locally without invalidation.
+
+Every reference also gets an empty marker under
+refs/sha256/{hash[:2]}/{hash}/, so the blob garbage collector finds the
+referenced hashes with one listing instead of a HEAD per document.
+
+- BlobCache: on-disk LRU read-through cache keyed by SHA-256, bounded by
+  size. Reads of a cached blob cost a local file open instead of an object
+  store round trip plus an in-memory copy. Several processes may share the
+  directory; eviction sizes the cache from the directory itself.
+- LocalS3Client: in-process stand-in for the subset of the boto3 S3 client
+  that S3Storage uses, backed by a directory (tests and offline development).
+
+S3Storage (web/storage.py) uses both.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Union
+from uuid import uuid4
+
+from utils.file_hasher import copy_and_hash
+
+logger = logging.getLogger(__name__)
+
+BLOB_PREFIX = "blobs/sha256/"
+
+
+REF_PREFIX = "refs/sha256/"
+
+
+def blob_key(file_hash: str) -> str:
+    """Object key of the blob holding the bytes with this SHA-256."""
+    return f"{BLOB_PREFIX}{file_hash[:2]}/{file_hash}"
+
+
+def ref_prefix(file_hash: str) -> str:
+    """Prefix of the reference markers of the blob with this SHA-256."""
+    return f"{REF_PREFIX}{file_hash[:2]}/{file_hash}/"
+
+
+def ref_key(file_hash: str, key: str) -> str:
+    """Marker recording that document key references the blob with this SHA-256."""
+    return ref_prefix(file_hash) + hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+# =============================================================================
+# LOCAL READ-THROUGH CACHE
+# =============================================================================
+
+class BlobCache:
+    """
+    Size-bounded LRU cache of blobs on local disk.
+
+    Files are stored as {cache_dir}/{hash[:2]}/{hash}. Every write is
+    verified against its hash, so a corrupt or truncated download is never
+    served. Recency is the file mtime (touched on hit), so it survives
+    restarts and is shared by every process using the directory: each write
+    re-reads the directory before evicting, and blobs written by another
+    process are picked up on get().
+
+    Usage:
+        cache = BlobCache(Path("/var/cache/blobs"), max_bytes=2 * 1024**3)
+        path = cache.get(file_hash)
+        if path is None:
+            path = cache.put(file_hash, response_body)
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # hash -> size, least recent first
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _path(self, file_hash: str) -> Path:
+        return self.cache_dir / file_hash[:2] / file_hash
+
+    def _load(self) -> None:
+        """Index blobs already on disk, oldest mtime first."""
+        with self._lock:
+            self._scan()
+            self._evict()
+
+    def _scan(self) -> None:
+        """Rebuild the index from the directory, oldest mtime first (caller holds the lock)."""
+        # Equal mtimes (coarse filesystem clocks) keep this process's recency order
+        position = {file_hash: i for i, file_hash in enumerate(self._entries)}
+        found = []
+        for path in self.cache_dir.glob("*/*"):
+            if len(path.name) != 64:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:  # Evicted by another process meanwhile
+                continue
+            found.append((stat.st_mtime, position.get(path.name, len(position)), path.name, stat.st_size))
+        self._entries = OrderedDict((file_hash, size) for _, _, file_hash, size in sorted(found))
+        self._total_bytes = sum(self._entries.values())
+
+    def get(self, file_hash: str) -> Optional[Path]:
+        """Path of the cached blob, or None on a miss."""
+        with self._lock:
+            path = self._path(file_hash)
+            try:
+                size = path.stat().st_size
+            except OSError:  # Not cached, or evicted by another process
+                if file_hash in self._entries:
+                    self._total_bytes -= self._entries.pop(file_hash)
+                self.misses += 1
+                return None
+            if file_hash not in self._entries:  # Written by another process
+                self._entries[file_hash] = size
+                self._total_bytes += size
+            self._entries.move_to_end(file_hash)
+            self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def put(self, file_hash: str, stream: BinaryIO) -> Path:
+        """
+        Write a blob from a stream, verifying its hash.
+
+        Raises:
+            ValueError: If the streamed bytes do not hash to file_hash
+        """
+        path = self._path(file_hash)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_name(f".{file_hash}.{uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                actual_hash, size = copy_and_hash(stream, f)
+            if actual_hash != file_hash:
+                raise ValueError(f"Blob hash mismatch: expected {file_hash[:16]}..., got {actual_hash[:16]}...")
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        with self._lock:
+            # Other processes write to the same directory: size it from disk
+            self._scan()
+            if file_hash not in self._entries:
+                self._entries[file_hash] = size
+                self._total_bytes += size
+            self._entries.move_to_end(file_hash)
+            self._evict(keep=file_hash)
+        return path
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Drop least recently used blobs until under max_bytes (caller holds the lock)."""
+        for file_hash in list(self._entries):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if file_hash == keep:
+                continue
+            self._total_bytes -= self._entries.pop(file_hash)
+            self._path(file_hash).unlink(missing_ok=True)
+            logger.debug(f"Evicted blob {file_hash[:16]}... from cache")
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, size and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# =============================================================================
+# LOCAL S3-COMPATIBLE STAND-IN
+# =============================================================================
+
+try:
+    from botocore.exceptions import ClientError
+except ImportError:
+    class ClientError(Exception):
+        """Mirrors botocore.exceptions.ClientError for the local stand-in."""
+
+        def __init__(self, error_response: Dict, operation_name: str):
+            super().__init__(f"An error occurred ({error_response['Error']['Code']}) when calling "
+                             f"the {operation_name} operation")
+            self.response = error_response
+            self.operation_name = operation_name
+
+
+class _Exceptions:
+    ClientError = ClientError
+
+
+class _ListObjectsPaginator:
+    def __init__(self, client: "LocalS3Client"):
+        self._client = client
+
+    def paginate(self, Bucket: str, Prefix: str = "") -> Iterator[Dict[str, Any]]:
+        yield {"Contents": list(self._client._list(Bucket, Prefix))}
+
+
+class LocalS3Client:
+    """
+    Directory-backed stand-in for a boto3 S3 client.
+
+    Implements the calls S3Storage makes (head/get/put/delete object,
+    upload_fileobj, list_objects_v2 pagination, presigned URLs) with S3's
+    semantics for metadata, ranges and missing keys, so storage code can be
+    exercised without an object store.
+    """
+
+    exceptions = _Exceptions
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.calls: Dict[str, int] = {}
+
+    def _count(self, operation: str) -> None:
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+
+    def _path(self, bucket: str, key: str) -> Path:
+        return self.root / bucket / key.replace("..", "")
+
+    def _meta_path(self, bucket: str, key: str) -> Path:
+        path = self._path(bucket, key)
+        return path.with_name(path.name + ".s3meta")
+
+    def _not_found(self, operation: str, key: str):
+        return ClientError({"Error": {"Code": "404", "Message": f"Not Found: {key}"}}, operation)
+
+    def _write(self, bucket: str, key: str, stream: BinaryIO, content_type: str, metadata: Dict[str, str]) -> None:
+        path = self._path(bucket, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            etag, _ = copy_and_hash(stream, f)
+        with open(self._meta_path(bucket, key), "w") as f:
+            json.dump({"ContentType": content_type, "Metadata": metadata, "ETag": etag}, f)
+
+    def head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        self._count("head_object")
+        path = self._path(Bucket, Key)
+        if not path.is_file():
+            raise self._not_found("HeadObject", Key)
+        with open(self._meta_path(Bucket, Key)) as f:
+            meta = json.load(f)
+        return {
+            "ContentLength": path.stat().st_size,
+            "ContentType": meta.get("ContentType", "binary/octet-stream"),
+            "Metadata": dict(meta.get("Metadata", {})),
+            "ETag": f'"{meta.get("ETag", "")}"',
+            "LastModified": datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc),
+        }
+
+    def get_object(self, Bucket: str, Key: str, Range: Optional[str] = None) -> Dict[str, Any]:
+        self._count("get_object")
+        head = self.head_object(Bucket, Key)
+        self.calls["head_object"] -= 1
+        body = open(self._path(Bucket, Key), "rb")
+        if Range:
+            start, _, end = Range.replace("bytes=", "").partition("-")
+            start = int(start)
+            end = min(int(end) if end else head["ContentLength"] - 1, head["ContentLength"] - 1)
+            body.seek(start)
+            data = body.read(max(0, end - start + 1))
+            body.close()
+            body = io.BytesIO(data)
+            head["ContentLength"] = len(data)
+        head["Body"] = body
+        return head
+
+    def put_object(self, Bucket: str, Key: str, Body: Union[bytes, BinaryIO] = b"",
+                   ContentType: str = "binary/octet-stream", Metadata: Optional[Dict[str, str]] = None) -> Dict:
+        self._count("put_object")
+        stream = io.BytesIO(Body) if isinstance(Body, bytes) else Body
+        self._write(Bucket, Key, stream, ContentType, Metadata or {})
+        return {}
+
+    def upload_fileobj(self, Fileobj: BinaryIO, Bucket: str, Key: str,
+                       ExtraArgs: Optional[Dict[str, Any]] = None) -> None:
+        self._count("upload_fileobj")
+        extra = ExtraArgs or {}
+        self._write(Bucket, Key, Fileobj, extra.get("ContentType", "binary/octet-stream"), extra.get("Metadata", {}))
+
+    def download_fileobj(self, Bucket: str, Key: str, Fileobj: BinaryIO) -> None:
+        self._count("download_fileobj")
+        with self.get_object(Bucket, Key)["Body"] as body:
+            for chunk in iter(lambda: body.read(65536), b""):
+                Fileobj.write(chunk)
+
+    def delete_object(self, Bucket: str, Key: str) -> Dict:
+        self._count("delete_object")
+        self._path(Bucket, Key).unlink(missing_ok=True)
+        self._meta_path(Bucket, Key).unlink(missing_ok=True)
+        return {}
+
+    def _list(self, bucket: str, prefix: str) -> Iterator[Dict[str, Any]]:
+        bucket_dir = self.root / bucket
+        if not bucket_dir.exists():
+            return
+        for path in sorted(bucket_dir.rglob("*")):
+            if not path.is_file() or path.name.endswith(".s3meta"):
+                continue
+            key = path.relative_to(bucket_dir).as_posix()
+            if key.startswith(prefix):
+                stat = path.stat()
+                yield {"Key": key, "Size": stat.st_size,
+                       "LastModified": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)}
+
+    def get_paginator(self, operation: str) -> _ListObjectsPaginator:
+        if operation != "list_objects_v2":
+            raise NotImplementedError(operation)
+        return _ListObjectsPaginator(self)
+
+    def generate_presigned_url(self, operation: str, Params: Dict[str, Any], ExpiresIn: int = 3600) -> str:
+        return f"file://{self._path(Params['Bucket'], Params['Key'])}"
+
+    def head_bucket(self, Bucket: str) -> Dict:
+        if not (self.root / Bucket).is_dir():
+            raise self._not_found("HeadBucket", Bucket)
+        return {}
+
+    def create_bucket(self, Bucket: str, **kwargs) -> Dict:
+        (self.root / Bucket).mkdir(parents=True, exist_ok=True)
+        return {}
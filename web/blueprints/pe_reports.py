@@ -16,7 +16,7 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
 
-from flask import Blueprint, render_template, jsonify, request, current_app, send_file, session as flask_session, g
+from flask import Blueprint, Response, render_template, jsonify, request, current_app, send_file, session as flask_session, g, stream_with_context
 import zipfile
 import io
 
@@ -179,6 +179,17 @@ def dashboard(deal_id: str = None):
         return f"<h1>Error generating dashboard</h1><p>{str(e)}</p>", 500
 
 
+def _stream_report_chunks(chunks, domain: str, editing_html: str):
+    """Yield rendered report chunks, injecting the editing UI before </body>."""
+    try:
+        for chunk in chunks:
+            yield chunk.replace('</body>', editing_html + '\n</body>')
+    except Exception as e:
+        # Headers are already sent - log and end the partial page
+        logger.exception(f"Error streaming {domain} report: {e}")
+        yield f"<p>Error generating {domain} report: {str(e)}</p></body></html>"
+
+
 # =============================================================================
 # DOMAIN ROUTES
 # =============================================================================
@@ -188,7 +199,7 @@ def dashboard(deal_id: str = None):
 def domain_report(domain: str, deal_id: str = None):
     """Domain deep-dive page."""
     from tools_v2.domain_generators import DOMAIN_GENERATORS
-    from tools_v2.renderers.html_renderer import render_domain_report
+    from tools_v2.renderers.html_renderer import DomainReportRenderer
     from tools_v2.pe_report_schemas import DOMAIN_ORDER
 
     # Get entity from query param (Phase 7 - Entity Separation)
@@ -227,18 +238,18 @@ def domain_report(domain: str, deal_id: str = None):
                 _apply_overrides(domain_data, overrides)
                 logger.info(f"Applied {sum(len(v) for v in overrides.values())} overrides to {domain}")
 
-        # Render to HTML with entity context
-        html = render_domain_report(
-            data=domain_data,
-            target_name=deal_context.target_name,
-            entity=entity
-        )
+        # Render to HTML with entity context, streaming sections as they are
+        # produced (unchanged sections come from the fragment cache)
+        renderer = DomainReportRenderer(entity=entity)
+        chunks = renderer.iter_render(domain_data, target_name=deal_context.target_name)
 
         # Inject editing capabilities for web UI viewing
         editing_html = _get_editing_injection_html(domain, overrides)
-        html = html.replace('</body>', editing_html + '\n</body>')
 
-        return html
+        return Response(
+            stream_with_context(_stream_report_chunks(chunks, domain, editing_html)),
+            mimetype='text/html'
+        )
 
     except Exception as e:
         logger.exception(f"Error generating {domain} report: {e}")
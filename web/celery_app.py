@@ -50,6 +50,16 @@ celery.conf.update(
             'task': 'web.tasks.cleanup_old_tasks',
             'schedule': 3600.0,  # Every hour
         },
+        # Remove abandoned resumable upload parts
+        'cleanup-stale-uploads': {
+            'task': 'web.tasks.cleanup_stale_uploads',
+            'schedule': 3600.0,  # Every hour
+        },
+        # Reclaim S3 blobs no document references any more
+        'cleanup-unreferenced-blobs': {
+            'task': 'web.tasks.cleanup_unreferenced_blobs',
+            'schedule': 86400.0,  # Every day
+        },
     },
 )
 
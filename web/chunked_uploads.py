@@ -0,0 +1,322 @@
+"""
+Resumable Chunked Uploads
+
+Data rooms run to hundreds of MB; a single multipart POST has to be retried
+from the start when the connection drops. Clients can instead upload a file
+in chunks:
+
+    POST   /api/uploads                  -> start, returns upload_id
+    PUT    /api/uploads/<id>?offset=N    -> append the request body at offset N
+    GET    /api/uploads/<id>             -> status (bytes received so far)
+    POST   /api/uploads/<id>/complete    -> register with the DocumentStore
+    DELETE /api/uploads/<id>             -> abort
+
+Each chunk is appended to a part file on disk and fed to a running SHA-256
+in the same pass, so memory stays at one read buffer per request regardless
+of file size. After a dropped connection the client asks for the status and
+resumes from the received offset. The part file is the source of truth: if
+the running hash is lost (worker restart, another worker), it is rebuilt
+from the part file.
+
+On completion the part file is moved into document storage by path
+(DocumentStore.add_spooled_document); parsing reads it from there.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from utils.file_hasher import HASH_BUFFER_SIZE, copy_and_hash
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config_v2 import UPLOAD_SPOOL_DIR, UPLOAD_CHUNK_SIZE, MAX_UPLOAD_SIZE_MB, UPLOAD_SPOOL_MAX_AGE_HOURS
+except ImportError:
+    UPLOAD_SPOOL_DIR = Path("uploads/.spool")
+    UPLOAD_CHUNK_SIZE = 1024 * 1024
+    MAX_UPLOAD_SIZE_MB = 30
+    UPLOAD_SPOOL_MAX_AGE_HOURS = 24
+
+
+class UploadError(Exception):
+    """A chunked upload request cannot be applied."""
+
+
+class UploadNotFoundError(UploadError):
+    """No upload with this ID (never started, completed or aborted)."""
+
+
+class UploadOffsetError(UploadError):
+    """Chunk offset does not match the bytes already received."""
+
+    def __init__(self, expected: int, received: int):
+        super().__init__(f"Chunk offset {received} does not match received size {expected}")
+        self.expected = expected
+        self.received = received
+
+
+@dataclass
+class ChunkedUpload:
+    """Metadata of an upload in progress (persisted next to the part file)."""
+    upload_id: str
+    filename: str
+    entity: str
+    deal_id: str = ""
+    authority_level: int = 1
+    uploaded_by: Optional[str] = None
+    total_size: Optional[int] = None     # Declared by the client, if known
+    received: int = 0                    # Bytes in the part file
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["complete"] = self.total_size is not None and self.received >= self.total_size
+        return data
+
+
+class ChunkedUploadManager:
+    """
+    Resumable uploads spooled to disk with an incremental SHA-256.
+
+    Appends to one upload are serialized; different uploads proceed in
+    parallel.
+
+    Usage:
+        manager = get_upload_manager()
+        upload = manager.start("contracts.pdf", entity="target", deal_id=deal_id, total_size=size)
+        manager.append(upload.upload_id, request.stream, offset=0)
+        doc = manager.complete(upload.upload_id, doc_store)
+    """
+
+    def __init__(self, spool_dir: Optional[Path] = None, max_bytes: Optional[int] = None,
+                 chunk_size: Optional[int] = None):
+        self.spool_dir = Path(spool_dir or UPLOAD_SPOOL_DIR)
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes if max_bytes is not None else MAX_UPLOAD_SIZE_MB * 1024 * 1024
+        self.chunk_size = chunk_size or UPLOAD_CHUNK_SIZE
+        self._hashers: Dict[str, Tuple[Any, int]] = {}  # upload_id -> (running sha256, bytes hashed)
+        self._upload_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # PATHS AND METADATA
+    # =========================================================================
+
+    def _part_path(self, upload_id: str) -> Path:
+        return self.spool_dir / f"{upload_id}.part"
+
+    def _meta_path(self, upload_id: str) -> Path:
+        return self.spool_dir / f"{upload_id}.json"
+
+    def _upload_lock(self, upload_id: str) -> threading.Lock:
+        with self._lock:
+            return self._upload_locks.setdefault(upload_id, threading.Lock())
+
+    def _load(self, upload_id: str) -> ChunkedUpload:
+        # upload_ids are uuid hex; anything else could escape the spool dir
+        if not upload_id or not upload_id.isalnum():
+            raise UploadNotFoundError(f"Unknown upload: {upload_id}")
+        meta_path = self._meta_path(upload_id)
+        try:
+            with open(meta_path) as f:
+                upload = ChunkedUpload(**json.load(f))
+        except FileNotFoundError:
+            raise UploadNotFoundError(f"Unknown upload: {upload_id}")
+        part_path = self._part_path(upload_id)
+        upload.received = part_path.stat().st_size if part_path.exists() else 0
+        return upload
+
+    def _save(self, upload: ChunkedUpload) -> None:
+        upload.updated_at = time.time()
+        tmp_path = self._meta_path(upload.upload_id).with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(asdict(upload), f)
+        tmp_path.replace(self._meta_path(upload.upload_id))
+
+    def _hasher_for(self, upload: ChunkedUpload):
+        """
+        Running hash of the part file.
+
+        Rebuilt from disk when it was lost or covers a different number of
+        bytes than the part file (e.g. another worker appended).
+        """
+        hasher, hashed = self._hashers.get(upload.upload_id, (None, -1))
+        if hasher is None or hashed != upload.received:
+            hasher = hashlib.sha256()
+            part_path = self._part_path(upload.upload_id)
+            if part_path.exists():
+                with open(part_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(HASH_BUFFER_SIZE), b""):
+                        hasher.update(chunk)
+                logger.debug(f"Rebuilt hash of upload {upload.upload_id} from {upload.received} bytes")
+            self._hashers[upload.upload_id] = (hasher, upload.received)
+        return hasher
+
+    def _discard(self, upload_id: str) -> None:
+        self._hashers.pop(upload_id, None)
+        with self._lock:
+            self._upload_locks.pop(upload_id, None)
+        self._part_path(upload_id).unlink(missing_ok=True)
+        self._meta_path(upload_id).unlink(missing_ok=True)
+
+    # =========================================================================
+    # UPLOAD LIFECYCLE
+    # =========================================================================
+
+    def start(
+        self,
+        filename: str,
+        entity: str,
+        deal_id: str = "",
+        authority_level: int = 1,
+        uploaded_by: Optional[str] = None,
+        total_size: Optional[int] = None
+    ) -> ChunkedUpload:
+        """Create an empty upload and return its metadata."""
+        if entity not in ("target", "buyer"):
+            raise UploadError(f"Invalid entity '{entity}'. Must be 'target' or 'buyer'.")
+        if total_size is not None and total_size > self.max_bytes:
+            raise UploadError(f"Upload of {total_size} bytes exceeds limit of {self.max_bytes} bytes")
+
+        upload = ChunkedUpload(
+            upload_id=uuid4().hex,
+            filename=filename,
+            entity=entity,
+            deal_id=deal_id or "",
+            authority_level=authority_level,
+            uploaded_by=uploaded_by,
+            total_size=total_size,
+        )
+        self._part_path(upload.upload_id).touch()
+        self._save(upload)
+        self._hashers[upload.upload_id] = (hashlib.sha256(), 0)
+        logger.info(f"Started chunked upload {upload.upload_id} for {filename} ({total_size or '?'} bytes)")
+        return upload
+
+    def status(self, upload_id: str) -> ChunkedUpload:
+        """Metadata including the bytes received so far (the resume offset)."""
+        return self._load(upload_id)
+
+    def append(self, upload_id: str, stream: BinaryIO, offset: int) -> ChunkedUpload:
+        """
+        Append a chunk read from stream at offset.
+
+        The offset must equal the bytes already received, so a retried or
+        out-of-order chunk is rejected instead of corrupting the file.
+
+        Raises:
+            UploadNotFoundError: Unknown upload
+            UploadOffsetError: offset != bytes received
+            UploadError: The upload would exceed its declared size or the limit
+        """
+        with self._upload_lock(upload_id):
+            upload = self._load(upload_id)
+            if offset != upload.received:
+                raise UploadOffsetError(expected=upload.received, received=offset)
+
+            limit = self.max_bytes if upload.total_size is None else min(self.max_bytes, upload.total_size)
+            hasher = self._hasher_for(upload)
+            part_path = self._part_path(upload_id)
+            try:
+                with open(part_path, "ab") as f:
+                    _, written = copy_and_hash(stream, f, chunk_size=self.chunk_size, hasher=hasher,
+                                               max_bytes=limit - upload.received)
+            except ValueError:
+                self._truncate(upload)
+                raise UploadError(f"Upload {upload_id} exceeds {limit} bytes")
+            except Exception:
+                # Partial chunk (e.g. client disconnected): keep the bytes that
+                # reached disk and rebuild the hash from them on the next append
+                self._hashers.pop(upload_id, None)
+                raise
+
+            upload.received += written
+            self._hashers[upload_id] = (hasher, upload.received)
+            self._save(upload)
+            return upload
+
+    def _truncate(self, upload: ChunkedUpload) -> None:
+        """Cut the part file back to the last accepted chunk."""
+        with open(self._part_path(upload.upload_id), "r+b") as f:
+            f.truncate(upload.received)
+        self._hashers.pop(upload.upload_id, None)
+
+    def complete(self, upload_id: str, doc_store, expected_hash: Optional[str] = None):
+        """
+        Register the finished file with a DocumentStore and clean up.
+
+        Args:
+            upload_id: Upload to finish
+            doc_store: DocumentStore receiving the file (moved by path)
+            expected_hash: Optional client-side SHA-256 to verify against
+
+        Returns:
+            Document record (new or existing if duplicate)
+        """
+        with self._upload_lock(upload_id):
+            upload = self._load(upload_id)
+            if upload.total_size is not None and upload.received != upload.total_size:
+                raise UploadError(f"Upload {upload_id} incomplete: {upload.received} of {upload.total_size} bytes")
+
+            file_hash = self._hasher_for(upload).hexdigest()
+            if expected_hash and expected_hash.lower() != file_hash:
+                raise UploadError(f"Hash mismatch for upload {upload_id}: got {file_hash[:16]}...")
+
+            doc = doc_store.add_spooled_document(
+                self._part_path(upload_id),
+                file_hash,
+                upload.filename,
+                upload.entity,
+                deal_id=upload.deal_id or None,
+                authority_level=upload.authority_level,
+                uploaded_by=upload.uploaded_by,
+                file_size=upload.received,
+            )
+            self._discard(upload_id)
+
+        logger.info(f"Completed chunked upload {upload_id}: {upload.filename} -> {doc.doc_id}")
+        return doc
+
+    def abort(self, upload_id: str) -> None:
+        """Delete an upload and its data."""
+        with self._upload_lock(upload_id):
+            self._load(upload_id)
+            self._discard(upload_id)
+
+    def cleanup_stale(self, max_age_hours: Optional[int] = None) -> List[str]:
+        """Remove uploads not touched for max_age_hours. Returns their IDs."""
+        max_age = (max_age_hours if max_age_hours is not None else UPLOAD_SPOOL_MAX_AGE_HOURS) * 3600
+        cutoff = time.time() - max_age
+        removed = []
+        for meta_path in self.spool_dir.glob("*.json"):
+            upload_id = meta_path.stem
+            try:
+                if self._load(upload_id).updated_at < cutoff:
+                    self._discard(upload_id)
+                    removed.append(upload_id)
+            except (UploadError, ValueError, TypeError):
+                continue
+        if removed:
+            logger.info(f"Removed {len(removed)} stale chunked uploads")
+        return removed
+
+
+_upload_manager: Optional[ChunkedUploadManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_upload_manager() -> ChunkedUploadManager:
+    """Process-wide ChunkedUploadManager."""
+    global _upload_manager
+    with _manager_lock:
+        if _upload_manager is None:
+            _upload_manager = ChunkedUploadManager()
+        return _upload_manager
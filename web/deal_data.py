@@ -461,6 +461,8 @@ class DBFactWrapper:
     that works whether the fact came from DB or from the in-memory FactStore.
     """
 
+    __slots__ = ('_fact',)
+
     def __init__(self, db_fact):
         self._fact = db_fact
 
@@ -0,0 +1,422 @@
+"""
+Progress Events - Push-based analysis progress for Server-Sent Events
+
+Replaces client-side status polling with a publish/subscribe feed:
+
+- Publishers (AnalysisTaskManager, Celery analysis tasks) call
+  publish_progress() whenever phase, per-domain progress, fact counts or
+  token spend change.
+- The SSE endpoints in web/app.py stream those events to the browser.
+
+Each channel ("task:<task_id>", "deal:<deal_id>") keeps a short backlog of
+events with increasing integer IDs, so a reconnecting EventSource that
+sends Last-Event-ID receives exactly the events it missed.
+
+Backends:
+- Redis (when web.redis_client can connect): INCR for event IDs, a capped
+  list for the backlog, PUBLISH for live delivery. Works across web and
+  Celery worker processes. Subscriptions use their own connection pool.
+- In-process (fallback): a deque per channel and a Condition to wake
+  subscribers. Only sees events published in the same process, so with
+  several web workers streams also re-read a status snapshot while idle.
+
+A channel's backlog is dropped PROGRESS_TERMINAL_RETENTION_SECONDS after
+its terminal event. Streams are short (PROGRESS_STREAM_MAX_SECONDS) and
+capped per process (PROGRESS_MAX_STREAMS); past the cap a request gets the
+events it missed and ends, and EventSource reconnects - long-polling.
+Serve them from threaded workers (gunicorn gthread), not sync workers.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+PROGRESS_BACKLOG_SIZE = int(os.environ.get('PROGRESS_BACKLOG_SIZE', '200'))  # Events kept per channel for resume
+PROGRESS_CHANNEL_TTL = 24 * 3600  # Seconds to keep Redis backlogs after the last event
+PROGRESS_HEARTBEAT_SECONDS = 15.0  # Keep-alive comment interval on idle streams
+PROGRESS_STREAM_MAX_SECONDS = int(os.environ.get('PROGRESS_STREAM_MAX_SECONDS', '55'))  # Browser reconnects with Last-Event-ID
+PROGRESS_TERMINAL_RETENTION_SECONDS = int(os.environ.get('PROGRESS_TERMINAL_RETENTION_SECONDS', '60'))  # Backlog kept after a run ends
+PROGRESS_REFRESH_SECONDS = 2.0  # Snapshot re-read interval when the bus is process-local
+# Concurrent streams per process; defaults to half the gunicorn threads
+# (rounded down) so streams never take every request thread. With one
+# thread that is 0 and every stream long-polls
+GUNICORN_THREADS = int(os.environ.get('GUNICORN_THREADS', '2'))
+PROGRESS_MAX_STREAMS = max(0, min(
+    int(os.environ.get('PROGRESS_MAX_STREAMS', str(GUNICORN_THREADS // 2))), GUNICORN_THREADS - 1
+))
+PROGRESS_RETRY_MS = 3000  # EventSource reconnect delay
+
+REDIS_KEY_PREFIX = 'progress'
+
+
+@dataclass
+class ProgressEvent:
+    """A single progress update on a channel."""
+    id: int
+    channel: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    event: str = 'progress'
+
+    @property
+    def is_terminal(self) -> bool:
+        """True once the run has finished (completed, failed, cancelled)."""
+        return bool(self.data.get('complete'))
+
+    def to_json(self) -> str:
+        return json.dumps({
+            'id': self.id,
+            'channel': self.channel,
+            'event': self.event,
+            'data': self.data,
+        }, default=str)
+
+    @classmethod
+    def from_json(cls, payload: str) -> "ProgressEvent":
+        raw = json.loads(payload)
+        return cls(id=int(raw['id']), channel=raw['channel'], data=raw.get('data') or {},
+                   event=raw.get('event', 'progress'))
+
+    def to_sse(self) -> str:
+        """Format as a Server-Sent Events message."""
+        return f"id: {self.id}\nevent: {self.event}\ndata: {json.dumps(self.data, default=str)}\n\n"
+
+
+def format_sse(data: Dict[str, Any], event: str = 'snapshot') -> str:
+    """Format an un-numbered SSE message (does not move the client's Last-Event-ID)."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+SSE_HEARTBEAT = ": keep-alive\n\n"
+
+
+# =============================================================================
+# IN-PROCESS BACKEND
+# =============================================================================
+
+class InMemoryProgressBus:
+    """Thread-safe in-process pub/sub with a bounded backlog per channel."""
+
+    shared = False  # Events are only visible to this process
+
+    def __init__(
+        self,
+        backlog_size: int = PROGRESS_BACKLOG_SIZE,
+        terminal_retention: float = PROGRESS_TERMINAL_RETENTION_SECONDS
+    ):
+        self.backlog_size = backlog_size
+        self.terminal_retention = terminal_retention
+        self._events: Dict[str, Deque[ProgressEvent]] = {}
+        self._last_ids: Dict[str, int] = {}
+        self._finished: Dict[str, float] = {}  # channel -> monotonic time of its terminal event
+        self._condition = threading.Condition()
+
+    def publish(self, channel: str, data: Dict[str, Any], event: str = 'progress') -> ProgressEvent:
+        with self._condition:
+            self._prune_finished()
+            event_id = self._last_ids.get(channel, 0) + 1
+            self._last_ids[channel] = event_id
+            progress_event = ProgressEvent(id=event_id, channel=channel, data=data, event=event)
+            backlog = self._events.get(channel)
+            if backlog is None:
+                backlog = self._events[channel] = deque(maxlen=self.backlog_size)
+            backlog.append(progress_event)
+            if progress_event.is_terminal:
+                self._finished[channel] = time.monotonic()
+            else:
+                self._finished.pop(channel, None)
+            self._condition.notify_all()
+        return progress_event
+
+    def _prune_finished(self) -> None:
+        """Drop channels whose run ended more than terminal_retention ago."""
+        cutoff = time.monotonic() - self.terminal_retention
+        for channel, finished_at in list(self._finished.items()):
+            if finished_at <= cutoff:
+                del self._finished[channel]
+                self._events.pop(channel, None)
+                self._last_ids.pop(channel, None)
+
+    def events_since(self, channel: str, last_id: int = 0) -> List[ProgressEvent]:
+        with self._condition:
+            return [e for e in self._events.get(channel, ()) if e.id > last_id]
+
+    def last_event_id(self, channel: str) -> int:
+        with self._condition:
+            return self._last_ids.get(channel, 0)
+
+    def subscribe(
+        self,
+        channel: str,
+        last_id: int = 0,
+        heartbeat: float = PROGRESS_HEARTBEAT_SECONDS
+    ) -> Iterator[Optional[ProgressEvent]]:
+        """Yield events after last_id as they arrive; None when idle for `heartbeat` seconds."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._last_ids.get(channel, 0) > last_id, timeout=heartbeat
+                )
+                pending = [e for e in self._events.get(channel, ()) if e.id > last_id]
+            if not pending:
+                yield None
+                continue
+            for progress_event in pending:
+                last_id = progress_event.id
+                yield progress_event
+
+    def clear(self, channel: Optional[str] = None):
+        with self._condition:
+            if channel is None:
+                self._events.clear()
+                self._last_ids.clear()
+                self._finished.clear()
+            else:
+                self._events.pop(channel, None)
+                self._last_ids.pop(channel, None)
+                self._finished.pop(channel, None)
+
+
+# =============================================================================
+# REDIS BACKEND
+# =============================================================================
+
+class RedisProgressBus:
+    """
+    Redis pub/sub with a capped list backlog per channel for resumable streams.
+
+    Subscriptions hold a connection for the life of a stream, so they use
+    pubsub_client (its own pool) rather than the shared client.
+    """
+
+    shared = True
+
+    def __init__(self, client, backlog_size: int = PROGRESS_BACKLOG_SIZE, pubsub_client=None):
+        self.client = client
+        self.pubsub_client = pubsub_client or client
+        self.backlog_size = backlog_size
+
+    def _key(self, channel: str, suffix: str) -> str:
+        return f"{REDIS_KEY_PREFIX}:{channel}:{suffix}"
+
+    def publish(self, channel: str, data: Dict[str, Any], event: str = 'progress') -> ProgressEvent:
+        event_id = int(self.client.incr(self._key(channel, 'seq')))
+        progress_event = ProgressEvent(id=event_id, channel=channel, data=data, event=event)
+        payload = progress_event.to_json()
+
+        # Once the run ends the backlog only has to outlive reconnects
+        ttl = PROGRESS_TERMINAL_RETENTION_SECONDS if progress_event.is_terminal else PROGRESS_CHANNEL_TTL
+        log_key = self._key(channel, 'log')
+        pipe = self.client.pipeline()
+        pipe.rpush(log_key, payload)
+        pipe.ltrim(log_key, -self.backlog_size, -1)
+        pipe.expire(log_key, ttl)
+        pipe.expire(self._key(channel, 'seq'), ttl)
+        pipe.publish(self._key(channel, 'live'), payload)
+        pipe.execute()
+        return progress_event
+
+    def events_since(self, channel: str, last_id: int = 0) -> List[ProgressEvent]:
+        events = [ProgressEvent.from_json(p) for p in self.client.lrange(self._key(channel, 'log'), 0, -1)]
+        return sorted((e for e in events if e.id > last_id), key=lambda e: e.id)
+
+    def last_event_id(self, channel: str) -> int:
+        return int(self.client.get(self._key(channel, 'seq')) or 0)
+
+    def subscribe(
+        self,
+        channel: str,
+        last_id: int = 0,
+        heartbeat: float = PROGRESS_HEARTBEAT_SECONDS
+    ) -> Iterator[Optional[ProgressEvent]]:
+        """Yield events after last_id as they arrive; None when idle for `heartbeat` seconds."""
+        pubsub = self.pubsub_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self._key(channel, 'live'))
+        try:
+            # Subscribed first, so nothing published from here on is lost;
+            # the backlog covers everything before. IDs dedupe the overlap.
+            for progress_event in self.events_since(channel, last_id):
+                last_id = progress_event.id
+                yield progress_event
+
+            while True:
+                message = pubsub.get_message(timeout=heartbeat)
+                if message is None:
+                    yield None
+                    continue
+                progress_event = ProgressEvent.from_json(message['data'])
+                if progress_event.id <= last_id:
+                    continue
+                if progress_event.id > last_id + 1:
+                    # Missed messages (e.g. slow consumer) - fill the gap from the backlog
+                    for missed in self.events_since(channel, last_id):
+                        if missed.id < progress_event.id:
+                            yield missed
+                last_id = progress_event.id
+                yield progress_event
+        finally:
+            try:
+                pubsub.close()
+            except Exception:
+                pass
+
+
+# =============================================================================
+# BUS SELECTION AND HELPERS
+# =============================================================================
+
+_bus = None
+_bus_lock = threading.Lock()
+
+
+def get_progress_bus():
+    """Get the process-wide progress bus (Redis when available, else in-process)."""
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                client = pubsub_client = None
+                try:
+                    from web.redis_client import get_pubsub_client, get_redis_client
+                    client = get_redis_client()
+                    if client is not None:
+                        pubsub_client = get_pubsub_client(max_connections=max(1, PROGRESS_MAX_STREAMS))
+                except Exception as e:
+                    logger.debug(f"Redis unavailable for progress events: {e}")
+                if client is not None:
+                    _bus = RedisProgressBus(client, pubsub_client=pubsub_client)
+                    logger.info("Progress events: using Redis pub/sub")
+                else:
+                    _bus = InMemoryProgressBus()
+                    logger.info("Progress events: using in-process bus")
+    return _bus
+
+
+def set_progress_bus(bus) -> None:
+    """Replace the progress bus (tests, or explicit configuration at start-up)."""
+    global _bus
+    with _bus_lock:
+        _bus = bus
+
+
+def task_channel(task_id: str) -> str:
+    return f"task:{task_id}"
+
+
+def deal_channel(deal_id: str) -> str:
+    return f"deal:{deal_id}"
+
+
+def publish_progress(
+    data: Dict[str, Any],
+    task_id: Optional[str] = None,
+    deal_id: Optional[str] = None,
+    event: str = 'progress'
+) -> None:
+    """
+    Publish a progress update to the task and/or deal channel.
+
+    Never raises: progress streaming must not break the analysis itself.
+    """
+    channels = []
+    if task_id:
+        channels.append(task_channel(task_id))
+    if deal_id:
+        channels.append(deal_channel(deal_id))
+    if not channels:
+        return
+
+    try:
+        bus = get_progress_bus()
+        for channel in channels:
+            bus.publish(channel, data, event=event)
+    except Exception as e:
+        logger.warning(f"Failed to publish progress event: {e}")
+
+
+def parse_last_event_id(value: Optional[str]) -> int:
+    """Parse a Last-Event-ID header / query value (0 when missing or invalid)."""
+    try:
+        return max(0, int(value)) if value else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+_stream_slots = threading.BoundedSemaphore(PROGRESS_MAX_STREAMS)
+
+
+def stream_progress(
+    channel: str,
+    last_id: int = 0,
+    snapshot: Optional[Dict[str, Any]] = None,
+    max_seconds: float = PROGRESS_STREAM_MAX_SECONDS,
+    heartbeat: float = PROGRESS_HEARTBEAT_SECONDS,
+    bus=None,
+    refresh: Optional[Callable[[], Dict[str, Any]]] = None,
+    slots: Optional[threading.BoundedSemaphore] = None
+) -> Iterator[str]:
+    """
+    Generate an SSE response body for a channel.
+
+    Sends the snapshot first (un-numbered), then every event after last_id.
+    Ends after a terminal event, or after max_seconds so that connections
+    stay short; EventSource reconnects with Last-Event-ID and resumes where
+    it stopped. When this process already has PROGRESS_MAX_STREAMS open,
+    only the missed events are sent before ending (long-polling).
+
+    refresh re-reads the status snapshot; with a process-local bus it is
+    polled while idle, since events may be published by another worker.
+    """
+    bus = bus or get_progress_bus()
+    slots = slots or _stream_slots
+    if last_id > bus.last_event_id(channel):
+        last_id = 0  # Channel was dropped after its run ended; IDs restarted
+
+    yield f"retry: {PROGRESS_RETRY_MS}\n\n"
+    if snapshot is not None:
+        yield format_sse(snapshot)
+        if snapshot.get('complete') and not bus.events_since(channel, last_id):
+            return
+
+    if not slots.acquire(blocking=False):
+        for progress_event in bus.events_since(channel, last_id):
+            yield progress_event.to_sse()
+        return
+
+    try:
+        poll = refresh if refresh is not None and not getattr(bus, 'shared', True) else None
+        if poll:
+            heartbeat = min(heartbeat, PROGRESS_REFRESH_SECONDS)
+        deadline = time.monotonic() + max_seconds
+
+        for progress_event in bus.subscribe(channel, last_id, heartbeat=heartbeat):
+            if progress_event is not None:
+                yield progress_event.to_sse()
+                if progress_event.is_terminal:
+                    return
+            elif poll:
+                current = poll()
+                if current and current != snapshot:
+                    snapshot = current
+                    yield format_sse(current)
+                    if current.get('complete'):
+                        return
+                else:
+                    yield SSE_HEARTBEAT
+            else:
+                yield SSE_HEARTBEAT
+            if time.monotonic() >= deadline:
+                return
+    finally:
+        slots.release()
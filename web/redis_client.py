@@ -57,6 +57,41 @@ def get_redis_client():
         return None
 
 
+_pubsub_client = None
+
+
+def get_pubsub_client(max_connections: int = 50):
+    """
+    Get a Redis client for long-lived pub/sub subscriptions.
+
+    Uses its own connection pool: each subscriber holds a connection for as
+    long as it listens, and must not drain the shared pool used for
+    ordinary commands.
+
+    Returns:
+        Redis client or None if unavailable
+    """
+    global _pubsub_client
+
+    if _pubsub_client is not None:
+        return _pubsub_client
+
+    try:
+        import redis
+
+        pool = redis.ConnectionPool.from_url(
+            REDIS_URL,
+            max_connections=max_connections,
+            decode_responses=True
+        )
+        _pubsub_client = redis.Redis(connection_pool=pool)
+        return _pubsub_client
+
+    except ImportError:
+        logger.warning("Redis package not installed")
+        return None
+
+
 def redis_health_check() -> Dict[str, Any]:
     """
     Check Redis connection health.
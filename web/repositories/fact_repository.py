@@ -435,6 +435,41 @@ class FactRepository(BaseRepository[Fact]):
         db.session.commit()
         return facts
 
+    def replace_for_run(
+        self,
+        deal_id: str,
+        run_id: str,
+        domain: str,
+        entity: str,
+        facts_data: List[Dict[str, Any]]
+    ) -> List[Fact]:
+        """
+        Replace a run's facts for one domain and entity in a single transaction.
+
+        Facts written by an earlier attempt of the same run step are deleted
+        first, so a retried step never leaves duplicates or half-saved sets.
+        """
+        fact_ids = [data['id'] for data in facts_data if data.get('id')]
+        try:
+            Fact.query.filter(
+                Fact.deal_id == deal_id,
+                Fact.analysis_run_id == run_id,
+                Fact.entity == entity,
+                or_(Fact.domain == domain, Fact.id.in_(fact_ids))
+            ).delete(synchronize_session=False)
+
+            facts = []
+            for data in facts_data:
+                fact = Fact(**data)
+                db.session.add(fact)
+                facts.append(fact)
+
+            db.session.commit()
+            return facts
+        except Exception:
+            db.session.rollback()
+            raise
+
     def update_change_type(
         self,
         deal_id: str,
@@ -9,14 +9,23 @@ import os
 import hashlib
 import logging
 import mimetypes
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, BinaryIO, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
+from utils.file_hasher import copy_and_hash
+from web.blob_store import BLOB_PREFIX, REF_PREFIX, BlobCache, blob_key, ref_key, ref_prefix
+
 logger = logging.getLogger(__name__)
 
+try:
+    from config_v2 import UPLOAD_CHUNK_SIZE
+except ImportError:
+    UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 # Storage configuration from environment
 STORAGE_TYPE = os.environ.get('STORAGE_TYPE', 'local')  # 'local' or 's3'
 S3_BUCKET = os.environ.get('S3_BUCKET', 'diligence-documents')
@@ -25,6 +34,10 @@ S3_ENDPOINT = os.environ.get('S3_ENDPOINT', '')  # For R2, MinIO, etc.
 S3_ACCESS_KEY = os.environ.get('S3_ACCESS_KEY', '')
 S3_SECRET_KEY = os.environ.get('S3_SECRET_KEY', '')
 S3_PUBLIC_URL = os.environ.get('S3_PUBLIC_URL', '')  # Optional CDN URL
+S3_CONTENT_ADDRESSED = os.environ.get('S3_CONTENT_ADDRESSED', 'true').lower() == 'true'  # Store bytes once per SHA-256
+BLOB_CACHE_DIR = os.environ.get('BLOB_CACHE_DIR', '')  # Local read-through cache for S3 blobs ('' = uploads/.blob_cache)
+BLOB_CACHE_MAX_MB = int(os.environ.get('BLOB_CACHE_MAX_MB', '2048'))  # 0 disables the cache
+BLOB_GC_GRACE_HOURS = float(os.environ.get('BLOB_GC_GRACE_HOURS', '24'))  # Unreferenced blobs younger than this are kept
 
 
 @dataclass
@@ -92,6 +105,15 @@ class StorageBackend(ABC):
         """List files with optional prefix filter."""
         pass
 
+    def read_range(self, key: str, start: int, length: int) -> bytes:
+        """Read length bytes from offset start (e.g. one PDF xref table)."""
+        file, _ = self.download(key)
+        try:
+            file.seek(start)
+            return file.read(length)
+        finally:
+            file.close()
+
     def compute_hash(self, file: BinaryIO) -> str:
         """Compute SHA-256 hash of file contents."""
         sha256 = hashlib.sha256()
@@ -130,25 +152,20 @@ class LocalStorage(StorageBackend):
         full_path = self._get_full_path(key)
         full_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Compute hash before saving
-        file_hash = self.compute_hash(file)
-
         # Determine content type
         if content_type is None:
             content_type, _ = mimetypes.guess_type(filename)
             content_type = content_type or 'application/octet-stream'
 
-        # Write file
-        file.seek(0)
-        with open(full_path, 'wb') as f:
-            while True:
-                chunk = file.read(8192)
-                if not chunk:
-                    break
-                f.write(chunk)
-
-        # Get file size
-        size = full_path.stat().st_size
+        # Write and hash in one pass; rename into place once complete so a
+        # failed upload never leaves a truncated file under the key
+        part_path = full_path.with_suffix(full_path.suffix + '.part')
+        try:
+            with open(part_path, 'wb') as f:
+                file_hash, size = copy_and_hash(file, f, chunk_size=UPLOAD_CHUNK_SIZE)
+            os.replace(part_path, full_path)
+        finally:
+            part_path.unlink(missing_ok=True)
 
         # Save metadata to sidecar file
         meta = metadata or {}
@@ -261,7 +278,20 @@ class LocalStorage(StorageBackend):
 
 
 class S3Storage(StorageBackend):
-    """S3-compatible cloud storage backend."""
+    """
+    S3-compatible cloud storage backend.
+
+    With content addressing (S3_CONTENT_ADDRESSED, the default), the bytes
+    of a document are stored once per SHA-256 as a blob (see
+    web/blob_store.py) and the document key holds an empty reference object
+    whose metadata names the blob. Reads go through the local BlobCache when
+    one is configured. Keys written before content addressing (holding the
+    bytes themselves) are still read, and cached by their sha256 metadata.
+
+    delete() removes a document's reference and its marker; the blob bytes
+    are reclaimed by delete_unreferenced_blobs(), which the daily
+    web.tasks.cleanup_unreferenced_blobs job runs with a grace period.
+    """
 
     def __init__(
         self,
@@ -269,14 +299,25 @@ class S3Storage(StorageBackend):
         region: Optional[str] = None,
         endpoint_url: Optional[str] = None,
         access_key: Optional[str] = None,
-        secret_key: Optional[str] = None
+        secret_key: Optional[str] = None,
+        client: Any = None,
+        cache: Optional[BlobCache] = None,
+        content_addressed: Optional[bool] = None
     ):
-        import boto3
-        from botocore.config import Config
-
         self.bucket = bucket or S3_BUCKET
         self.region = region or S3_REGION
         self.endpoint_url = endpoint_url or S3_ENDPOINT or None
+        self.cache = cache
+        self.content_addressed = S3_CONTENT_ADDRESSED if content_addressed is None else content_addressed
+
+        if client is not None:
+            # Pre-built client (e.g. LocalS3Client in tests)
+            self.client = client
+            self.resource = None
+            return
+
+        import boto3
+        from botocore.config import Config
 
         # Configure boto3 client
         config = Config(
@@ -311,35 +352,54 @@ class S3Storage(StorageBackend):
         metadata: Optional[Dict[str, str]] = None
     ) -> StoredFile:
         """Upload a file to S3."""
-        # Compute hash
-        file_hash = self.compute_hash(file)
-
         # Determine content type
         if content_type is None:
             content_type, _ = mimetypes.guess_type(filename)
             content_type = content_type or 'application/octet-stream'
 
-        # Prepare metadata
-        s3_metadata = metadata or {}
-        s3_metadata['original-filename'] = filename
-        s3_metadata['sha256'] = file_hash
-
-        # Upload to S3
-        file.seek(0)
-        self.client.upload_fileobj(
-            file,
-            self.bucket,
-            key,
-            ExtraArgs={
-                'ContentType': content_type,
-                'Metadata': s3_metadata
-            }
-        )
+        # The hash goes into the object metadata, so it is needed before the
+        # upload starts: spool to a temporary file while hashing (one pass
+        # over the incoming stream), then upload from the spool
+        with tempfile.TemporaryFile() as spool:
+            file_hash, size = copy_and_hash(file, spool, chunk_size=UPLOAD_CHUNK_SIZE)
+            spool.seek(0)
+
+            # Prepare metadata
+            s3_metadata = metadata or {}
+            s3_metadata['original-filename'] = filename
+            s3_metadata['sha256'] = file_hash
+
+            if self.content_addressed:
+                data_key = blob_key(file_hash)
+                s3_metadata['blob-key'] = data_key
+                s3_metadata['size'] = str(size)
+                # Marker first, so a concurrent garbage collection sees the blob as referenced
+                self.client.put_object(Bucket=self.bucket, Key=ref_key(file_hash, key), Body=b'')
+                if self._object_exists(data_key):
+                    logger.info(f"Blob {file_hash[:16]}... already stored; {key} references it")
+                else:
+                    self._upload_object(spool, data_key, content_type, {'sha256': file_hash})
+
+                # Overwriting a key with new content: the old blob loses this reference
+                previous = self._reference_metadata(key)
+
+                # Reference object: no body, metadata points at the blob
+                self.client.put_object(
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=b'',
+                    ContentType=content_type,
+                    Metadata=s3_metadata
+                )
+                if previous.get('blob-key') and previous.get('sha256') not in (None, file_hash):
+                    self.client.delete_object(Bucket=self.bucket, Key=ref_key(previous['sha256'], key))
+            else:
+                self._upload_object(spool, key, content_type, s3_metadata)
 
-        # Get file size
-        file.seek(0, 2)  # Seek to end
-        size = file.tell()
-        file.seek(0)
+            # Write-through: the bytes are already local
+            if self.cache is not None:
+                spool.seek(0)
+                self.cache.put(file_hash, spool)
 
         return StoredFile(
             key=key,
@@ -352,41 +412,167 @@ class S3Storage(StorageBackend):
             metadata=metadata or {}
         )
 
-    def download(self, key: str) -> Tuple[BinaryIO, StoredFile]:
-        """Download a file from S3."""
-        import io
-
-        # Get object metadata first
-        head = self.client.head_object(Bucket=self.bucket, Key=key)
+    def _upload_object(self, file: BinaryIO, key: str, content_type: str, metadata: Dict[str, str]) -> None:
+        """Upload bytes (multipart for large files, handled by boto3)."""
+        self.client.upload_fileobj(
+            file,
+            self.bucket,
+            key,
+            ExtraArgs={
+                'ContentType': content_type,
+                'Metadata': metadata
+            }
+        )
 
-        # Download to memory
-        buffer = io.BytesIO()
-        self.client.download_fileobj(self.bucket, key, buffer)
-        buffer.seek(0)
+    def _object_exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except self.client.exceptions.ClientError:
+            return False
 
+    def _resolve(self, key: str) -> Tuple[str, StoredFile]:
+        """Key holding the bytes (blob or legacy object) and the file's metadata."""
+        head = self.client.head_object(Bucket=self.bucket, Key=key)
         metadata = head.get('Metadata', {})
+        data_key = metadata.get('blob-key', key)
+        size = int(metadata['size']) if metadata.get('size') else head['ContentLength']
         stored_file = StoredFile(
             key=key,
             filename=metadata.get('original-filename', key.split('/')[-1]),
-            size=head['ContentLength'],
+            size=size,
             content_type=head.get('ContentType', 'application/octet-stream'),
             hash=metadata.get('sha256', ''),
             storage_type='s3',
             created_at=head.get('LastModified', datetime.utcnow()),
             metadata=metadata
         )
+        return data_key, stored_file
+
+    def _cached_path(self, data_key: str, file_hash: str) -> Optional[Path]:
+        """Local path of the bytes, fetching them into the cache on a miss."""
+        if self.cache is None or not file_hash:
+            return None
+        path = self.cache.get(file_hash)
+        if path is None:
+            body = self.client.get_object(Bucket=self.bucket, Key=data_key)['Body']
+            try:
+                path = self.cache.put(file_hash, body)
+            finally:
+                body.close()
+        return path
+
+    def download(self, key: str) -> Tuple[BinaryIO, StoredFile]:
+        """
+        Download a file from S3.
 
-        return buffer, stored_file
+        Served from the local blob cache when possible; otherwise streamed
+        into the cache (or a temporary file without one), never into memory.
+        """
+        data_key, stored_file = self._resolve(key)
+
+        path = self._cached_path(data_key, stored_file.hash)
+        if path is not None:
+            return open(path, 'rb'), stored_file
+
+        spool = tempfile.TemporaryFile()
+        body = self.client.get_object(Bucket=self.bucket, Key=data_key)['Body']
+        try:
+            copy_and_hash(body, spool, chunk_size=UPLOAD_CHUNK_SIZE)
+        finally:
+            body.close()
+        spool.seek(0)
+        return spool, stored_file
+
+    def read_range(self, key: str, start: int, length: int) -> bytes:
+        """Read a byte range: from the cache if present, else a ranged GET."""
+        data_key, stored_file = self._resolve(key)
+        if length <= 0:
+            return b''
+
+        path = self.cache.get(stored_file.hash) if self.cache is not None and stored_file.hash else None
+        if path is not None:
+            with open(path, 'rb') as f:
+                f.seek(start)
+                return f.read(length)
+
+        body = self.client.get_object(
+            Bucket=self.bucket,
+            Key=data_key,
+            Range=f"bytes={start}-{start + length - 1}"
+        )['Body']
+        try:
+            return body.read()
+        finally:
+            body.close()
 
     def delete(self, key: str) -> bool:
-        """Delete a file from S3."""
+        """
+        Delete a file from S3.
+
+        For content-addressed files the reference and its marker are
+        deleted; the blob may be shared with other deals and is removed by
+        delete_unreferenced_blobs() once nothing references it.
+        """
         try:
+            metadata = self._reference_metadata(key)
             self.client.delete_object(Bucket=self.bucket, Key=key)
+            if metadata.get('blob-key') and metadata.get('sha256'):
+                self.client.delete_object(Bucket=self.bucket, Key=ref_key(metadata['sha256'], key))
             return True
         except Exception as e:
             logger.error(f"Error deleting S3 object {key}: {e}")
             return False
 
+    def _reference_metadata(self, key: str) -> Dict[str, str]:
+        """Metadata of the object at key ({} if there is none)."""
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key).get('Metadata', {})
+        except self.client.exceptions.ClientError:
+            return {}
+
+    def _has_references(self, file_hash: str) -> bool:
+        paginator = self.client.get_paginator('list_objects_v2')
+        return any(page.get('Contents') for page in paginator.paginate(Bucket=self.bucket,
+                                                                       Prefix=ref_prefix(file_hash)))
+
+    def delete_unreferenced_blobs(self, grace_hours: Optional[float] = None,
+                                  now: Optional[datetime] = None) -> int:
+        """
+        Delete blobs no reference marker points at. Returns the count.
+
+        Lists the markers and the blobs (no per-object HEAD). Blobs modified
+        within grace_hours (BLOB_GC_GRACE_HOURS) are kept, since an upload
+        writes its blob before its reference, and each candidate's markers
+        are listed again just before it is deleted.
+        """
+        grace = timedelta(hours=BLOB_GC_GRACE_HOURS if grace_hours is None else grace_hours)
+        cutoff = (now or datetime.utcnow()) - grace
+        paginator = self.client.get_paginator('list_objects_v2')
+
+        referenced = set()
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=REF_PREFIX):
+            for obj in page.get('Contents', []):
+                referenced.add(obj['Key'][len(REF_PREFIX):].split('/')[1])
+
+        removed = 0
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=BLOB_PREFIX):
+            for obj in page.get('Contents', []):
+                file_hash = obj['Key'].rsplit('/', 1)[-1]
+                modified = obj['LastModified']
+                if modified.tzinfo is not None:
+                    modified = modified.astimezone(timezone.utc).replace(tzinfo=None)
+                if file_hash in referenced or modified > cutoff or self._has_references(file_hash):
+                    continue
+                try:
+                    self.client.delete_object(Bucket=self.bucket, Key=obj['Key'])
+                    removed += 1
+                except Exception as e:
+                    logger.error(f"Error deleting blob {obj['Key']}: {e}")
+        if removed:
+            logger.info(f"Deleted {removed} unreferenced blobs from {self.bucket}")
+        return removed
+
     def exists(self, key: str) -> bool:
         """Check if a file exists in S3."""
         try:
@@ -401,13 +587,20 @@ class S3Storage(StorageBackend):
         if S3_PUBLIC_URL:
             return f"{S3_PUBLIC_URL.rstrip('/')}/{key}"
 
-        # Generate presigned URL
+        # Generate presigned URL (for the blob, under the document's name)
+        params = {
+            'Bucket': self.bucket,
+            'Key': key
+        }
+        if self.content_addressed:
+            data_key, stored_file = self._resolve(key)
+            if data_key != key:
+                params['Key'] = data_key
+                params['ResponseContentDisposition'] = f'attachment; filename="{stored_file.filename}"'
+
         url = self.client.generate_presigned_url(
             'get_object',
-            Params={
-                'Bucket': self.bucket,
-                'Key': key
-            },
+            Params=params,
             ExpiresIn=expires_in
         )
         return url
@@ -421,6 +614,8 @@ class S3Storage(StorageBackend):
 
         for page in pages:
             for obj in page.get('Contents', []):
+                if obj['Key'].startswith((BLOB_PREFIX, REF_PREFIX)):
+                    continue  # Blobs are reached through their references
                 # Get metadata for each object
                 try:
                     head = self.client.head_object(Bucket=self.bucket, Key=obj['Key'])
@@ -429,7 +624,7 @@ class S3Storage(StorageBackend):
                     files.append(StoredFile(
                         key=obj['Key'],
                         filename=metadata.get('original-filename', obj['Key'].split('/')[-1]),
-                        size=obj['Size'],
+                        size=int(metadata['size']) if metadata.get('size') else obj['Size'],
                         content_type=head.get('ContentType', 'application/octet-stream'),
                         hash=metadata.get('sha256', ''),
                         storage_type='s3',
@@ -497,7 +692,7 @@ class StorageService:
                 self._backend = LocalStorage()
             else:
                 try:
-                    self._backend = S3Storage()
+                    self._backend = S3Storage(cache=self._create_blob_cache())
                     logger.info(f"S3 storage initialized: bucket={S3_BUCKET}")
                 except Exception as e:
                     logger.error(f"Failed to initialize S3 storage: {e}")
@@ -509,6 +704,21 @@ class StorageService:
         if self._multi_tenancy_enabled:
             logger.info("Multi-tenancy storage namespacing enabled")
 
+    def _create_blob_cache(self) -> Optional[BlobCache]:
+        """Local cache for S3 blobs (None when BLOB_CACHE_MAX_MB is 0)."""
+        if BLOB_CACHE_MAX_MB <= 0:
+            return None
+        if BLOB_CACHE_DIR:
+            cache_dir = Path(BLOB_CACHE_DIR)
+        else:
+            from config_v2 import UPLOADS_DIR
+            cache_dir = UPLOADS_DIR / '.blob_cache'
+        try:
+            return BlobCache(cache_dir, max_bytes=BLOB_CACHE_MAX_MB * 1024 * 1024)
+        except OSError as e:
+            logger.warning(f"Blob cache unavailable at {cache_dir}: {e}")
+            return None
+
     @property
     def backend(self) -> StorageBackend:
         """Get the storage backend, initializing if needed."""
@@ -669,6 +879,10 @@ class StorageService:
 
         return self.backend.list_files(prefix)
 
+    def read_document_range(self, key: str, start: int, length: int) -> bytes:
+        """Read a byte range of a document without fetching all of it."""
+        return self.backend.read_range(key, start, length)
+
     def document_exists(self, key: str) -> bool:
         """Check if a document exists."""
         return self.backend.exists(key)
@@ -107,6 +107,9 @@ class AnalysisProgress:
     facts_extracted: int = 0
     risks_identified: int = 0
     work_items_created: int = 0
+    tokens_used: int = 0
+    estimated_cost: float = 0.0
+    domain_progress: Dict[str, str] = field(default_factory=dict)  # domain -> running/complete/failed
     errors: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -120,6 +123,9 @@ class AnalysisProgress:
             "facts_extracted": self.facts_extracted,
             "risks_identified": self.risks_identified,
             "work_items_created": self.work_items_created,
+            "tokens_used": self.tokens_used,
+            "estimated_cost": self.estimated_cost,
+            "domain_progress": dict(self.domain_progress),
             "errors": self.errors,
         }
 
@@ -382,6 +388,7 @@ class AnalysisTaskManager:
 
             # Save task state
             self._save_task_state(task)
+            self._publish_task_event(task)
 
     def _update_progress(self, task_id: str, progress_update: Dict[str, Any]):
         """Update task progress from callback."""
@@ -401,14 +408,30 @@ class AnalysisTaskManager:
                 should_save_to_db = True
 
             for key in ["current_document", "documents_processed", "total_documents",
-                       "facts_extracted", "risks_identified", "work_items_created", "phase_display"]:
+                       "facts_extracted", "risks_identified", "work_items_created", "phase_display",
+                       "tokens_used", "estimated_cost"]:
                 if key in progress_update:
                     setattr(task.progress, key, progress_update[key])
 
+            if "domain_progress" in progress_update:
+                task.progress.domain_progress.update(progress_update["domain_progress"])
+
         # Persist phase changes to database (outside lock to avoid deadlock)
         if should_save_to_db:
             self._save_task_to_db(task)
 
+        self._publish_task_event(task)
+
+    def _publish_task_event(self, task: AnalysisTask):
+        """Push the task's current status to SSE subscribers (see web/progress_events.py)."""
+        from web.progress_events import publish_progress
+
+        publish_progress(
+            self._status_payload(task),
+            task_id=task.task_id,
+            deal_id=task.deal_context.get('deal_id') if task.deal_context else None
+        )
+
     def get_task(self, task_id: str) -> Optional[AnalysisTask]:
         """Get task by ID (checks memory first, then database)."""
         with self._tasks_lock:
@@ -554,6 +577,10 @@ class AnalysisTaskManager:
                 # Update local task with Celery status
                 self._sync_celery_status(task, celery_status)
 
+        return self._status_payload(task)
+
+    def _status_payload(self, task: AnalysisTask) -> Dict[str, Any]:
+        """Task status as returned by the status API and pushed to SSE streams."""
         return {
             "task_id": task.task_id,
             "status": task.status.value,
@@ -620,15 +647,14 @@ class AnalysisTaskManager:
 
             if task.status == TaskStatus.RUNNING:
                 task._cancelled = True
-                task.status = TaskStatus.CANCELLED
-                task.completed_at = datetime.now().isoformat()
-                return True
-            elif task.status == TaskStatus.PENDING:
-                task.status = TaskStatus.CANCELLED
-                task.completed_at = datetime.now().isoformat()
-                return True
+            elif task.status != TaskStatus.PENDING:
+                return False
 
-        return False
+            task.status = TaskStatus.CANCELLED
+            task.completed_at = datetime.now().isoformat()
+
+        self._publish_task_event(task)
+        return True
 
     def _save_task_state(self, task: AnalysisTask):
         """Save task state to disk and database for persistence."""
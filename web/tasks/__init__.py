@@ -10,6 +10,8 @@ Background tasks for IT Due Diligence Agent:
 from web.tasks.analysis_tasks import (
     run_analysis_task,
     run_domain_analysis,
+    run_domain_analysis_step,
+    finalize_analysis_run,
     process_document_task,
 )
 
@@ -17,15 +19,21 @@ from web.tasks.cleanup_tasks import (
     cleanup_old_tasks,
     cleanup_expired_sessions,
     cleanup_temp_files,
+    cleanup_stale_uploads,
+    cleanup_unreferenced_blobs,
 )
 
 __all__ = [
     # Analysis
     'run_analysis_task',
     'run_domain_analysis',
+    'run_domain_analysis_step',
+    'finalize_analysis_run',
     'process_document_task',
     # Cleanup
     'cleanup_old_tasks',
     'cleanup_expired_sessions',
     'cleanup_temp_files',
+    'cleanup_stale_uploads',
+    'cleanup_unreferenced_blobs',
 ]
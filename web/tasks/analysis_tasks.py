@@ -9,7 +9,13 @@ import logging
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
-from celery import shared_task
+from celery import chain, chord, group, shared_task
+
+from config_v2 import (
+    ANALYSIS_MAX_PARALLEL_DOMAINS,
+    ANALYSIS_DOMAIN_MAX_RETRIES,
+    ANALYSIS_DOMAIN_RETRY_DELAY,
+)
 
 # V2 Pipeline imports for actual analysis
 try:
@@ -29,6 +35,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Share of run progress (0-100) covered by domain steps; the rest is
+# start-up and finalization.
+DOMAIN_PROGRESS_SPAN = 90.0
+
 
 @shared_task(bind=True, name='web.tasks.run_analysis_task')
 def run_analysis_task(
@@ -42,8 +52,16 @@ def run_analysis_task(
     """
     Run multi-domain analysis for a deal.
 
-    This is the main entry point for background analysis.
-    Updates progress as each domain is analyzed.
+    This is the main entry point for background analysis. It creates the
+    AnalysisRun, then replaces itself with a Celery chord:
+
+        group(chain(domain steps) per lane) | finalize_analysis_run
+
+    Domains are spread over at most ANALYSIS_MAX_PARALLEL_DOMAINS lanes
+    (or options['max_parallel_domains']), so a deal never holds more
+    worker slots than that. Each domain step retries on its own and
+    reports progress into this task's id; the chord callback's result
+    becomes this task's result.
 
     Args:
         deal_id: The deal to analyze
@@ -53,25 +71,15 @@ def run_analysis_task(
         options: Additional analysis options
 
     Returns:
-        Analysis results summary
+        Analysis results summary (via the chord callback)
     """
-    from web.database import db, Deal, AnalysisRun
     from web.repositories.analysis_run_repository import AnalysisRunRepository
 
     options = options or {}
-    results = {
-        'deal_id': deal_id,
-        'entity': entity,
-        'domains_analyzed': [],
-        'total_facts': 0,
-        'total_findings': 0,
-        'errors': [],
-        'started_at': datetime.utcnow().isoformat(),
-    }
+    repo = AnalysisRunRepository()
 
     try:
         # Create analysis run record
-        repo = AnalysisRunRepository()
         run = repo.create_run(
             deal_id=deal_id,
             run_type='full' if len(domains) > 2 else 'partial',
@@ -81,7 +89,10 @@ def run_analysis_task(
         )
         # Start the run
         run = repo.start_run(run)
-        run_id = run.id
+        run_id = str(run.id)
+
+        max_parallel = int(options.get('max_parallel_domains') or ANALYSIS_MAX_PARALLEL_DOMAINS)
+        lanes = plan_domain_lanes(domains, max_parallel)
 
         # Update progress: starting
         self.update_state(
@@ -89,97 +100,339 @@ def run_analysis_task(
             meta={
                 'progress': 0,
                 'phase': 'Starting analysis',
-                'message': f'Initializing analysis for {len(domains)} domains',
-                'run_id': str(run_id)
+                'message': f'Analyzing {len(domains)} domains, {len(lanes)} in parallel',
+                'run_id': run_id
             }
         )
 
-        total_domains = len(domains)
-        for i, domain in enumerate(domains):
-            # Update progress
-            progress = int((i / total_domains) * 100)
-            self.update_state(
-                state='PROGRESS',
-                meta={
-                    'progress': progress,
-                    'phase': f'Analyzing {domain}',
-                    'message': f'Processing domain {i + 1} of {total_domains}',
-                    'current_domain': domain,
-                    'run_id': str(run_id)
-                }
-            )
+        workflow = build_analysis_workflow(
+            deal_id=deal_id,
+            run_id=run_id,
+            lanes=lanes,
+            entity=entity,
+            options=options,
+            parent_task_id=self.request.id,
+            started_at=datetime.utcnow().isoformat()
+        )
+
+    except Exception as e:
+        logger.error(f"Analysis task failed for deal {deal_id}: {e}")
 
+        # Update run as failed
+        if 'run' in locals():
             try:
-                # Run domain analysis
-                domain_result = _analyze_domain(deal_id, domain, entity, options)
-                results['domains_analyzed'].append(domain)
-                results['total_facts'] += domain_result.get('facts_count', 0)
-                results['total_findings'] += domain_result.get('findings_count', 0)
-
-            except Exception as e:
-                logger.error(f"Error analyzing domain {domain}: {e}")
-                results['errors'].append({
-                    'domain': domain,
-                    'error': str(e)
-                })
-
-        # Final progress update
+                repo.fail_run(run, error_message=str(e))
+            except Exception:
+                pass
+
+        raise
+
+    logger.info(f"Dispatching analysis run {run_id} for deal {deal_id}: lanes={lanes}")
+    return self.replace(workflow)
+
+
+def plan_domain_lanes(domains: List[str], max_parallel: int) -> List[List[str]]:
+    """
+    Split domains round-robin into at most max_parallel lanes.
+
+    Each lane runs its domains one after another; lanes run concurrently.
+    """
+    lane_count = max(1, min(max_parallel, len(domains)))
+    lanes: List[List[str]] = [[] for _ in range(lane_count)]
+    for i, domain in enumerate(domains):
+        lanes[i % lane_count].append(domain)
+    return [lane for lane in lanes if lane]
+
+
+def build_analysis_workflow(
+    deal_id: str,
+    run_id: str,
+    lanes: List[List[str]],
+    entity: str,
+    options: Dict[str, Any],
+    parent_task_id: Optional[str],
+    started_at: str
+):
+    """Build the chord of per-lane domain chains and the finalizing callback."""
+    total_domains = sum(len(lane) for lane in lanes)
+    context = {
+        'deal_id': deal_id,
+        'run_id': run_id,
+        'entity': entity,
+        'options': options,
+        'parent_task_id': parent_task_id,
+        'total_domains': total_domains,
+    }
+
+    header = []
+    for lane in lanes:
+        # The first step starts the lane's result list; later steps receive
+        # the previous step's list as their first argument.
+        steps = [run_domain_analysis_step.s([], domain=lane[0], **context)]
+        steps += [run_domain_analysis_step.s(domain=domain, **context) for domain in lane[1:]]
+        header.append(chain(*steps))
+
+    callback = finalize_analysis_run.s(
+        deal_id=deal_id,
+        run_id=run_id,
+        entity=entity,
+        parent_task_id=parent_task_id,
+        started_at=started_at
+    )
+    # A step that crashes (or the finalizer itself) fails the chord; the
+    # errback marks the run failed instead of leaving it "running"
+    callback.link_error(fail_analysis_run.s(deal_id=deal_id, run_id=run_id))
+    return chord(group(header), callback)
+
+
+@shared_task(
+    bind=True,
+    name='web.tasks.run_domain_analysis_step',
+    max_retries=ANALYSIS_DOMAIN_MAX_RETRIES,
+    default_retry_delay=ANALYSIS_DOMAIN_RETRY_DELAY
+)
+def run_domain_analysis_step(
+    self,
+    lane_results: List[Dict[str, Any]],
+    deal_id: str,
+    domain: str,
+    run_id: str,
+    entity: str = 'target',
+    options: Optional[Dict[str, Any]] = None,
+    parent_task_id: Optional[str] = None,
+    total_domains: int = 1
+) -> List[Dict[str, Any]]:
+    """
+    Analyze one domain as part of a fanned-out analysis run.
+
+    Failed domains are retried up to max_retries times; after that the
+    error result is recorded so the rest of the run still completes.
+
+    Returns:
+        lane_results with this domain's result appended
+    """
+    result = _analyze_domain(deal_id, domain, entity, options or {}, run_id=run_id)
+
+    retryable = V2_PIPELINE_AVAILABLE and result.get('status') == 'error'
+    if retryable and self.request.retries < self.max_retries:
+        logger.warning(
+            f"Domain {domain} failed for deal {deal_id} "
+            f"(attempt {self.request.retries + 1}), retrying: {result.get('error')}"
+        )
+        raise self.retry()
+
+    _record_domain_progress(self, deal_id, run_id, domain, result, total_domains, parent_task_id)
+    return list(lane_results) + [result]
+
+
+def _record_domain_progress(
+    task,
+    deal_id: str,
+    run_id: str,
+    domain: str,
+    domain_result: Dict[str, Any],
+    total_domains: int,
+    parent_task_id: Optional[str]
+) -> None:
+    """Add one domain's share to the run's progress and publish it on the parent task and SSE feed."""
+    from web.database import db, AnalysisRun
+    from web.progress_events import publish_progress
+
+    step = DOMAIN_PROGRESS_SPAN / max(total_domains, 1)
+    try:
+        # Atomic increment: domain steps finish concurrently on different workers
+        AnalysisRun.query.filter_by(id=run_id).update(
+            {
+                AnalysisRun.progress: AnalysisRun.progress + step,
+                AnalysisRun.current_step: f'Analyzed {domain}'[:100],
+            },
+            synchronize_session=False
+        )
+        db.session.commit()
+        progress = db.session.query(AnalysisRun.progress).filter_by(id=run_id).scalar() or 0.0
+    except Exception as e:
+        logger.warning(f"Failed to record progress for run {run_id}: {e}")
+        db.session.rollback()
+        return
+
+    completed = min(total_domains, int(round(progress / step)))
+    meta = {
+        'progress': int(progress),
+        'phase': f'Analyzed {domain}',
+        'message': f'Completed {completed} of {total_domains} domains',
+        'current_domain': domain,
+        'run_id': run_id
+    }
+    if parent_task_id:
+        task.update_state(task_id=parent_task_id, state='PROGRESS', meta=meta)
+
+    publish_progress(
+        {
+            **meta,
+            'status': 'running',
+            'complete': False,
+            'domain_progress': {domain: domain_result.get('status', 'completed')},
+            'facts_count': domain_result.get('facts_count', 0),
+        },
+        deal_id=deal_id
+    )
+
+
+@shared_task(bind=True, name='web.tasks.finalize_analysis_run')
+def finalize_analysis_run(
+    self,
+    lane_results: List[List[Dict[str, Any]]],
+    deal_id: str,
+    run_id: str,
+    entity: str = 'target',
+    parent_task_id: Optional[str] = None,
+    started_at: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Chord callback: aggregate per-domain results and complete the AnalysisRun.
+
+    Returns:
+        Analysis results summary
+    """
+    from web.database import db, Deal
+    from web.progress_events import publish_progress
+    from web.repositories.analysis_run_repository import AnalysisRunRepository
+
+    if parent_task_id:
         self.update_state(
+            task_id=parent_task_id,
             state='PROGRESS',
             meta={
                 'progress': 95,
                 'phase': 'Finalizing',
                 'message': 'Generating summary and saving results',
-                'run_id': str(run_id)
+                'run_id': run_id
             }
         )
 
-        # Update analysis run record
-        results['completed_at'] = datetime.utcnow().isoformat()
-        repo.complete(
-            run_id,
-            facts_count=results['total_facts'],
-            findings_count=results['total_findings'],
-            errors=results['errors'] if results['errors'] else None
+    results = aggregate_domain_results(
+        [result for lane in lane_results for result in lane]
+    )
+    results.update({
+        'deal_id': deal_id,
+        'entity': entity,
+        'run_id': run_id,
+        'started_at': started_at,
+        'completed_at': datetime.utcnow().isoformat(),
+    })
+
+    # Update analysis run record
+    repo = AnalysisRunRepository()
+    run = repo.get_by_id(run_id)
+    if run:
+        repo.complete_run(
+            run,
+            facts_created=results['total_facts'],
+            findings_created=results['total_findings'],
+            errors_count=len(results['errors'])
         )
+        if results['errors']:
+            repo.update(run, error_details={'domain_errors': results['errors']})
+
+    # Update deal statistics
+    deal = Deal.query.get(deal_id)
+    if deal:
+        deal.facts_extracted = results['total_facts']
+        deal.findings_count = results['total_findings']
+        deal.analysis_runs_count = (deal.analysis_runs_count or 0) + 1
+        deal.last_accessed_at = datetime.utcnow()
+        db.session.commit()
 
-        # Update deal statistics
-        deal = Deal.query.get(deal_id)
-        if deal:
-            deal.facts_extracted = results['total_facts']
-            deal.findings_count = results['total_findings']
-            deal.analysis_runs_count = (deal.analysis_runs_count or 0) + 1
-            deal.last_accessed_at = datetime.utcnow()
-            db.session.commit()
+    publish_progress(
+        {
+            'progress': 100,
+            'phase': 'Analysis complete',
+            'status': 'completed',
+            'complete': True,
+            'success': True,
+            'run_id': run_id,
+            'facts_count': results['total_facts'],
+            'findings_count': results['total_findings'],
+            'errors': results['errors'],
+        },
+        deal_id=deal_id
+    )
 
-        logger.info(f"Analysis complete for deal {deal_id}: {results['total_facts']} facts, {results['total_findings']} findings")
-        return results
+    logger.info(f"Analysis complete for deal {deal_id}: {results['total_facts']} facts, {results['total_findings']} findings")
+    return results
 
-    except Exception as e:
-        logger.error(f"Analysis task failed for deal {deal_id}: {e}")
-        results['error'] = str(e)
-        results['completed_at'] = datetime.utcnow().isoformat()
 
-        # Update run as failed
-        if 'run_id' in locals():
-            try:
-                repo.fail(run_id, error=str(e))
-            except Exception:
-                pass
+@shared_task(name='web.tasks.fail_analysis_run')
+def fail_analysis_run(request, exc, traceback, deal_id: str, run_id: str) -> None:
+    """
+    Chord errback: mark the AnalysisRun failed and end its progress stream.
 
-        raise
+    Runs once the chord fails, whether a domain step crashed or the
+    finalizer raised. A run that already reached a terminal state is left
+    alone.
+    """
+    from web.progress_events import publish_progress
+    from web.repositories.analysis_run_repository import AnalysisRunRepository
+
+    error = str(exc) or exc.__class__.__name__
+    logger.error(f"Analysis run {run_id} for deal {deal_id} failed: {error}")
+
+    repo = AnalysisRunRepository()
+    run = repo.get_by_id(run_id)
+    if run and run.status in ('pending', 'running'):
+        repo.fail_run(run, error_message=error[:1000],
+                      error_details={'task_id': getattr(request, 'id', None)})
+
+    publish_progress(
+        {
+            'phase': 'Analysis failed',
+            'status': 'failed',
+            'complete': True,
+            'success': False,
+            'run_id': run_id,
+            'error': error,
+        },
+        deal_id=deal_id
+    )
+
+
+def aggregate_domain_results(domain_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sum per-domain results into the run summary returned to the UI."""
+    results = {
+        'domains_analyzed': [],
+        'total_facts': 0,
+        'total_findings': 0,
+        'errors': [],
+    }
+    for domain_result in domain_results:
+        domain = domain_result.get('domain')
+        if domain_result.get('status') == 'error':
+            results['errors'].append({
+                'domain': domain,
+                'error': domain_result.get('error', 'Unknown error')
+            })
+            continue
+        results['domains_analyzed'].append(domain)
+        results['total_facts'] += domain_result.get('facts_count', 0)
+        results['total_findings'] += domain_result.get('findings_count', 0)
+    return results
 
 
 def _analyze_domain(
     deal_id: str,
     domain: str,
     entity: str,
-    options: Dict[str, Any]
+    options: Dict[str, Any],
+    run_id: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Analyze a single domain for a deal using V2 pipeline.
+
+    With a run_id the domain's facts are saved against that run and replace
+    any saved by an earlier attempt, so retried steps are idempotent.
     """
-    from web.database import db, Deal, Fact, Document
+    from web.database import db, Deal, Document
+    from web.repositories.fact_repository import FactRepository
 
     logger.info(f"Analyzing domain {domain} for deal {deal_id}")
 
@@ -235,34 +488,34 @@ def _analyze_domain(
             analysis_phase=f"{entity}_extraction"
         )
 
-        # Save facts to database
-        facts_saved = 0
-        for store_fact in fact_store.facts:
-            try:
-                # store_fact is a Fact dataclass from stores.fact_store
-                # Convert to DB model Fact from web.database
-                fact = Fact(
-                    id=store_fact.fact_id or f"F-{domain[:3].upper()}-{facts_saved:04d}",
-                    deal_id=deal_id,
-                    domain=store_fact.domain or domain,
-                    category=store_fact.category or '',
-                    entity=store_fact.entity or entity,
-                    item=store_fact.item or '',
-                    status=store_fact.status or 'documented',
-                    details=store_fact.details or {},
-                    evidence=store_fact.evidence or {},
-                    source_document=store_fact.source_document or '',
-                    confidence_score=store_fact.confidence_score if hasattr(store_fact, 'confidence_score') else 0.5,
-                    analysis_phase=f"{entity}_extraction",
-                    created_at=datetime.utcnow()
-                )
-                db.session.add(fact)
-                facts_saved += 1
-            except Exception as e:
-                logger.warning(f"Failed to save fact: {e}")
-                db.session.rollback()
-
-        db.session.commit()
+        # Save facts to database (all or nothing)
+        facts_data = []
+        for index, store_fact in enumerate(fact_store.facts):
+            # store_fact is a Fact dataclass from stores.fact_store
+            # Convert to DB model Fact from web.database
+            facts_data.append({
+                'id': store_fact.fact_id or f"F-{domain[:3].upper()}-{index:04d}",
+                'deal_id': deal_id,
+                'analysis_run_id': run_id,
+                'domain': store_fact.domain or domain,
+                'category': store_fact.category or '',
+                'entity': store_fact.entity or entity,
+                'item': store_fact.item or '',
+                'status': store_fact.status or 'documented',
+                'details': store_fact.details or {},
+                'evidence': store_fact.evidence or {},
+                'source_document': store_fact.source_document or '',
+                'confidence_score': store_fact.confidence_score if hasattr(store_fact, 'confidence_score') else 0.5,
+                'analysis_phase': f"{entity}_extraction",
+                'created_at': datetime.utcnow()
+            })
+
+        repo = FactRepository()
+        if run_id:
+            repo.replace_for_run(deal_id, run_id, domain, entity, facts_data)
+        else:
+            repo.create_many(facts_data)
+        facts_saved = len(facts_data)
 
         # Save inventory items to deal-specific path
         inventory_store.save()
@@ -312,6 +565,7 @@ def _analyze_domain(
 
     except Exception as e:
         logger.exception(f"Error analyzing domain {domain}: {e}")
+        db.session.rollback()
         return {'domain': domain, 'facts_count': 0, 'status': 'error', 'error': str(e)}
 
 
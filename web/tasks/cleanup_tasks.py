@@ -2,10 +2,12 @@
 Cleanup Tasks - Periodic maintenance tasks
 
 These tasks run on a schedule via Celery Beat to clean up
-old sessions, temporary files, and stale data.
+old sessions, temporary files, and stale data. Redis keyspace sweeps go
+through the batched RetentionEngine (web/tasks/retention.py).
 """
 
 import os
+import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -16,32 +18,69 @@ from celery import shared_task
 logger = logging.getLogger(__name__)
 
 
+def _task_results_past_expiry(cutoff: datetime):
+    """
+    RetentionEngine selector for Celery result keys that will never expire.
+
+    Celery sets a TTL (result_expires) on new results; keys without one
+    (written before that setting, or by other producers) are deleted once
+    their date_done is older than cutoff.
+    """
+    def select(client, keys):
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.ttl(key)
+        ttls = pipe.execute()
+        no_ttl = [key for key, ttl in zip(keys, ttls) if ttl == -1]
+        if not no_ttl:
+            return []
+
+        pipe = client.pipeline(transaction=False)
+        for key in no_ttl:
+            pipe.get(key)
+        expired = []
+        for key, raw in zip(no_ttl, pipe.execute()):
+            try:
+                date_done = json.loads(raw or '{}').get('date_done')
+                done = datetime.fromisoformat(date_done.replace('Z', '')).replace(tzinfo=None) if date_done else None
+            except (ValueError, TypeError, AttributeError):
+                done = None
+            if done is None or done < cutoff:
+                expired.append(key)
+        return expired
+    return select
+
+
 @shared_task(name='web.tasks.cleanup_old_tasks')
 def cleanup_old_tasks() -> Dict[str, Any]:
     """
     Clean up old completed Celery tasks from Redis.
 
     Runs hourly via Celery Beat.
-    Removes task results older than 24 hours.
+    Walks result keys with SCAN (never KEYS, which blocks Redis) and removes
+    results older than 24 hours that have no TTL; results with a TTL expire
+    on their own (result_expires).
     """
     from web.celery_app import celery, REDIS_URL
+    from web.tasks.retention import RetentionEngine
 
     try:
         import redis
         r = redis.from_url(REDIS_URL)
 
-        # Count task keys before cleanup
-        task_keys = r.keys('celery-task-meta-*')
-        initial_count = len(task_keys)
-
-        # Celery handles expiration automatically via result_expires config
-        # This task is mainly for logging/monitoring
+        expires = celery.conf.result_expires or 86400
+        cutoff = datetime.utcnow() - (expires if isinstance(expires, timedelta) else timedelta(seconds=expires))
+        report = RetentionEngine().sweep_redis(
+            r, 'celery-task-meta-*', job='task_results', select=_task_results_past_expiry(cutoff)
+        )
 
-        logger.info(f"Task cleanup: {initial_count} task results in Redis")
+        logger.info(f"Task cleanup: {report.scanned} task results in Redis, {report.affected} removed")
 
         return {
             'status': 'success',
-            'task_count': initial_count,
+            'task_count': report.scanned,
+            'removed': report.affected,
+            'retention': report.to_dict(),
             'timestamp': datetime.utcnow().isoformat()
         }
 
@@ -54,45 +93,48 @@ def cleanup_old_tasks() -> Dict[str, Any]:
         }
 
 
-@shared_task(name='web.tasks.cleanup_expired_sessions')
+def _sessions_without_ttl(client, keys):
+    """RetentionEngine selector for session keys that would never expire."""
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.ttl(key)
+    return [key for key, ttl in zip(keys, pipe.execute()) if ttl == -1]
+
+
+@shared_task(name='web.tasks.cleanup_expired_redis_sessions')
 def cleanup_expired_sessions() -> Dict[str, Any]:
     """
     Clean up expired user sessions from Redis.
 
     Runs daily via Celery Beat.
-    Removes sessions older than configured lifetime.
+    Redis expires sessions through their TTL; sessions stored without one
+    (their age is unknown) are given the configured session lifetime so
+    they age out instead of accumulating. Keys are walked with SCAN.
+
+    The SQL session backend is cleaned by
+    web.tasks.maintenance_tasks.cleanup_expired_sessions.
     """
     from web.celery_app import REDIS_URL
-    from config_v2 import SESSION_LIFETIME_HOURS
+    from config_v2 import SESSION_LIFETIME_DAYS
+    from web.tasks.retention import RetentionEngine
 
     try:
         import redis
         r = redis.from_url(REDIS_URL)
 
         # Session keys pattern (Flask-Session uses 'session:' prefix)
-        session_keys = r.keys('session:*')
-        initial_count = len(session_keys)
-
-        expired_count = 0
-        cutoff = datetime.utcnow() - timedelta(hours=SESSION_LIFETIME_HOURS)
-
-        for key in session_keys:
-            try:
-                # Check TTL - if no TTL, session may be stale
-                ttl = r.ttl(key)
-                if ttl == -1:  # No expiration set
-                    # Check if session is old (would need session data inspection)
-                    # For now, just log it
-                    logger.debug(f"Session {key} has no TTL")
-            except Exception as e:
-                logger.warning(f"Error checking session {key}: {e}")
+        report = RetentionEngine().sweep_redis(
+            r, 'session:*', job='redis_sessions', select=_sessions_without_ttl,
+            expire_seconds=SESSION_LIFETIME_DAYS * 86400
+        )
 
-        logger.info(f"Session cleanup: {initial_count} sessions, {expired_count} expired")
+        logger.info(f"Session cleanup: {report.scanned} sessions, {report.affected} given a TTL")
 
         return {
             'status': 'success',
-            'total_sessions': initial_count,
-            'expired_cleaned': expired_count,
+            'total_sessions': report.scanned,
+            'expired_cleaned': report.affected,
+            'retention': report.to_dict(),
             'timestamp': datetime.utcnow().isoformat()
         }
 
@@ -163,6 +205,72 @@ def cleanup_temp_files() -> Dict[str, Any]:
         }
 
 
+@shared_task(name='web.tasks.cleanup_stale_uploads')
+def cleanup_stale_uploads() -> Dict[str, Any]:
+    """
+    Remove abandoned resumable uploads from the spool directory.
+
+    Runs hourly via Celery Beat. Uploads not touched for
+    UPLOAD_SPOOL_MAX_AGE_HOURS lose their part and metadata files.
+    """
+    from web.chunked_uploads import get_upload_manager
+
+    try:
+        removed = get_upload_manager().cleanup_stale()
+
+        return {
+            'status': 'success',
+            'uploads_removed': len(removed),
+            'timestamp': datetime.utcnow().isoformat()
+        }
+
+    except Exception as e:
+        logger.error(f"Stale upload cleanup failed: {e}")
+        return {
+            'status': 'error',
+            'error': str(e),
+            'timestamp': datetime.utcnow().isoformat()
+        }
+
+
+@shared_task(name='web.tasks.cleanup_unreferenced_blobs')
+def cleanup_unreferenced_blobs() -> Dict[str, Any]:
+    """
+    Delete S3 blobs that no document references any more.
+
+    Runs daily via Celery Beat. Only content-addressed S3 storage keeps
+    blobs; other backends are skipped. Blobs younger than
+    BLOB_GC_GRACE_HOURS are kept so in-flight uploads are never affected.
+    """
+    from web.storage import S3Storage, get_storage
+
+    try:
+        backend = get_storage().backend
+        if not isinstance(backend, S3Storage) or not backend.content_addressed:
+            return {
+                'status': 'skipped',
+                'reason': 'storage is not content-addressed S3',
+                'timestamp': datetime.utcnow().isoformat()
+            }
+
+        removed = backend.delete_unreferenced_blobs()
+        logger.info(f"Blob cleanup: {removed} unreferenced blobs deleted")
+
+        return {
+            'status': 'success',
+            'blobs_deleted': removed,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+
+    except Exception as e:
+        logger.error(f"Blob cleanup failed: {e}")
+        return {
+            'status': 'error',
+            'error': str(e),
+            'timestamp': datetime.utcnow().isoformat()
+        }
+
+
 @shared_task(name='web.tasks.cleanup_stale_analysis_runs')
 def cleanup_stale_analysis_runs() -> Dict[str, Any]:
     """
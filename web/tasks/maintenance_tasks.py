@@ -46,7 +46,9 @@ def cleanup_expired_sessions(cutoff_days: int = 7) -> Dict[str, Any]:
     Remove expired sessions from database.
 
     Run this periodically (e.g., daily at 3am) via cron or Celery beat.
-    Only needed if using SQLAlchemy session backend.
+    Only needed if using SQLAlchemy session backend. Rows are deleted in
+    batches of RETENTION_BATCH_SIZE, each committed on its own; if the time
+    budget runs out, 'complete' is False and the next run continues.
 
     Args:
         cutoff_days: Remove sessions older than this many days
@@ -64,32 +66,29 @@ def cleanup_expired_sessions(cutoff_days: int = 7) -> Dict[str, Any]:
         cleanup_expired_sessions.delay(cutoff_days=7)
     """
     from web.database import db
-
-    try:
-        # Calculate cutoff timestamp
-        cutoff = datetime.utcnow() - timedelta(days=cutoff_days)
-
-        # Delete expired sessions
-        result = db.session.execute(db.text("""
-            DELETE FROM flask_sessions
-            WHERE expiry < :cutoff OR expiry IS NULL
-        """), {'cutoff': cutoff})
-
-        db.session.commit()
-        deleted = result.rowcount
-
-        logger.info(f"✅ Cleaned up {deleted} expired sessions (cutoff: {cutoff.isoformat()})")
-
-        return {
-            'deleted': deleted,
-            'cutoff': cutoff.isoformat(),
-            'cutoff_days': cutoff_days
-        }
-
-    except Exception as e:
-        logger.error(f"Session cleanup failed: {e}")
-        db.session.rollback()
-        raise
+    from web.tasks.retention import RetentionEngine
+
+    # Calculate cutoff timestamp
+    cutoff = datetime.utcnow() - timedelta(days=cutoff_days)
+
+    # Delete expired sessions in short batched transactions (one unbounded
+    # DELETE would hold its locks until every row is gone)
+    report = RetentionEngine().purge_sql(
+        db.session, 'flask_sessions', 'expiry < :cutoff OR expiry IS NULL', {'cutoff': cutoff},
+        job='flask_sessions'
+    )
+    if report.errors:
+        raise RuntimeError(f"Session cleanup failed after {report.affected} deletions: {report.errors[-1]}")
+
+    logger.info(f"✅ Cleaned up {report.affected} expired sessions (cutoff: {cutoff.isoformat()})")
+
+    return {
+        'deleted': report.affected,
+        'cutoff': cutoff.isoformat(),
+        'cutoff_days': cutoff_days,
+        'complete': report.complete,
+        'retention': report.to_dict()
+    }
 
 
 @shared_task(name='web.tasks.check_session_backend_health')
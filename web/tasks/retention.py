@@ -0,0 +1,241 @@
+"""
+Retention Engine - batched, non-blocking cleanup
+
+Cleanup jobs used to issue one blocking command for the whole keyspace or
+table (Redis KEYS, a single unbounded DELETE). On a large Redis that stalls
+every other client; on a large table it holds one long transaction and its
+locks. The RetentionEngine does the same work incrementally:
+
+- Redis: SCAN cursors with a COUNT hint, then the selected keys of each
+  batch are deleted (UNLINK, falling back to DEL) or given a TTL in one
+  pipeline.
+- SQL: repeatedly select up to batch_size primary keys matching the
+  condition and delete them by key, committing after every batch.
+- Between batches the engine sleeps briefly so other work gets through,
+  and stops when its time budget is spent; the next scheduled run picks up
+  the rest.
+
+Every sweep returns a RetentionReport (scanned, affected, batches,
+throughput) that the Celery tasks return and log.
+
+Usage:
+    engine = RetentionEngine()
+    report = engine.sweep_redis(r, 'celery-task-meta-*', job='task_results', select=older_than)
+    report = engine.purge_sql(db.session, 'flask_sessions', 'expiry < :cutoff', {'cutoff': cutoff})
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config_v2 import RETENTION_BATCH_SIZE, RETENTION_BATCH_PAUSE_MS, RETENTION_MAX_SECONDS
+except ImportError:
+    RETENTION_BATCH_SIZE = 500
+    RETENTION_BATCH_PAUSE_MS = 50
+    RETENTION_MAX_SECONDS = 300
+
+# Table and column names are interpolated into SQL; only plain identifiers are accepted
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+@dataclass
+class RetentionReport:
+    """Progress and result of one retention sweep."""
+    job: str
+    scanned: int = 0            # Keys/rows examined
+    affected: int = 0           # Keys/rows deleted (or given a TTL)
+    batches: int = 0
+    complete: bool = False      # False when the time budget ran out first
+    errors: List[str] = field(default_factory=list)
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Keys/rows affected per second."""
+        duration = self.duration_seconds
+        return self.affected / duration if duration > 0 else float(self.affected)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job': self.job,
+            'scanned': self.scanned,
+            'affected': self.affected,
+            'batches': self.batches,
+            'complete': self.complete,
+            'duration_seconds': round(self.duration_seconds, 3),
+            'throughput_per_second': round(self.throughput, 1),
+            'errors': self.errors,
+        }
+
+
+class RetentionEngine:
+    """
+    Runs retention sweeps in bounded batches.
+
+    Args:
+        batch_size: Keys per SCAN step / rows per DELETE transaction
+        pause_seconds: Sleep between batches
+        max_seconds: Time budget per sweep (0 for no limit)
+        progress: Called with the report after every batch
+        sleep: Sleep function (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        pause_seconds: Optional[float] = None,
+        max_seconds: Optional[float] = None,
+        progress: Optional[Callable[[RetentionReport], None]] = None,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.batch_size = max(1, batch_size or RETENTION_BATCH_SIZE)
+        self.pause_seconds = RETENTION_BATCH_PAUSE_MS / 1000 if pause_seconds is None else pause_seconds
+        self.max_seconds = RETENTION_MAX_SECONDS if max_seconds is None else max_seconds
+        self.progress = progress
+        self._sleep = sleep
+
+    def _after_batch(self, report: RetentionReport) -> bool:
+        """Report progress and pause; False once the time budget is spent."""
+        logger.debug(f"Retention {report.job}: batch {report.batches}, "
+                     f"{report.scanned} scanned, {report.affected} affected")
+        if self.progress:
+            self.progress(report)
+        if self.max_seconds and report.duration_seconds >= self.max_seconds:
+            return False
+        if self.pause_seconds > 0:
+            self._sleep(self.pause_seconds)
+        return True
+
+    def _finish(self, report: RetentionReport, complete: bool) -> RetentionReport:
+        report.complete = complete
+        report.finished_at = time.monotonic()
+        logger.info(f"Retention {report.job}: {report.affected} of {report.scanned} affected in "
+                    f"{report.batches} batches, {report.duration_seconds:.1f}s "
+                    f"({report.throughput:.0f}/s){'' if complete else ' - time budget reached, continuing next run'}")
+        return report
+
+    # =========================================================================
+    # REDIS
+    # =========================================================================
+
+    def sweep_redis(
+        self,
+        client,
+        pattern: str,
+        job: str,
+        select: Optional[Callable[[Any, List[bytes]], Sequence[bytes]]] = None,
+        expire_seconds: Optional[int] = None
+    ) -> RetentionReport:
+        """
+        Walk keys matching pattern with SCAN and act on them batch by batch.
+
+        Args:
+            client: redis.Redis (or compatible) client
+            pattern: Key pattern, e.g. 'celery-task-meta-*'
+            job: Name used in the report and logs
+            select: Given (client, keys of one batch), returns the keys to act
+                on; all keys when None
+            expire_seconds: Give selected keys this TTL instead of deleting them
+
+        Returns:
+            RetentionReport
+        """
+        report = RetentionReport(job=job)
+        cursor = 0
+        while True:
+            cursor, keys = client.scan(cursor=cursor, match=pattern, count=self.batch_size)
+            report.batches += 1
+            report.scanned += len(keys)
+            if keys:
+                try:
+                    chosen = list(select(client, keys)) if select else list(keys)
+                    if chosen:
+                        report.affected += self._apply(client, chosen, expire_seconds)
+                except Exception as e:
+                    logger.warning(f"Retention {job}: batch failed: {e}")
+                    report.errors.append(str(e)[:200])
+            if int(cursor) == 0:
+                return self._finish(report, complete=True)
+            if not self._after_batch(report):
+                return self._finish(report, complete=False)
+
+    def _apply(self, client, keys: List[bytes], expire_seconds: Optional[int]) -> int:
+        if expire_seconds is not None:
+            pipe = client.pipeline(transaction=False)
+            for key in keys:
+                pipe.expire(key, expire_seconds)
+            return sum(1 for ok in pipe.execute() if ok)
+        try:
+            return client.unlink(*keys)  # Frees memory in the background (Redis >= 4)
+        except Exception as e:
+            if 'unknown command' not in str(e).lower():
+                raise
+            return client.delete(*keys)
+
+    # =========================================================================
+    # SQL
+    # =========================================================================
+
+    def purge_sql(
+        self,
+        session,
+        table: str,
+        where: str,
+        params: Optional[Dict[str, Any]] = None,
+        job: Optional[str] = None,
+        key_column: str = 'id'
+    ) -> RetentionReport:
+        """
+        Delete rows matching a condition in short, separately committed batches.
+
+        Args:
+            session: SQLAlchemy session (e.g. db.session)
+            table: Table name
+            where: SQL condition with bound parameters, e.g. 'expiry < :cutoff'
+            params: Values for the condition's parameters
+            job: Name used in the report and logs (defaults to the table)
+            key_column: Primary key column used to delete by key
+
+        Returns:
+            RetentionReport
+        """
+        from sqlalchemy import bindparam, text
+
+        if not _IDENTIFIER.match(table) or not _IDENTIFIER.match(key_column):
+            raise ValueError(f"Invalid table or column name: {table}.{key_column}")
+
+        report = RetentionReport(job=job or table)
+        select_keys = text(f"SELECT {key_column} FROM {table} WHERE {where} LIMIT :batch_size")
+        delete_keys = text(f"DELETE FROM {table} WHERE {key_column} IN :keys").bindparams(
+            bindparam('keys', expanding=True))
+
+        while True:
+            try:
+                keys = [row[0] for row in session.execute(
+                    select_keys, {**(params or {}), 'batch_size': self.batch_size})]
+                if keys:
+                    result = session.execute(delete_keys, {'keys': keys})
+                    report.affected += result.rowcount if result.rowcount is not None else len(keys)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Retention {report.job}: batch failed: {e}")
+                report.errors.append(str(e)[:200])
+                return self._finish(report, complete=False)
+
+            report.batches += 1
+            report.scanned += len(keys)
+            if len(keys) < self.batch_size:
+                return self._finish(report, complete=True)
+            if not self._after_batch(report):
+                return self._finish(report, complete=False)